@@ -91,6 +91,18 @@ export const PartitionView: React.FunctionComponent<PartitionViewProps> = ({
                     partitions={partitions}
                     generateData={_getDurationData}
                   />
+                  <PartitionGraph
+                    title="CPU Time by Partition"
+                    yLabel="CPU time (secs)"
+                    partitions={partitions}
+                    generateData={_getCpuTimeData}
+                  />
+                  <PartitionGraph
+                    title="Peak Memory by Partition"
+                    yLabel="Peak memory (MB)"
+                    partitions={partitions}
+                    generateData={_getPeakMemoryData}
+                  />
                   <PartitionGraph
                     title="Materialization Count by Partition"
                     yLabel="Number of materializations"
@@ -178,6 +190,64 @@ const _getDurationData = (partitions: Partition[]) => {
   return points;
 };
 
+const _getCpuTimeData = (partitions: Partition[]) => {
+  const pipelineKey = "Total CPU Time";
+  const points: {
+    [key: string]: { x: string; y: number | null }[];
+  } = {
+    [pipelineKey]: []
+  };
+  partitions.forEach(partition => {
+    const runs = partition.runs;
+    if (!runs || !runs.length) {
+      return;
+    }
+    const { stepStats } = runs[runs.length - 1];
+    let pipelineCpuSeconds = 0;
+    stepStats.forEach(stepStat => {
+      if (stepStat.resourceUsage) {
+        points[stepStat.stepKey] = [
+          ...(points[stepStat.stepKey] || []),
+          { x: partition.name, y: stepStat.resourceUsage.cpuSeconds }
+        ];
+        pipelineCpuSeconds += stepStat.resourceUsage.cpuSeconds;
+      }
+    });
+    points[pipelineKey] = [
+      ...points[pipelineKey],
+      { x: partition.name, y: pipelineCpuSeconds }
+    ];
+  });
+
+  return points;
+};
+
+const _getPeakMemoryData = (partitions: Partition[]) => {
+  const points: {
+    [key: string]: { x: string; y: number | null }[];
+  } = {};
+  partitions.forEach(partition => {
+    const runs = partition.runs;
+    if (!runs || !runs.length) {
+      return;
+    }
+    const { stepStats } = runs[runs.length - 1];
+    stepStats.forEach(stepStat => {
+      if (stepStat.resourceUsage) {
+        points[stepStat.stepKey] = [
+          ...(points[stepStat.stepKey] || []),
+          {
+            x: partition.name,
+            y: stepStat.resourceUsage.maxRssBytes / (1024 * 1024)
+          }
+        ];
+      }
+    });
+  });
+
+  return points;
+};
+
 const _getMaterializationData = (partitions: Partition[]) => {
   const points: {
     [key: string]: { x: string; y: number | null }[];
@@ -535,6 +605,10 @@ const PARTITION_SET_QUERY = gql`
                 expectationResults {
                   success
                 }
+                resourceUsage {
+                  cpuSeconds
+                  maxRssBytes
+                }
               }
               status
             }
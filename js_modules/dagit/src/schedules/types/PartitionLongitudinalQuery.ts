@@ -41,6 +41,12 @@ export interface PartitionLongitudinalQuery_partitionSetOrError_PartitionSet_par
   success: boolean;
 }
 
+export interface PartitionLongitudinalQuery_partitionSetOrError_PartitionSet_partitions_results_runs_stepStats_resourceUsage {
+  __typename: "StepResourceUsage";
+  cpuSeconds: number;
+  maxRssBytes: number;
+}
+
 export interface PartitionLongitudinalQuery_partitionSetOrError_PartitionSet_partitions_results_runs_stepStats {
   __typename: "PipelineRunStepStats";
   stepKey: string;
@@ -48,6 +54,7 @@ export interface PartitionLongitudinalQuery_partitionSetOrError_PartitionSet_par
   endTime: number | null;
   materializations: PartitionLongitudinalQuery_partitionSetOrError_PartitionSet_partitions_results_runs_stepStats_materializations[];
   expectationResults: PartitionLongitudinalQuery_partitionSetOrError_PartitionSet_partitions_results_runs_stepStats_expectationResults[];
+  resourceUsage: PartitionLongitudinalQuery_partitionSetOrError_PartitionSet_partitions_results_runs_stepStats_resourceUsage | null;
 }
 
 export interface PartitionLongitudinalQuery_partitionSetOrError_PartitionSet_partitions_results_runs {
@@ -1,12 +1,61 @@
+import threading
+from collections import OrderedDict
+
 from dagster import ExecutionTargetHandle, check
 from dagster.core.definitions.partition import PartitionScheduleDefinition
 from dagster.core.instance import DagsterInstance
+from dagster.core.snap.execution_plan_snapshot import ExecutionPlanIndex
+from dagster.core.snap.pipeline_snapshot import PipelineIndex
 from dagster.core.snap.repository_snapshot import RepositoryIndex, RepositorySnapshot
 
 from .pipeline_execution_manager import PipelineExecutionManager
 from .reloader import Reloader
 
 
+class ExecutionPlanIndexCache(object):
+    '''Caches the indices of the execution plan snapshots of runs, by snapshot id.
+
+    Snapshots are content addressed, so a cached index never goes stale. The least recently used
+    indices are evicted once ``max_size`` are cached.
+    '''
+
+    def __init__(self, instance, max_size=64):
+        self._instance = check.inst_param(instance, 'instance', DagsterInstance)
+        self._max_size = check.int_param(max_size, 'max_size')
+        self._indices = OrderedDict()
+        # dagit resolves queries concurrently
+        self._lock = threading.Lock()
+
+    def get(self, execution_plan_snapshot_id):
+        check.str_param(execution_plan_snapshot_id, 'execution_plan_snapshot_id')
+
+        with self._lock:
+            execution_plan_index = self._indices.pop(execution_plan_snapshot_id, None)
+            if execution_plan_index is not None:
+                self._indices[execution_plan_snapshot_id] = execution_plan_index
+                return execution_plan_index
+
+        # built outside of the lock, two threads missing on the same snapshot both build its index
+        # and the last one to finish wins, which is harmless
+        execution_plan_snapshot = self._instance.get_execution_plan_snapshot(
+            execution_plan_snapshot_id
+        )
+        execution_plan_index = ExecutionPlanIndex(
+            execution_plan_snapshot,
+            PipelineIndex(
+                self._instance.get_pipeline_snapshot(execution_plan_snapshot.pipeline_snapshot_id)
+            ),
+        )
+
+        with self._lock:
+            self._indices.pop(execution_plan_snapshot_id, None)
+            self._indices[execution_plan_snapshot_id] = execution_plan_index
+            while len(self._indices) > self._max_size:
+                self._indices.popitem(last=False)
+
+        return execution_plan_index
+
+
 class DagsterSnapshotGraphQLContext(object):
     def __init__(self, repository_snapshot, execution_manager, instance, version=None):
         self._repository_snapshot = check.inst_param(
@@ -18,11 +67,15 @@ class DagsterSnapshotGraphQLContext(object):
             execution_manager, 'pipeline_execution_manager', PipelineExecutionManager
         )
         self.version = version
+        self._execution_plan_index_cache = ExecutionPlanIndexCache(self._instance)
 
     @property
     def instance(self):
         return self._instance
 
+    def get_execution_plan_index(self, execution_plan_snapshot_id):
+        return self._execution_plan_index_cache.get(execution_plan_snapshot_id)
+
     def get_repository_snapshot(self):
         return self._repository_snapshot
 
@@ -43,6 +96,7 @@ class DagsterGraphQLContext(object):
         self._repository_index = RepositoryIndex.from_repository_def(self.repository_definition)
 
         self._cached_pipelines = {}
+        self._execution_plan_index_cache = ExecutionPlanIndexCache(self._instance)
         self.scheduler_handle = self.get_handle().build_scheduler_handle()
         self.partitions_handle = self.get_handle().build_partitions_handle()
 
@@ -53,6 +107,9 @@ class DagsterGraphQLContext(object):
     def get_handle(self):
         return self._handle
 
+    def get_execution_plan_index(self, execution_plan_snapshot_id):
+        return self._execution_plan_index_cache.get(execution_plan_snapshot_id)
+
     def get_partition_set(self, partition_set_name):
         return next(
             (
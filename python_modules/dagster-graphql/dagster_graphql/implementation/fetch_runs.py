@@ -1,7 +1,7 @@
 from dagster_graphql.schema.pipelines import DauphinPipeline
 from graphql.execution.base import ResolveInfo
 
-from dagster import PipelineDefinition, check
+from dagster import PipelineDefinition, PipelineRun, check
 from dagster.config.validate import validate_config
 from dagster.core.definitions import create_environment_schema
 from dagster.core.definitions.pipeline import ExecutionSelector
@@ -10,6 +10,7 @@ from dagster.core.snap.execution_plan_snapshot import ExecutionPlanIndex
 from dagster.core.storage.pipeline_run import PipelineRunsFilter
 
 from .fetch_pipelines import get_pipeline_def_from_selector
+from .loader import RunsLoader
 from .utils import UserFacingGraphQLError, capture_dauphin_error
 
 
@@ -76,7 +77,15 @@ def get_runs(graphene_info, filters, cursor=None, limit=None):
     else:
         runs = instance.get_runs(cursor=cursor, limit=limit)
 
-    return [graphene_info.schema.type_named('PipelineRun')(run) for run in runs]
+    return get_dauphin_runs(graphene_info, runs)
+
+
+def get_dauphin_runs(graphene_info, runs):
+    '''Wrap a batch of runs, e.g. a page of the runs list, that share a RunsLoader.'''
+    check.list_param(runs, 'runs', of_type=PipelineRun)
+
+    loader = RunsLoader(graphene_info.context.instance, runs)
+    return [graphene_info.schema.type_named('PipelineRun')(run, loader=loader) for run in runs]
 
 
 @capture_dauphin_error
@@ -108,11 +117,50 @@ def get_execution_plan(graphene_info, selector, environment_dict, mode):
 
 
 @capture_dauphin_error
-def get_stats(graphene_info, run_id):
-    stats = graphene_info.context.instance.get_run_stats(run_id)
+def get_stats(graphene_info, run_id, loader=None):
+    check.opt_inst_param(loader, 'loader', RunsLoader)
+
+    stats = (
+        loader.get_run_stats(run_id)
+        if loader
+        else graphene_info.context.instance.get_run_stats(run_id)
+    )
     return graphene_info.schema.type_named('PipelineRunStatsSnapshot')(stats)
 
 
-def get_step_stats(graphene_info, run_id):
-    step_stats = graphene_info.context.instance.get_run_step_stats(run_id)
+def get_step_stats(graphene_info, run_id, loader=None):
+    check.opt_inst_param(loader, 'loader', RunsLoader)
+
+    step_stats = (
+        loader.get_run_step_stats(run_id)
+        if loader
+        else graphene_info.context.instance.get_run_step_stats(run_id)
+    )
     return [graphene_info.schema.type_named('PipelineRunStepStats')(stats) for stats in step_stats]
+
+
+def get_step_history(graphene_info, pipeline_name, step_key, limit=None):
+    check.str_param(pipeline_name, 'pipeline_name')
+    check.str_param(step_key, 'step_key')
+    check.opt_int_param(limit, 'limit')
+
+    return [
+        graphene_info.schema.type_named('PipelineRunStepStats')(stats)
+        for stats in graphene_info.context.instance.get_step_history(
+            pipeline_name, step_key, limit=limit
+        )
+    ]
+
+
+def get_materialization_history(graphene_info, label, limit=None):
+    from dagster_graphql.schema.runs import from_dagster_event_record
+
+    check.str_param(label, 'label')
+    check.opt_int_param(limit, 'limit')
+
+    return [
+        from_dagster_event_record(graphene_info, event_record, None, None)
+        for event_record in graphene_info.context.instance.get_materialization_history(
+            label, limit=limit
+        )
+    ]
@@ -0,0 +1,70 @@
+from dagster import PipelineRun, check
+from dagster.core.errors import DagsterEventLogInvalidForRun
+from dagster.core.instance import DagsterInstance
+
+
+class RunsLoader(object):
+    '''Loads the data that a batch of runs resolve, e.g. the runs on a page of the runs list.
+
+    The stats and step stats of every run in the batch are fetched with a single call to the
+    instance the first time any of them is resolved, instead of with a call per run. Snapshots are
+    fetched once per snapshot id. A loader is created per batch of runs, so nothing it caches
+    outlives the request that resolves them.
+    '''
+
+    def __init__(self, instance, runs):
+        self._instance = check.inst_param(instance, 'instance', DagsterInstance)
+        self._run_ids = [run.run_id for run in check.list_param(runs, 'runs', of_type=PipelineRun)]
+        self._stats = None
+        self._step_stats = None
+        self._pipeline_snapshots = {}
+        self._execution_plan_snapshots = {}
+
+    def get_run_stats(self, run_id):
+        check.str_param(run_id, 'run_id')
+
+        if self._stats is None:
+            try:
+                self._stats = self._instance.get_runs_stats(self._run_ids)
+            except DagsterEventLogInvalidForRun:
+                # fall back to loading the runs one at a time, so that only the invalid run errors
+                self._stats = {}
+
+        if run_id in self._stats:
+            return self._stats[run_id]
+
+        return self._instance.get_run_stats(run_id)
+
+    def get_run_step_stats(self, run_id):
+        check.str_param(run_id, 'run_id')
+
+        if self._step_stats is None:
+            try:
+                self._step_stats = self._instance.get_runs_step_stats(self._run_ids)
+            except DagsterEventLogInvalidForRun:
+                self._step_stats = {}
+
+        if run_id in self._step_stats:
+            return self._step_stats[run_id]
+
+        return self._instance.get_run_step_stats(run_id)
+
+    def get_pipeline_snapshot(self, pipeline_snapshot_id):
+        check.str_param(pipeline_snapshot_id, 'pipeline_snapshot_id')
+
+        if pipeline_snapshot_id not in self._pipeline_snapshots:
+            self._pipeline_snapshots[pipeline_snapshot_id] = self._instance.get_pipeline_snapshot(
+                pipeline_snapshot_id
+            )
+
+        return self._pipeline_snapshots[pipeline_snapshot_id]
+
+    def get_execution_plan_snapshot(self, execution_plan_snapshot_id):
+        check.str_param(execution_plan_snapshot_id, 'execution_plan_snapshot_id')
+
+        if execution_plan_snapshot_id not in self._execution_plan_snapshots:
+            self._execution_plan_snapshots[
+                execution_plan_snapshot_id
+            ] = self._instance.get_execution_plan_snapshot(execution_plan_snapshot_id)
+
+        return self._execution_plan_snapshots[execution_plan_snapshot_id]
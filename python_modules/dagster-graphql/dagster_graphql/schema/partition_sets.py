@@ -9,7 +9,7 @@ from dagster_graphql.schema.errors import (
 
 from dagster import check
 from dagster.core.definitions.partition import Partition, PartitionSetDefinition
-from dagster.core.storage.pipeline_run import PipelineRunsFilter
+from dagster.core.storage.pipeline_run import PipelineRunStatus, PipelineRunsFilter
 
 
 class DauphinPartition(dauphin.ObjectType):
@@ -23,8 +23,11 @@ class DauphinPartition(dauphin.ObjectType):
     environmentConfigYaml = dauphin.NonNull(dauphin.String)
     tags = dauphin.non_null_list('PipelineTag')
     runs = dauphin.non_null_list('PipelineRun')
+    status = dauphin.Field(
+        'PipelineRunStatus', description='The status of the most recent run of the partition.'
+    )
 
-    def __init__(self, partition, partition_set):
+    def __init__(self, partition, partition_set, status=None):
         self._partition = check.inst_param(partition, 'partition', Partition)
         self._partition_set = check.inst_param(
             partition_set, 'partition_set', PartitionSetDefinition
@@ -35,6 +38,7 @@ class DauphinPartition(dauphin.ObjectType):
             partition_set_name=partition_set.name,
             solid_subset=partition_set.solid_subset,
             mode=partition_set.mode,
+            status=check.opt_inst_param(status, 'status', PipelineRunStatus),
         )
 
     def resolve_environmentConfigYaml(self, _):
@@ -102,10 +106,18 @@ class DauphinPartitionSet(dauphin.ObjectType):
         elif limit:
             partitions = partitions[: min(len(partitions), limit)]
 
+        # the statuses of all of the partitions are fetched in one query, rather than one per
+        # partition
+        run_status_by_partition = graphene_info.context.instance.get_run_status_by_partition(
+            self._partition_set.name
+        )
+
         return graphene_info.schema.type_named('Partitions')(
             results=[
                 graphene_info.schema.type_named('Partition')(
-                    partition=partition, partition_set=self._partition_set
+                    partition=partition,
+                    partition_set=self._partition_set,
+                    status=run_status_by_partition.get(partition.name),
                 )
                 for partition in partitions
             ]
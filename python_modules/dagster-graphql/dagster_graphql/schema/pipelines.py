@@ -188,12 +188,14 @@ class DauphinPipeline(DauphinIPipelineSnapshotMixin, dauphin.ObjectType):
         ]
 
     def resolve_runs(self, graphene_info):
-        return [
-            graphene_info.schema.type_named('PipelineRun')(r)
-            for r in graphene_info.context.instance.get_runs(
+        from dagster_graphql.implementation.fetch_runs import get_dauphin_runs
+
+        return get_dauphin_runs(
+            graphene_info,
+            graphene_info.context.instance.get_runs(
                 filters=PipelineRunsFilter(pipeline_name=self.get_pipeline_index().name)
-            )
-        ]
+            ),
+        )
 
     @staticmethod
     def from_pipeline_def(pipeline_definition):
@@ -37,9 +37,11 @@ from dagster_graphql.implementation.fetch_pipelines import (
 )
 from dagster_graphql.implementation.fetch_runs import (
     get_execution_plan,
+    get_materialization_history,
     get_run_by_id,
     get_run_tags,
     get_runs,
+    get_step_history,
     validate_pipeline_config,
 )
 from dagster_graphql.implementation.fetch_schedules import (
@@ -115,6 +117,21 @@ class DauphinQuery(dauphin.ObjectType):
 
     pipelineRunTags = dauphin.non_null_list('PipelineTagAndValues')
 
+    stepHistory = dauphin.Field(
+        dauphin.non_null_list('PipelineRunStepStats'),
+        pipelineName=dauphin.NonNull(dauphin.String),
+        stepKey=dauphin.NonNull(dauphin.String),
+        limit=dauphin.Int(),
+        description='The stats of a step in the most recent runs of a pipeline, most recent '
+        'first. limit is the number of runs to look at.',
+    )
+    materializationHistory = dauphin.Field(
+        dauphin.non_null_list('StepMaterializationEvent'),
+        label=dauphin.NonNull(dauphin.String),
+        limit=dauphin.Int(),
+        description='The materializations with a label in all runs, most recent first.',
+    )
+
     usedSolids = dauphin.Field(dauphin.non_null_list('UsedSolid'))
     usedSolid = dauphin.Field('UsedSolid', name=dauphin.NonNull(dauphin.String))
 
@@ -218,6 +235,12 @@ class DauphinQuery(dauphin.ObjectType):
     def resolve_pipelineRunTags(self, graphene_info):
         return get_run_tags(graphene_info)
 
+    def resolve_stepHistory(self, graphene_info, pipelineName, stepKey, **kwargs):
+        return get_step_history(graphene_info, pipelineName, stepKey, kwargs.get('limit'))
+
+    def resolve_materializationHistory(self, graphene_info, label, **kwargs):
+        return get_materialization_history(graphene_info, label, kwargs.get('limit'))
+
     def resolve_usedSolid(self, graphene_info, name):
         return get_solid(graphene_info, name)
 
@@ -14,6 +14,7 @@ from dagster_graphql.implementation.fetch_runs import (
     get_step_stats,
     is_config_valid,
 )
+from dagster_graphql.implementation.loader import RunsLoader
 
 from dagster import PipelineRun, check, seven
 from dagster.core.definitions.events import (
@@ -29,7 +30,7 @@ from dagster.core.definitions.pipeline import ExecutionSelector
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventRecord
 from dagster.core.execution.api import create_execution_plan
-from dagster.core.execution.plan.objects import StepFailureData
+from dagster.core.execution.plan.objects import StepFailureData, StepResourceUsage
 from dagster.core.execution.stats import RunStepKeyStatsSnapshot, StepEventStatus
 from dagster.core.snap.execution_plan_snapshot import ExecutionPlanIndex
 from dagster.core.snap.pipeline_snapshot import PipelineIndex
@@ -79,6 +80,26 @@ class DauphinPipelineRunStatsOrError(dauphin.Union):
         types = ('PipelineRunStatsSnapshot', 'PythonError')
 
 
+class DauphinStepResourceUsage(dauphin.ObjectType):
+    class Meta(object):
+        name = 'StepResourceUsage'
+
+    cpuSeconds = dauphin.NonNull(dauphin.Float)
+    # byte counts can exceed the 32 bit range of GraphQL Ints
+    maxRssBytes = dauphin.NonNull(dauphin.Float)
+    readBytes = dauphin.NonNull(dauphin.Float)
+    writeBytes = dauphin.NonNull(dauphin.Float)
+
+    def __init__(self, resource_usage):
+        check.inst_param(resource_usage, 'resource_usage', StepResourceUsage)
+        super(DauphinStepResourceUsage, self).__init__(
+            cpuSeconds=resource_usage.cpu_seconds,
+            maxRssBytes=resource_usage.max_rss_bytes,
+            readBytes=resource_usage.read_bytes,
+            writeBytes=resource_usage.write_bytes,
+        )
+
+
 class DauphinPipelineRunStepStats(dauphin.ObjectType):
     class Meta(object):
         name = 'PipelineRunStepStats'
@@ -90,6 +111,7 @@ class DauphinPipelineRunStepStats(dauphin.ObjectType):
     endTime = dauphin.Field(dauphin.Float)
     materializations = dauphin.non_null_list('Materialization')
     expectationResults = dauphin.non_null_list('ExpectationResult')
+    resourceUsage = dauphin.Field('StepResourceUsage')
 
     def __init__(self, stats):
         self._stats = check.inst_param(stats, 'stats', RunStepKeyStatsSnapshot)
@@ -101,6 +123,9 @@ class DauphinPipelineRunStepStats(dauphin.ObjectType):
             endTime=stats.end_time,
             materializations=stats.materializations,
             expectationResults=stats.expectation_results,
+            resourceUsage=DauphinStepResourceUsage(stats.resource_usage)
+            if stats.resource_usage
+            else None,
         )
 
 
@@ -133,11 +158,17 @@ class DauphinPipelineRun(dauphin.ObjectType):
     canCancel = dauphin.NonNull(dauphin.Boolean)
     executionSelection = dauphin.NonNull('ExecutionSelection')
 
-    def __init__(self, pipeline_run):
+    def __init__(self, pipeline_run, loader=None):
         super(DauphinPipelineRun, self).__init__(
             runId=pipeline_run.run_id, status=pipeline_run.status, mode=pipeline_run.mode
         )
         self._pipeline_run = check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        self._loader = check.opt_inst_param(loader, 'loader', RunsLoader)
+
+    def _get_loader(self, graphene_info):
+        if self._loader is None:
+            self._loader = RunsLoader(graphene_info.context.instance, [self._pipeline_run])
+        return self._loader
 
     def resolve_pipeline(self, graphene_info):
         return get_pipeline_reference_or_raise(graphene_info, self._pipeline_run.selector)
@@ -149,10 +180,10 @@ class DauphinPipelineRun(dauphin.ObjectType):
         return graphene_info.schema.type_named('LogMessageConnection')(self._pipeline_run)
 
     def resolve_stats(self, graphene_info):
-        return get_stats(graphene_info, self.run_id)
+        return get_stats(graphene_info, self.run_id, self._get_loader(graphene_info))
 
     def resolve_stepStats(self, graphene_info):
-        return get_step_stats(graphene_info, self.run_id)
+        return get_step_stats(graphene_info, self.run_id, self._get_loader(graphene_info))
 
     def resolve_computeLogs(self, graphene_info, stepKey):
         return graphene_info.schema.type_named('ComputeLogs')(runId=self.run_id, stepKey=stepKey)
@@ -164,11 +195,11 @@ class DauphinPipelineRun(dauphin.ObjectType):
         ):
             from .execution import DauphinExecutionPlan
 
-            instance = graphene_info.context.instance
-            execution_plan_snapshot = instance.get_execution_plan_snapshot(
+            loader = self._get_loader(graphene_info)
+            execution_plan_snapshot = loader.get_execution_plan_snapshot(
                 self._pipeline_run.execution_plan_snapshot_id
             )
-            pipeline_snapshot = instance.get_pipeline_snapshot(
+            pipeline_snapshot = loader.get_pipeline_snapshot(
                 self._pipeline_run.pipeline_snapshot_id
             )
             return (
@@ -339,6 +370,30 @@ class DauphinLogMessageConnection(dauphin.ObjectType):
 
     def __init__(self, pipeline_run):
         self._pipeline_run = check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        # shared by the fields of the connection, so that the logs are fetched once per request
+        self._logs = None
+
+    def _get_logs(self, graphene_info):
+        if self._logs is None:
+            self._logs = graphene_info.context.instance.all_logs(self._pipeline_run.run_id)
+        return self._logs
+
+    def _get_execution_plan_index(self, graphene_info, pipeline_def):
+        if self._pipeline_run.execution_plan_snapshot_id:
+            return graphene_info.context.get_execution_plan_index(
+                self._pipeline_run.execution_plan_snapshot_id
+            )
+
+        # runs created before execution plan snapshots were stored
+        execution_plan = create_execution_plan(
+            pipeline_def,
+            self._pipeline_run.environment_dict,
+            mode=self._pipeline_run.mode,
+            step_keys_to_execute=self._pipeline_run.step_keys_to_execute,
+        )
+        return ExecutionPlanIndex.from_plan_and_index(
+            execution_plan, pipeline_def.get_pipeline_index()
+        )
 
     def resolve_nodes(self, graphene_info):
 
@@ -348,27 +403,22 @@ class DauphinLogMessageConnection(dauphin.ObjectType):
             pipeline_def = get_pipeline_def_from_selector(
                 graphene_info, self._pipeline_run.selector
             )
-            execution_plan = create_execution_plan(
-                pipeline_def,
-                self._pipeline_run.environment_dict,
-                mode=self._pipeline_run.mode,
-                step_keys_to_execute=self._pipeline_run.step_keys_to_execute,
-            )
-            execution_plan_index = ExecutionPlanIndex.from_plan_and_index(
-                execution_plan, pipeline_def.get_pipeline_index()
-            )
+            execution_plan_index = self._get_execution_plan_index(graphene_info, pipeline_def)
         else:
             pipeline = None
-            execution_plan = None
             execution_plan_index = None
 
         return [
             from_event_record(graphene_info, log, pipeline, execution_plan_index)
-            for log in graphene_info.context.instance.all_logs(self._pipeline_run.run_id)
+            for log in self._get_logs(graphene_info)
         ]
 
     def resolve_pageInfo(self, graphene_info):
-        count = len(graphene_info.context.instance.all_logs(self._pipeline_run.run_id))
+        count = (
+            len(self._logs)
+            if self._logs is not None
+            else graphene_info.context.instance.logs_count(self._pipeline_run.run_id)
+        )
         lastCursor = None
         if count > 0:
             lastCursor = str(count - 1)
@@ -4,6 +4,7 @@ import os
 
 import yaml
 from dagster_graphql import dauphin
+from dagster_graphql.implementation.fetch_runs import get_dauphin_runs
 from dagster_graphql.implementation.fetch_schedules import (
     get_dagster_schedule_def,
     get_schedule_attempt_filenames,
@@ -327,12 +328,12 @@ class DauphinRunningSchedule(dauphin.ObjectType):
         return len(ticks)
 
     def resolve_runs(self, graphene_info, **kwargs):
-        return [
-            graphene_info.schema.type_named('PipelineRun')(r)
-            for r in graphene_info.context.instance.get_runs(
+        return get_dauphin_runs(
+            graphene_info,
+            graphene_info.context.instance.get_runs(
                 filters=PipelineRunsFilter.for_schedule(self._schedule), limit=kwargs.get('limit'),
-            )
-        ]
+            ),
+        )
 
     def resolve_runs_count(self, graphene_info):
         return graphene_info.context.instance.get_runs_count(
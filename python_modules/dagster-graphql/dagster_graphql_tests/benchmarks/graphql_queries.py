@@ -0,0 +1,125 @@
+'''Benchmarks of the GraphQL queries dagit issues to render pipelines and runs. Run them with the
+benchmark runner of dagster:
+
+    python -m dagster_tests.benchmarks.runner \\
+        --module dagster_graphql_tests.benchmarks.graphql_queries
+'''
+from dagster_graphql.test.utils import define_context_for_file, execute_dagster_graphql
+
+from dagster import RepositoryDefinition, execute_pipeline
+from dagster.core.instance import DagsterInstance
+from dagster.utils.test.benchmarks import benchmark
+from dagster.utils.test.synthetic_pipelines import (
+    define_synthetic_pipeline,
+    synthetic_environment_dict,
+)
+
+SHAPES = {
+    'wide': (100, 1, 1),
+    'deep': (1, 100, 1),
+    'fan_in': (20, 5, 20),
+}
+
+PIPELINE_QUERY = '''
+query PipelineQuery($name: String!) {
+  pipelineOrError(params: { name: $name }) {
+    __typename
+    ... on Pipeline {
+      name
+      solids {
+        name
+        inputs {
+          definition { name type { name } }
+          dependsOn { definition { name } solid { name } }
+        }
+        outputs {
+          definition { name type { name } }
+        }
+      }
+    }
+  }
+}
+'''
+
+EXECUTION_PLAN_QUERY = '''
+query ExecutionPlanQuery($pipeline: ExecutionSelector!, $environmentConfigData: EnvironmentConfigData, $mode: String!) {
+  executionPlan(pipeline: $pipeline, environmentConfigData: $environmentConfigData, mode: $mode) {
+    __typename
+    ... on ExecutionPlan {
+      steps {
+        key
+        inputs { name dependsOn { key } }
+        outputs { name }
+      }
+    }
+  }
+}
+'''
+
+RUNS_QUERY = '''
+query RunsQuery($limit: Int) {
+  pipelineRunsOrError(limit: $limit) {
+    __typename
+    ... on PipelineRuns {
+      results {
+        runId
+        status
+        stats {
+          ... on PipelineRunStatsSnapshot {
+            stepsSucceeded
+            stepsFailed
+            materializations
+            startTime
+            endTime
+          }
+        }
+      }
+    }
+  }
+}
+'''
+
+
+def define_benchmark_repository():
+    return RepositoryDefinition(
+        name='benchmarks',
+        pipeline_defs=[
+            define_synthetic_pipeline(*shape, name=name) for name, shape in SHAPES.items()
+        ],
+    )
+
+
+def _execute_query(context, query, variables):
+    result = execute_dagster_graphql(context, query, variables)
+    assert not result.errors, result.errors
+    return result
+
+
+@benchmark(params=[dict(shape=shape) for shape in sorted(SHAPES)])
+def graphql_pipeline(shape):
+    context = define_context_for_file(__file__, 'define_benchmark_repository')
+    yield lambda: _execute_query(context, PIPELINE_QUERY, {'name': shape})
+
+
+@benchmark(params=[dict(shape=shape) for shape in sorted(SHAPES)])
+def graphql_execution_plan(shape):
+    width, depth, _ = SHAPES[shape]
+    context = define_context_for_file(__file__, 'define_benchmark_repository')
+    variables = {
+        'pipeline': {'name': shape},
+        'environmentConfigData': synthetic_environment_dict(width, depth),
+        'mode': 'default',
+    }
+    yield lambda: _execute_query(context, EXECUTION_PLAN_QUERY, variables)
+
+
+@benchmark(params=[dict(runs=50, limit=20)])
+def graphql_runs(runs, limit):
+    instance = DagsterInstance.ephemeral()
+    pipeline_def = define_synthetic_pipeline(*SHAPES['wide'], name='wide')
+    environment_dict = {'loggers': {'console': {'config': {'log_level': 'CRITICAL'}}}}
+    for _ in range(runs):
+        execute_pipeline(pipeline_def, environment_dict=environment_dict, instance=instance)
+
+    context = define_context_for_file(__file__, 'define_benchmark_repository', instance)
+    yield lambda: _execute_query(context, RUNS_QUERY, {'limit': limit})
@@ -0,0 +1,93 @@
+'''Benchmarks of the per-step overhead of the workers of the dask engine and the airflow python
+operator, which used to execute every step through the executePlan GraphQL mutation. Run them with
+the benchmark runner of dagster:
+
+    python -m dagster_tests.benchmarks.runner \\
+        --module dagster_graphql_tests.benchmarks.step_execution
+'''
+from dagster_graphql.client.mutations import execute_execute_plan_mutation
+from dagster_graphql.client.util import construct_variables
+
+from dagster import ExecutionTargetHandle, InputDefinition, Int, lambda_solid, pipeline, seven
+from dagster.core.execution.worker import execute_run_steps
+from dagster.core.instance import DagsterInstance
+from dagster.serdes import deserialize_json_to_dagster_namedtuple
+from dagster.utils.test.benchmarks import benchmark
+
+NUM_STEPS = 10
+
+STEP_KEYS = ['emit_one.compute'] + [
+    'add_one_{}.compute'.format(idx) for idx in range(NUM_STEPS - 1)
+]
+
+ENVIRONMENT_DICT = {
+    'storage': {'filesystem': {}},
+    # the console logger would otherwise dominate the time taken to execute the steps
+    'loggers': {'console': {'config': {'log_level': 'CRITICAL'}}},
+}
+
+
+@lambda_solid
+def emit_one():
+    return 1
+
+
+@lambda_solid(input_defs=[InputDefinition('num', Int)])
+def add_one(num):
+    return num + 1
+
+
+@pipeline
+def chain_pipeline():
+    num = emit_one()
+    for idx in range(NUM_STEPS - 1):
+        num = add_one.alias('add_one_{}'.format(idx))(num)
+
+
+def define_chain_pipeline():
+    return chain_pipeline
+
+
+def define_chain_pipeline_handle():
+    return ExecutionTargetHandle.for_pipeline_python_file(__file__, 'define_chain_pipeline')
+
+
+def execute_steps_through_graphql(handle, instance, run_id, step_keys):
+    for step_key in step_keys:
+        execute_execute_plan_mutation(
+            handle,
+            construct_variables('default', ENVIRONMENT_DICT, 'chain_pipeline', run_id, [step_key]),
+            instance_ref=instance.get_ref(),
+        )
+
+
+def execute_steps_directly(handle, instance, run_id, step_keys):
+    for step_key in step_keys:
+        for serialized_event in execute_run_steps(handle, instance, run_id, [step_key]):
+            deserialize_json_to_dagster_namedtuple(serialized_event)
+
+
+def execute_chain_run(execute_steps_fn, handle, instance):
+    '''Execute the steps of a new run of the chain pipeline one at a time, the way the workers do.
+
+    Returns:
+        str: The id of the run.
+    '''
+    pipeline_run = instance.create_run_for_pipeline(
+        chain_pipeline, environment_dict=ENVIRONMENT_DICT
+    )
+    execute_steps_fn(handle, instance, pipeline_run.run_id, STEP_KEYS)
+    return pipeline_run.run_id
+
+
+@benchmark(params=[dict(path='graphql'), dict(path='direct')])
+def execute_worker_steps(path):
+    execute_steps_fn = {
+        'graphql': execute_steps_through_graphql,
+        'direct': execute_steps_directly,
+    }[path]
+    handle = define_chain_pipeline_handle()
+
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        yield lambda: execute_chain_run(execute_steps_fn, handle, instance)
@@ -0,0 +1,38 @@
+from dagster_graphql_tests.benchmarks.step_execution import (
+    NUM_STEPS,
+    define_chain_pipeline_handle,
+    execute_chain_run,
+    execute_steps_directly,
+    execute_steps_through_graphql,
+)
+
+from dagster import seven
+from dagster.core.instance import DagsterInstance
+
+
+def _step_event_types(instance, run_id):
+    return sorted(
+        (record.dagster_event.step_key, record.dagster_event.event_type_value)
+        for record in instance.all_logs(run_id)
+        if record.is_dagster_event and record.dagster_event.step_key
+    )
+
+
+def test_direct_step_execution_matches_graphql():
+    '''The workers of the dask engine and the airflow python operator execute steps directly
+    rather than through the executePlan GraphQL mutation. The per-step overhead of each path is
+    measured by the execute_worker_steps benchmark.'''
+    handle = define_chain_pipeline_handle()
+
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+
+        graphql_run_id = execute_chain_run(execute_steps_through_graphql, handle, instance)
+        direct_run_id = execute_chain_run(execute_steps_directly, handle, instance)
+
+        for run_id in [graphql_run_id, direct_run_id]:
+            assert instance.get_run_stats(run_id).steps_succeeded == NUM_STEPS
+
+        assert _step_event_types(instance, direct_run_id) == _step_event_types(
+            instance, graphql_run_id
+        )
@@ -16,7 +16,7 @@ snapshots['TestPipelineSnapshotGraphQL.test_fetch_snapshot_success[create_epheme
       }
     ],
     "name": "noop_pipeline",
-    "pipelineSnapshotId": "88528edde2ed64da3c39cca0da8ba2f7586c1a5d",
+    "pipelineSnapshotId": "cc590a1fd3a666fa2faf5da633fbe255e8c19fb7",
     "runtimeTypes": [
       {
         "key": "Any"
@@ -64,7 +64,7 @@ snapshots['TestPipelineSnapshotGraphQL.test_fetch_snapshot_success[create_local_
       }
     ],
     "name": "noop_pipeline",
-    "pipelineSnapshotId": "88528edde2ed64da3c39cca0da8ba2f7586c1a5d",
+    "pipelineSnapshotId": "cc590a1fd3a666fa2faf5da633fbe255e8c19fb7",
     "runtimeTypes": [
       {
         "key": "Any"
@@ -112,7 +112,7 @@ snapshots['TestPipelineSnapshotGraphQL.test_fetch_snapshot_or_error_by_snapshot_
       }
     ],
     "name": "noop_pipeline",
-    "pipelineSnapshotId": "88528edde2ed64da3c39cca0da8ba2f7586c1a5d",
+    "pipelineSnapshotId": "cc590a1fd3a666fa2faf5da633fbe255e8c19fb7",
     "runtimeTypes": [
       {
         "key": "Any"
@@ -160,7 +160,7 @@ snapshots['TestPipelineSnapshotGraphQL.test_fetch_snapshot_or_error_by_snapshot_
       }
     ],
     "name": "noop_pipeline",
-    "pipelineSnapshotId": "88528edde2ed64da3c39cca0da8ba2f7586c1a5d",
+    "pipelineSnapshotId": "cc590a1fd3a666fa2faf5da633fbe255e8c19fb7",
     "runtimeTypes": [
       {
         "key": "Any"
@@ -222,7 +222,7 @@ snapshots['TestPipelineSnapshotGraphQL.test_fetch_snapshot_or_error_by_active_pi
       }
     ],
     "name": "csv_hello_world",
-    "pipelineSnapshotId": "c5f9b33924f0843bb005d31e8a44a747b5731891",
+    "pipelineSnapshotId": "cc18f36a955dfb9775e5a6e29893dbc7ada1c340",
     "runtimeTypes": [
       {
         "key": "Any"
@@ -279,7 +279,7 @@ snapshots['TestPipelineSnapshotGraphQL.test_fetch_snapshot_or_error_by_active_pi
       }
     ],
     "name": "csv_hello_world",
-    "pipelineSnapshotId": "c5f9b33924f0843bb005d31e8a44a747b5731891",
+    "pipelineSnapshotId": "cc18f36a955dfb9775e5a6e29893dbc7ada1c340",
     "runtimeTypes": [
       {
         "key": "Any"
@@ -1,6 +1,12 @@
 import re
 from copy import deepcopy
 
+from dagster_graphql.test.utils import execute_dagster_graphql
+
+from dagster import execute_pipeline, seven
+from dagster.core.instance import DagsterInstance
+
+from .setup import define_repository, define_test_context
 from .test_expectations import sanitize as sanitize_gql
 from .utils import sync_execute_get_events
 
@@ -66,3 +72,37 @@ def test_materializations(snapshot):
     assert text_entry['name']
 
     snapshot.assert_match(logs)
+
+
+MATERIALIZATION_HISTORY_QUERY = '''
+query MaterializationHistoryQuery($label: String!, $limit: Int) {
+  materializationHistory(label: $label, limit: $limit) {
+    runId
+    materialization {
+      label
+    }
+  }
+}
+'''
+
+
+def test_materialization_history():
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        run_ids = [
+            execute_pipeline(
+                define_repository().get_pipeline('materialization_pipeline'), instance=instance
+            ).run_id
+            for _ in range(3)
+        ]
+
+        result = execute_dagster_graphql(
+            define_test_context(instance),
+            MATERIALIZATION_HISTORY_QUERY,
+            variables={'label': 'all_types', 'limit': 2},
+        )
+
+        assert result.data['materializationHistory'] == [
+            {'runId': run_id, 'materialization': {'label': 'all_types'}}
+            for run_id in reversed(run_ids[1:])
+        ]
@@ -1,5 +1,8 @@
 from dagster_graphql.test.utils import define_context_for_repository_yaml, execute_dagster_graphql
 
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
+from dagster.core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
 from dagster.utils import file_relative_path
 
 GET_PARTITION_SETS_QUERY = '''
@@ -110,3 +113,50 @@ def test_get_partition_set(snapshot):
 
     assert invalid_partition_set_result.data
     snapshot.assert_match(invalid_partition_set_result.data)
+
+
+GET_PARTITION_STATUSES_QUERY = '''
+    query PartitionStatusesQuery($partitionSetName: String!) {
+        partitionSetOrError(partitionSetName: $partitionSetName) {
+            ...on PartitionSet {
+                partitions {
+                    results {
+                        name
+                        status
+                    }
+                }
+            }
+        }
+    }
+'''
+
+
+def test_get_partition_statuses():
+    instance = DagsterInstance.ephemeral()
+    for partition_name, status in [
+        ('0', PipelineRunStatus.FAILURE),
+        ('0', PipelineRunStatus.SUCCESS),
+        ('1', PipelineRunStatus.SUCCESS),
+        ('1', PipelineRunStatus.FAILURE),
+    ]:
+        instance.add_run(
+            PipelineRun(
+                pipeline_name='no_config_pipeline',
+                status=status,
+                tags={PARTITION_SET_TAG: 'integer_partition', PARTITION_NAME_TAG: partition_name},
+            )
+        )
+
+    context = define_context_for_repository_yaml(
+        path=file_relative_path(__file__, '../repository.yaml'), instance=instance
+    )
+    result = execute_dagster_graphql(
+        context, GET_PARTITION_STATUSES_QUERY, variables={'partitionSetName': 'integer_partition'},
+    )
+
+    partitions = result.data['partitionSetOrError']['partitions']['results']
+    assert partitions[:3] == [
+        {'name': '0', 'status': 'SUCCESS'},
+        {'name': '1', 'status': 'FAILURE'},
+        {'name': '2', 'status': None},
+    ]
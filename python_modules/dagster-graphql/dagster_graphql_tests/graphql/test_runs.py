@@ -1,9 +1,15 @@
 import copy
+import threading
+from contextlib import contextmanager
 
+import sqlalchemy as db
+from dagster_graphql.implementation.context import ExecutionPlanIndexCache
 from dagster_graphql.test.utils import define_context_for_file, execute_dagster_graphql
+from sqlalchemy.engine import Engine
 
-from dagster import RepositoryDefinition, execute_pipeline, lambda_solid, pipeline
+from dagster import RepositoryDefinition, execute_pipeline, lambda_solid, pipeline, seven
 from dagster.core.instance import DagsterInstance
+from dagster.seven import mock
 
 RUNS_QUERY = '''
 query PipelineRunsRootQuery($name: String!) {
@@ -307,3 +313,222 @@ def test_runs_over_time():
         'name': 'evolving_pipeline',
         'solidSubset': ['solid_B'],
     }
+
+
+RUN_LOGS_QUERY = '''
+query RunLogsQuery($runId: ID!) {
+  pipelineRunOrError(runId: $runId) {
+    ... on PipelineRun {
+      logs {
+        nodes {
+          __typename
+          ... on ExecutionStepSuccessEvent {
+            step { key }
+          }
+        }
+        pageInfo {
+          count
+          lastCursor
+        }
+      }
+    }
+  }
+}
+'''
+
+
+def test_run_logs_use_execution_plan_snapshot():
+    instance = DagsterInstance.local_temp()
+    repo = get_repo_at_time_1()
+    run_id = execute_pipeline(repo.get_pipeline('evolving_pipeline'), instance=instance).run_id
+    execution_plan_snapshot_id = instance.get_run_by_id(run_id).execution_plan_snapshot_id
+    assert execution_plan_snapshot_id
+
+    context = define_context_for_file(__file__, 'get_repo_at_time_1', instance)
+
+    result = execute_dagster_graphql(context, RUN_LOGS_QUERY, variables={'runId': run_id})
+    logs = result.data['pipelineRunOrError']['logs']
+    assert [
+        node['step']['key']
+        for node in logs['nodes']
+        if node['__typename'] == 'ExecutionStepSuccessEvent'
+    ] == ['solid_A.compute', 'solid_B.compute']
+    assert logs['pageInfo']['count'] == len(logs['nodes']) == len(instance.all_logs(run_id))
+
+    # the index of the execution plan snapshot is cached on the context
+    execution_plan_index = context.get_execution_plan_index(execution_plan_snapshot_id)
+    result = execute_dagster_graphql(context, RUN_LOGS_QUERY, variables={'runId': run_id})
+    assert result.data['pipelineRunOrError']['logs'] == logs
+    assert context.get_execution_plan_index(execution_plan_snapshot_id) is execution_plan_index
+
+
+def test_execution_plan_index_cache_is_thread_safe():
+    instance = DagsterInstance.local_temp()
+    repo = get_repo_at_time_1()
+    # the number of steps of the execution plan of each snapshot, by snapshot id
+    step_counts = {
+        instance.get_run_by_id(
+            execute_pipeline(repo.get_pipeline(pipeline_name), instance=instance).run_id
+        ).execution_plan_snapshot_id: step_count
+        for pipeline_name, step_count in [('evolving_pipeline', 2), ('foo_pipeline', 1)]
+    }
+    snapshot_ids = sorted(step_counts.keys())
+
+    # smaller than the number of snapshots, so that threads also race on eviction
+    cache = ExecutionPlanIndexCache(instance, max_size=1)
+    errors = []
+
+    def _get_indices(offset):
+        try:
+            for idx in range(50):
+                snapshot_id = snapshot_ids[(idx + offset) % len(snapshot_ids)]
+                execution_plan_index = cache.get(snapshot_id)
+                assert len(execution_plan_index.execution_plan_snapshot.steps) == (
+                    step_counts[snapshot_id]
+                )
+        except Exception as exc:  # pylint: disable=broad-except
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_get_indices, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+
+RUNS_STATS_QUERY = '''
+{
+  pipelineRunsOrError {
+    ... on PipelineRuns {
+      results {
+        runId
+        stats {
+          ... on PipelineRunStatsSnapshot {
+            stepsSucceeded
+          }
+        }
+        stepStats {
+          stepKey
+          status
+          resourceUsage {
+            cpuSeconds
+            maxRssBytes
+          }
+        }
+        executionPlan {
+          steps {
+            key
+          }
+        }
+        tags {
+          key
+          value
+        }
+        canCancel
+      }
+    }
+  }
+}
+'''
+
+
+def test_runs_stats_are_batched():
+    with seven.TemporaryDirectory() as temp_dir:
+        _test_runs_stats_are_batched(DagsterInstance.local_temp(temp_dir))
+
+
+@contextmanager
+def _event_log_queries():
+    '''Record the SQL statements executed against the event log by any engine.'''
+    statements = []
+
+    def _before_cursor_execute(_conn, _cursor, statement, *_args):
+        if 'event_logs' in statement:
+            statements.append(statement)
+
+    db.event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        db.event.remove(Engine, 'before_cursor_execute', _before_cursor_execute)
+
+
+def _test_runs_stats_are_batched(instance):
+    repo = get_repo_at_time_1()
+    context = define_context_for_file(__file__, 'get_repo_at_time_1', instance)
+
+    statement_counts = []
+    run_ids = []
+    for n_runs in [2, 6]:
+        while len(run_ids) < n_runs:
+            run_ids.append(
+                execute_pipeline(repo.get_pipeline('evolving_pipeline'), instance=instance).run_id
+            )
+
+        with _event_log_queries() as statements, mock.patch.object(
+            instance, 'get_execution_plan_snapshot', wraps=instance.get_execution_plan_snapshot
+        ) as get_execution_plan_snapshot:
+            result = execute_dagster_graphql(context, RUNS_STATS_QUERY)
+            # the shared snapshot of the runs is fetched once
+            assert get_execution_plan_snapshot.call_count == 1
+
+        statement_counts.append(len(statements))
+
+        runs = result.data['pipelineRunsOrError']['results']
+        assert {run['runId'] for run in runs} == set(run_ids)
+        for run in runs:
+            assert run['stats']['stepsSucceeded'] == 2
+            assert [step_stats['stepKey'] for step_stats in run['stepStats']] == [
+                step_stats.step_key for step_stats in instance.get_run_step_stats(run['runId'])
+            ]
+            for step_stats in run['stepStats']:
+                assert step_stats['resourceUsage']['cpuSeconds'] >= 0
+                assert step_stats['resourceUsage']['maxRssBytes'] > 0
+            assert [step['key'] for step in run['executionPlan']['steps']] == [
+                'solid_A.compute',
+                'solid_B.compute',
+            ]
+
+    # the event log is queried for the stats of the whole page at once, not once per run
+    assert statement_counts[0] > 0
+    assert statement_counts[0] == statement_counts[1]
+
+
+STEP_HISTORY_QUERY = '''
+query StepHistoryQuery($pipelineName: String!, $stepKey: String!, $limit: Int) {
+  stepHistory(pipelineName: $pipelineName, stepKey: $stepKey, limit: $limit) {
+    runId
+    stepKey
+    status
+  }
+}
+'''
+
+
+def test_step_history():
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        repo = get_repo_at_time_1()
+        run_ids = [
+            execute_pipeline(repo.get_pipeline('evolving_pipeline'), instance=instance).run_id
+            for _ in range(3)
+        ]
+        execute_pipeline(repo.get_pipeline('foo_pipeline'), instance=instance)
+
+        context = define_context_for_file(__file__, 'get_repo_at_time_1', instance)
+        result = execute_dagster_graphql(
+            context,
+            STEP_HISTORY_QUERY,
+            variables={
+                'pipelineName': 'evolving_pipeline',
+                'stepKey': 'solid_A.compute',
+                'limit': 2,
+            },
+        )
+
+        assert result.data['stepHistory'] == [
+            {'runId': run_id, 'stepKey': 'solid_A.compute', 'status': 'SUCCESS'}
+            for run_id in reversed(run_ids[1:])
+        ]
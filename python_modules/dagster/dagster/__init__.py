@@ -115,6 +115,7 @@ from dagster.core.types.marshal import SerializationStrategy
 from dagster.core.types.python_dict import Dict
 from dagster.core.types.python_set import Set
 from dagster.core.types.python_tuple import Tuple
+from dagster.core.types.type_check_policy import TypeCheckPolicy
 from dagster.utils import file_relative_path
 from dagster.utils.test import (
     check_dagster_type,
@@ -242,6 +243,7 @@ __all__ = [
     'String',
     'Tuple',
     'TypeCheck',
+    'TypeCheckPolicy',
     'input_hydration_config',
     'output_materialization_config',
     # type creation
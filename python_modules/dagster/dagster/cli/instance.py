@@ -3,13 +3,17 @@ import os
 import click
 
 from dagster import check
-from dagster.core.instance import DagsterInstance
+from dagster.core.instance import DEFAULT_PURGE_BATCH_SIZE, DagsterInstance
+
+SECONDS_PER_DAY = 24 * 60 * 60
 
 
 def create_instance_cli_group():
     group = click.Group(name='instance')
     group.add_command(info_command)
     group.add_command(migrate_command)
+    group.add_command(consolidate_event_logs_command)
+    group.add_command(purge_command)
     return group
 
 
@@ -51,4 +55,116 @@ def migrate_command():
     click.echo(instance.info_str())
 
 
+@click.command(
+    name='consolidate-event-logs',
+    help=(
+        'Copy the event logs of runs from the per-run SQLite databases in SOURCE_DIR into the '
+        'single SQLite database of the event log storage of the current instance.'
+    ),
+)
+@click.argument('source_dir', type=click.Path(exists=True, file_okay=False))
+def consolidate_event_logs_command(source_dir):
+    from dagster.core.storage.event_log import (
+        ConsolidatedSqliteEventLogStorage,
+        SqliteEventLogStorage,
+    )
+    from dagster.core.storage.event_log.migration import consolidate_sqlite_event_logs
+
+    instance = DagsterInstance.get()
+    event_log_storage = instance._event_storage  # pylint: disable=protected-access
+    if not isinstance(event_log_storage, ConsolidatedSqliteEventLogStorage):
+        raise click.UsageError(
+            'The event log storage of the instance must be a ConsolidatedSqliteEventLogStorage to '
+            'consolidate event logs into, found {klass}.'.format(
+                klass=type(event_log_storage).__name__
+            )
+        )
+
+    run_ids = consolidate_sqlite_event_logs(SqliteEventLogStorage(source_dir), event_log_storage)
+    click.echo('Copied the event logs of {n_runs} runs.'.format(n_runs=len(run_ids)))
+
+
+@click.command(
+    name='purge',
+    help=(
+        'Delete the runs of the current instance that finished more than --older-than-days ago, '
+        'with their events, compute logs and the intermediates stored under the instance '
+        'directory.'
+    ),
+)
+@click.option(
+    '--older-than-days',
+    type=click.FLOAT,
+    required=True,
+    help='Purge runs that finished more than this many days ago.',
+)
+@click.option(
+    '--status',
+    type=click.Choice(['SUCCESS', 'FAILURE']),
+    multiple=True,
+    help='Only purge runs with this status. Can be passed more than once. (default: both)',
+)
+@click.option('--pipeline', help='Only purge runs of this pipeline.')
+@click.option(
+    '--tag',
+    multiple=True,
+    help='Only purge runs with this tag, given as KEY=VALUE. Can be passed more than once.',
+)
+@click.option(
+    '--batch-size',
+    type=click.INT,
+    default=DEFAULT_PURGE_BATCH_SIZE,
+    help='The number of runs to delete at once.',
+)
+@click.option('--dry-run', is_flag=True, help='List the runs to purge without deleting them.')
+@click.option('--yes', is_flag=True, help='Purge without asking for confirmation.')
+def purge_command(older_than_days, status, pipeline, tag, batch_size, dry_run, yes):
+    from dagster.core.storage.pipeline_run import PipelineRunStatus
+
+    tags = {}
+    for key_value in tag:
+        if '=' not in key_value:
+            raise click.UsageError(
+                'Tags must be given as KEY=VALUE, found "{tag}".'.format(tag=key_value)
+            )
+        key, value = key_value.split('=', 1)
+        tags[key] = value
+
+    instance = DagsterInstance.get()
+    # the runs are selected once, so that the runs that are deleted are the ones confirmed
+    run_ids = instance.purge_runs(
+        max_age_seconds=older_than_days * SECONDS_PER_DAY,
+        statuses=[PipelineRunStatus(name) for name in status] or None,
+        pipeline_name=pipeline,
+        tags=tags or None,
+        dry_run=True,
+    )
+    if dry_run:
+        for run_id in run_ids:
+            click.echo(run_id)
+        click.echo('Found {n_runs} runs to purge.'.format(n_runs=len(run_ids)))
+        return
+
+    if not run_ids:
+        click.echo('No runs to purge.')
+        return
+
+    if not yes:
+        click.confirm(
+            'Delete {n_runs} runs and their events, compute logs and intermediates?'.format(
+                n_runs=len(run_ids)
+            ),
+            abort=True,
+        )
+
+    run_ids = instance.delete_runs(
+        run_ids,
+        batch_size=batch_size,
+        progress_fn=lambda done, total: click.echo(
+            'Purged {done}/{total} runs.'.format(done=done, total=total)
+        ),
+    )
+    click.echo('Purged {n_runs} runs.'.format(n_runs=len(run_ids)))
+
+
 instance_cli = create_instance_cli_group()
@@ -0,0 +1,319 @@
+'''Compiled config processors.
+
+:py:func:`traverse_and_process_config` walks a config type tree with a :py:class:`TraversalContext`,
+building an evaluation stack at every level so that errors can point at the offending value. That bookkeeping
+is only needed when the config is invalid. Here, a config type tree is compiled once into a tree of
+closures that validate, resolve defaults and post process a value in a single pass without any of
+it. When a value turns out to be invalid, the compiled processor falls back to the full traversal
+so that errors are reported exactly as before.
+'''
+import weakref
+
+import six
+
+from dagster import check
+from dagster.utils import ensure_single_item, frozendict, frozenlist
+
+from .config_type import ConfigType, ConfigTypeKind
+from .evaluate_value_result import EvaluateValueResult
+
+
+class _InvalidConfigValue(Exception):
+    '''Raised by compiled closures to bail out to the full traversal.'''
+
+
+_COMPILED_PROCESSORS = weakref.WeakKeyDictionary()
+
+
+def compile_config_type(config_type):
+    '''Compile a config type into a function that processes config values of that type.
+
+    Compiled processors are cached per config type, so compiling the same type again is free.
+
+    Args:
+        config_type (ConfigType): The config type to compile.
+
+    Returns:
+        Callable[[Any], EvaluateValueResult]: Equivalent to ``process_config(config_type, value)``.
+    '''
+    check.inst_param(config_type, 'config_type', ConfigType)
+
+    processor = _COMPILED_PROCESSORS.get(config_type)
+    if processor is None:
+        processor = _compile_processor(config_type)
+        _COMPILED_PROCESSORS[config_type] = processor
+
+    return processor
+
+
+def _compile_processor(config_type):
+    from .validate import traverse_and_process_config
+
+    compiler = _Compiler()
+    validate_fn = compiler.validator(config_type)
+    process_fn = compiler.processor(config_type)
+
+    def _process(config_value):
+        try:
+            return EvaluateValueResult.for_value(process_fn(validate_fn(config_value)))
+        except _InvalidConfigValue:
+            return traverse_and_process_config(config_type, config_value)
+
+    return _process
+
+
+def _post_processed(config_type, fn):
+    post_process = config_type.post_process
+
+    def _fn(config_value):
+        value = fn(config_value)
+        try:
+            return post_process(value)
+        except Exception:  # pylint: disable=broad-except
+            raise _InvalidConfigValue()
+
+    return _fn
+
+
+class _Compiler(object):
+    '''Builds the validation and default resolution / post processing closures for a config type
+    tree, mirroring ``validate.py`` and ``post_process.py`` respectively. Closures are shared
+    between the occurrences of a config type in the tree.'''
+
+    def __init__(self):
+        self._validators = {}
+        self._processors = {}
+
+    def validator(self, config_type):
+        if config_type not in self._validators:
+            self._validators[config_type] = self._compile_validator(config_type)
+        return self._validators[config_type]
+
+    def processor(self, config_type):
+        if config_type not in self._processors:
+            self._processors[config_type] = _post_processed(
+                config_type, self._compile_processor(config_type)
+            )
+        return self._processors[config_type]
+
+    def _compile_validator(self, config_type):
+        from .validate import is_config_scalar_valid
+
+        kind = config_type.kind
+
+        if kind == ConfigTypeKind.NONEABLE:
+            inner_fn = self.validator(config_type.inner_type)
+            return lambda config_value: None if config_value is None else inner_fn(config_value)
+
+        if kind == ConfigTypeKind.ANY:
+            return lambda config_value: config_value
+
+        if kind == ConfigTypeKind.SCALAR:
+
+            def _validate_scalar(config_value):
+                if config_value is None or not is_config_scalar_valid(config_type, config_value):
+                    raise _InvalidConfigValue()
+                return config_value
+
+            return _validate_scalar
+
+        if kind == ConfigTypeKind.ENUM:
+
+            def _validate_enum(config_value):
+                if not isinstance(
+                    config_value, six.string_types
+                ) or not config_type.is_valid_config_enum_value(config_value):
+                    raise _InvalidConfigValue()
+                return config_value
+
+            return _validate_enum
+
+        if kind == ConfigTypeKind.SELECTOR:
+            return self._compile_selector_validator(config_type)
+
+        if ConfigTypeKind.is_shape(kind):
+            return self._compile_shape_validator(config_type)
+
+        if kind == ConfigTypeKind.ARRAY:
+            inner_fn = self.validator(config_type.inner_type)
+
+            def _validate_array(config_value):
+                if not isinstance(config_value, list):
+                    raise _InvalidConfigValue()
+                return [inner_fn(item) for item in config_value]
+
+            return _validate_array
+
+        if kind == ConfigTypeKind.SCALAR_UNION:
+            scalar_fn = self.validator(config_type.scalar_type)
+            non_scalar_fn = self.validator(config_type.non_scalar_type)
+
+            def _validate_scalar_union(config_value):
+                if config_value is None:
+                    raise _InvalidConfigValue()
+                if isinstance(config_value, (dict, list)):
+                    return non_scalar_fn(config_value)
+                return scalar_fn(config_value)
+
+            return _validate_scalar_union
+
+        check.failed('Unsupported ConfigTypeKind {}'.format(kind))
+
+    def _compile_selector_validator(self, config_type):
+        fields = config_type.fields
+        field_fns = {name: self.validator(field.config_type) for name, field in fields.items()}
+        fills_empty_value = {
+            name: ConfigTypeKind.has_fields(field.config_type.kind)
+            for name, field in fields.items()
+        }
+
+        def _validate_selector(config_value):
+            if config_value == {}:
+                if len(fields) > 1:
+                    raise _InvalidConfigValue()
+                _, field = ensure_single_item(fields)
+                if field.is_required:
+                    raise _InvalidConfigValue()
+                return {}
+
+            if not isinstance(config_value, dict) or len(config_value) > 1:
+                raise _InvalidConfigValue()
+
+            field_name, field_value = ensure_single_item(config_value)
+            if field_name not in fields:
+                raise _InvalidConfigValue()
+
+            if field_value is None and fills_empty_value[field_name]:
+                field_value = {}
+
+            return frozendict({field_name: field_fns[field_name](field_value)})
+
+        return _validate_selector
+
+    def _compile_shape_validator(self, config_type):
+        fields = config_type.fields
+        field_fns = [
+            (name, self.validator(field.config_type), field.is_required)
+            for name, field in fields.items()
+        ]
+        is_strict = config_type.kind == ConfigTypeKind.STRICT_SHAPE
+
+        def _validate_shape(config_value):
+            if config_value is None or not isinstance(config_value, dict):
+                raise _InvalidConfigValue()
+
+            if is_strict and any(name not in fields for name in config_value):
+                raise _InvalidConfigValue()
+
+            for name, field_fn, is_required in field_fns:
+                if name in config_value:
+                    field_fn(config_value[name])
+                elif is_required:
+                    raise _InvalidConfigValue()
+
+            # like the full traversal, validation hands on the incoming value, not the validated
+            # values of the fields
+            return frozendict(config_value)
+
+        return _validate_shape
+
+    def _compile_processor(self, config_type):
+        kind = config_type.kind
+
+        if kind in (ConfigTypeKind.SCALAR, ConfigTypeKind.ENUM, ConfigTypeKind.ANY):
+            return lambda config_value: config_value
+
+        if kind == ConfigTypeKind.NONEABLE:
+            inner_fn = self.processor(config_type.inner_type)
+            return lambda config_value: None if config_value is None else inner_fn(config_value)
+
+        if kind == ConfigTypeKind.SELECTOR:
+            return self._compile_selector_processor(config_type)
+
+        if ConfigTypeKind.is_shape(kind):
+            return self._compile_shape_processor(config_type)
+
+        if kind == ConfigTypeKind.ARRAY:
+            inner_fn = self.processor(config_type.inner_type)
+            allows_none = config_type.inner_type.kind == ConfigTypeKind.NONEABLE
+
+            def _process_array(config_value):
+                if not config_value:
+                    return []
+                if not allows_none and any(item is None for item in config_value):
+                    raise _InvalidConfigValue()
+                return frozenlist([inner_fn(item) for item in config_value])
+
+            return _process_array
+
+        if kind == ConfigTypeKind.SCALAR_UNION:
+            scalar_fn = self.processor(config_type.scalar_type)
+            non_scalar_fn = self.processor(config_type.non_scalar_type)
+
+            def _process_scalar_union(config_value):
+                if isinstance(config_value, (dict, list)):
+                    return non_scalar_fn(config_value)
+                return scalar_fn(config_value)
+
+            return _process_scalar_union
+
+        check.failed('Unsupported type {name}'.format(name=config_type.name))
+
+    def _compile_selector_processor(self, config_type):
+        fields = config_type.fields
+        field_fns = {name: self.processor(field.config_type) for name, field in fields.items()}
+        fills_empty_value = {
+            name: ConfigTypeKind.has_fields(field.config_type.kind)
+            for name, field in fields.items()
+        }
+
+        def _process_selector(config_value):
+            if config_value:
+                if len(config_value) != 1:
+                    raise _InvalidConfigValue()
+                field_name, field_value = ensure_single_item(config_value)
+            else:
+                field_name, field = ensure_single_item(fields)
+                field_value = field.default_value if field.default_provided else None
+
+            if field_name not in fields:
+                raise _InvalidConfigValue()
+
+            if field_value is None and fills_empty_value[field_name]:
+                field_value = {}
+
+            return frozendict({field_name: field_fns[field_name](field_value)})
+
+        return _process_selector
+
+    def _compile_shape_processor(self, config_type):
+        fields = config_type.fields
+        field_fns = [
+            (name, self.processor(field.config_type), field) for name, field in fields.items()
+        ]
+        is_permissive = config_type.kind == ConfigTypeKind.PERMISSIVE_SHAPE
+
+        def _process_shape(config_value):
+            if config_value is None:
+                config_value = {}
+            elif not isinstance(config_value, dict):
+                raise _InvalidConfigValue()
+
+            processed = {}
+            for name, field_fn, field in field_fns:
+                if name in config_value:
+                    processed[name] = field_fn(config_value[name])
+                elif field.default_provided:
+                    processed[name] = field_fn(field.default_value)
+                elif field.is_required:
+                    raise _InvalidConfigValue()
+
+            # defaults are not applied to the unknown fields of permissive shapes
+            if is_permissive:
+                for name, value in config_value.items():
+                    if name not in fields:
+                        processed[name] = value
+
+            return frozendict(processed)
+
+        return _process_shape
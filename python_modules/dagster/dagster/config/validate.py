@@ -3,6 +3,7 @@ import six
 from dagster import check
 from dagster.utils import ensure_single_item, frozendict
 
+from .compile import compile_config_type
 from .config_type import Bool, ConfigScalar, ConfigType, ConfigTypeKind, Float, Int, Path, String
 from .errors import (
     create_array_error,
@@ -302,6 +303,15 @@ def validate_enum_config(context, config_value):
 
 
 def process_config(config_type, config_dict):
+    '''Validate a config value against a config type, then resolve defaults and post process it.
+
+    The config type is compiled into a reusable processor on first use, see
+    :py:func:`dagster.config.compile.compile_config_type`.
+    '''
+    return compile_config_type(config_type)(config_dict)
+
+
+def traverse_and_process_config(config_type, config_dict):
     validate_evr = validate_config(config_type, config_dict)
     if not validate_evr.success:
         return validate_evr
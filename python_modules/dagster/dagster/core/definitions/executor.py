@@ -3,7 +3,7 @@ from functools import update_wrapper
 from dagster import check
 from dagster.builtins import Int
 from dagster.config.field import Field
-from dagster.config.field_utils import check_user_facing_opt_config_param
+from dagster.config.field_utils import Permissive, check_user_facing_opt_config_param
 from dagster.core.errors import DagsterUnmetExecutorRequirementsError
 from dagster.core.execution.config import InProcessExecutorConfig, MultiprocessExecutorConfig
 from dagster.core.execution.retries import Retries, get_retries_config
@@ -177,6 +177,12 @@ def in_process_executor(init_context):
     name='multiprocess',
     config={
         'max_concurrent': Field(Int, is_required=False, default_value=0),
+        'resources': Field(
+            Permissive(),
+            is_required=False,
+            description='The capacities of the resources that steps declare they require with '
+            'the dagster/resource_requirements tag, by resource name.',
+        ),
         'retries': get_retries_config(),
     },
 )
@@ -200,6 +206,21 @@ def multiprocess_executor(init_context):
     Execution priority can be configured using the ``dagster/priority`` tag via solid metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
+
+    The optional ``resources`` arg sets the capacities of resources that steps share, e.g.
+
+    .. code-block:: yaml
+
+        execution:
+          multiprocess:
+            config:
+              resources:
+                memory: 16000000000
+                db_connections: 2
+
+    Steps declare the amounts they require with the ``dagster/resource_requirements`` tag, e.g.
+    ``@solid(tags={'dagster/resource_requirements': {'memory': 4e9}})``, and only start while the
+    steps executing leave enough of each resource for them.
     '''
     from dagster.core.definitions.handle import ExecutionTargetHandle
     from dagster.core.engine.init import InitExecutorContext
@@ -217,6 +238,7 @@ def multiprocess_executor(init_context):
     return MultiprocessExecutorConfig(
         handle=handle,
         max_concurrent=init_context.executor_config['max_concurrent'],
+        resources=init_context.executor_config.get('resources'),
         retries=Retries.from_config(init_context.executor_config['retries']),
     )
 
@@ -3,7 +3,7 @@ from collections import namedtuple
 from dagster import check
 from dagster.core.definitions.schedule import ScheduleDefinition, ScheduleExecutionContext
 from dagster.core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
-from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
+from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.core.storage.tags import check_tags
 from dagster.utils import merge_dicts
 
@@ -49,11 +49,12 @@ def last_empty_partition(context, partition_set_def):
     partitions = partition_set_def.get_partitions()
     if not partitions:
         return None
+    successful_partition_names = context.instance.get_successful_partition_names(
+        partition_set_def.name
+    )
     selected = None
     for partition in reversed(partitions):
-        filters = PipelineRunsFilter.for_partition(partition_set_def, partition)
-        matching = context.instance.get_runs(filters)
-        if not any(run.status == PipelineRunStatus.SUCCESS for run in matching):
+        if partition.name not in successful_partition_names:
             selected = partition
             break
     return selected
@@ -1,8 +1,11 @@
 from collections import namedtuple
 
+from toposort import CircularDependencyError
+
 from dagster import check
 from dagster.core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
 from dagster.core.types.dagster_type import DagsterTypeKind, construct_dagster_type_dictionary
+from dagster.core.utils import toposort
 from dagster.serdes import whitelist_for_serdes
 from dagster.utils.backcompat import rename_warning
 
@@ -563,6 +566,44 @@ def _validate_resource_dependencies(mode_definitions, solid_defs):
                             mode_name=mode_def.name,
                         )
                     )
+        for resource_name, resource_def in mode_def.resource_defs.items():
+            for required_resource in resource_def.required_resource_keys:
+                if required_resource not in mode_resources:
+                    raise DagsterInvalidDefinitionError(
+                        (
+                            'Resource "{resource}" is required by resource "{resource_name}", but '
+                            'is not provided by mode "{mode_name}".'
+                        ).format(
+                            resource=required_resource,
+                            resource_name=resource_name,
+                            mode_name=mode_def.name,
+                        )
+                    )
+        resource_dependencies = resource_dependencies_for_mode(mode_def)
+        try:
+            toposort(resource_dependencies)
+        except CircularDependencyError as exc:
+            raise DagsterInvalidDefinitionError(
+                'Resources of mode "{mode_name}" depend on each other in a cycle: {data}'.format(
+                    mode_name=mode_def.name, data=exc.data
+                )
+            )
+        for resource_name, required_resources in resource_dependencies.items():
+            if resource_name in required_resources:
+                raise DagsterInvalidDefinitionError(
+                    'Resource "{resource_name}" of mode "{mode_name}" requires itself.'.format(
+                        resource_name=resource_name, mode_name=mode_def.name
+                    )
+                )
+
+
+def resource_dependencies_for_mode(mode_def):
+    '''The keys of the resources required by each resource of a mode, by resource key.'''
+    check.inst_param(mode_def, 'mode_def', ModeDefinition)
+    return {
+        resource_name: set(resource_def.required_resource_keys)
+        for resource_name, resource_def in mode_def.resource_defs.items()
+    }
 
 
 def _validate_inputs(dependency_structure, solid_dict):
@@ -51,12 +51,18 @@ class ResourceDefinition(object):
             5. An instance of :py:class:`~dagster.Field`.
 
         description (Optional[str]): A human-readable description of the resource.
+        required_resource_keys (Optional[Set[str]]): Keys for the resources required by this
+            resource. They are initialized before it, torn down after it, and available to its
+            resource_fn as ``init_context.resources``.
     '''
 
-    def __init__(self, resource_fn, config=None, description=None):
+    def __init__(self, resource_fn, config=None, description=None, required_resource_keys=None):
         self._resource_fn = check.callable_param(resource_fn, 'resource_fn')
         self._config_field = check_user_facing_opt_config_param(config, 'config')
         self._description = check.opt_str_param(description, 'description')
+        self._required_resource_keys = frozenset(
+            check.opt_set_param(required_resource_keys, 'required_resource_keys', of_type=str)
+        )
 
     @property
     def resource_fn(self):
@@ -70,6 +76,10 @@ class ResourceDefinition(object):
     def description(self):
         return self._description
 
+    @property
+    def required_resource_keys(self):
+        return self._required_resource_keys
+
     @staticmethod
     def none_resource(description=None):
         return ResourceDefinition.hardcoded_resource(value=None, description=description)
@@ -88,15 +98,21 @@ class ResourceDefinition(object):
 
 
 class _ResourceDecoratorCallable(object):
-    def __init__(self, config=None, description=None):
+    def __init__(self, config=None, description=None, required_resource_keys=None):
         self.config = check_user_facing_opt_config_param(config, 'config')
         self.description = check.opt_str_param(description, 'description')
+        self.required_resource_keys = check.opt_set_param(
+            required_resource_keys, 'required_resource_keys', of_type=str
+        )
 
     def __call__(self, fn):
         check.callable_param(fn, 'fn')
 
         resource_def = ResourceDefinition(
-            resource_fn=fn, config=self.config, description=self.description,
+            resource_fn=fn,
+            config=self.config,
+            description=self.description,
+            required_resource_keys=self.required_resource_keys,
         )
 
         update_wrapper(resource_def, wrapped=fn)
@@ -104,7 +120,7 @@ class _ResourceDecoratorCallable(object):
         return resource_def
 
 
-def resource(config=None, description=None):
+def resource(config=None, description=None, required_resource_keys=None):
     '''Define a resource.
 
     The decorated function should accept an :py:class:`InitResourceContext` and return an instance of
@@ -141,6 +157,8 @@ def resource(config=None, description=None):
             5. An instance of :py:class:`~dagster.Field`.
 
         description(Optional[str]): A human-readable description of the resource.
+        required_resource_keys (Optional[Set[str]]): Keys for the resources required by this
+            resource, available to it as ``init_context.resources``.
     '''
 
     # This case is for when decorator is used bare, without arguments.
@@ -149,7 +167,9 @@ def resource(config=None, description=None):
         return _ResourceDecoratorCallable()(config)
 
     def _wrap(resource_fn):
-        return _ResourceDecoratorCallable(config=config, description=description)(resource_fn)
+        return _ResourceDecoratorCallable(
+            config=config, description=description, required_resource_keys=required_resource_keys
+        )(resource_fn)
 
     return _wrap
 
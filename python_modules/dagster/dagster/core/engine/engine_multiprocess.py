@@ -7,6 +7,9 @@ from dagster.core.execution.api import create_execution_plan, execute_plan_itera
 from dagster.core.execution.config import MultiprocessExecutorConfig
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.step_fusion import is_step_fusion_enabled
+from dagster.core.execution.step_priority import step_priority_sort_key_fn
+from dagster.core.execution.step_resources import StepResourcePool
 from dagster.core.instance import DagsterInstance
 from dagster.utils import get_multiprocessing_context, start_termination_thread
 from dagster.utils.timing import format_duration, time_execution_scope
@@ -24,12 +27,12 @@ DELEGATE_MARKER = 'multiprocess_subprocess_init'
 
 class InProcessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
-        self, environment_dict, pipeline_run, executor_config, step_key, instance_ref, term_event
+        self, environment_dict, pipeline_run, executor_config, step_keys, instance_ref, term_event
     ):
         self.environment_dict = environment_dict
         self.executor_config = executor_config
         self.pipeline_run = pipeline_run
-        self.step_key = step_key
+        self.step_keys = step_keys
         self.instance_ref = instance_ref
         self.term_event = term_event
 
@@ -45,20 +48,24 @@ class InProcessExecutorChildProcessCommand(ChildProcessCommand):
             environment_dict=self.environment_dict,
             mode=self.pipeline_run.mode,
             step_keys_to_execute=self.pipeline_run.step_keys_to_execute,
-        ).build_subset_plan([self.step_key])
+        ).build_subset_plan(self.step_keys)
 
+        step_key = self.step_keys[0]
         yield instance.report_engine_event(
-            'Executing step {} in subprocess'.format(self.step_key),
+            'Executing {steps} {step_keys} in subprocess'.format(
+                steps='step' if len(self.step_keys) == 1 else 'steps',
+                step_keys=', '.join(self.step_keys),
+            ),
             self.pipeline_run,
             EngineEventData(
                 [
                     EventMetadataEntry.text(str(os.getpid()), 'pid'),
-                    EventMetadataEntry.text(self.step_key, 'step_key'),
+                    EventMetadataEntry.text(step_key, 'step_key'),
                 ],
                 marker_end=DELEGATE_MARKER,
             ),
             MultiprocessEngine,
-            self.step_key,
+            step_key,
         )
 
         for step_event in execute_plan_iterator(
@@ -71,12 +78,14 @@ class InProcessExecutorChildProcessCommand(ChildProcessCommand):
             yield step_event
 
 
-def execute_step_out_of_process(step_context, step, errors, term_events):
+def execute_step_out_of_process(step_context, step, errors, term_events, fused_steps=None):
+    '''Execute a step, along with the steps fused with it if any, in a child process.'''
+    fused_steps = check.opt_list_param(fused_steps, 'fused_steps')
     command = InProcessExecutorChildProcessCommand(
         step_context.environment_dict,
         step_context.pipeline_run,
         step_context.executor_config,
-        step.key,
+        [step.key] + [fused_step.key for fused_step in fused_steps],
         step_context.instance.get_ref(),
         term_events[step.key],
     )
@@ -115,6 +124,8 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
         intermediates_manager = pipeline_context.intermediates_manager
 
         limit = pipeline_context.executor_config.max_concurrent
+        resource_pool = StepResourcePool(pipeline_context.executor_config.resources)
+        resource_pool.check_execution_plan(execution_plan)
 
         yield DagsterEvent.engine_event(
             pipeline_context,
@@ -132,7 +143,9 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
         with time_execution_scope() as timer_result:
 
             active_execution = execution_plan.start(
-                retries=pipeline_context.executor_config.retries
+                retries=pipeline_context.executor_config.retries,
+                sort_key_fn=step_priority_sort_key_fn(pipeline_context, execution_plan),
+                fuse_steps=is_step_fusion_enabled(pipeline_context.pipeline_run),
             )
             active_iters = {}
             errors = {}
@@ -144,7 +157,7 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
                     # start iterators
                     while len(active_iters) < limit and not stopping:
                         steps = active_execution.get_steps_to_execute(
-                            limit=(limit - len(active_iters))
+                            limit=(limit - len(active_iters)), admit_fn=resource_pool.try_acquire,
                         )
 
                         if not steps:
@@ -154,7 +167,13 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
                             step_context = pipeline_context.for_step(step)
                             term_events[step.key] = get_multiprocessing_context().Event()
                             active_iters[step.key] = execute_step_out_of_process(
-                                step_context, step, errors, term_events
+                                step_context,
+                                step,
+                                errors,
+                                term_events,
+                                active_execution.claim_fused_steps(
+                                    step, can_fuse_fn=resource_pool.can_fuse_fn(step)
+                                ),
                             )
 
                     # process active iterators
@@ -174,6 +193,7 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
                     # clear and mark complete finished iterators
                     for key in empty_iters:
                         del active_iters[key]
+                        resource_pool.release(key)
                         if term_events[key].is_set():
                             stopping = True
                         del term_events[key]
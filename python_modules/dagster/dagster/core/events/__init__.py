@@ -11,7 +11,7 @@ from dagster.core.definitions import (
     SolidHandle,
     TypeCheck,
 )
-from dagster.core.definitions.events import ObjectStoreOperationType
+from dagster.core.definitions.events import ObjectStoreOperationType, TextMetadataEntryData
 from dagster.core.execution.context.system import (
     SystemPipelineExecutionContext,
     SystemStepExecutionContext,
@@ -283,6 +283,10 @@ class DagsterEvent(
     def is_step_failure(self):
         return self.event_type == DagsterEventType.STEP_FAILURE
 
+    @property
+    def is_step_skipped(self):
+        return self.event_type == DagsterEventType.STEP_SKIPPED
+
     @property
     def is_step_up_for_retry(self):
         return self.event_type == DagsterEventType.STEP_UP_FOR_RETRY
@@ -474,6 +478,35 @@ class DagsterEvent(
             ),
         )
 
+    @staticmethod
+    def step_cache_hit_event(step_context, cache_key, source_run_id):
+        return DagsterEvent.from_step(
+            event_type=DagsterEventType.ENGINE_EVENT,
+            step_context=step_context,
+            event_specific_data=EngineEventData.step_cache_hit(
+                step_context.step.key, cache_key, source_run_id
+            ),
+            message=(
+                'Found cached outputs for step "{step_key}" in run {source_run_id}. '
+                'Skipping execution.'
+            ).format(step_key=step_context.step.key, source_run_id=source_run_id),
+        )
+
+    @staticmethod
+    def step_profile_event(step_context, profiler_name, file_handle, total_seconds, hotspots):
+        return DagsterEvent.from_step(
+            event_type=DagsterEventType.ENGINE_EVENT,
+            step_context=step_context,
+            event_specific_data=EngineEventData.step_profile(
+                file_handle.path_desc, total_seconds, hotspots
+            ),
+            message='Wrote {profiler_name} profile of step "{step_key}" to {path_desc}.'.format(
+                profiler_name=profiler_name,
+                step_key=step_context.step.key,
+                path_desc=file_handle.path_desc,
+            ),
+        )
+
     @staticmethod
     def step_materialization(step_context, materialization):
         check.inst_param(materialization, 'materialization', Materialization)
@@ -740,6 +773,19 @@ class ObjectStoreOperationResultData(
     pass
 
 
+# The labels of the metadata entries of the event of a step cache hit
+STEP_CACHE_HIT_STEP_KEY_LABEL = 'step_key'
+STEP_CACHE_HIT_CACHE_KEY_LABEL = 'cache_key'
+STEP_CACHE_HIT_SOURCE_RUN_ID_LABEL = 'source_run_id'
+STEP_CACHE_HIT_LABELS = frozenset(
+    [
+        STEP_CACHE_HIT_STEP_KEY_LABEL,
+        STEP_CACHE_HIT_CACHE_KEY_LABEL,
+        STEP_CACHE_HIT_SOURCE_RUN_ID_LABEL,
+    ]
+)
+
+
 @whitelist_for_serdes
 class EngineEventData(
     namedtuple('_EngineEventData', 'metadata_entries error marker_start marker_end')
@@ -786,6 +832,73 @@ class EngineEventData(
             )
         )
 
+    @staticmethod
+    def step_cache_hit(step_key, cache_key, source_run_id):
+        check.str_param(step_key, 'step_key')
+        check.str_param(cache_key, 'cache_key')
+        check.str_param(source_run_id, 'source_run_id')
+        return EngineEventData(
+            metadata_entries=[
+                EventMetadataEntry.text(step_key, STEP_CACHE_HIT_STEP_KEY_LABEL),
+                EventMetadataEntry.text(cache_key, STEP_CACHE_HIT_CACHE_KEY_LABEL),
+                EventMetadataEntry.text(source_run_id, STEP_CACHE_HIT_SOURCE_RUN_ID_LABEL),
+            ]
+        )
+
+    @property
+    def step_cache_hit_data(self):
+        '''The step key, cache key and source run id of the event of a step cache hit, by label,
+        or None if this is the data of another engine event.'''
+        entries = {
+            entry.label: entry.entry_data.text
+            for entry in self.metadata_entries
+            if isinstance(entry.entry_data, TextMetadataEntryData)
+        }
+        if not STEP_CACHE_HIT_LABELS <= set(entries.keys()):
+            return None
+        return {label: entries[label] for label in STEP_CACHE_HIT_LABELS}
+
+    @staticmethod
+    def step_profile(path_desc, total_seconds, hotspots):
+        check.str_param(path_desc, 'path_desc')
+        check.float_param(total_seconds, 'total_seconds')
+        check.list_param(hotspots, 'hotspots')
+        return EngineEventData(
+            metadata_entries=[
+                EventMetadataEntry.path(path_desc, 'profile'),
+                EventMetadataEntry.text(
+                    '{total_seconds:.3f}s'.format(total_seconds=total_seconds), 'profiled_time'
+                ),
+            ]
+            + [
+                EventMetadataEntry.text(
+                    '{self_seconds:.3f}s self, {cumulative_seconds:.3f}s cumulative{calls}'.format(
+                        self_seconds=hotspot.self_seconds,
+                        cumulative_seconds=hotspot.cumulative_seconds,
+                        calls=', {} calls'.format(hotspot.calls)
+                        if hotspot.calls is not None
+                        else '',
+                    ),
+                    hotspot.function,
+                )
+                for hotspot in hotspots
+            ]
+        )
+
+    @staticmethod
+    def run_trace(trace_path, summary):
+        check.str_param(trace_path, 'trace_path')
+        check.list_param(summary, 'summary', tuple)
+        return EngineEventData(
+            metadata_entries=[EventMetadataEntry.path(trace_path, 'trace')]
+            + [
+                EventMetadataEntry.text(
+                    '{seconds:.3f}s in {count} spans'.format(seconds=seconds, count=count), key
+                )
+                for key, count, seconds in summary
+            ]
+        )
+
     @staticmethod
     def interrupted(steps_interrupted):
         check.list_param(steps_interrupted, 'steps_interrupted', str)
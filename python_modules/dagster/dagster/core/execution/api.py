@@ -10,12 +10,14 @@ from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.plan.execute_plan import inner_plan_execution_iterator
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.retries import Retries
+from dagster.core.execution.tracing import run_trace_event, tracer_for_tags, write_trace_fragment
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
 from dagster.core.system_config.objects import EnvironmentConfig
 from dagster.core.telemetry import telemetry_wrapper
 from dagster.core.utils import make_new_backfill_id, make_new_run_id
 from dagster.utils import merge_dicts
+from dagster.utils.tracing import active_tracer, get_active_tracer, trace_span
 
 from .config import RunConfig
 from .context_creation_pipeline import pipeline_initialization_manager, scoped_pipeline_context
@@ -28,11 +30,12 @@ def create_execution_plan(pipeline, environment_dict=None, mode=None, step_keys_
     mode = check.opt_str_param(mode, 'mode', default=pipeline.get_default_mode_name())
     check.opt_list_param(step_keys_to_execute, 'step_keys_to_execute', of_type=str)
 
-    environment_config = EnvironmentConfig.build(pipeline, environment_dict, mode=mode)
+    with trace_span('build_execution_plan', 'plan'):
+        environment_config = EnvironmentConfig.build(pipeline, environment_dict, mode=mode)
 
-    return ExecutionPlan.build(
-        pipeline, environment_config, mode=mode, step_keys_to_execute=step_keys_to_execute
-    )
+        return ExecutionPlan.build(
+            pipeline, environment_config, mode=mode, step_keys_to_execute=step_keys_to_execute
+        )
 
 
 def _pipeline_execution_iterator(pipeline_context, execution_plan, pipeline_run):
@@ -77,23 +80,32 @@ def execute_run_iterator(pipeline, pipeline_run, instance):
     check.inst_param(instance, 'instance', DagsterInstance)
     check.invariant(pipeline_run.status == PipelineRunStatus.NOT_STARTED)
 
-    execution_plan = create_execution_plan(
-        pipeline,
-        environment_dict=pipeline_run.environment_dict,
-        mode=pipeline_run.mode,
-        step_keys_to_execute=pipeline_run.step_keys_to_execute,
-    )
+    tracer = tracer_for_tags(pipeline_run.tags)
+    with active_tracer(tracer):
+        execution_plan = create_execution_plan(
+            pipeline,
+            environment_dict=pipeline_run.environment_dict,
+            mode=pipeline_run.mode,
+            step_keys_to_execute=pipeline_run.step_keys_to_execute,
+        )
 
-    return _execute_run_iterator_with_plan(pipeline, pipeline_run, instance, execution_plan)
+    return _execute_run_iterator_with_plan(
+        pipeline, pipeline_run, instance, execution_plan, tracer=tracer
+    )
 
 
-def _execute_run_iterator_with_plan(pipeline, pipeline_run, instance, execution_plan):
+def _execute_run_iterator_with_plan(pipeline, pipeline_run, instance, execution_plan, tracer=None):
     check.inst_param(pipeline, 'pipeline', PipelineDefinition)
     check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
     check.inst_param(instance, 'instance', DagsterInstance)
     check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
     check.invariant(pipeline_run.status == PipelineRunStatus.NOT_STARTED)
 
+    run_iterator = _run_iterator_with_plan(pipeline, pipeline_run, instance, execution_plan)
+    return tracer.trace_iterator(run_iterator) if tracer else run_iterator
+
+
+def _run_iterator_with_plan(pipeline, pipeline_run, instance, execution_plan):
     initialization_manager = pipeline_initialization_manager(
         pipeline, pipeline_run.environment_dict, pipeline_run, instance, execution_plan,
     )
@@ -117,6 +129,20 @@ def _execute_run_iterator_with_plan(pipeline, pipeline_run, instance, execution_
             if not generator_closed:
                 yield event
 
+        if not generator_closed:
+            for event in _run_trace_events(pipeline_context):
+                yield event
+
+
+def _run_trace_events(pipeline_context):
+    '''Write the trace of a traced run, once its resources have been torn down so that the trace
+    covers their teardown.'''
+    tracer = get_active_tracer()
+    if tracer and pipeline_context:
+        trace_event = run_trace_event(pipeline_context, tracer)
+        if trace_event:
+            yield trace_event
+
 
 def _check_execute_pipeline_args(
     fn_name, pipeline, environment_dict, mode, preset, tags, run_config, instance
@@ -214,11 +240,16 @@ def _check_execute_pipeline_args(
     check.opt_inst_param(instance, 'instance', DagsterInstance)
     instance = instance or DagsterInstance.ephemeral()
 
-    execution_plan = create_execution_plan(
-        pipeline, environment_dict, mode=mode, step_keys_to_execute=run_config.step_keys_to_execute
-    )
+    tracer = tracer_for_tags(tags)
+    with active_tracer(tracer):
+        execution_plan = create_execution_plan(
+            pipeline,
+            environment_dict,
+            mode=mode,
+            step_keys_to_execute=run_config.step_keys_to_execute,
+        )
 
-    return pipeline, environment_dict, instance, mode, tags, run_config, execution_plan
+    return pipeline, environment_dict, instance, mode, tags, run_config, execution_plan, tracer
 
 
 def execute_pipeline_iterator(
@@ -271,6 +302,7 @@ def execute_pipeline_iterator(
         tags,
         run_config,
         execution_plan,
+        tracer,
     ) = _check_execute_pipeline_args(
         'execute_pipeline_iterator',
         pipeline=pipeline,
@@ -294,7 +326,9 @@ def execute_pipeline_iterator(
         parent_run_id=run_config.previous_run_id,
     )
 
-    return _execute_run_iterator_with_plan(pipeline, pipeline_run, instance, execution_plan)
+    return _execute_run_iterator_with_plan(
+        pipeline, pipeline_run, instance, execution_plan, tracer=tracer
+    )
 
 
 @telemetry_wrapper
@@ -352,6 +386,7 @@ def execute_pipeline(
         tags,
         run_config,
         execution_plan,
+        tracer,
     ) = _check_execute_pipeline_args(
         'execute_pipeline',
         pipeline=pipeline,
@@ -375,23 +410,25 @@ def execute_pipeline(
         parent_run_id=run_config.previous_run_id,
     )
 
-    initialization_manager = pipeline_initialization_manager(
-        pipeline,
-        environment_dict,
-        pipeline_run,
-        instance,
-        execution_plan,
-        raise_on_error=raise_on_error,
-    )
-    event_list = list(initialization_manager.generate_setup_events())
-    pipeline_context = initialization_manager.get_object()
-    try:
-        if pipeline_context:
-            event_list.extend(
-                _pipeline_execution_iterator(pipeline_context, execution_plan, pipeline_run)
-            )
-    finally:
-        event_list.extend(initialization_manager.generate_teardown_events())
+    with active_tracer(tracer):
+        initialization_manager = pipeline_initialization_manager(
+            pipeline,
+            environment_dict,
+            pipeline_run,
+            instance,
+            execution_plan,
+            raise_on_error=raise_on_error,
+        )
+        event_list = list(initialization_manager.generate_setup_events())
+        pipeline_context = initialization_manager.get_object()
+        try:
+            if pipeline_context:
+                event_list.extend(
+                    _pipeline_execution_iterator(pipeline_context, execution_plan, pipeline_run)
+                )
+        finally:
+            event_list.extend(initialization_manager.generate_teardown_events())
+            event_list.extend(_run_trace_events(pipeline_context))
     return PipelineExecutionResult(
         pipeline,
         pipeline_run.run_id,
@@ -419,6 +456,26 @@ def execute_plan_iterator(
     retries = check.opt_inst_param(retries, 'retries', Retries, Retries.disabled_mode())
     environment_dict = check.opt_dict_param(environment_dict, 'environment_dict')
 
+    # processes executing some of the steps of a traced run write the spans they record for the
+    # process executing the run to merge
+    tracer = tracer_for_tags(pipeline_run.tags)
+    plan_iterator = _plan_execution_iterator(
+        execution_plan, pipeline_run, instance, retries, environment_dict
+    )
+    if not tracer:
+        return plan_iterator
+    return _traced_plan_execution_iterator(instance, pipeline_run.run_id, tracer, plan_iterator)
+
+
+def _traced_plan_execution_iterator(instance, run_id, tracer, plan_iterator):
+    try:
+        for event in tracer.trace_iterator(plan_iterator):
+            yield event
+    finally:
+        write_trace_fragment(instance, run_id, tracer)
+
+
+def _plan_execution_iterator(execution_plan, pipeline_run, instance, retries, environment_dict):
     initialization_manager = pipeline_initialization_manager(
         execution_plan.pipeline_def, environment_dict, pipeline_run, instance, execution_plan,
     )
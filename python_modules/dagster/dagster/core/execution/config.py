@@ -126,13 +126,15 @@ class InProcessExecutorConfig(ExecutorConfig):
 
 
 class MultiprocessExecutorConfig(ExecutorConfig):
-    def __init__(self, handle, retries, max_concurrent=None):
+    def __init__(self, handle, retries, max_concurrent=None, resources=None):
         from dagster import ExecutionTargetHandle
 
         self._handle = check.inst_param(handle, 'handle', ExecutionTargetHandle,)
         self.retries = check.inst_param(retries, 'retries', Retries)
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
         self.max_concurrent = check.int_param(max_concurrent, 'max_concurrent')
+        # the capacities of the resources that steps declare they require, by resource name
+        self.resources = check.opt_dict_param(resources, 'resources', key_type=str)
 
     def load_pipeline(self, pipeline_run):
         from dagster.core.storage.pipeline_run import PipelineRun
@@ -8,7 +8,8 @@ from dagster.core.log_manager import DagsterLogManager
 
 class InitResourceContext(
     namedtuple(
-        'InitResourceContext', 'resource_config pipeline_def resource_def run_id log_manager'
+        'InitResourceContext',
+        'resource_config pipeline_def resource_def run_id log_manager resources',
     )
 ):
     '''Resource-specific initialization context.
@@ -22,9 +23,13 @@ class InitResourceContext(
             constructed.
         run_id (str): The id for this run of the pipeline.
         log_manager (DagsterLogManager): The log manager for this run of the pipeline
+        resources (Resources): The resources required by the resource being constructed, as
+            declared by its ``required_resource_keys``.
     '''
 
-    def __new__(cls, resource_config, pipeline_def, resource_def, run_id, log_manager=None):
+    def __new__(
+        cls, resource_config, pipeline_def, resource_def, run_id, log_manager=None, resources=None
+    ):
         return super(InitResourceContext, cls).__new__(
             cls,
             resource_config,
@@ -32,6 +37,7 @@ class InitResourceContext(
             check.inst_param(resource_def, 'resource_def', ResourceDefinition),
             check.str_param(run_id, 'run_id'),
             check.opt_inst_param(log_manager, 'log_manager', DagsterLogManager),
+            resources,
         )
 
     @property
@@ -108,6 +108,12 @@ class SystemPipelineExecutionContext(object):
     def for_type(self, dagster_type):
         return TypeCheckContext(self._pipeline_context_data, self.log, dagster_type)
 
+    def for_intermediates_manager(self, intermediates_manager):
+        return SystemPipelineExecutionContext(
+            self._pipeline_context_data._replace(intermediates_manager=intermediates_manager),
+            self._log_manager,
+        )
+
     @property
     def executor_config(self):
         return self._pipeline_context_data.executor_config
@@ -13,8 +13,10 @@ from dagster.core.events import DagsterEvent, PipelineInitFailureData
 from dagster.core.execution.config import ExecutorConfig
 from dagster.core.execution.memoization import validate_reexecution_memoization
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.profiling import step_profile_config_for_run
 from dagster.core.execution.resources_init import (
     get_required_resource_keys_to_init,
+    resource_init_concurrency_for_run,
     resource_initialization_manager,
 )
 from dagster.core.instance import DagsterInstance
@@ -23,6 +25,7 @@ from dagster.core.storage.init import InitSystemStorageContext
 from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.core.storage.type_storage import construct_type_storage_plugin_registry
 from dagster.core.system_config.objects import EnvironmentConfig
+from dagster.core.types.type_check_policy import type_check_policy_for_run
 from dagster.loggers import default_loggers, default_system_loggers
 from dagster.utils import EventGenerationManager, merge_dicts
 from dagster.utils.error import serializable_error_info_from_exc_info
@@ -83,6 +86,11 @@ def create_context_creation_data(
         pipeline_def, environment_dict, mode=pipeline_run.mode
     )
 
+    # fail on invalid run tags before any of the steps that use them execute
+    type_check_policy_for_run(pipeline_run)
+    step_profile_config_for_run(pipeline_run)
+    resource_init_concurrency_for_run(pipeline_run)
+
     mode_def = pipeline_def.get_mode_definition(pipeline_run.mode)
     system_storage_def = system_storage_def_from_config(mode_def, environment_config)
     executor_def = executor_def_from_config(mode_def, environment_config)
@@ -7,7 +7,7 @@ from dagster.core.execution.retries import Retries
 from .plan import ExecutionPlan
 
 
-def _default_sort_key(step):
+def default_sort_key(step):
     return int(step.tags.get('dagster/priority', 0)) * -1
 
 
@@ -15,10 +15,16 @@ class ActiveExecution(object):
     '''State machine used to track progress through execution of an ExecutionPlan
     '''
 
-    def __init__(self, execution_plan, retries, sort_key_fn=None):
+    def __init__(self, execution_plan, retries, sort_key_fn=None, fuse_steps=False):
         self._plan = check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
         self._retries = check.inst_param(retries, 'retries', Retries)
-        self._sort_key_fn = check.opt_callable_param(sort_key_fn, 'sort_key_fn', _default_sort_key)
+        self._sort_key_fn = check.opt_callable_param(sort_key_fn, 'sort_key_fn', default_sort_key)
+
+        # steps that are executed along with the step they are fused with, see claim_fused_steps
+        self._fused_successors = (
+            self._plan.fused_step_successors() if check.bool_param(fuse_steps, 'fuse_steps') else {}
+        )
+        self._fused_steps = {}
 
         # All steps to be executed start out here in _pending
         self._pending = self._plan.execution_deps()
@@ -94,15 +100,32 @@ class ActiveExecution(object):
         check.invariant(step is not None, 'Unexpected ActiveExecution state')
         return step
 
-    def get_steps_to_execute(self, limit=None):
+    def get_steps_to_execute(self, limit=None, admit_fn=None):
+        '''Vend the steps that are ready to execute, in priority order.
+
+        Args:
+            limit (Optional[int]): The maximum number of steps to vend.
+            admit_fn (Optional[Callable[[ExecutionStep], bool]]): Called on each ready step in
+                turn, until the limit is reached. Steps it does not admit, e.g. because the
+                resources they require are not available, stay ready to execute.
+        '''
         check.opt_int_param(limit, 'limit')
+        check.opt_callable_param(admit_fn, 'admit_fn')
         self._update()
 
         steps = sorted(
             [self._plan.get_step_by_key(key) for key in self._executable], key=self._sort_key_fn
         )
 
-        if limit:
+        if admit_fn:
+            admitted = []
+            for step in steps:
+                if limit and len(admitted) == limit:
+                    break
+                if admit_fn(step):
+                    admitted.append(step)
+            steps = admitted
+        elif limit:
             steps = steps[:limit]
 
         for step in steps:
@@ -111,6 +134,64 @@ class ActiveExecution(object):
 
         return steps
 
+    def claim_fused_steps(self, step, can_fuse_fn=None):
+        '''Claim the steps that are fused with a step that is about to be executed, so that they
+        are executed along with it, in the same worker.
+
+        Args:
+            step (ExecutionStep): A step vended by get_steps_to_execute.
+            can_fuse_fn (Optional[Callable[[ExecutionStep, ExecutionStep], bool]]): Further
+                restricts which steps are fused, e.g. to steps bound for the same queue.
+
+        Returns:
+            List[ExecutionStep]: The fused steps, in execution order. They are considered in flight
+                and their completion is verified together with that of ``step``.
+        '''
+        check.invariant(
+            step.key in self._in_flight, 'Can only claim steps fused with a step in flight'
+        )
+        check.opt_callable_param(can_fuse_fn, 'can_fuse_fn')
+
+        fused_steps = []
+        upstream_step = step
+        while upstream_step.key in self._fused_successors:
+            fused_step = self._plan.get_step_by_key(self._fused_successors[upstream_step.key])
+            if fused_step.key not in self._pending or (
+                can_fuse_fn and not can_fuse_fn(upstream_step, fused_step)
+            ):
+                break
+
+            fused_steps.append(fused_step)
+            upstream_step = fused_step
+
+        for fused_step in fused_steps:
+            del self._pending[fused_step.key]
+            self._in_flight.add(fused_step.key)
+
+        if fused_steps:
+            self._fused_steps[step.key] = [fused_step.key for fused_step in fused_steps]
+
+        return fused_steps
+
+    def _release_fused_steps(self, step_key):
+        # the steps fused with a step that is up for retry go back to pending, to be executed
+        # (and possibly fused again) once it has been retried
+        for head_key, fused_keys in self._fused_steps.items():
+            chain = [head_key] + fused_keys
+            if step_key not in chain:
+                continue
+
+            index = chain.index(step_key)
+            execution_deps = self._plan.execution_deps()
+            for key in chain[index + 1 :]:
+                if key in self._in_flight:
+                    self._in_flight.remove(key)
+                    self._pending[key] = execution_deps[key]
+
+            # the step up for retry is no longer part of the unit being executed either
+            self._fused_steps[head_key] = chain[1:index]
+            return
+
     def get_steps_to_skip(self):
         self._update()
 
@@ -181,6 +262,7 @@ class ActiveExecution(object):
 
         self._retries.mark_attempt(step_key)
         self._in_flight.remove(step_key)
+        self._release_fused_steps(step_key)
 
     def _mark_complete(self, step_key):
         check.invariant(
@@ -203,6 +285,11 @@ class ActiveExecution(object):
             self.mark_failed(dagster_event.step_key)
         elif dagster_event.is_step_success:
             self.mark_success(dagster_event.step_key)
+        elif dagster_event.is_step_skipped and dagster_event.step_key in self._in_flight:
+            # skips are vended by this object, except for those of the steps fused with a step that
+            # failed, which are skipped by the worker executing them. The steps fused with a step
+            # that is up for retry have been released already, see _release_fused_steps.
+            self.mark_skipped(dagster_event.step_key)
         elif dagster_event.is_step_up_for_retry:
             self.mark_up_for_retry(
                 dagster_event.step_key,
@@ -212,15 +299,17 @@ class ActiveExecution(object):
             )
 
     def verify_complete(self, pipeline_context, step_key):
-        '''Ensure that a step has reached a terminal state, if it has not mark it as an unexpected failure
+        '''Ensure that a step, and the steps fused with it, have reached a terminal state, if they
+        have not mark them as an unexpected failure
         '''
-        if step_key in self._in_flight:
-            pipeline_context.log.error(
-                'Step {key} finished without success or failure event, assuming failure.'.format(
-                    key=step_key
+        for key in [step_key] + self._fused_steps.pop(step_key, []):
+            if key in self._in_flight:
+                pipeline_context.log.error(
+                    'Step {key} finished without success or failure event, assuming failure.'.format(
+                        key=key
+                    )
                 )
-            )
-            self.mark_failed(step_key)
+                self.mark_failed(key)
 
     @property
     def is_complete(self):
@@ -6,6 +6,13 @@ from dagster.core.execution.memoization import copy_required_intermediates_for_e
 from dagster.core.execution.plan.execute_step import dagster_event_sequence_for_step
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.retries import Retries
+from dagster.core.execution.step_cache import (
+    find_step_cache_entry,
+    step_cache_hit_event_sequence,
+    step_cache_keys_for_execution,
+    step_cache_recording_event_sequence,
+)
+from dagster.core.execution.step_fusion import fused_pipeline_context
 
 
 def inner_plan_execution_iterator(pipeline_context, execution_plan, retries):
@@ -13,9 +20,13 @@ def inner_plan_execution_iterator(pipeline_context, execution_plan, retries):
     check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
     check.inst_param(retries, 'retries', Retries)
 
+    pipeline_context = fused_pipeline_context(pipeline_context, execution_plan)
+
     for event in copy_required_intermediates_for_execution(pipeline_context, execution_plan):
         yield event
 
+    step_cache_keys = step_cache_keys_for_execution(pipeline_context, execution_plan)
+
     # It would be good to implement a reference tracking algorithm here to
     # garbage collect results that are no longer needed by any steps
     # https://github.com/dagster-io/dagster/issues/811
@@ -53,9 +64,24 @@ def inner_plan_execution_iterator(pipeline_context, execution_plan, retries):
                 yield DagsterEvent.step_skipped_event(step_context)
                 active_execution.mark_skipped(step.key)
             else:
-                for step_event in check.generator(
-                    dagster_event_sequence_for_step(step_context, retries)
-                ):
+                cache_key = step_cache_keys.get(step.key)
+                step_cache_entry = (
+                    find_step_cache_entry(step_context, cache_key) if cache_key else None
+                )
+                if step_cache_entry:
+                    step_event_sequence = step_cache_hit_event_sequence(
+                        step_context, step_cache_entry
+                    )
+                elif cache_key:
+                    step_event_sequence = step_cache_recording_event_sequence(
+                        step_context,
+                        cache_key,
+                        dagster_event_sequence_for_step(step_context, retries),
+                    )
+                else:
+                    step_event_sequence = dagster_event_sequence_for_step(step_context, retries)
+
+                for step_event in check.generator(step_event_sequence):
                     check.inst(step_event, DagsterEvent)
                     yield step_event
                     active_execution.handle_event(step_event)
@@ -1,5 +1,7 @@
 import sys
 
+import six
+
 from dagster import check
 from dagster.core.definitions import (
     ExpectationResult,
@@ -33,10 +35,13 @@ from dagster.core.execution.plan.objects import (
     TypeCheckData,
     UserFailureData,
 )
+from dagster.core.execution.profiling import PROFILE_SCOPE_STEP, step_profile_config_for_run
+from dagster.core.execution.resource_usage import ResourceUsageMeter
 from dagster.core.storage.object_store import ObjectStoreOperation
 from dagster.core.types.dagster_type import DagsterTypeKind
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster.utils.timing import time_execution_scope
+from dagster.utils.tracing import get_active_tracer, trace_span
 
 
 class MultipleStepOutputsListWrapper(list):
@@ -88,11 +93,25 @@ def dagster_event_sequence_for_step(step_context, retries):
 
     check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
 
+    profile_config = step_profile_config_for_run(step_context.pipeline_run)
+    profiler = profile_config.create_profiler() if profile_config else None
+    resource_usage_meter = ResourceUsageMeter()
+
     try:
-        for step_event in check.generator(
-            _core_dagster_event_sequence_for_step(step_context, retries)
-        ):
-            yield step_event
+        step_events = _core_dagster_event_sequence_for_step(
+            step_context,
+            retries,
+            resource_usage_meter,
+            profiler if profiler and profile_config.scope != PROFILE_SCOPE_STEP else None,
+        )
+        if profiler:
+            step_events = _profiled_step_event_sequence(
+                step_context, profile_config, profiler, step_events
+            )
+
+        with trace_span('execute_step', 'step', step_key=step_context.step.key):
+            for step_event in check.generator(step_events):
+                yield step_event
 
     # case (1) in top comment
     except RetryRequested as retry_request:
@@ -107,7 +126,11 @@ def dagster_event_sequence_for_step(step_context, retries):
             )
             yield DagsterEvent.step_failure_event(
                 step_context=step_context,
-                step_failure_data=StepFailureData(error=fail_err, user_failure_data=None),
+                step_failure_data=StepFailureData(
+                    error=fail_err,
+                    user_failure_data=None,
+                    resource_usage=resource_usage_meter.measure(),
+                ),
             )
         else:  # retries.enabled or retries.deferred
             prev_attempts = retries.get_attempt_count(step_context.step.key)
@@ -120,7 +143,11 @@ def dagster_event_sequence_for_step(step_context, retries):
                 )
                 yield DagsterEvent.step_failure_event(
                     step_context=step_context,
-                    step_failure_data=StepFailureData(error=fail_err, user_failure_data=None),
+                    step_failure_data=StepFailureData(
+                        error=fail_err,
+                        user_failure_data=None,
+                        resource_usage=resource_usage_meter.measure(),
+                    ),
                 )
             else:
                 attempt_num = prev_attempts + 1
@@ -136,6 +163,7 @@ def dagster_event_sequence_for_step(step_context, retries):
         yield _step_failure_event_from_exc_info(
             step_context,
             sys.exc_info(),
+            resource_usage_meter,
             UserFailureData(
                 label='intentional-failure',
                 description=failure.description,
@@ -148,7 +176,7 @@ def dagster_event_sequence_for_step(step_context, retries):
     # case (3) in top comment
     except DagsterUserCodeExecutionError as dagster_user_error:
         yield _step_failure_event_from_exc_info(
-            step_context, dagster_user_error.original_exc_info,
+            step_context, dagster_user_error.original_exc_info, resource_usage_meter
         )
 
         if step_context.raise_on_error:
@@ -156,24 +184,71 @@ def dagster_event_sequence_for_step(step_context, retries):
 
     # case (4) in top comment
     except DagsterError as dagster_error:
-        yield _step_failure_event_from_exc_info(step_context, sys.exc_info())
+        yield _step_failure_event_from_exc_info(step_context, sys.exc_info(), resource_usage_meter)
 
         if step_context.raise_on_error:
             raise dagster_error
 
     # case (5) in top comment
     except (Exception, KeyboardInterrupt) as unexpected_exception:  # pylint: disable=broad-except
-        yield _step_failure_event_from_exc_info(step_context, sys.exc_info())
+        yield _step_failure_event_from_exc_info(step_context, sys.exc_info(), resource_usage_meter)
 
         raise unexpected_exception
 
 
-def _step_failure_event_from_exc_info(step_context, exc_info, user_failure_data=None):
+def _profiled_step_event_sequence(step_context, profile_config, profiler, step_events):
+    '''Emit the profile of a step before it succeeds, or once it has failed.'''
+    if profile_config.scope == PROFILE_SCOPE_STEP:
+        step_events = profiler.profile_iterator(step_events)
+
+    try:
+        for step_event in step_events:
+            if step_event.is_step_success:
+                profile_event = _step_profile_event(step_context, profile_config, profiler)
+                if profile_event:
+                    yield profile_event
+            yield step_event
+    except Exception:  # pylint: disable=broad-except
+        exc_info = sys.exc_info()
+        profile_event = _step_profile_event(step_context, profile_config, profiler)
+        if profile_event:
+            yield profile_event
+        six.reraise(*exc_info)
+    finally:
+        profiler.stop()
+
+
+def _step_profile_event(step_context, profile_config, profiler):
+    profiler.stop()
+    try:
+        file_handle = step_context.file_manager.write_data(profiler.dump(), ext=profiler.ext)
+    except Exception as exc:  # pylint: disable=broad-except
+        # a profile that can not be written should not fail the step it profiled
+        step_context.log.warning(
+            'Could not write the profile of step "{step_key}": {exc}'.format(
+                step_key=step_context.step.key, exc=exc
+            )
+        )
+        return None
+
+    return DagsterEvent.step_profile_event(
+        step_context,
+        profile_config.profiler,
+        file_handle,
+        profiler.total_seconds(),
+        profiler.hotspots(),
+    )
+
+
+def _step_failure_event_from_exc_info(
+    step_context, exc_info, resource_usage_meter, user_failure_data=None
+):
     return DagsterEvent.step_failure_event(
         step_context=step_context,
         step_failure_data=StepFailureData(
             error=serializable_error_info_from_exc_info(exc_info),
             user_failure_data=user_failure_data,
+            resource_usage=resource_usage_meter.measure(),
         ),
     )
 
@@ -240,7 +315,8 @@ def _step_output_error_checked_user_event_sequence(step_context, user_event_sequ
 
 
 def _do_type_check(context, dagster_type, value):
-    type_check = dagster_type.type_check(context, value)
+    with trace_span('type_check', 'step', dagster_type=dagster_type.name):
+        type_check = dagster_type.type_check(context, value)
     if not isinstance(type_check, TypeCheck):
         return TypeCheck(
             success=False,
@@ -364,12 +440,17 @@ def _type_checked_step_output_event_sequence(step_context, output):
             )
 
 
-def _core_dagster_event_sequence_for_step(step_context, retries):
+def _core_dagster_event_sequence_for_step(
+    step_context, retries, resource_usage_meter, compute_profiler=None
+):
     '''
     Execute the step within the step_context argument given the in-memory
     events. This function yields a sequence of DagsterEvents, but without
     catching any exceptions that have bubbled up during the computation
     of the step.
+
+    The resource_usage_meter measures the resources used by the step for its success event. If a
+    compute_profiler is given, it profiles the compute function of the step.
     '''
     check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
     attempts = retries.get_attempt_count(step_context.step.key)
@@ -379,20 +460,22 @@ def _core_dagster_event_sequence_for_step(step_context, retries):
         yield DagsterEvent.step_start_event(step_context)
 
     inputs = {}
-    for input_name, input_value in _input_values_from_intermediates_manager(step_context):
-        if isinstance(input_value, ObjectStoreOperation):
-            yield DagsterEvent.object_store_operation(
-                step_context, ObjectStoreOperation.serializable(input_value, value_name=input_name)
-            )
-            inputs[input_name] = input_value.obj
-        elif isinstance(input_value, MultipleStepOutputsListWrapper):
-            for op in input_value:
+    with trace_span('load_inputs', 'step', step_key=step_context.step.key):
+        for input_name, input_value in _input_values_from_intermediates_manager(step_context):
+            if isinstance(input_value, ObjectStoreOperation):
                 yield DagsterEvent.object_store_operation(
-                    step_context, ObjectStoreOperation.serializable(op, value_name=input_name)
+                    step_context,
+                    ObjectStoreOperation.serializable(input_value, value_name=input_name),
                 )
-            inputs[input_name] = [op.obj for op in input_value]
-        else:
-            inputs[input_name] = input_value
+                inputs[input_name] = input_value.obj
+            elif isinstance(input_value, MultipleStepOutputsListWrapper):
+                for op in input_value:
+                    yield DagsterEvent.object_store_operation(
+                        step_context, ObjectStoreOperation.serializable(op, value_name=input_name)
+                    )
+                inputs[input_name] = [op.obj for op in input_value]
+            else:
+                inputs[input_name] = input_value
 
     for input_name, input_value in inputs.items():
         for evt in check.generator(
@@ -404,6 +487,10 @@ def _core_dagster_event_sequence_for_step(step_context, retries):
         user_event_sequence = check.generator(
             _user_event_sequence_for_step_compute_fn(step_context, inputs)
         )
+        if compute_profiler:
+            user_event_sequence = compute_profiler.profile_iterator(user_event_sequence)
+        if get_active_tracer():
+            user_event_sequence = _traced_user_event_sequence(step_context, user_event_sequence)
 
         # It is important for this loop to be indented within the
         # timer block above in order for time to be recorded accurately.
@@ -426,10 +513,25 @@ def _core_dagster_event_sequence_for_step(step_context, retries):
                 )
 
     yield DagsterEvent.step_success_event(
-        step_context, StepSuccessData(duration_ms=timer_result.millis)
+        step_context,
+        StepSuccessData(
+            duration_ms=timer_result.millis, resource_usage=resource_usage_meter.measure()
+        ),
     )
 
 
+def _traced_user_event_sequence(step_context, user_event_sequence):
+    '''Trace each resumption of the compute function of a step, but not the handling of the events
+    it yields.'''
+    while True:
+        with trace_span('compute', 'step', step_key=step_context.step.key):
+            try:
+                user_event = next(user_event_sequence)
+            except StopIteration:
+                return
+        yield user_event
+
+
 def _create_step_events_for_output(step_context, output):
     check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
     check.inst_param(output, 'output', Output)
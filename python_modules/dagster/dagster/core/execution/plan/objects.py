@@ -86,14 +86,42 @@ class StepOutputData(
 
 
 @whitelist_for_serdes
-class StepFailureData(namedtuple('_StepFailureData', 'error user_failure_data')):
-    def __new__(cls, error, user_failure_data):
+class StepResourceUsage(
+    namedtuple('_StepResourceUsage', 'cpu_seconds max_rss_bytes read_bytes write_bytes')
+):
+    '''The resources used by the execution of a step.
+
+    Args:
+        cpu_seconds (float): User and system CPU time.
+        max_rss_bytes (int): Peak resident set size of the process that executed the step. Steps
+            executed in a subprocess of their own get the peak of the step, steps executed in
+            process the peak of the process so far.
+        read_bytes (int): Bytes read from storage devices.
+        write_bytes (int): Bytes written to storage devices.
+    '''
+
+    def __new__(cls, cpu_seconds, max_rss_bytes, read_bytes, write_bytes):
+        return super(StepResourceUsage, cls).__new__(
+            cls,
+            cpu_seconds=check.float_param(cpu_seconds, 'cpu_seconds'),
+            max_rss_bytes=check.int_param(max_rss_bytes, 'max_rss_bytes'),
+            read_bytes=check.int_param(read_bytes, 'read_bytes'),
+            write_bytes=check.int_param(write_bytes, 'write_bytes'),
+        )
+
+
+@whitelist_for_serdes
+class StepFailureData(namedtuple('_StepFailureData', 'error user_failure_data resource_usage')):
+    def __new__(cls, error, user_failure_data, resource_usage=None):
         return super(StepFailureData, cls).__new__(
             cls,
             error=check.opt_inst_param(error, 'error', SerializableErrorInfo),
             user_failure_data=check.opt_inst_param(
                 user_failure_data, 'user_failure_data', UserFailureData
             ),
+            resource_usage=check.opt_inst_param(
+                resource_usage, 'resource_usage', StepResourceUsage
+            ),
         )
 
 
@@ -108,10 +136,14 @@ class StepRetryData(namedtuple('_StepRetryData', 'error seconds_to_wait')):
 
 
 @whitelist_for_serdes
-class StepSuccessData(namedtuple('_StepSuccessData', 'duration_ms')):
-    def __new__(cls, duration_ms):
+class StepSuccessData(namedtuple('_StepSuccessData', 'duration_ms resource_usage')):
+    def __new__(cls, duration_ms, resource_usage=None):
         return super(StepSuccessData, cls).__new__(
-            cls, duration_ms=check.float_param(duration_ms, 'duration_ms')
+            cls,
+            duration_ms=check.float_param(duration_ms, 'duration_ms'),
+            resource_usage=check.opt_inst_param(
+                resource_usage, 'resource_usage', StepResourceUsage
+            ),
         )
 
 
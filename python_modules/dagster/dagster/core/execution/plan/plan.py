@@ -1,4 +1,4 @@
-from collections import OrderedDict, namedtuple
+from collections import OrderedDict, defaultdict, namedtuple
 
 from dagster import check
 from dagster.core.definitions import (
@@ -12,6 +12,7 @@ from dagster.core.definitions import (
 )
 from dagster.core.definitions.dependency import DependencyStructure
 from dagster.core.errors import DagsterExecutionStepNotFoundError, DagsterInvariantViolationError
+from dagster.core.storage.tags import STEP_FUSION_TAG
 from dagster.core.system_config.objects import EnvironmentConfig
 from dagster.core.types.dagster_type import DagsterTypeKind
 from dagster.core.utils import toposort
@@ -344,6 +345,42 @@ class ExecutionPlan(
                 )
         return deps
 
+    def fused_step_successors(self):
+        '''Find the linear chains of steps to execute that can be fused, i.e. executed one after
+        the other in the same worker.
+
+        A step is fused with its successor if the successor is the only step that depends on it,
+        and it is the only step that the successor depends on. Steps tagged with
+        ``dagster/step_fusion: false`` are not fused.
+
+        Returns:
+            Dict[str, str]: For every step that is fused with its successor, the key of the
+                successor.
+        '''
+        downstream = defaultdict(set)
+        for step_key, upstream_keys in self.deps.items():
+            for upstream_key in upstream_keys:
+                downstream[upstream_key].add(step_key)
+
+        step_keys_to_execute = set(self.step_keys_to_execute)
+
+        def _can_fuse(step_key):
+            return (
+                step_key in step_keys_to_execute
+                and self.step_dict[step_key].tags.get(STEP_FUSION_TAG) != 'false'
+            )
+
+        successors = {}
+        for step_key in self.step_keys_to_execute:
+            if not _can_fuse(step_key) or len(downstream[step_key]) != 1:
+                continue
+
+            successor_key = next(iter(downstream[step_key]))
+            if _can_fuse(successor_key) and self.deps[successor_key] == {step_key}:
+                successors[step_key] = successor_key
+
+        return successors
+
     def build_subset_plan(self, step_keys_to_execute):
         check.list_param(step_keys_to_execute, 'step_keys_to_execute', of_type=str)
         return ExecutionPlan(
@@ -355,11 +392,11 @@ class ExecutionPlan(
         )
 
     def start(
-        self, retries, sort_key_fn=None,
+        self, retries, sort_key_fn=None, fuse_steps=False,
     ):
         from .active import ActiveExecution
 
-        return ActiveExecution(self, retries, sort_key_fn)
+        return ActiveExecution(self, retries, sort_key_fn, fuse_steps)
 
     def step_key_for_single_step_plans(self):
         # Temporary hack to isolate single-step plans, which are often the representation of
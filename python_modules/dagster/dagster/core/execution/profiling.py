@@ -0,0 +1,283 @@
+'''Per-step profiling.
+
+A run can opt in to profiling each of its steps by setting the ``dagster/profile_steps`` tag to
+one of:
+
+    ``cprofile``
+        Profile deterministically with :py:mod:`cProfile`. Precise call counts and times, at the
+        cost of slowing down code that makes many small function calls.
+
+    ``sample``
+        Sample the stack of the step every few milliseconds. Little overhead, but statistical.
+
+By default only the compute function of the step is profiled. Append ``:step`` to the value, e.g.
+``cprofile:step``, to profile the whole step instead, including loading its inputs, type checks and
+writing its intermediates.
+
+The profile of each step is written with the file manager of the run, and the step emits an engine
+event with the location of the profile and a summary of its hotspots. The ``cprofile`` profiles
+can be loaded with :py:class:`pstats.Stats`, the ``sample`` profiles are in the collapsed stack
+format read by flame graph tools.
+'''
+import cProfile
+import marshal
+import sys
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from collections import Counter, namedtuple
+
+import six
+
+from dagster import check
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.storage.tags import PROFILE_STEPS_TAG
+
+PROFILER_CPROFILE = 'cprofile'
+PROFILER_SAMPLE = 'sample'
+
+PROFILE_SCOPE_COMPUTE = 'compute'
+PROFILE_SCOPE_STEP = 'step'
+
+# the number of hotspots summarized in the event of a profiled step
+DEFAULT_HOTSPOT_LIMIT = 10
+
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+
+class StepProfileConfig(namedtuple('_StepProfileConfig', 'profiler scope')):
+    def __new__(cls, profiler, scope=PROFILE_SCOPE_COMPUTE):
+        check.param_invariant(
+            profiler in (PROFILER_CPROFILE, PROFILER_SAMPLE), 'profiler', 'Unknown profiler'
+        )
+        check.param_invariant(
+            scope in (PROFILE_SCOPE_COMPUTE, PROFILE_SCOPE_STEP), 'scope', 'Unknown scope'
+        )
+        return super(StepProfileConfig, cls).__new__(cls, profiler, scope)
+
+    @staticmethod
+    def from_tag_value(tag_value):
+        check.str_param(tag_value, 'tag_value')
+
+        profiler, _, scope = tag_value.strip().lower().partition(':')
+        try:
+            return StepProfileConfig(profiler, scope or PROFILE_SCOPE_COMPUTE)
+        except check.CheckError:
+            raise DagsterInvariantViolationError(
+                'Invalid value "{tag_value}" for tag {tag}. Expected one of "cprofile", "sample", '
+                '"cprofile:step" or "sample:step".'.format(
+                    tag_value=tag_value, tag=PROFILE_STEPS_TAG
+                )
+            )
+
+    def create_profiler(self):
+        if self.profiler == PROFILER_CPROFILE:
+            return CProfileStepProfiler()
+        return SamplingStepProfiler()
+
+
+def step_profile_config_for_run(pipeline_run):
+    '''The profiling set for a run by its ``dagster/profile_steps`` tag, if any.
+
+    Runs validate the tag when they start, so that an invalid value fails the run before any
+    steps execute.
+
+    Returns:
+        Optional[StepProfileConfig]
+    '''
+    tag_value = pipeline_run.tags.get(PROFILE_STEPS_TAG)
+    return StepProfileConfig.from_tag_value(tag_value) if tag_value else None
+
+
+class Hotspot(namedtuple('_Hotspot', 'function self_seconds cumulative_seconds calls')):
+    '''A function that a profiled step spent time in.
+
+    Args:
+        function (str): The function, as ``path:line(name)``.
+        self_seconds (float): Time spent in the function itself.
+        cumulative_seconds (float): Time spent in the function and the functions it called.
+        calls (Optional[int]): The number of calls to the function. Only known to deterministic
+            profilers.
+    '''
+
+
+def _function_label(filename, lineno, name):
+    return '{filename}:{lineno}({name})'.format(filename=filename, lineno=lineno, name=name)
+
+
+class StepProfiler(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
+    '''Profiles the execution of a step while enabled, in the thread executing the step.'''
+
+    # the extension of the files the profiles are written to
+    ext = None
+
+    @abstractmethod
+    def enable(self):
+        pass
+
+    @abstractmethod
+    def disable(self):
+        pass
+
+    def stop(self):
+        '''Release any resources held by the profiler. It can not be enabled again.'''
+
+    @abstractmethod
+    def dump(self):
+        '''The profile, as bytes.'''
+
+    @abstractmethod
+    def hotspots(self, limit=DEFAULT_HOTSPOT_LIMIT):
+        '''The functions the profiled code spent the most time in, by self time.
+
+        Returns:
+            List[Hotspot]
+        '''
+
+    @abstractmethod
+    def total_seconds(self):
+        '''The time covered by the profile.'''
+
+    def profile_iterator(self, iterator):
+        '''Profile the iteration of an iterator, but not the code consuming it.
+
+        Compute functions and the steps executing them are generators, so the profiler is enabled
+        around each of their resumptions rather than around a single call.
+        '''
+        iterator = iter(iterator)
+        while True:
+            self.enable()
+            try:
+                value = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.disable()
+            yield value
+
+
+class CProfileStepProfiler(StepProfiler):
+    ext = 'prof'
+
+    def __init__(self):
+        self._profile = cProfile.Profile()
+        self._stats = None
+
+    def enable(self):
+        self._profile.enable()
+
+    def disable(self):
+        self._profile.disable()
+
+    def _get_stats(self):
+        if self._stats is None:
+            self._profile.create_stats()
+            self._stats = self._profile.stats  # pylint: disable=no-member
+        return self._stats
+
+    def dump(self):
+        # the format of pstats.Stats.dump_stats
+        return marshal.dumps(self._get_stats())
+
+    def hotspots(self, limit=DEFAULT_HOTSPOT_LIMIT):
+        check.int_param(limit, 'limit')
+        ranked = sorted(self._get_stats().items(), key=lambda item: item[1][2], reverse=True)
+        return [
+            Hotspot(
+                function=_function_label(*function),
+                self_seconds=self_seconds,
+                cumulative_seconds=cumulative_seconds,
+                calls=calls,
+            )
+            for function, (_, calls, self_seconds, cumulative_seconds, _) in ranked[:limit]
+        ]
+
+    def total_seconds(self):
+        return sum(stat[2] for stat in self._get_stats().values())
+
+
+class SamplingStepProfiler(StepProfiler):
+    '''Samples the stack of the thread that created the profiler from a background thread.
+
+    Samples are weighted by the time since the previous sample, as the sampler can wake up late
+    while the profiled code holds the GIL. The profile is written in the collapsed stack format, a
+    line per distinct stack with its frames from the outermost in, separated by semicolons, and the
+    time it was sampled for in microseconds.
+    '''
+
+    ext = 'txt'
+
+    def __init__(self, interval=DEFAULT_SAMPLE_INTERVAL):
+        self._interval = check.float_param(interval, 'interval')
+        self._thread_id = threading.current_thread().ident
+        self._enabled = threading.Event()
+        self._stopped = threading.Event()
+        # seconds sampled, by stack
+        self._stacks = Counter()
+        self._sampler = threading.Thread(target=self._sample, name='dagster-step-profiler')
+        self._sampler.daemon = True
+        self._sampler.start()
+
+    def enable(self):
+        self._enabled.set()
+
+    def disable(self):
+        self._enabled.clear()
+
+    def stop(self):
+        self._enabled.clear()
+        self._stopped.set()
+        self._sampler.join()
+
+    def _sample(self):
+        last_sample_time = None
+        while not self._stopped.is_set():
+            if not self._enabled.wait(self._interval):
+                last_sample_time = None
+                continue
+
+            frame = sys._current_frames().get(self._thread_id)  # pylint: disable=protected-access
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(_function_label(code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+
+            sample_time = time.time()
+            if stack:
+                self._stacks[tuple(reversed(stack))] += (
+                    sample_time - last_sample_time
+                    if last_sample_time is not None
+                    else self._interval
+                )
+            last_sample_time = sample_time
+
+            self._stopped.wait(self._interval)
+
+    def dump(self):
+        return ''.join(
+            '{stack} {micros}\n'.format(stack=';'.join(stack), micros=int(round(seconds * 1e6)))
+            for stack, seconds in sorted(self._stacks.items())
+        ).encode('utf-8')
+
+    def hotspots(self, limit=DEFAULT_HOTSPOT_LIMIT):
+        check.int_param(limit, 'limit')
+        self_seconds = Counter()
+        cumulative_seconds = Counter()
+        for stack, seconds in self._stacks.items():
+            self_seconds[stack[-1]] += seconds
+            for function in set(stack):
+                cumulative_seconds[function] += seconds
+
+        return [
+            Hotspot(
+                function=function,
+                self_seconds=seconds,
+                cumulative_seconds=cumulative_seconds[function],
+                calls=None,
+            )
+            for function, seconds in self_seconds.most_common(limit)
+        ]
+
+    def total_seconds(self):
+        return float(sum(self._stacks.values()))
@@ -0,0 +1,57 @@
+'''Measuring the CPU time, memory and disk I/O used by steps, with getrusage.
+
+Where the platform supports it (Linux), CPU time and I/O are measured for the calling thread, so
+that the usage of a step executing in process is not mixed up with that of other threads. Peak
+memory is the high water mark of the resident set size of the whole process, as the memory of a
+process is shared by its threads.
+
+On platforms without the resource module (Windows), no usage is measured.
+'''
+import sys
+
+from dagster.core.execution.plan.objects import StepResourceUsage
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+_MAX_RSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
+# ru_inblock and ru_oublock count 512 byte blocks
+_BLOCK_SIZE = 512
+
+
+class ResourceUsageMeter(object):
+    '''Measures the resources used from when it is created.
+
+    Usage:
+
+        meter = ResourceUsageMeter()
+        do_some_operation()
+        usage = meter.measure()
+    '''
+
+    def __init__(self):
+        self._who = getattr(resource, 'RUSAGE_THREAD', resource.RUSAGE_SELF) if resource else None
+        self._start = resource.getrusage(self._who) if resource else None
+
+    def measure(self):
+        '''The resources used since the meter was created.
+
+        Returns:
+            Optional[StepResourceUsage]: None if usage can not be measured on this platform.
+        '''
+        if not resource:
+            return None
+
+        end = resource.getrusage(self._who)
+        return StepResourceUsage(
+            cpu_seconds=float(
+                (end.ru_utime + end.ru_stime) - (self._start.ru_utime + self._start.ru_stime)
+            ),
+            max_rss_bytes=int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAX_RSS_UNIT),
+            read_bytes=int((end.ru_inblock - self._start.ru_inblock) * _BLOCK_SIZE),
+            write_bytes=int((end.ru_oublock - self._start.ru_oublock) * _BLOCK_SIZE),
+        )
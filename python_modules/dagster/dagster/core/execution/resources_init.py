@@ -1,8 +1,14 @@
+import sys
+import threading
 from collections import deque
 
+import six
+
 from dagster import check
+from dagster.core.definitions.pipeline import resource_dependencies_for_mode
 from dagster.core.definitions.resource import ScopedResourcesBuilder
 from dagster.core.errors import (
+    DagsterInvariantViolationError,
     DagsterResourceFunctionError,
     DagsterUserCodeExecutionError,
     user_code_error_boundary,
@@ -12,10 +18,13 @@ from dagster.core.execution.plan.objects import StepInputSourceType
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.log_manager import DagsterLogManager
 from dagster.core.storage.pipeline_run import PipelineRun
+from dagster.core.storage.tags import RESOURCE_INIT_CONCURRENCY_TAG
 from dagster.core.system_config.objects import EnvironmentConfig
+from dagster.core.utils import toposort_flatten
 from dagster.utils import EventGenerationManager, ensure_gen
 from dagster.utils.error import serializable_error_info_from_exc_info
 from dagster.utils.timing import format_duration, time_execution_scope
+from dagster.utils.tracing import active_tracer, get_active_tracer, trace_span
 
 from .context.init import InitResourceContext
 
@@ -51,37 +60,61 @@ def resource_initialization_event_generator(
     generator_closed = False
     resource_init_times = {}
 
+    # resources are initialized after the resources they require, and torn down before them
+    resource_dependencies = _resource_dependencies_to_init(
+        resource_dependencies_for_mode(mode_definition), resource_keys_to_init
+    )
+    resource_keys_to_init = set(resource_dependencies.keys())
+
+    def _resource_generation_manager(resource_name):
+        resource_def = mode_definition.resource_defs[resource_name]
+        resource_context = InitResourceContext(
+            pipeline_def=pipeline_def,
+            resource_def=resource_def,
+            resource_config=environment_config.resources.get(resource_name, {}).get('config'),
+            run_id=pipeline_run.run_id,
+            # Add tags with information about the resource
+            log_manager=resource_log_manager.with_tags(
+                resource_name=resource_name,
+                resource_fn_name=str(resource_def.resource_fn.__name__),
+            ),
+            resources=ScopedResourcesBuilder(resource_instances).build(
+                resource_def.required_resource_keys
+            ),
+        )
+        return single_resource_generation_manager(resource_context, resource_name, resource_def)
+
+    def _record_initialized_resource(resource_name, manager):
+        initialized_resource = check.inst(manager.get_object(), InitializedResource)
+        resource_instances[resource_name] = initialized_resource.resource
+        resource_init_times[resource_name] = initialized_resource.duration
+
     try:
         if resource_keys_to_init:
             yield DagsterEvent.resource_init_start(
                 execution_plan, resource_log_manager, resource_keys_to_init,
             )
 
-        for resource_name, resource_def in sorted(mode_definition.resource_defs.items()):
-            if not resource_name in resource_keys_to_init:
-                continue
-
-            resource_context = InitResourceContext(
-                pipeline_def=pipeline_def,
-                resource_def=resource_def,
-                resource_config=environment_config.resources.get(resource_name, {}).get('config'),
-                run_id=pipeline_run.run_id,
-                # Add tags with information about the resource
-                log_manager=resource_log_manager.with_tags(
-                    resource_name=resource_name,
-                    resource_fn_name=str(resource_def.resource_fn.__name__),
-                ),
-            )
-            manager = single_resource_generation_manager(
-                resource_context, resource_name, resource_def
-            )
-            for event in manager.generate_setup_events():
-                if event:
-                    yield event
-            initialized_resource = check.inst(manager.get_object(), InitializedResource)
-            resource_instances[resource_name] = initialized_resource.resource
-            resource_init_times[resource_name] = initialized_resource.duration
-            resource_managers.append(manager)
+        concurrency = resource_init_concurrency_for_run(pipeline_run)
+        if concurrency > 1:
+            for resource_name, manager, events in concurrent_resource_setup(
+                resource_dependencies, _resource_generation_manager, concurrency
+            ):
+                # managers are kept in the order their resources were initialized, which
+                # respects dependencies, so that they are torn down in reverse
+                resource_managers.append(manager)
+                for event in events:
+                    if event:
+                        yield event
+                _record_initialized_resource(resource_name, manager)
+        else:
+            for resource_name in toposort_flatten(resource_dependencies):
+                manager = _resource_generation_manager(resource_name)
+                for event in manager.generate_setup_events():
+                    if event:
+                        yield event
+                _record_initialized_resource(resource_name, manager)
+                resource_managers.append(manager)
 
         if resource_keys_to_init:
             yield DagsterEvent.resource_init_success(
@@ -120,6 +153,127 @@ def resource_initialization_event_generator(
                 )
 
 
+def resource_init_concurrency_for_run(pipeline_run):
+    '''The number of resources a run initializes at once, set by its
+    ``dagster/resource_init_concurrency`` tag.
+
+    Resources are initialized one at a time in the thread executing the run by default. With a
+    concurrency above one, each resource is initialized in a thread of its own, so a resource must
+    not rely on being used from the thread it was initialized in.
+
+    Returns:
+        int
+    '''
+    check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+
+    tag_value = pipeline_run.tags.get(RESOURCE_INIT_CONCURRENCY_TAG)
+    if not tag_value:
+        return 1
+
+    try:
+        concurrency = int(tag_value)
+    except ValueError:
+        concurrency = 0
+
+    if concurrency < 1:
+        raise DagsterInvariantViolationError(
+            'Invalid value "{tag_value}" for tag {tag}. Expected a positive integer.'.format(
+                tag_value=tag_value, tag=RESOURCE_INIT_CONCURRENCY_TAG
+            )
+        )
+    return concurrency
+
+
+def _resource_dependencies_to_init(resource_dependencies, resource_keys_to_init):
+    '''The dependencies of the resources to init and of the resources they require, transitively.'''
+    to_init = {}
+    to_visit = list(resource_keys_to_init)
+    while to_visit:
+        resource_name = to_visit.pop()
+        if resource_name in to_init or resource_name not in resource_dependencies:
+            continue
+        to_init[resource_name] = set(resource_dependencies[resource_name])
+        to_visit.extend(to_init[resource_name])
+    return to_init
+
+
+def concurrent_resource_setup(resource_dependencies, manager_fn, concurrency):
+    '''Set up resources on up to ``concurrency`` threads at once, each once the resources it
+    requires have been set up.
+
+    Resources are yielded in the order they finish setting up. Each is yielded before the resources
+    that require it start, so that it can be made available to them. If a resource fails to set
+    up, no more are started, the resources already setting up are yielded once they finish, and
+    the error is raised.
+
+    Args:
+        resource_dependencies (Dict[str, Set[str]]): The keys of the resources required by each
+            resource to set up, by resource key.
+        manager_fn (Callable[[str], EventGenerationManager]): Builds the generation manager of a
+            resource, by resource key.
+        concurrency (int): The number of resources to set up at once.
+
+    Yields:
+        Tuple[str, EventGenerationManager, List[DagsterEvent]]: The key, the manager and the setup
+            events of each resource set up.
+    '''
+    check.dict_param(resource_dependencies, 'resource_dependencies', key_type=str)
+    check.callable_param(manager_fn, 'manager_fn')
+    check.int_param(concurrency, 'concurrency')
+
+    tracer = get_active_tracer()
+    results = six.moves.queue.Queue()
+
+    def _setup(resource_name, manager):
+        # setup events are collected, as events must be yielded from the thread executing the run
+        try:
+            with active_tracer(tracer):
+                events = list(manager.generate_setup_events())
+                manager.get_object()
+            results.put((resource_name, manager, events, None))
+        except Exception:  # pylint: disable=broad-except
+            results.put((resource_name, manager, None, sys.exc_info()))
+
+    pending = dict(resource_dependencies)
+    set_up = set()
+    running = 0
+    error_info = None
+
+    while pending or running:
+        if error_info is None:
+            ready = sorted(
+                resource_name
+                for resource_name, required_resources in pending.items()
+                if required_resources <= set_up
+            )
+            for resource_name in ready[: concurrency - running]:
+                del pending[resource_name]
+                thread = threading.Thread(
+                    target=_setup,
+                    args=(resource_name, manager_fn(resource_name)),
+                    name='dagster-resource-init-{resource_name}'.format(
+                        resource_name=resource_name
+                    ),
+                )
+                thread.daemon = True
+                thread.start()
+                running += 1
+        elif not running:
+            break
+
+        check.invariant(running > 0, 'Resources to set up require resources never set up')
+        resource_name, manager, events, exc_info = results.get()
+        running -= 1
+        if exc_info:
+            error_info = error_info or exc_info
+        else:
+            set_up.add(resource_name)
+            yield resource_name, manager, events
+
+    if error_info:
+        six.reraise(*error_info)
+
+
 class InitializedResource(object):
     ''' Utility class to wrap the untyped resource object emitted from the user-supplied
     resource function.  Used for distinguishing from the framework-yielded events in an
@@ -143,7 +297,9 @@ def single_resource_event_generator(context, resource_name, resource_def):
         )
         with user_code_error_boundary(DagsterResourceFunctionError, msg_fn):
             try:
-                with time_execution_scope() as timer_result:
+                with time_execution_scope() as timer_result, trace_span(
+                    'init_resource', 'resources', resource_name=resource_name
+                ):
                     resource_or_gen = resource_def.resource_fn(context)
                     gen = ensure_gen(resource_or_gen)
                     resource = next(gen)
@@ -157,7 +313,8 @@ def single_resource_event_generator(context, resource_name, resource_def):
 
     with user_code_error_boundary(DagsterResourceFunctionError, msg_fn):
         try:
-            next(gen)
+            with trace_span('teardown_resource', 'resources', resource_name=resource_name):
+                next(gen)
         except StopIteration:
             pass
         else:
@@ -7,6 +7,7 @@ from dagster import check
 from dagster.core.definitions import ExpectationResult, Materialization
 from dagster.core.events import DagsterEventType, StepExpectationResultData, StepMaterializationData
 from dagster.core.events.log import EventRecord
+from dagster.core.execution.plan.objects import StepResourceUsage
 from dagster.core.storage.pipeline_run import PipelineRunStatsSnapshot
 from dagster.serdes import whitelist_for_serdes
 from dagster.utils import datetime_as_float
@@ -77,9 +78,13 @@ def build_run_step_stats_from_events(run_id, records):
         if event.dagster_event.event_type == DagsterEventType.STEP_FAILURE:
             by_step_key[step_key]['end_time'] = event.timestamp
             by_step_key[step_key]['status'] = StepEventStatus.FAILURE
+            step_data = event.dagster_event.event_specific_data
+            by_step_key[step_key]['resource_usage'] = step_data.resource_usage
         if event.dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
             by_step_key[step_key]['end_time'] = event.timestamp
             by_step_key[step_key]['status'] = StepEventStatus.SUCCESS
+            step_data = event.dagster_event.event_specific_data
+            by_step_key[step_key]['resource_usage'] = step_data.resource_usage
         if event.dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
             by_step_key[step_key]['end_time'] = event.timestamp
             by_step_key[step_key]['status'] = StepEventStatus.SKIPPED
@@ -106,7 +111,10 @@ def build_run_step_stats_from_events(run_id, records):
 class RunStepKeyStatsSnapshot(
     namedtuple(
         '_RunStepKeyStatsSnapshot',
-        ('run_id step_key status start_time end_time materializations expectation_results'),
+        (
+            'run_id step_key status start_time end_time materializations expectation_results '
+            'resource_usage'
+        ),
     )
 ):
     def __new__(
@@ -118,6 +126,7 @@ class RunStepKeyStatsSnapshot(
         end_time=None,
         materializations=None,
         expectation_results=None,
+        resource_usage=None,
     ):
 
         return super(RunStepKeyStatsSnapshot, cls).__new__(
@@ -133,4 +142,7 @@ class RunStepKeyStatsSnapshot(
             expectation_results=check.opt_list_param(
                 expectation_results, 'expectation_results', ExpectationResult
             ),
+            resource_usage=check.opt_inst_param(
+                resource_usage, 'resource_usage', StepResourceUsage
+            ),
         )
@@ -0,0 +1,198 @@
+'''Cross-run step output cache.
+
+Solids opt in to caching by declaring a code version with the ``dagster/code_version`` tag. Such a
+step gets a content-addressed cache key, and when a previous run with persistent intermediates
+recorded outputs under the same key, the step is not executed: its outputs are copied from that
+run's intermediates instead.
+
+A run can opt out of the cache by setting the ``dagster/step_cache`` tag to ``false``.
+'''
+import hashlib
+import time
+
+from dagster import check, seven
+from dagster.core.events import DagsterEvent
+from dagster.core.execution.context.system import (
+    SystemPipelineExecutionContext,
+    SystemStepExecutionContext,
+)
+from dagster.core.execution.plan.objects import StepOutputData, StepOutputHandle, StepSuccessData
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.storage.object_store import ObjectStoreOperation
+from dagster.core.storage.step_cache import StepCacheEntry
+from dagster.core.storage.tags import CODE_VERSION_TAG, STEP_CACHE_TAG
+from dagster.core.system_config.objects import EnvironmentConfig
+from dagster.utils.timing import time_execution_scope
+
+
+def _add_hash(m, string):
+    m.update(string.encode())
+
+
+def _json_str(value):
+    return seven.json.dumps(value, sort_keys=True, default=repr)
+
+
+def _step_cache_key(step, upstream_cache_keys, environment_config, mode):
+    code_version = step.tags.get(CODE_VERSION_TAG) if step.tags else None
+    if code_version is None:
+        return None
+
+    m = hashlib.sha1()  # so that hexdigest is 40, not 64 bytes
+    _add_hash(m, ':solid_definition: ' + step.solid_definition_name)
+    _add_hash(m, ':code_version: ' + code_version)
+    _add_hash(m, ':mode: ' + mode)
+
+    solid_config = environment_config.solids.get(step.solid_handle.to_string())
+    if solid_config:
+        _add_hash(m, ':config: ' + _json_str(solid_config.config))
+        _add_hash(m, ':outputs: ' + _json_str(solid_config.outputs))
+
+    for step_input in sorted(step.step_inputs, key=lambda step_input: step_input.name):
+        _add_hash(m, ':input: ' + step_input.name)
+        if step_input.is_from_output:
+            for source_handle in step_input.source_handles:
+                upstream_cache_key = upstream_cache_keys.get(source_handle.step_key)
+                # an output that can not be fingerprinted makes the step uncacheable
+                if upstream_cache_key is None:
+                    return None
+                _add_hash(
+                    m, ':source: ' + upstream_cache_key + '.' + source_handle.output_name,
+                )
+        else:
+            _add_hash(m, ':value: ' + _json_str(step_input.config_data))
+
+    return m.hexdigest()
+
+
+def resolve_step_cache_keys(execution_plan, environment_config, mode):
+    '''Compute the cache keys for the steps of an execution plan.
+
+    The key of a cacheable step hashes the solid definition name and code version, the mode, the
+    resolved solid config and a fingerprint of every input. Config and default input values are
+    fingerprinted by value, outputs of upstream steps by the cache key of the upstream step, so a
+    step is only cacheable if all the steps it depends on are.
+
+    Args:
+        execution_plan (ExecutionPlan): The plan. Keys are computed over all of its steps, not just
+            the steps to execute.
+        environment_config (EnvironmentConfig): The resolved environment config of the run.
+        mode (str): The mode of the run.
+
+    Returns:
+        Dict[str, Optional[str]]: The cache key for each step key, or None if the step is not
+            cacheable.
+    '''
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.inst_param(environment_config, 'environment_config', EnvironmentConfig)
+    check.str_param(mode, 'mode')
+
+    cache_keys = {}
+    for step in execution_plan.topological_steps():
+        cache_keys[step.key] = _step_cache_key(step, cache_keys, environment_config, mode)
+
+    return cache_keys
+
+
+def step_cache_keys_for_execution(pipeline_context, execution_plan):
+    check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+
+    if pipeline_context.pipeline_run.tags.get(STEP_CACHE_TAG) == 'false':
+        return {}
+
+    if not pipeline_context.intermediates_manager.is_persistent:
+        return {}
+
+    if not any(step.tags and CODE_VERSION_TAG in step.tags for step in execution_plan.steps):
+        return {}
+
+    return resolve_step_cache_keys(
+        execution_plan, pipeline_context.environment_config, pipeline_context.mode_def.name
+    )
+
+
+def find_step_cache_entry(step_context, cache_key):
+    '''Find the most recent cache entry for the step whose outputs are still available.'''
+    check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
+    check.str_param(cache_key, 'cache_key')
+
+    step = step_context.step
+    intermediates_manager = step_context.intermediates_manager
+    required_output_names = {
+        step_output.name for step_output in step.step_outputs if not step_output.optional
+    }
+
+    for entry in step_context.instance.get_step_cache_entries(cache_key):
+        if entry.run_id == step_context.run_id or entry.step_key != step.key:
+            continue
+
+        if not required_output_names.issubset(entry.output_names):
+            continue
+
+        if all(
+            intermediates_manager.has_intermediate_in_run(
+                step_context, entry.run_id, StepOutputHandle(step.key, output_name)
+            )
+            for output_name in entry.output_names
+        ):
+            return entry
+
+    return None
+
+
+def step_cache_hit_event_sequence(step_context, step_cache_entry):
+    '''Link the cached outputs of a step into the current run in lieu of executing it.'''
+    check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
+    check.inst_param(step_cache_entry, 'step_cache_entry', StepCacheEntry)
+
+    intermediates_manager = step_context.intermediates_manager
+
+    with time_execution_scope() as timer_result:
+        yield DagsterEvent.step_cache_hit_event(
+            step_context, step_cache_entry.cache_key, step_cache_entry.run_id
+        )
+
+        for output_name in step_cache_entry.output_names:
+            step_output_handle = StepOutputHandle(step_context.step.key, output_name)
+            if not intermediates_manager.has_intermediate(step_context, step_output_handle):
+                operation = intermediates_manager.copy_intermediate_from_run(
+                    step_context, step_cache_entry.run_id, step_output_handle
+                )
+                yield DagsterEvent.object_store_operation(
+                    step_context,
+                    ObjectStoreOperation.serializable(operation, value_name=output_name),
+                )
+
+            yield DagsterEvent.step_output_event(
+                step_context, StepOutputData(step_output_handle=step_output_handle)
+            )
+
+    yield DagsterEvent.step_success_event(
+        step_context, StepSuccessData(duration_ms=timer_result.millis)
+    )
+
+
+def step_cache_recording_event_sequence(step_context, cache_key, step_event_sequence):
+    '''Pass through the events of a step, recording its outputs in the step cache index once the
+    step succeeds.'''
+    check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
+    check.str_param(cache_key, 'cache_key')
+    check.generator_param(step_event_sequence, 'step_event_sequence')
+
+    output_names = []
+    for step_event in step_event_sequence:
+        yield step_event
+
+        if step_event.is_successful_output:
+            output_names.append(step_event.step_output_data.output_name)
+        elif step_event.is_step_success:
+            step_context.instance.add_step_cache_entry(
+                StepCacheEntry(
+                    cache_key=cache_key,
+                    run_id=step_context.run_id,
+                    step_key=step_context.step.key,
+                    output_names=output_names,
+                    timestamp=time.time(),
+                )
+            )
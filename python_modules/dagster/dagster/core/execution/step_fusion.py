@@ -0,0 +1,83 @@
+'''Step fusion.
+
+Linear chains of steps, where every step but the last is consumed by the next step only, can be
+executed as a single unit of work by engines that dispatch steps to workers, instead of dispatching
+every step separately. The outputs handed off from one step to the next within a unit are passed in
+memory. Every step still emits its own events.
+
+A run opts in to fusion by setting the ``dagster/step_fusion`` tag to one of:
+
+- ``true``: handed off outputs are still written to the intermediate store, so that the run can be
+  re-executed from any step.
+- ``in_memory``: handed off outputs are only kept in memory.
+
+Steps tagged with ``dagster/step_fusion: false`` are never fused.
+'''
+from dagster import check
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.plan.objects import StepOutputHandle
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.storage.intermediates_manager import FusedStepsIntermediatesManager
+from dagster.core.storage.pipeline_run import PipelineRun
+from dagster.core.storage.tags import STEP_FUSION_TAG
+
+STEP_FUSION_ENABLED = 'true'
+STEP_FUSION_IN_MEMORY = 'in_memory'
+
+
+def step_fusion_mode(pipeline_run):
+    '''The step fusion mode requested by a run, if any.
+
+    Returns:
+        Optional[str]: ``'true'``, ``'in_memory'``, or None if steps are not to be fused.
+    '''
+    check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+
+    tag_value = pipeline_run.tags.get(STEP_FUSION_TAG)
+    if tag_value is None or tag_value == 'false':
+        return None
+
+    if tag_value not in (STEP_FUSION_ENABLED, STEP_FUSION_IN_MEMORY):
+        raise DagsterInvariantViolationError(
+            'Invalid value "{tag_value}" for tag {tag}. Expected one of "true", "in_memory" or '
+            '"false".'.format(tag_value=tag_value, tag=STEP_FUSION_TAG)
+        )
+
+    return tag_value
+
+
+def is_step_fusion_enabled(pipeline_run):
+    return step_fusion_mode(pipeline_run) is not None
+
+
+def fused_pipeline_context(pipeline_context, execution_plan):
+    '''Hand off the outputs of fused steps in memory.
+
+    Returns:
+        SystemPipelineExecutionContext: ``pipeline_context`` itself if none of the steps to execute
+            are fused, otherwise a context whose intermediates manager keeps the outputs handed off
+            between the fused steps in memory.
+    '''
+    check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+
+    mode = step_fusion_mode(pipeline_context.pipeline_run)
+    if mode is None:
+        return pipeline_context
+
+    handoff_handles = set()
+    for step_key in execution_plan.fused_step_successors():
+        for step_output in execution_plan.get_step_by_key(step_key).step_outputs:
+            handoff_handles.add(StepOutputHandle(step_key, step_output.name))
+
+    if not handoff_handles:
+        return pipeline_context
+
+    return pipeline_context.for_intermediates_manager(
+        FusedStepsIntermediatesManager(
+            pipeline_context.intermediates_manager,
+            handoff_handles,
+            persist=mode == STEP_FUSION_ENABLED,
+        )
+    )
@@ -0,0 +1,165 @@
+'''Critical path step prioritization.
+
+By default, engines start the steps that are ready to execute in the order of their
+``dagster/priority`` tag. With limited concurrency, that can start short steps off the critical
+path of the plan before long steps on it, and stretch the wall time of the run.
+
+A run can opt in to prioritizing steps by the length of the longest path from the step to the end of
+the plan instead, by setting the ``dagster/step_priority_policy`` tag to ``critical_path``. Path
+lengths are estimated from the durations of the steps in recent runs of the same pipeline. The
+``dagster/priority`` tag still takes precedence, and steps are ordered by the tag alone when there
+are no recent durations to go on.
+'''
+from collections import defaultdict
+
+from dagster import check
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.plan.active import default_sort_key
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.stats import StepEventStatus
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.pipeline_run import PipelineRunStatus, PipelineRunsFilter
+from dagster.core.storage.tags import STEP_PRIORITY_POLICY_TAG
+from dagster.core.utils import toposort
+
+STEP_PRIORITY_POLICY_TAG_VALUE = 'tag'
+STEP_PRIORITY_POLICY_CRITICAL_PATH = 'critical_path'
+
+# the number of recent runs that step durations are taken from
+DEFAULT_RUN_LIMIT = 10
+
+
+def _median(values):
+    values = sorted(values)
+    mid = len(values) // 2
+    return values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) / 2.0
+
+
+def recent_step_durations(instance, pipeline_name, run_limit=DEFAULT_RUN_LIMIT):
+    '''The median durations of the steps of a pipeline that succeeded in its recent runs.
+
+    Args:
+        instance (DagsterInstance): The instance the runs were executed on.
+        pipeline_name (str): The name of the pipeline.
+        run_limit (int): How many of the most recent runs to take into account.
+
+    Returns:
+        Dict[str, float]: Median duration in seconds, by step key.
+    '''
+    check.inst_param(instance, 'instance', DagsterInstance)
+    check.str_param(pipeline_name, 'pipeline_name')
+    check.int_param(run_limit, 'run_limit')
+
+    durations = defaultdict(list)
+    for run in instance.get_runs(
+        filters=PipelineRunsFilter(pipeline_name=pipeline_name), limit=run_limit
+    ):
+        if run.status not in (PipelineRunStatus.SUCCESS, PipelineRunStatus.FAILURE):
+            continue
+
+        for step_stats in instance.get_run_step_stats(run.run_id):
+            if (
+                step_stats.status == StepEventStatus.SUCCESS
+                and step_stats.start_time is not None
+                and step_stats.end_time is not None
+            ):
+                durations[step_stats.step_key].append(step_stats.end_time - step_stats.start_time)
+
+    return {step_key: _median(step_durations) for step_key, step_durations in durations.items()}
+
+
+def critical_path_priorities(execution_plan, step_durations):
+    '''Compute the length of the longest path from each step to execute to the end of the plan.
+
+    Steps without a known duration are assumed to take the median of the known durations.
+
+    Args:
+        execution_plan (ExecutionPlan): The plan.
+        step_durations (Dict[str, float]): Step durations, by step key.
+
+    Returns:
+        Dict[str, float]: The length of the longest path starting at each step to execute,
+            including the step itself, by step key. Empty if none of the durations are known.
+    '''
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.dict_param(step_durations, 'step_durations', key_type=str)
+
+    known_durations = [
+        step_durations[step_key]
+        for step_key in execution_plan.step_keys_to_execute
+        if step_key in step_durations
+    ]
+    if not known_durations:
+        return {}
+
+    default_duration = _median(known_durations)
+
+    deps = execution_plan.execution_deps()
+    downstream = defaultdict(set)
+    for step_key, upstream_keys in deps.items():
+        for upstream_key in upstream_keys:
+            downstream[upstream_key].add(step_key)
+
+    priorities = {}
+    for step_key_level in reversed(toposort(deps)):
+        for step_key in step_key_level:
+            priorities[step_key] = step_durations.get(step_key, default_duration) + max(
+                [priorities[downstream_key] for downstream_key in downstream[step_key]] or [0]
+            )
+
+    return priorities
+
+
+def step_priorities_for_execution(pipeline_context, execution_plan):
+    '''The critical path priorities of the steps to execute, if the run opted in to them.
+
+    Returns:
+        Dict[str, float]: See :py:func:`critical_path_priorities`. Empty if the run did not opt in,
+            or if there are no recent step durations to go on.
+    '''
+    check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+
+    policy = pipeline_context.pipeline_run.tags.get(
+        STEP_PRIORITY_POLICY_TAG, STEP_PRIORITY_POLICY_TAG_VALUE
+    )
+    if policy == STEP_PRIORITY_POLICY_TAG_VALUE:
+        return {}
+
+    if policy != STEP_PRIORITY_POLICY_CRITICAL_PATH:
+        raise DagsterInvariantViolationError(
+            'Invalid value "{policy}" for tag {tag}. Expected one of "{tag_value}" or '
+            '"{critical_path}".'.format(
+                policy=policy,
+                tag=STEP_PRIORITY_POLICY_TAG,
+                tag_value=STEP_PRIORITY_POLICY_TAG_VALUE,
+                critical_path=STEP_PRIORITY_POLICY_CRITICAL_PATH,
+            )
+        )
+
+    return critical_path_priorities(
+        execution_plan,
+        recent_step_durations(pipeline_context.instance, pipeline_context.pipeline_def.name),
+    )
+
+
+def step_priority_sort_key_fn(pipeline_context, execution_plan, sort_key_fn=None):
+    '''Build the function that engines sort the steps that are ready to execute by.
+
+    Args:
+        pipeline_context (SystemPipelineExecutionContext): The context of the run.
+        execution_plan (ExecutionPlan): The plan being executed.
+        sort_key_fn (Optional[Callable[[ExecutionStep], Any]]): The sort key derived from the
+            priority tags of the steps, which takes precedence over the critical path.
+
+    Returns:
+        Callable[[ExecutionStep], Any]: A sort key function for ``ExecutionPlan.start``.
+    '''
+    sort_key_fn = check.opt_callable_param(sort_key_fn, 'sort_key_fn', default_sort_key)
+
+    priorities = step_priorities_for_execution(pipeline_context, execution_plan)
+    if not priorities:
+        return sort_key_fn
+
+    return lambda step: (sort_key_fn(step), -1 * priorities.get(step.key, 0))
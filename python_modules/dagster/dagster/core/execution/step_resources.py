@@ -0,0 +1,168 @@
+'''Resource-aware admission of steps.
+
+Steps declare the resources they use while they execute with the ``dagster/resource_requirements``
+tag, a mapping from resource name to amount, e.g.
+
+    @solid(tags={'dagster/resource_requirements': {'cpu': 2, 'memory': 4e9, 'db_connections': 1}})
+
+Resource names are free form. By convention ``cpu`` is in cores and ``memory`` in bytes, and other
+names are tokens, e.g. of a connection pool that steps share.
+
+Engines configured with the capacities of some of the resources only start a step once its
+requirements fit within the capacities left over by the steps already executing. Ready steps are
+considered in priority order, and a step that does not fit does not hold back lower priority steps
+that do. Requirements of resources without a configured capacity are not limited.
+'''
+import numbers
+
+import six
+
+from dagster import check, seven
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.execution.plan.objects import ExecutionStep
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.storage.tags import STEP_RESOURCE_REQUIREMENTS_TAG
+
+
+def _check_amounts(amounts, description):
+    if not isinstance(amounts, dict) or not all(
+        isinstance(name, six.string_types)
+        and isinstance(amount, numbers.Number)
+        and not isinstance(amount, bool)
+        and amount >= 0
+        for name, amount in amounts.items()
+    ):
+        raise DagsterInvariantViolationError(
+            'Invalid {description} {amounts}. Expected a mapping of resource names to '
+            'non-negative amounts.'.format(description=description, amounts=amounts)
+        )
+    return {name: float(amount) for name, amount in amounts.items()}
+
+
+def get_step_resource_requirements(tags):
+    '''The resources a step declares it uses with its ``dagster/resource_requirements`` tag.
+
+    Args:
+        tags (Dict[str, str]): The tags of the step.
+
+    Returns:
+        Dict[str, float]: The amount of each resource the step uses, by resource name.
+    '''
+    check.dict_param(tags, 'tags', key_type=str)
+
+    tag_value = tags.get(STEP_RESOURCE_REQUIREMENTS_TAG)
+    if tag_value is None:
+        return {}
+
+    try:
+        requirements = seven.json.loads(tag_value)
+    except seven.JSONDecodeError:
+        requirements = tag_value
+
+    return _check_amounts(
+        requirements, 'value for tag {tag}'.format(tag=STEP_RESOURCE_REQUIREMENTS_TAG)
+    )
+
+
+class StepResourcePool(object):
+    '''Admits steps to execute while their resource requirements fit within the capacities of an
+    engine.
+
+    Args:
+        capacities (Optional[Dict[str, float]]): The amount of each limited resource, by resource
+            name.
+    '''
+
+    def __init__(self, capacities=None):
+        self._capacities = _check_amounts(
+            check.opt_dict_param(capacities, 'capacities'), 'resource capacities'
+        )
+        # the limited resources held by each step executing, by step key
+        self._held = {}
+
+    @property
+    def capacities(self):
+        return dict(self._capacities)
+
+    def _limited_requirements(self, step):
+        return {
+            name: amount
+            for name, amount in get_step_resource_requirements(step.tags).items()
+            if name in self._capacities
+        }
+
+    def in_use(self):
+        '''The amount of each limited resource held by the steps executing.
+
+        Returns:
+            Dict[str, float]
+        '''
+        return {
+            name: sum(requirements.get(name, 0.0) for requirements in self._held.values())
+            for name in self._capacities
+        }
+
+    def check_execution_plan(self, execution_plan):
+        '''Ensure that each step to execute fits within the capacities on its own, so that no step
+        waits for resources forever.'''
+        check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+
+        for step_key in execution_plan.step_keys_to_execute:
+            step = execution_plan.get_step_by_key(step_key)
+            for name, amount in self._limited_requirements(step).items():
+                if amount > self._capacities[name]:
+                    raise DagsterInvariantViolationError(
+                        'Step {step_key} requires {amount} of resource "{name}", more than its '
+                        'capacity of {capacity}.'.format(
+                            step_key=step_key,
+                            amount=amount,
+                            name=name,
+                            capacity=self._capacities[name],
+                        )
+                    )
+
+    def try_acquire(self, step):
+        '''Acquire the resources a step requires, if they are available.
+
+        Returns:
+            bool: Whether the step was admitted. It holds its resources until released.
+        '''
+        check.inst_param(step, 'step', ExecutionStep)
+        check.invariant(
+            step.key not in self._held, 'Step {key} already holds resources'.format(key=step.key)
+        )
+
+        requirements = self._limited_requirements(step)
+        if requirements:
+            in_use = self.in_use()
+            if any(
+                in_use[name] + amount > self._capacities[name]
+                for name, amount in requirements.items()
+            ):
+                return False
+
+        self._held[step.key] = requirements
+        return True
+
+    def can_fuse_fn(self, step):
+        '''Build the function that restricts the steps fused with an admitted step to those that
+        require no more of any resource than it holds, as they execute in its worker.
+
+        Returns:
+            Callable[[ExecutionStep, ExecutionStep], bool]: A ``can_fuse_fn`` for
+                ``ActiveExecution.claim_fused_steps``.
+        '''
+        check.inst_param(step, 'step', ExecutionStep)
+        held = self._held.get(step.key, {})
+
+        def _can_fuse(_upstream_step, fused_step):
+            return all(
+                amount <= held.get(name, 0.0)
+                for name, amount in self._limited_requirements(fused_step).items()
+            )
+
+        return _can_fuse
+
+    def release(self, step_key):
+        check.str_param(step_key, 'step_key')
+        self._held.pop(step_key, None)
@@ -0,0 +1,134 @@
+'''Tracing runs.
+
+A run can opt in to tracing by setting the ``dagster/trace`` tag to ``true``. Spans are then
+recorded for building the execution plan, initializing resources, executing steps (loading inputs,
+type checks and compute), reading and writing intermediates and storing events.
+
+Each process that executes steps of the run writes the spans it recorded to the trace directory of
+the run, and once the resources of the run have been torn down, the process executing the run
+merges them into a single ``trace.json`` file in the Chrome trace event format. The run then emits
+an engine event with the location of the file and the total time spent in each kind of span.
+'''
+import os
+import uuid
+from collections import defaultdict
+
+from dagster import check
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.events import DagsterEvent, EngineEventData
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.tags import TRACE_TAG
+from dagster.utils import mkdir_p
+from dagster.utils.tracing import Tracer, read_chrome_trace, write_chrome_trace
+
+TRACE_FILENAME = 'trace.json'
+
+# the number of kinds of span summarized in the event of a traced run
+DEFAULT_SUMMARY_LIMIT = 10
+
+
+def tracer_for_tags(tags):
+    '''A tracer for a run with the given tags, if its ``dagster/trace`` tag enables tracing.
+
+    Returns:
+        Optional[Tracer]
+    '''
+    check.dict_param(tags, 'tags', key_type=str)
+
+    tag_value = tags.get(TRACE_TAG)
+    if not tag_value:
+        return None
+
+    value = tag_value.strip().lower()
+    if value not in ('true', 'false'):
+        raise DagsterInvariantViolationError(
+            'Invalid value "{tag_value}" for tag {tag}. Expected "true" or "false".'.format(
+                tag_value=tag_value, tag=TRACE_TAG
+            )
+        )
+    return Tracer() if value == 'true' else None
+
+
+def write_trace_fragment(instance, run_id, tracer):
+    '''Write the spans recorded by a process executing some of the steps of a run, for the process
+    executing the run to merge.'''
+    check.inst_param(instance, 'instance', DagsterInstance)
+    check.str_param(run_id, 'run_id')
+    check.inst_param(tracer, 'tracer', Tracer)
+
+    trace_dir = instance.trace_directory(run_id)
+    mkdir_p(trace_dir)
+    write_chrome_trace(
+        os.path.join(
+            trace_dir, '{pid}-{uuid}.json'.format(pid=os.getpid(), uuid=str(uuid.uuid4()))
+        ),
+        tracer.chrome_trace_events(),
+    )
+
+
+def write_run_trace(instance, run_id, tracer):
+    '''Merge the spans recorded by the process executing a run with those written by the other
+    processes that executed its steps.
+
+    Returns:
+        Tuple[str, List[dict]]: The path of the trace of the run, and its trace events.
+    '''
+    check.inst_param(instance, 'instance', DagsterInstance)
+    check.str_param(run_id, 'run_id')
+    check.inst_param(tracer, 'tracer', Tracer)
+
+    trace_dir = instance.trace_directory(run_id)
+    mkdir_p(trace_dir)
+    trace_path = os.path.join(trace_dir, TRACE_FILENAME)
+
+    events = tracer.chrome_trace_events()
+    for filename in sorted(os.listdir(trace_dir)):
+        if filename == TRACE_FILENAME or not filename.endswith('.json'):
+            continue
+        fragment_path = os.path.join(trace_dir, filename)
+        events.extend(read_chrome_trace(fragment_path))
+        os.unlink(fragment_path)
+
+    events.sort(key=lambda event: event['ts'])
+    write_chrome_trace(trace_path, events)
+    return trace_path, events
+
+
+def summarize_trace(events, limit=DEFAULT_SUMMARY_LIMIT):
+    '''The kinds of span the most time was spent in.
+
+    Returns:
+        List[Tuple[str, int, float]]: The category and name of each kind of span, the number of
+            spans of the kind and their total duration in seconds, by total duration.
+    '''
+    check.list_param(events, 'events', dict)
+    check.int_param(limit, 'limit')
+
+    counts = defaultdict(int)
+    durations = defaultdict(int)
+    for event in events:
+        key = '{category}.{name}'.format(category=event['cat'], name=event['name'])
+        counts[key] += 1
+        durations[key] += event['dur']
+
+    ranked = sorted(durations.items(), key=lambda item: item[1], reverse=True)
+    return [(key, counts[key], duration / 1e6) for key, duration in ranked[:limit]]
+
+
+def run_trace_event(pipeline_context, tracer):
+    try:
+        trace_path, events = write_run_trace(
+            pipeline_context.instance, pipeline_context.run_id, tracer
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        # a trace that can not be written should not fail the run it traced
+        pipeline_context.log.warning('Could not write the trace of the run: {exc}'.format(exc=exc))
+        return None
+
+    return DagsterEvent.engine_event(
+        pipeline_context,
+        'Wrote trace of {count} spans to {trace_path}.'.format(
+            count=len(events), trace_path=trace_path
+        ),
+        EngineEventData.run_trace(trace_path, summarize_trace(events)),
+    )
@@ -0,0 +1,61 @@
+'''Execution of the steps of a run by the workers of engines that dispatch steps to other processes
+or machines, e.g. dask workers or airflow tasks.
+
+Workers execute steps directly against the plan of the run, rather than through the ``executePlan``
+GraphQL mutation, and hand the resulting events back to the engine serialized with serdes.
+'''
+from dagster import check
+from dagster.core.definitions.handle import ExecutionTargetHandle
+from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster.core.execution.retries import Retries
+from dagster.core.instance import DagsterInstance
+from dagster.serdes import serialize_dagster_namedtuple
+
+
+def execute_run_steps(handle, instance, run_id, step_keys, retries=None):
+    '''Execute steps of a run in the current process.
+
+    Args:
+        handle (ExecutionTargetHandle): A handle to the pipeline of the run, or to the repository
+            containing it.
+        instance (DagsterInstance): The instance the run was created on.
+        run_id (str): The id of the run.
+        step_keys (List[str]): The keys of the steps of the run to execute.
+        retries (Optional[Retries]): How to retry steps that request it. (default: disabled)
+
+    Returns:
+        List[str]: The DagsterEvents emitted during execution, serialized with serdes.
+    '''
+    check.inst_param(handle, 'handle', ExecutionTargetHandle)
+    check.inst_param(instance, 'instance', DagsterInstance)
+    check.str_param(run_id, 'run_id')
+    check.list_param(step_keys, 'step_keys', of_type=str)
+    check.opt_inst_param(retries, 'retries', Retries)
+
+    pipeline_run = instance.get_run_by_id(run_id)
+    check.invariant(pipeline_run, 'Could not load run {}'.format(run_id))
+
+    if not handle.is_resolved_to_pipeline:
+        handle = handle.with_pipeline_name(pipeline_run.pipeline_name)
+
+    pipeline_def = handle.build_pipeline_definition().build_sub_pipeline(
+        pipeline_run.selector.solid_subset
+    )
+
+    execution_plan = create_execution_plan(
+        pipeline_def,
+        pipeline_run.environment_dict,
+        mode=pipeline_run.mode,
+        step_keys_to_execute=pipeline_run.step_keys_to_execute,
+    ).build_subset_plan(step_keys)
+
+    return [
+        serialize_dagster_namedtuple(event)
+        for event in execute_plan_iterator(
+            execution_plan,
+            pipeline_run=pipeline_run,
+            environment_dict=pipeline_run.environment_dict,
+            instance=instance,
+            retries=retries,
+        )
+    ]
@@ -1,6 +1,7 @@
 import datetime
 import logging
 import os
+import shutil
 import time
 from abc import ABCMeta
 from collections import defaultdict, namedtuple
@@ -28,6 +29,8 @@ from dagster.utils.yaml_utils import load_yaml_from_globs
 from .config import DAGSTER_CONFIG_YAML_FILENAME
 from .ref import InstanceRef, compute_logs_directory
 
+DEFAULT_PURGE_BATCH_SIZE = 100
+
 # 'airflow_execution_date' and 'is_airflow_ingest_pipeline' are hardcoded tags used in the
 # airflow ingestion logic (see: dagster_pipeline_factory.py). 'airflow_execution_date' stores the
 # 'execution_date' used in Airflow operator execution and 'is_airflow_ingest_pipeline' determines
@@ -413,6 +416,49 @@ class DagsterInstance:
     def get_run_step_stats(self, run_id):
         return self._event_storage.get_step_stats_for_run(run_id)
 
+    def get_runs_stats(self, run_ids):
+        return self._event_storage.get_stats_for_runs(run_ids)
+
+    def get_runs_step_stats(self, run_ids):
+        return self._event_storage.get_step_stats_for_runs(run_ids)
+
+    def get_step_history(self, pipeline_name, step_key, limit=None):
+        '''Get the stats of a step in the most recent runs of a pipeline.
+
+        Args:
+            pipeline_name (str): The name of the pipeline.
+            step_key (str): The key of the step.
+            limit (Optional[int]): The number of most recent runs of the pipeline to look at.
+
+        Returns:
+            List[RunStepKeyStatsSnapshot]: The stats of the step, for the runs in which it
+                executed, most recent run first.
+        '''
+        check.str_param(pipeline_name, 'pipeline_name')
+        check.str_param(step_key, 'step_key')
+        check.opt_int_param(limit, 'limit')
+
+        run_ids = [
+            run.run_id
+            for run in self.get_runs(PipelineRunsFilter(pipeline_name=pipeline_name), limit=limit)
+        ]
+        step_stats_by_run_id = self._event_storage.get_step_stats_for_runs(
+            run_ids, step_keys=[step_key]
+        )
+        return [step_stats for run_id in run_ids for step_stats in step_stats_by_run_id[run_id]]
+
+    def get_materialization_history(self, label, limit=None):
+        '''Get the events of the materializations with a label, across all runs.
+
+        Args:
+            label (str): The label of the materializations.
+            limit (Optional[int]): The most events to return.
+
+        Returns:
+            List[EventRecord]: The ``STEP_MATERIALIZATION`` events, most recent first.
+        '''
+        return self._event_storage.get_materialization_history(label, limit=limit)
+
     def get_run_tags(self):
         return self._run_storage.get_run_tags()
 
@@ -561,6 +607,12 @@ class DagsterInstance:
     def get_runs_count(self, filters=None):
         return self._run_storage.get_runs_count(filters)
 
+    def get_run_status_by_partition(self, partition_set_name):
+        return self._run_storage.get_run_status_by_partition(partition_set_name)
+
+    def get_successful_partition_names(self, partition_set_name):
+        return self._run_storage.get_successful_partition_names(partition_set_name)
+
     def wipe(self):
         self._run_storage.wipe()
         self._event_storage.wipe()
@@ -569,6 +621,164 @@ class DagsterInstance:
         self._run_storage.delete_run(run_id)
         self._event_storage.delete_events(run_id)
 
+    def purge_runs(
+        self,
+        max_age_seconds,
+        statuses=None,
+        pipeline_name=None,
+        tags=None,
+        batch_size=DEFAULT_PURGE_BATCH_SIZE,
+        dry_run=False,
+        progress_fn=None,
+    ):
+        '''Purge finished runs, along with their tags, events, compute logs and the intermediates
+        stored under the instance root directory.
+
+        Only runs that finished longer ago than ``max_age_seconds`` are purged, so runs in progress
+        are never touched. Runs are purged in batches, removing the artifacts of a batch before the
+        runs themselves, so a purge that is interrupted is completed by the next one.
+
+        Args:
+            max_age_seconds (float): Purge runs that finished longer ago than this.
+            statuses (Optional[List[PipelineRunStatus]]): Purge runs with these statuses, which
+                must be SUCCESS or FAILURE. (default: [SUCCESS, FAILURE])
+            pipeline_name (Optional[str]): Only purge runs of this pipeline.
+            tags (Optional[Dict[str, str]]): Only purge runs with all of these tags.
+            batch_size (Optional[int]): The number of runs to purge at once.
+            dry_run (Optional[bool]): Find the runs to purge without purging them.
+            progress_fn (Optional[Callable[[int, int], None]]): Called after each batch with the
+                number of runs purged so far and the number of runs to purge.
+
+        Returns:
+            List[str]: The ids of the purged runs.
+        '''
+        check.numeric_param(max_age_seconds, 'max_age_seconds')
+        statuses = check.opt_list_param(statuses, 'statuses', of_type=PipelineRunStatus) or [
+            PipelineRunStatus.SUCCESS,
+            PipelineRunStatus.FAILURE,
+        ]
+        check.invariant(
+            all(
+                status in (PipelineRunStatus.SUCCESS, PipelineRunStatus.FAILURE)
+                for status in statuses
+            ),
+            'Only runs that have finished, with status SUCCESS or FAILURE, can be purged',
+        )
+        check.opt_str_param(pipeline_name, 'pipeline_name')
+        check.opt_dict_param(tags, 'tags', key_type=str, value_type=str)
+        check.int_param(batch_size, 'batch_size')
+        check.bool_param(dry_run, 'dry_run')
+        check.opt_callable_param(progress_fn, 'progress_fn')
+
+        updated_before = float(time.time() - max_age_seconds)
+        run_ids = []
+        for status in statuses:
+            run_ids.extend(
+                self._run_storage.get_run_ids_updated_before(
+                    updated_before,
+                    PipelineRunsFilter(pipeline_name=pipeline_name, status=status, tags=tags),
+                )
+            )
+
+        if dry_run:
+            return run_ids
+
+        return self.delete_runs(run_ids, batch_size=batch_size, progress_fn=progress_fn)
+
+    def delete_runs(self, run_ids, batch_size=DEFAULT_PURGE_BATCH_SIZE, progress_fn=None):
+        '''Delete runs, along with their tags, events, compute logs and the intermediates stored
+        under the instance root directory.
+
+        Args:
+            run_ids (List[str]): The ids of the runs to delete.
+            batch_size (Optional[int]): The number of runs to delete at once.
+            progress_fn (Optional[Callable[[int, int], None]]): Called after each batch with the
+                number of runs deleted so far and the number of runs to delete.
+
+        Returns:
+            List[str]: The ids of the deleted runs.
+        '''
+        check.list_param(run_ids, 'run_ids', of_type=str)
+        check.int_param(batch_size, 'batch_size')
+        check.opt_callable_param(progress_fn, 'progress_fn')
+
+        for i in range(0, len(run_ids), batch_size):
+            batch = run_ids[i : i + batch_size]
+            for run_id in batch:
+                self._compute_log_manager.delete_logs(run_id)
+                intermediates_directory = self.intermediates_directory(run_id)
+                if os.path.exists(intermediates_directory):
+                    shutil.rmtree(intermediates_directory)
+            self._event_storage.delete_events_for_runs(batch)
+            self._run_storage.delete_runs(batch)
+
+            if progress_fn:
+                progress_fn(i + len(batch), len(run_ids))
+
+        return run_ids
+
+    # step cache
+
+    def add_step_cache_entry(self, step_cache_entry):
+        return self._run_storage.add_step_cache_entry(step_cache_entry)
+
+    def get_step_cache_entries(self, cache_key=None):
+        return self._run_storage.get_step_cache_entries(cache_key)
+
+    def evict_step_cache(self, max_age_seconds=None, max_entries=None, max_bytes=None):
+        '''Evict entries from the step cache index.
+
+        Args:
+            max_age_seconds (Optional[float]): Evict entries recorded longer ago than this.
+            max_entries (Optional[int]): Evict the oldest entries in excess of this count.
+            max_bytes (Optional[int]): Evict the oldest entries whose cached outputs, together with
+                those of the newer entries, are in excess of this size. Only the outputs stored
+                under the instance root directory are counted.
+
+        Returns:
+            int: The number of evicted entries.
+        '''
+        check.opt_numeric_param(max_age_seconds, 'max_age_seconds')
+        check.opt_int_param(max_entries, 'max_entries')
+        check.opt_int_param(max_bytes, 'max_bytes')
+
+        num_evicted = self._run_storage.evict_step_cache_entries(
+            before_timestamp=float(time.time() - max_age_seconds)
+            if max_age_seconds is not None
+            else None,
+            max_entries=max_entries,
+        )
+
+        if max_bytes is not None:
+            total_bytes = 0
+            for idx, entry in enumerate(self._run_storage.get_step_cache_entries()):
+                total_bytes += self._step_cache_entry_size(entry)
+                if total_bytes > max_bytes:
+                    # the entries are newest first, so this and every older entry go
+                    num_evicted += self._run_storage.evict_step_cache_entries(max_entries=idx)
+                    break
+
+        return num_evicted
+
+    def _step_cache_entry_size(self, step_cache_entry):
+        '''The size in bytes of the cached outputs of an entry stored under the instance root
+        directory.'''
+        size = 0
+        for output_name in step_cache_entry.output_names:
+            path = os.path.join(
+                self.intermediates_directory(step_cache_entry.run_id),
+                'intermediates',
+                step_cache_entry.step_key,
+                output_name,
+            )
+            if os.path.isfile(path):
+                size += os.path.getsize(path)
+            for dirpath, _, filenames in os.walk(path):
+                size += sum(
+                    os.path.getsize(os.path.join(dirpath, filename)) for filename in filenames
+                )
+        return size
+
     # event storage
 
     def logs_after(self, run_id, cursor):
@@ -577,6 +787,9 @@ class DagsterInstance:
     def all_logs(self, run_id):
         return self._event_storage.get_logs_for_run(run_id)
 
+    def logs_count(self, run_id):
+        return self._event_storage.get_logs_count_for_run(run_id)
+
     def watch_event_logs(self, run_id, cursor, cb):
         return self._event_storage.watch(run_id, cursor, cb)
 
@@ -677,6 +890,9 @@ class DagsterInstance:
     def intermediates_directory(self, run_id):
         return self._local_artifact_storage.intermediates_dir(run_id)
 
+    def trace_directory(self, run_id):
+        return self._local_artifact_storage.trace_dir(run_id)
+
     def schedules_directory(self):
         return self._local_artifact_storage.schedules_dir
 
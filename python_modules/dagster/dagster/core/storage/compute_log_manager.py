@@ -142,6 +142,13 @@ class ComputeLogManager(six.with_metaclass(ABCMeta)):
             ComputeLogFileData
         '''
 
+    def delete_logs(self, run_id):
+        '''Remove the compute logs of a run. Does nothing unless overridden.
+
+        Args:
+            run_id (str): The id of the pipeline run.
+        '''
+
     def enabled(self, _pipeline_run, _step_key):
         '''Hook for disabling compute log capture.
 
@@ -2,4 +2,4 @@ from .base import EventLogStorage
 from .in_memory import InMemoryEventLogStorage
 from .schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
 from .sql_event_log import SqlEventLogStorage
-from .sqlite import SqliteEventLogStorage
+from .sqlite import ConsolidatedSqliteEventLogStorage, SqliteEventLogStorage
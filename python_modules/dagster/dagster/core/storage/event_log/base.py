@@ -1,8 +1,9 @@
 from abc import ABCMeta, abstractmethod, abstractproperty
 
-import pyrsistent
 import six
 
+from dagster import check
+from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventRecord
 from dagster.core.execution.stats import (
     build_run_stats_from_events,
@@ -10,10 +11,6 @@ from dagster.core.execution.stats import (
 )
 
 
-class EventLogSequence(pyrsistent.CheckedPVector):
-    __type__ = EventRecord
-
-
 class EventLogStorage(six.with_metaclass(ABCMeta)):
     '''Abstract base class for storing structured event logs from pipeline runs.
 
@@ -36,6 +33,10 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
                 i.e., if cursor is -1, all logs will be returned. (default: -1)
         '''
 
+    def get_logs_count_for_run(self, run_id):
+        '''Get the number of logs corresponding to a run.'''
+        return len(self.get_logs_for_run(run_id))
+
     def get_stats_for_run(self, run_id):
         '''Get a summary of events that have ocurred in a run.'''
         return build_run_stats_from_events(run_id, self.get_logs_for_run(run_id))
@@ -44,6 +45,56 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
         '''Get per-step stats for a pipeline run.'''
         return build_run_step_stats_from_events(run_id, self.get_logs_for_run(run_id))
 
+    def get_stats_for_runs(self, run_ids):
+        '''Get summaries of the events that have occurred in many runs at once.
+
+        Storages that can fetch the stats of many runs in a single query should override this.
+
+        Args:
+            run_ids (List[str]): The ids of the runs.
+
+        Returns:
+            Dict[str, PipelineRunStatsSnapshot]: The stats of every run, by run id.
+        '''
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
+    def get_step_stats_for_runs(self, run_ids, step_keys=None):
+        '''Get the per-step stats of many runs at once.
+
+        Storages that can fetch the step stats of many runs in a single query should override this.
+
+        Args:
+            run_ids (List[str]): The ids of the runs.
+            step_keys (Optional[List[str]]): If set, only the stats of these steps are returned.
+
+        Returns:
+            Dict[str, List[RunStepKeyStatsSnapshot]]: The step stats of every run, by run id.
+        '''
+        return {
+            run_id: [
+                step_stats
+                for step_stats in self.get_step_stats_for_run(run_id)
+                if step_keys is None or step_stats.step_key in step_keys
+            ]
+            for run_id in run_ids
+        }
+
+    def get_materialization_history(self, label, limit=None):
+        '''Get the events of the materializations with a label, across all runs.
+
+        Args:
+            label (str): The label of the materializations.
+            limit (Optional[int]): The most events to return.
+
+        Returns:
+            List[EventRecord]: The ``STEP_MATERIALIZATION`` events, most recent first.
+        '''
+        check.not_implemented(
+            '{klass} does not support querying materializations across runs'.format(
+                klass=type(self).__name__
+            )
+        )
+
     @abstractmethod
     def store_event(self, event):
         '''Store an event corresponding to a pipeline run.
@@ -57,6 +108,16 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
     def delete_events(self, run_id):
         '''Remove events for a given run id'''
 
+    def delete_events_for_runs(self, run_ids):
+        '''Remove the events of many runs. Storages that can remove them at once, e.g. in a single
+        statement, should override this.
+
+        Args:
+            run_ids (List[str]): The ids of the runs whose events to remove.
+        '''
+        for run_id in run_ids:
+            self.delete_events(run_id)
+
     @abstractmethod
     def wipe(self):
         '''Clear the log storage.'''
@@ -75,3 +136,17 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
 
     def dispose(self):
         '''Explicit lifecycle management.'''
+
+
+def materialization_label(event):
+    '''The label of the materialization an event reports, or None for other events.'''
+    if (
+        event.is_dagster_event
+        and event.dagster_event.event_type == DagsterEventType.STEP_MATERIALIZATION
+    ):
+        return event.dagster_event.step_materialization_data.materialization.label
+    return None
+
+
+def is_materialization_with_label(event, label):
+    return materialization_label(event) == label
@@ -4,14 +4,59 @@ import gevent.lock
 
 from dagster import check
 from dagster.core.events.log import EventRecord
+from dagster.utils.tracing import trace_span
 
-from .base import EventLogSequence, EventLogStorage
+from .base import EventLogStorage, is_materialization_with_label
+
+# The number of events in each chunk of an EventLogBuffer
+EVENT_LOG_CHUNK_SIZE = 1024
+
+
+class EventLogBuffer(object):
+    '''An append-only sequence of the events of a run.
+
+    Events are appended to fixed size chunks, so an append never copies the events already stored.
+    Stored events are never modified, so reads need only take the number of stored events as of
+    when they start; events appended while a read copies them out are left for the next read.
+    '''
+
+    def __init__(self):
+        self._chunks = []
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return iter(self.read(0, self._len))
+
+    def append(self, event):
+        if self._len % EVENT_LOG_CHUNK_SIZE == 0:
+            self._chunks.append([])
+        self._chunks[-1].append(event)
+        self._len += 1
+
+    def read(self, start, end):
+        '''The events from index start up to, but not including, index end.'''
+        events = []
+        chunk_index, offset = divmod(start, EVENT_LOG_CHUNK_SIZE)
+        while start < end:
+            chunk = self._chunks[chunk_index]
+            stop = min(EVENT_LOG_CHUNK_SIZE, offset + end - start)
+            events.extend(chunk[offset:stop])
+            start += stop - offset
+            chunk_index += 1
+            offset = 0
+        return events
 
 
 class InMemoryEventLogStorage(EventLogStorage):
     def __init__(self):
-        self._logs = defaultdict(EventLogSequence)
+        self._logs = defaultdict(EventLogBuffer)
         self._lock = defaultdict(gevent.lock.Semaphore)
+        # serializes storing and dispatching the events of a run, so that handlers see the events
+        # in the order they were stored. Reentrant, for handlers that store events of their own.
+        self._dispatch_lock = defaultdict(gevent.lock.RLock)
         self._handlers = defaultdict(set)
 
     def get_logs_for_run(self, run_id, cursor=-1):
@@ -22,26 +67,56 @@ class InMemoryEventLogStorage(EventLogStorage):
             'Don\'t know what to do with negative cursor {cursor}'.format(cursor=cursor),
         )
 
-        cursor = cursor + 1
         with self._lock[run_id]:
-            return self._logs[run_id][cursor:]
+            logs = self._logs[run_id]
+            end = len(logs)
+        return logs.read(min(cursor + 1, end), end)
+
+    def get_logs_count_for_run(self, run_id):
+        check.str_param(run_id, 'run_id')
+        with self._lock[run_id]:
+            return len(self._logs[run_id])
 
     def store_event(self, event):
         check.inst_param(event, 'event', EventRecord)
         run_id = event.run_id
-        with self._lock[run_id]:
-            self._logs[run_id] = self._logs[run_id].append(event)
-            for handler in self._handlers[run_id]:
-                handler(event)
+        with trace_span('store_event', 'event_log'), self._dispatch_lock[run_id]:
+            with self._lock[run_id]:
+                self._logs[run_id].append(event)
+                handlers = list(self._handlers[run_id]) if run_id in self._handlers else None
+
+            # handlers may call back into the storage, e.g. to end their watch, so they are called
+            # without holding the lock
+            if handlers:
+                for handler in handlers:
+                    handler(event)
+
+    def get_materialization_history(self, label, limit=None):
+        check.str_param(label, 'label')
+        check.opt_int_param(limit, 'limit')
+
+        events = sorted(
+            (
+                event
+                for run_id in list(self._logs.keys())
+                for event in self._logs[run_id]
+                if is_materialization_with_label(event, label)
+            ),
+            key=lambda event: event.timestamp,
+            reverse=True,
+        )
+        return events[:limit] if limit is not None else events
 
     def delete_events(self, run_id):
         with self._lock[run_id]:
             del self._logs[run_id]
         del self._lock[run_id]
+        self._dispatch_lock.pop(run_id, None)
 
     def wipe(self):
-        self._logs = defaultdict(EventLogSequence)
+        self._logs = defaultdict(EventLogBuffer)
         self._lock = defaultdict(gevent.lock.Semaphore)
+        self._dispatch_lock = defaultdict(gevent.lock.RLock)
 
     def watch(self, run_id, _start_cursor, callback):
         with self._lock[run_id]:
@@ -1,5 +1,14 @@
+import sqlalchemy as db
+from tqdm import tqdm
+
+from dagster import check
 from dagster.core.instance import DagsterInstance
+from dagster.core.storage.event_log.schema import SqlEventLogStorageTable
 from dagster.core.storage.event_log.sql_event_log import SqlEventLogStorage
+from dagster.core.storage.event_log.sqlite import (
+    ConsolidatedSqliteEventLogStorage,
+    SqliteEventLogStorage,
+)
 
 
 def migrate_event_log_data(instance=None):
@@ -20,3 +29,41 @@ def migrate_event_log_data(instance=None):
         event_records_by_id = event_log_storage.get_logs_for_run_by_log_id(run.run_id)
         for record_id, event in event_records_by_id.items():
             event_log_storage.update_event_log_record(record_id, event)
+
+
+def consolidate_sqlite_event_logs(source, dest):
+    '''
+    Utility method to copy the event logs of runs stored in a separate SQLite database per run into
+    a single SQLite database.  Runs that already have events in the destination are skipped, so the
+    copy can be resumed if it is interrupted.
+
+    Args:
+        source (SqliteEventLogStorage): The storage to copy event logs from.
+        dest (ConsolidatedSqliteEventLogStorage): The storage to copy event logs into.
+
+    Returns:
+        List[str]: The ids of the runs whose event logs were copied.
+    '''
+    check.inst_param(source, 'source', SqliteEventLogStorage)
+    check.inst_param(dest, 'dest', ConsolidatedSqliteEventLogStorage)
+
+    columns = [column for column in SqlEventLogStorageTable.columns if column.name != 'id']
+    copied = []
+    for run_id in tqdm(source.get_all_run_ids()):
+        if dest.get_logs_count_for_run(run_id):
+            continue
+
+        with source.connect(run_id) as source_conn:
+            rows = source_conn.execute(
+                db.select(columns).order_by(SqlEventLogStorageTable.c.id.asc())
+            ).fetchall()
+
+        if rows:
+            with dest.connect() as dest_conn:
+                dest_conn.execute(
+                    SqlEventLogStorageTable.insert(),  # pylint: disable=no-value-for-parameter
+                    [dict(zip([column.name for column in columns], row)) for row in rows],
+                )
+        copied.append(run_id)
+
+    return copied
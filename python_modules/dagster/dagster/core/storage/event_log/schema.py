@@ -11,4 +11,24 @@ SqlEventLogStorageTable = db.Table(
     db.Column('dagster_event_type', db.Text),
     db.Column('timestamp', db.types.TIMESTAMP),
     db.Column('step_key', db.String),
+    db.Column('materialization_label', db.String),
+)
+
+# Index names are global to the schema of a Postgres database, so they are prefixed with the table.
+# The events of a run are read in order of id, so id follows run_id in its index.
+db.Index('idx_event_logs_run_id', SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id)
+db.Index(
+    'idx_event_logs_step_key',
+    SqlEventLogStorageTable.c.step_key,
+    SqlEventLogStorageTable.c.dagster_event_type,
+)
+db.Index(
+    'idx_event_logs_event_type',
+    SqlEventLogStorageTable.c.dagster_event_type,
+    SqlEventLogStorageTable.c.timestamp,
+)
+db.Index(
+    'idx_event_logs_materialization_label',
+    SqlEventLogStorageTable.c.materialization_label,
+    SqlEventLogStorageTable.c.timestamp,
 )
@@ -11,9 +11,10 @@ from dagster.core.events.log import EventRecord
 from dagster.core.execution.stats import RunStepKeyStatsSnapshot, StepEventStatus
 from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 from dagster.utils import datetime_as_float, utc_datetime_from_timestamp
+from dagster.utils.tracing import trace_span
 
 from ..pipeline_run import PipelineRunStatsSnapshot
-from .base import EventLogStorage
+from .base import EventLogStorage, materialization_label
 from .schema import SqlEventLogStorageTable
 
 
@@ -44,26 +45,9 @@ class SqlEventLogStorage(EventLogStorage):
         '''
         check.inst_param(event, 'event', EventRecord)
 
-        dagster_event_type = None
-        step_key = event.step_key
-
-        if event.is_dagster_event:
-            dagster_event_type = event.dagster_event.event_type_value
-            step_key = event.dagster_event.step_key
-
-        run_id = event.run_id
-
-        # https://stackoverflow.com/a/54386260/324449
-        event_insert = SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
-            run_id=run_id,
-            event=serialize_dagster_namedtuple(event),
-            dagster_event_type=dagster_event_type,
-            timestamp=utc_datetime_from_timestamp(event.timestamp),
-            step_key=step_key,
-        )
-
-        with self.connect(run_id) as conn:
-            conn.execute(event_insert)
+        with trace_span('store_event', 'event_log'):
+            with self.connect(event.run_id) as conn:
+                conn.execute(event_insert_statement(event))
 
     def get_logs_for_run_by_log_id(self, run_id, cursor=-1):
         check.str_param(run_id, 'run_id')
@@ -115,6 +99,18 @@ class SqlEventLogStorage(EventLogStorage):
         events_by_id = self.get_logs_for_run_by_log_id(run_id, cursor)
         return [event for id, event in sorted(events_by_id.items(), key=lambda x: x[0])]
 
+    def get_logs_count_for_run(self, run_id):
+        check.str_param(run_id, 'run_id')
+
+        query = (
+            db.select([db.func.count()])
+            .select_from(SqlEventLogStorageTable)
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+        )
+
+        with self.connect(run_id) as conn:
+            return conn.execute(query).scalar()
+
     def get_stats_for_run(self, run_id):
         check.str_param(run_id, 'run_id')
 
@@ -133,133 +129,56 @@ class SqlEventLogStorage(EventLogStorage):
         with self.connect(run_id) as conn:
             results = conn.execute(query).fetchall()
 
-        try:
-            counts = {}
-            times = {}
-            for result in results:
-                (dagster_event_type, n_events_of_type, last_event_timestamp) = result
-                if dagster_event_type:
-                    counts[dagster_event_type] = n_events_of_type
-                    times[dagster_event_type] = last_event_timestamp
-
-            start_time = times.get(DagsterEventType.PIPELINE_START.value, None)
-            end_time = times.get(
-                DagsterEventType.PIPELINE_SUCCESS.value,
-                times.get(DagsterEventType.PIPELINE_FAILURE.value, None),
-            )
+        return _run_stats_from_rows(run_id, results)
 
-            return PipelineRunStatsSnapshot(
-                run_id=run_id,
-                steps_succeeded=counts.get(DagsterEventType.STEP_SUCCESS.value, 0),
-                steps_failed=counts.get(DagsterEventType.STEP_FAILURE.value, 0),
-                materializations=counts.get(DagsterEventType.STEP_MATERIALIZATION.value, 0),
-                expectations=counts.get(DagsterEventType.STEP_EXPECTATION_RESULT.value, 0),
-                start_time=datetime_as_float(start_time) if start_time else None,
-                end_time=datetime_as_float(end_time) if end_time else None,
-            )
-        except (seven.JSONDecodeError, check.CheckError) as err:
-            six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
+    def get_stats_for_runs(self, run_ids):
+        check.list_param(run_ids, 'run_ids', of_type=str)
+        if not run_ids:
+            return {}
+
+        with self.connect() as conn:
+            results = conn.execute(run_stats_query(SqlEventLogStorageTable, run_ids)).fetchall()
+
+        return run_stats_by_run_id(run_ids, results)
 
     def get_step_stats_for_run(self, run_id):
         check.str_param(run_id, 'run_id')
 
-        STEP_STATS_EVENT_TYPES = [
-            DagsterEventType.STEP_START.value,
-            DagsterEventType.STEP_SUCCESS.value,
-            DagsterEventType.STEP_SKIPPED.value,
-            DagsterEventType.STEP_FAILURE.value,
-        ]
-
-        by_step_query = (
-            db.select(
-                [
-                    SqlEventLogStorageTable.c.step_key,
-                    SqlEventLogStorageTable.c.dagster_event_type,
-                    db.func.max(SqlEventLogStorageTable.c.timestamp).label('timestamp'),
-                ]
-            )
-            .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .where(SqlEventLogStorageTable.c.step_key != None)
-            .where(SqlEventLogStorageTable.c.dagster_event_type.in_(STEP_STATS_EVENT_TYPES))
-            .group_by(
-                SqlEventLogStorageTable.c.step_key, SqlEventLogStorageTable.c.dagster_event_type,
-            )
+        by_step_query = _step_stats_by_step_query(SqlEventLogStorageTable).where(
+            SqlEventLogStorageTable.c.run_id == run_id
+        )
+        raw_event_query = _step_stats_raw_event_query(SqlEventLogStorageTable).where(
+            SqlEventLogStorageTable.c.run_id == run_id
         )
 
         with self.connect(run_id) as conn:
-            results = conn.execute(by_step_query).fetchall()
-
-        by_step_key = defaultdict(dict)
-        for result in results:
-            step_key = result.step_key
-            if result.dagster_event_type == DagsterEventType.STEP_START.value:
-                by_step_key[step_key]['start_time'] = (
-                    datetime_as_float(result.timestamp) if result.timestamp else None
-                )
-            if result.dagster_event_type == DagsterEventType.STEP_FAILURE.value:
-                by_step_key[step_key]['end_time'] = (
-                    datetime_as_float(result.timestamp) if result.timestamp else None
-                )
-                by_step_key[step_key]['status'] = StepEventStatus.FAILURE
-            if result.dagster_event_type == DagsterEventType.STEP_SUCCESS.value:
-                by_step_key[step_key]['end_time'] = (
-                    datetime_as_float(result.timestamp) if result.timestamp else None
-                )
-                by_step_key[step_key]['status'] = StepEventStatus.SUCCESS
-            if result.dagster_event_type == DagsterEventType.STEP_SKIPPED.value:
-                by_step_key[step_key]['end_time'] = (
-                    datetime_as_float(result.timestamp) if result.timestamp else None
-                )
-                by_step_key[step_key]['status'] = StepEventStatus.SKIPPED
+            by_step_results = conn.execute(by_step_query).fetchall()
+            raw_event_results = conn.execute(raw_event_query).fetchall()
 
-        materializations = defaultdict(list)
-        expectation_results = defaultdict(list)
-        raw_event_query = (
-            db.select([SqlEventLogStorageTable.c.event])
-            .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .where(SqlEventLogStorageTable.c.step_key != None)
-            .where(
-                SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [
-                        DagsterEventType.STEP_MATERIALIZATION.value,
-                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
-                    ]
-                )
-            )
-            .order_by(SqlEventLogStorageTable.c.id.asc())
+        return _run_step_stats_from_rows(run_id, by_step_results, raw_event_results)
+
+    def get_step_stats_for_runs(self, run_ids, step_keys=None):
+        check.list_param(run_ids, 'run_ids', of_type=str)
+        check.opt_list_param(step_keys, 'step_keys', of_type=str)
+        if not run_ids:
+            return {}
+
+        by_step_query, raw_event_query = run_step_stats_queries(
+            SqlEventLogStorageTable, run_ids, step_keys
         )
 
-        with self.connect(run_id) as conn:
-            results = conn.execute(raw_event_query).fetchall()
+        with self.connect() as conn:
+            by_step_results = conn.execute(by_step_query).fetchall()
+            raw_event_results = conn.execute(raw_event_query).fetchall()
 
-        try:
-            for (json_str,) in results:
-                event = check.inst_param(
-                    deserialize_json_to_dagster_namedtuple(json_str), 'event', EventRecord
-                )
-                if event.dagster_event.event_type == DagsterEventType.STEP_MATERIALIZATION:
-                    materializations[event.step_key].append(
-                        event.dagster_event.event_specific_data.materialization
-                    )
-                elif event.dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
-                    expectation_results[event.step_key].append(
-                        event.dagster_event.event_specific_data.expectation_result
-                    )
-        except (seven.JSONDecodeError, check.CheckError) as err:
-            six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
+        return run_step_stats_by_run_id(run_ids, by_step_results, raw_event_results)
 
-        return [
-            RunStepKeyStatsSnapshot(
-                run_id=run_id,
-                step_key=step_key,
-                status=value.get('status'),
-                start_time=value.get('start_time'),
-                end_time=value.get('end_time'),
-                materializations=materializations.get(step_key),
-                expectation_results=expectation_results.get(step_key),
-            )
-            for step_key, value in by_step_key.items()
-        ]
+    def get_materialization_history(self, label, limit=None):
+        check.str_param(label, 'label')
+        check.opt_int_param(limit, 'limit')
+
+        with self.connect() as conn:
+            return fetch_materialization_history(conn, label, limit)
 
     def wipe(self):
         '''Clears the event log storage.'''
@@ -279,6 +198,18 @@ class SqlEventLogStorage(EventLogStorage):
         with self.connect(run_id) as conn:
             conn.execute(statement)
 
+    def delete_events_for_runs(self, run_ids):
+        check.list_param(run_ids, 'run_ids', of_type=str)
+        if not run_ids:
+            return
+
+        statement = SqlEventLogStorageTable.delete().where(  # pylint: disable=no-value-for-parameter
+            SqlEventLogStorageTable.c.run_id.in_(run_ids)
+        )
+
+        with self.connect() as conn:
+            conn.execute(statement)
+
     @property
     def is_persistent(self):
         return True
@@ -299,6 +230,7 @@ class SqlEventLogStorage(EventLogStorage):
                     dagster_event_type=dagster_event_type,
                     timestamp=utc_datetime_from_timestamp(event.timestamp),
                     step_key=event.step_key,
+                    materialization_label=materialization_label(event),
                 )
             )
 
@@ -314,3 +246,230 @@ class SqlEventLogStorage(EventLogStorage):
                 .order_by(SqlEventLogStorageTable.c.id.asc())
             )
             return conn.execute(query).fetchone()
+
+
+def _run_stats_from_rows(run_id, rows):
+    try:
+        counts = {}
+        times = {}
+        for (dagster_event_type, n_events_of_type, last_event_timestamp) in rows:
+            if dagster_event_type:
+                counts[dagster_event_type] = n_events_of_type
+                times[dagster_event_type] = last_event_timestamp
+
+        start_time = times.get(DagsterEventType.PIPELINE_START.value, None)
+        end_time = times.get(
+            DagsterEventType.PIPELINE_SUCCESS.value,
+            times.get(DagsterEventType.PIPELINE_FAILURE.value, None),
+        )
+
+        return PipelineRunStatsSnapshot(
+            run_id=run_id,
+            steps_succeeded=counts.get(DagsterEventType.STEP_SUCCESS.value, 0),
+            steps_failed=counts.get(DagsterEventType.STEP_FAILURE.value, 0),
+            materializations=counts.get(DagsterEventType.STEP_MATERIALIZATION.value, 0),
+            expectations=counts.get(DagsterEventType.STEP_EXPECTATION_RESULT.value, 0),
+            start_time=datetime_as_float(start_time) if start_time else None,
+            end_time=datetime_as_float(end_time) if end_time else None,
+        )
+    except (seven.JSONDecodeError, check.CheckError) as err:
+        six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
+
+
+def event_insert_statement(event):
+    '''The statement inserting an event into the event_logs table.'''
+    check.inst_param(event, 'event', EventRecord)
+
+    dagster_event_type = None
+    step_key = event.step_key
+
+    if event.is_dagster_event:
+        dagster_event_type = event.dagster_event.event_type_value
+        step_key = event.dagster_event.step_key
+
+    # https://stackoverflow.com/a/54386260/324449
+    return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+        run_id=event.run_id,
+        event=serialize_dagster_namedtuple(event),
+        dagster_event_type=dagster_event_type,
+        timestamp=utc_datetime_from_timestamp(event.timestamp),
+        step_key=step_key,
+        materialization_label=materialization_label(event),
+    )
+
+
+def fetch_materialization_history(conn, label, limit):
+    # the index on the materialization label orders the materializations with a label by timestamp
+    query = (
+        db.select([SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.event])
+        .where(SqlEventLogStorageTable.c.materialization_label == label)
+        .order_by(SqlEventLogStorageTable.c.timestamp.desc(), SqlEventLogStorageTable.c.id.desc())
+    )
+    if limit is not None:
+        query = query.limit(limit)
+
+    events = []
+    for (run_id, json_str) in conn.execute(query).fetchall():
+        try:
+            events.append(
+                check.inst_param(
+                    deserialize_json_to_dagster_namedtuple(json_str), 'event', EventRecord
+                )
+            )
+        except (seven.JSONDecodeError, check.CheckError) as err:
+            six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
+
+    return events
+
+
+STEP_STATS_EVENT_TYPES = [
+    DagsterEventType.STEP_START.value,
+    DagsterEventType.STEP_SUCCESS.value,
+    DagsterEventType.STEP_SKIPPED.value,
+    DagsterEventType.STEP_FAILURE.value,
+]
+
+
+def run_stats_query(table, run_ids):
+    '''The query for the stats of a batch of runs, from a table or selectable of events.'''
+    return (
+        db.select(
+            [
+                table.c.run_id,
+                table.c.dagster_event_type,
+                db.func.count().label('n_events_of_type'),
+                db.func.max(table.c.timestamp).label('last_event_timestamp'),
+            ]
+        )
+        .where(table.c.run_id.in_(run_ids))
+        .group_by(table.c.run_id, table.c.dagster_event_type)
+    )
+
+
+def run_stats_by_run_id(run_ids, results):
+    rows_by_run_id = defaultdict(list)
+    for result in results:
+        rows_by_run_id[result.run_id].append(result[1:])
+
+    return {run_id: _run_stats_from_rows(run_id, rows_by_run_id[run_id]) for run_id in run_ids}
+
+
+def run_step_stats_queries(table, run_ids, step_keys=None):
+    '''The queries for the step stats of a batch of runs, from a table or selectable of events.'''
+    by_step_query = _step_stats_by_step_query(table, table.c.run_id).where(
+        table.c.run_id.in_(run_ids)
+    )
+    raw_event_query = _step_stats_raw_event_query(table, table.c.run_id).where(
+        table.c.run_id.in_(run_ids)
+    )
+    if step_keys is not None:
+        by_step_query = by_step_query.where(table.c.step_key.in_(step_keys))
+        raw_event_query = raw_event_query.where(table.c.step_key.in_(step_keys))
+    return by_step_query, raw_event_query
+
+
+def run_step_stats_by_run_id(run_ids, by_step_results, raw_event_results):
+    by_step_rows = defaultdict(list)
+    for result in by_step_results:
+        by_step_rows[result.run_id].append(result)
+
+    raw_event_rows = defaultdict(list)
+    for result in raw_event_results:
+        raw_event_rows[result.run_id].append(result)
+
+    return {
+        run_id: _run_step_stats_from_rows(run_id, by_step_rows[run_id], raw_event_rows[run_id])
+        for run_id in run_ids
+    }
+
+
+def _step_stats_by_step_query(table, *group_by_columns):
+    group_by_columns = list(group_by_columns) + [table.c.step_key, table.c.dagster_event_type]
+    return (
+        db.select(group_by_columns + [db.func.max(table.c.timestamp).label('timestamp')])
+        .where(table.c.step_key != None)
+        .where(table.c.dagster_event_type.in_(STEP_STATS_EVENT_TYPES))
+        .group_by(*group_by_columns)
+    )
+
+
+def _step_stats_raw_event_query(table, *columns):
+    return (
+        db.select(list(columns) + [table.c.event])
+        .where(table.c.step_key != None)
+        .where(
+            table.c.dagster_event_type.in_(
+                [
+                    DagsterEventType.STEP_MATERIALIZATION.value,
+                    DagsterEventType.STEP_EXPECTATION_RESULT.value,
+                    DagsterEventType.STEP_SUCCESS.value,
+                    DagsterEventType.STEP_FAILURE.value,
+                ]
+            )
+        )
+        .order_by(table.c.id.asc())
+    )
+
+
+def _run_step_stats_from_rows(run_id, by_step_rows, raw_event_rows):
+    by_step_key = defaultdict(dict)
+    for result in by_step_rows:
+        step_key = result.step_key
+        if result.dagster_event_type == DagsterEventType.STEP_START.value:
+            by_step_key[step_key]['start_time'] = (
+                datetime_as_float(result.timestamp) if result.timestamp else None
+            )
+        if result.dagster_event_type == DagsterEventType.STEP_FAILURE.value:
+            by_step_key[step_key]['end_time'] = (
+                datetime_as_float(result.timestamp) if result.timestamp else None
+            )
+            by_step_key[step_key]['status'] = StepEventStatus.FAILURE
+        if result.dagster_event_type == DagsterEventType.STEP_SUCCESS.value:
+            by_step_key[step_key]['end_time'] = (
+                datetime_as_float(result.timestamp) if result.timestamp else None
+            )
+            by_step_key[step_key]['status'] = StepEventStatus.SUCCESS
+        if result.dagster_event_type == DagsterEventType.STEP_SKIPPED.value:
+            by_step_key[step_key]['end_time'] = (
+                datetime_as_float(result.timestamp) if result.timestamp else None
+            )
+            by_step_key[step_key]['status'] = StepEventStatus.SKIPPED
+
+    materializations = defaultdict(list)
+    expectation_results = defaultdict(list)
+    resource_usage = {}
+    try:
+        for result in raw_event_rows:
+            event = check.inst_param(
+                deserialize_json_to_dagster_namedtuple(result.event), 'event', EventRecord
+            )
+            if event.dagster_event.event_type == DagsterEventType.STEP_MATERIALIZATION:
+                materializations[event.step_key].append(
+                    event.dagster_event.event_specific_data.materialization
+                )
+            elif event.dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+                expectation_results[event.step_key].append(
+                    event.dagster_event.event_specific_data.expectation_result
+                )
+            elif event.dagster_event.event_type in (
+                DagsterEventType.STEP_SUCCESS,
+                DagsterEventType.STEP_FAILURE,
+            ):
+                step_data = event.dagster_event.event_specific_data
+                resource_usage[event.step_key] = step_data.resource_usage
+    except (seven.JSONDecodeError, check.CheckError) as err:
+        six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
+
+    return [
+        RunStepKeyStatsSnapshot(
+            run_id=run_id,
+            step_key=step_key,
+            status=value.get('status'),
+            start_time=value.get('start_time'),
+            end_time=value.get('end_time'),
+            materializations=materializations.get(step_key),
+            expectation_results=expectation_results.get(step_key),
+            resource_usage=resource_usage.get(step_key),
+        )
+        for step_key, value in by_step_key.items()
+    ]
@@ -1 +1,2 @@
+from .consolidated_sqlite_event_log import ConsolidatedSqliteEventLogStorage
 from .sqlite_event_log import SqliteEventLogStorage
@@ -0,0 +1,40 @@
+"""add event log indexes
+
+Revision ID: d2e73ef25a01
+Revises: 3b1e175a2be3
+Create Date: 2020-05-04 10:12:31.408217
+
+"""
+from alembic import op
+
+from dagster.core.storage.migration.utils import has_index, has_table
+
+# alembic magic breaks pylint
+# pylint: disable=no-member
+
+# revision identifiers, used by Alembic.
+revision = 'd2e73ef25a01'
+down_revision = '3b1e175a2be3'
+branch_labels = None
+depends_on = None
+
+EVENT_LOG_INDEXES = [
+    ('idx_event_logs_run_id', ['run_id', 'id']),
+    ('idx_event_logs_step_key', ['step_key', 'dagster_event_type']),
+    ('idx_event_logs_event_type', ['dagster_event_type', 'timestamp']),
+]
+
+
+def upgrade():
+    if not has_table('event_logs'):
+        return
+
+    for index_name, columns in EVENT_LOG_INDEXES:
+        if not has_index('event_logs', index_name):
+            op.create_index(index_name, 'event_logs', columns)
+
+
+def downgrade():
+    for index_name, _ in EVENT_LOG_INDEXES:
+        if has_index('event_logs', index_name):
+            op.drop_index(index_name, 'event_logs')
@@ -0,0 +1,190 @@
+import os
+from collections import defaultdict
+from contextlib import contextmanager
+
+import six
+import sqlalchemy as db
+from sqlalchemy.pool import NullPool
+from watchdog.events import PatternMatchingEventHandler
+from watchdog.observers import Observer
+
+from dagster import check, seven
+from dagster.core.errors import DagsterEventLogInvalidForRun
+from dagster.core.events.log import EventRecord
+from dagster.serdes import (
+    ConfigurableClass,
+    ConfigurableClassData,
+    deserialize_json_to_dagster_namedtuple,
+)
+from dagster.utils import mkdir_p
+
+from ...pipeline_run import PipelineRunStatus
+from ...sql import create_engine, get_alembic_config, handle_schema_errors, run_alembic_upgrade
+from ..schema import SqlEventLogStorageTable
+from ..sql_event_log import SqlEventLogStorage
+from .sqlite_event_log import SQLITE_BUSY_TIMEOUT, initdb
+
+SQLITE_EVENT_LOG_FILENAME = 'event_log'
+
+
+class ConsolidatedSqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
+    '''SQLite-backed event log storage keeping the events of all runs in a single database.
+
+    Users should not directly instantiate this class; it is instantiated by internal machinery when
+    ``dagit`` and ``dagster-graphql`` load, based on the values in the ``dagster.yaml`` file in
+    ``$DAGSTER_HOME``. Configuration of this class should be done by setting values in that file.
+
+    To use a single SQLite database for event log storage, you can add a block such as the
+    following to your ``dagster.yaml``:
+
+    .. code-block:: YAML
+
+        event_log_storage:
+          module: dagster.core.storage.event_log
+          class: ConsolidatedSqliteEventLogStorage
+          config:
+            base_dir: /path/to/dir
+
+    Unlike :py:class:`SqliteEventLogStorage`, which stores the events of each run in a separate
+    database, this storage can answer queries across runs, e.g. the stats of many runs or the
+    history of a step, in a single query. It suits single node deployments. Events stored with
+    :py:class:`SqliteEventLogStorage` can be copied into it with
+    :py:func:`~dagster.core.storage.event_log.migration.consolidate_sqlite_event_logs`.
+    '''
+
+    def __init__(self, base_dir, inst_data=None):
+        self._base_dir = os.path.abspath(check.str_param(base_dir, 'base_dir'))
+        mkdir_p(self._base_dir)
+
+        self._watchers = defaultdict(dict)
+        self._obs = Observer()
+        self._obs.start()
+        self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
+
+        if not os.path.exists(self.path):
+            engine = self._create_engine()
+            try:
+                initdb(engine, get_alembic_config(__file__))
+            finally:
+                engine.dispose()
+
+    def upgrade(self):
+        alembic_config = get_alembic_config(__file__)
+        with self.connect() as conn:
+            run_alembic_upgrade(alembic_config, conn)
+
+    @property
+    def inst_data(self):
+        return self._inst_data
+
+    @classmethod
+    def config_type(cls):
+        return {'base_dir': str}
+
+    @staticmethod
+    def from_config_value(inst_data, config_value):
+        return ConsolidatedSqliteEventLogStorage(inst_data=inst_data, **config_value)
+
+    @property
+    def path(self):
+        return os.path.join(
+            self._base_dir, '{filename}.db'.format(filename=SQLITE_EVENT_LOG_FILENAME)
+        )
+
+    def _create_engine(self):
+        return create_engine(
+            'sqlite:///{}'.format('/'.join(self.path.split(os.sep))),
+            poolclass=NullPool,
+            connect_args={'timeout': SQLITE_BUSY_TIMEOUT},
+        )
+
+    @contextmanager
+    def connect(self, run_id=None):
+        engine = self._create_engine()
+        conn = engine.connect()
+        try:
+            with handle_schema_errors(
+                conn, get_alembic_config(__file__), msg='ConsolidatedSqliteEventLogStorage',
+            ):
+                yield conn
+        finally:
+            conn.close()
+        engine.dispose()
+
+    def get_all_run_ids(self):
+        with self.connect() as conn:
+            return [
+                row[0]
+                for row in conn.execute(db.select([SqlEventLogStorageTable.c.run_id]).distinct())
+            ]
+
+    def get_logs_for_run_by_log_id(self, run_id, cursor=-1):
+        check.str_param(run_id, 'run_id')
+        check.int_param(cursor, 'cursor')
+        check.invariant(
+            cursor >= -1,
+            'Don\'t know what to do with negative cursor {cursor}'.format(cursor=cursor),
+        )
+
+        # ids are shared by the events of all runs, so the cursor counts the events of the run
+        # rather than comparing against their ids
+        query = (
+            db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+            .offset(cursor + 1)
+        )
+
+        with self.connect(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        events = {}
+        try:
+            for (record_id, json_str,) in results:
+                events[record_id] = check.inst_param(
+                    deserialize_json_to_dagster_namedtuple(json_str), 'event', EventRecord
+                )
+        except (seven.JSONDecodeError, check.CheckError) as err:
+            six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
+
+        return events
+
+    def watch(self, run_id, start_cursor, callback):
+        watchdog = ConsolidatedSqliteEventLogStorageWatchdog(self, run_id, callback, start_cursor)
+        self._watchers[run_id][callback] = (
+            watchdog,
+            self._obs.schedule(watchdog, self._base_dir, True),
+        )
+
+    def end_watch(self, run_id, handler):
+        if handler in self._watchers[run_id]:
+            event_handler, watch = self._watchers[run_id][handler]
+            self._obs.remove_handler_for_watch(event_handler, watch)
+            del self._watchers[run_id][handler]
+
+
+class ConsolidatedSqliteEventLogStorageWatchdog(PatternMatchingEventHandler):
+    def __init__(self, event_log_storage, run_id, callback, start_cursor, **kwargs):
+        self._event_log_storage = check.inst_param(
+            event_log_storage, 'event_log_storage', ConsolidatedSqliteEventLogStorage
+        )
+        self._run_id = check.str_param(run_id, 'run_id')
+        self._cb = check.callable_param(callback, 'callback')
+        self._cursor = start_cursor if start_cursor is not None else -1
+        # in WAL mode, writes land in the write-ahead log before they are checkpointed into the
+        # database, so watch both
+        super(ConsolidatedSqliteEventLogStorageWatchdog, self).__init__(
+            patterns=[event_log_storage.path, event_log_storage.path + '-wal'], **kwargs
+        )
+
+    def _process_log(self):
+        events = self._event_log_storage.get_logs_for_run(self._run_id, self._cursor)
+        self._cursor += len(events)
+        for event in events:
+            status = self._cb(event)
+
+            if status == PipelineRunStatus.SUCCESS or status == PipelineRunStatus.FAILURE:
+                self._event_log_storage.end_watch(self._run_id, self._cb)
+
+    def on_modified(self, event):
+        self._process_log()
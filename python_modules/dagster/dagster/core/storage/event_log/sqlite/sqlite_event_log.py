@@ -12,7 +12,13 @@ from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers import Observer
 
 from dagster import check
-from dagster.serdes import ConfigurableClass, ConfigurableClassData
+from dagster.core.events import DagsterEventType
+from dagster.core.events.log import EventRecord
+from dagster.serdes import (
+    ConfigurableClass,
+    ConfigurableClassData,
+    deserialize_json_to_dagster_namedtuple,
+)
 from dagster.utils import mkdir_p
 
 from ...pipeline_run import PipelineRunStatus
@@ -23,8 +29,29 @@ from ...sql import (
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
-from ..schema import SqlEventLogStorageMetadata
-from ..sql_event_log import SqlEventLogStorage
+from ..base import materialization_label
+from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
+from ..sql_event_log import (
+    SqlEventLogStorage,
+    event_insert_statement,
+    fetch_materialization_history,
+    run_stats_by_run_id,
+    run_stats_query,
+    run_step_stats_by_run_id,
+    run_step_stats_queries,
+)
+
+# SQLite's default limit on the number of databases attached to a connection
+MAX_ATTACHED_DATABASES = 10
+
+# Writers from concurrent step processes take turns holding the write lock of the database, so wait
+# for it well beyond the five second default of sqlite3 before failing to store an event
+SQLITE_BUSY_TIMEOUT = 30
+
+# The materializations of every run are also stored in a database of their own, in a directory
+# of the base dir so that it is not taken for the database of a run
+MATERIALIZATION_INDEX_DIRNAME = 'index'
+MATERIALIZATION_INDEX_FILENAME = 'materializations.db'
 
 
 class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
@@ -49,7 +76,8 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     The ``base_dir`` param tells the event log storage where on disk to store the databases. To
     improve concurrent performance, event logs are stored in a separate SQLite database for each
-    run.
+    run. Materializations are also stored in a database shared by all runs, so that they can be
+    looked up across runs without opening the database of every run.
     '''
 
     def __init__(self, base_dir, inst_data=None):
@@ -75,6 +103,11 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
             with self.connect(run_id) as conn:
                 run_alembic_upgrade(alembic_config, conn, run_id)
 
+        print('Rebuilding the materialization index...')
+        with self._connect_materialization_index() as conn:
+            run_alembic_upgrade(alembic_config, conn)
+        self._rebuild_materialization_index(all_run_ids)
+
     @property
     def inst_data(self):
         return self._inst_data
@@ -99,31 +132,7 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
         return 'sqlite:///{}'.format('/'.join(self.path_for_run_id(run_id).split(os.sep)))
 
     def _initdb(self, engine, run_id):
-
-        alembic_config = get_alembic_config(__file__)
-
-        try:
-            SqlEventLogStorageMetadata.create_all(engine)
-            engine.execute('PRAGMA journal_mode=WAL;')
-            stamp_alembic_rev(alembic_config, engine)
-        except (db.exc.DatabaseError, sqlite3.DatabaseError, sqlite3.OperationalError) as exc:
-            # This is SQLite-specific handling for concurrency issues that can arise when, e.g.,
-            # the root nodes of a pipeline execute simultaneously on Airflow with SQLite storage
-            # configured and contend with each other to init the db. When we hit the following
-            # errors, we know that another process is on the case and it's safe to continue:
-            err_msg = str(exc)
-            if not (
-                'table event_logs already exists' in err_msg
-                or 'database is locked' in err_msg
-                or 'table alembic_version already exists' in err_msg
-                or 'UNIQUE constraint failed: alembic_version.version_num' in err_msg
-            ):
-                raise
-            else:
-                logging.info(
-                    'SqliteEventLogStorage._initdb: Encountered apparent concurrent init, '
-                    'swallowing {str_exc}'.format(str_exc=err_msg)
-                )
+        initdb(engine, get_alembic_config(__file__))
 
     @contextmanager
     def connect(self, run_id=None):
@@ -147,11 +156,186 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
             conn.close()
         engine.dispose()
 
+    @property
+    def materialization_index_path(self):
+        return os.path.join(
+            self._base_dir, MATERIALIZATION_INDEX_DIRNAME, MATERIALIZATION_INDEX_FILENAME
+        )
+
+    @contextmanager
+    def _connect_materialization_index(self):
+        path = self.materialization_index_path
+        engine = create_engine(
+            'sqlite:///{}'.format('/'.join(path.split(os.sep))),
+            poolclass=NullPool,
+            connect_args={'timeout': SQLITE_BUSY_TIMEOUT},
+        )
+
+        if not os.path.exists(path):
+            mkdir_p(os.path.dirname(path))
+            initdb(engine, get_alembic_config(__file__))
+
+        conn = engine.connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+        engine.dispose()
+
+    def _rebuild_materialization_index(self, run_ids):
+        with self._connect_materialization_index() as index_conn:
+            index_conn.execute(
+                SqlEventLogStorageTable.delete()  # pylint: disable=no-value-for-parameter
+            )
+            for run_id in run_ids:
+                with self.connect(run_id) as conn:
+                    rows = conn.execute(
+                        db.select([SqlEventLogStorageTable.c.event])
+                        .where(
+                            SqlEventLogStorageTable.c.dagster_event_type
+                            == DagsterEventType.STEP_MATERIALIZATION.value
+                        )
+                        .order_by(SqlEventLogStorageTable.c.id.asc())
+                    ).fetchall()
+
+                for (json_str,) in rows:
+                    event = check.inst_param(
+                        deserialize_json_to_dagster_namedtuple(json_str), 'event', EventRecord
+                    )
+                    index_conn.execute(event_insert_statement(event))
+
+    def store_event(self, event):
+        super(SqliteEventLogStorage, self).store_event(event)
+
+        if materialization_label(event) is not None:
+            with self._connect_materialization_index() as conn:
+                conn.execute(event_insert_statement(event))
+
+    @contextmanager
+    def _connect_attached(self, run_ids):
+        '''Attach the databases of a batch of runs to a single connection.
+
+        Yields the connection, and a selectable of the events of all of the runs that can be
+        queried like the event_logs table.
+        '''
+        engine = create_engine('sqlite://', poolclass=NullPool)
+        conn = engine.connect()
+        try:
+            tables = []
+            for idx, run_id in enumerate(run_ids):
+                schema = 'run_{idx}'.format(idx=idx)
+                conn.execute(
+                    db.text('ATTACH DATABASE :path AS {schema}'.format(schema=schema)),
+                    path=self.path_for_run_id(run_id),
+                )
+                tables.append(
+                    db.Table(
+                        SqlEventLogStorageTable.name,
+                        db.MetaData(),
+                        *[
+                            db.Column(column.name, column.type)
+                            for column in SqlEventLogStorageTable.columns
+                        ],
+                        schema=schema
+                    )
+                )
+            yield conn, db.union_all(*[db.select([table]) for table in tables]).alias()
+        finally:
+            conn.close()
+            engine.dispose()
+
+    def _attached_batches(self, run_ids):
+        # runs that have not stored any events do not have a database to attach
+        run_ids = [run_id for run_id in run_ids if os.path.exists(self.path_for_run_id(run_id))]
+        for idx in range(0, len(run_ids), MAX_ATTACHED_DATABASES):
+            yield run_ids[idx : idx + MAX_ATTACHED_DATABASES]
+
+    def get_stats_for_runs(self, run_ids):
+        # events are sharded into a database per run, so the databases of the runs are attached
+        # to a single connection and queried together, in batches
+        check.list_param(run_ids, 'run_ids', of_type=str)
+
+        results = []
+        try:
+            for batch_run_ids in self._attached_batches(run_ids):
+                with self._connect_attached(batch_run_ids) as (conn, table):
+                    results.extend(conn.execute(run_stats_query(table, batch_run_ids)).fetchall())
+        except db.exc.OperationalError as exc:
+            if not _is_attached_query_fallback_error(exc):
+                raise
+            _warn_attached_query_fallback('get_stats_for_runs', exc)
+            return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
+        return run_stats_by_run_id(run_ids, results)
+
+    def get_step_stats_for_runs(self, run_ids, step_keys=None):
+        check.list_param(run_ids, 'run_ids', of_type=str)
+        check.opt_list_param(step_keys, 'step_keys', of_type=str)
+
+        by_step_results = []
+        raw_event_results = []
+        try:
+            for batch_run_ids in self._attached_batches(run_ids):
+                with self._connect_attached(batch_run_ids) as (conn, table):
+                    by_step_query, raw_event_query = run_step_stats_queries(
+                        table, batch_run_ids, step_keys
+                    )
+                    by_step_results.extend(conn.execute(by_step_query).fetchall())
+                    raw_event_results.extend(conn.execute(raw_event_query).fetchall())
+        except db.exc.OperationalError as exc:
+            if not _is_attached_query_fallback_error(exc):
+                raise
+            _warn_attached_query_fallback('get_step_stats_for_runs', exc)
+            return {
+                run_id: [
+                    step_stats
+                    for step_stats in self.get_step_stats_for_run(run_id)
+                    if step_keys is None or step_stats.step_key in step_keys
+                ]
+                for run_id in run_ids
+            }
+
+        return run_step_stats_by_run_id(run_ids, by_step_results, raw_event_results)
+
+    def get_materialization_history(self, label, limit=None):
+        check.str_param(label, 'label')
+        check.opt_int_param(limit, 'limit')
+
+        with self._connect_materialization_index() as conn:
+            return fetch_materialization_history(conn, label, limit)
+
+    def delete_events(self, run_id):
+        check.str_param(run_id, 'run_id')
+        self.delete_events_for_runs([run_id])
+
+    def delete_events_for_runs(self, run_ids):
+        check.list_param(run_ids, 'run_ids', of_type=str)
+        if not run_ids:
+            return
+
+        with self._connect_materialization_index() as conn:
+            conn.execute(
+                SqlEventLogStorageTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    SqlEventLogStorageTable.c.run_id.in_(run_ids)
+                )
+            )
+
+        # the database of a run holds nothing else, so remove it rather than its rows
+        for run_id in run_ids:
+            path = self.path_for_run_id(run_id)
+            for filename in [path, path + '-wal', path + '-shm']:
+                if os.path.exists(filename):
+                    os.unlink(filename)
+
     def wipe(self):
+        index_dir = os.path.dirname(self.materialization_index_path)
         for filename in (
             glob.glob(os.path.join(self._base_dir, '*.db'))
             + glob.glob(os.path.join(self._base_dir, '*.db-wal'))
             + glob.glob(os.path.join(self._base_dir, '*.db-shm'))
+            + glob.glob(os.path.join(index_dir, '*.db'))
+            + glob.glob(os.path.join(index_dir, '*.db-wal'))
+            + glob.glob(os.path.join(index_dir, '*.db-shm'))
         ):
             os.unlink(filename)
 
@@ -169,6 +353,63 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
             del self._watchers[run_id][handler]
 
 
+def initdb(engine, alembic_config):
+    '''Create the event log schema in a new SQLite database and stamp it with the latest revision.
+
+    Args:
+        engine (sqlalchemy.engine.Engine): An engine connected to the database.
+        alembic_config (alembic.config.Config): The alembic config of the storage.
+    '''
+    try:
+        SqlEventLogStorageMetadata.create_all(engine)
+        engine.execute('PRAGMA journal_mode=WAL;')
+        stamp_alembic_rev(alembic_config, engine)
+    except (db.exc.DatabaseError, sqlite3.DatabaseError, sqlite3.OperationalError) as exc:
+        # This is SQLite-specific handling for concurrency issues that can arise when, e.g.,
+        # the root nodes of a pipeline execute simultaneously on Airflow with SQLite storage
+        # configured and contend with each other to init the db. When we hit the following
+        # errors, we know that another process is on the case and it's safe to continue:
+        err_msg = str(exc)
+        if not (
+            'table event_logs already exists' in err_msg
+            or 'database is locked' in err_msg
+            or 'table alembic_version already exists' in err_msg
+            or 'UNIQUE constraint failed: alembic_version.version_num' in err_msg
+            or ('index' in err_msg and 'already exists' in err_msg)
+        ):
+            raise
+        else:
+            logging.info(
+                'SqliteEventLogStorage._initdb: Encountered apparent concurrent init, '
+                'swallowing {str_exc}'.format(str_exc=err_msg)
+            )
+
+
+def _is_attached_query_fallback_error(exc):
+    '''Whether the per-run queries can serve a query of attached run databases that failed with
+    this error.
+
+    SQLite may be compiled with a lower limit on attached databases than the default one we batch
+    by, and the database of a run may be out of date, which querying the run alone reports as a
+    required migration.
+    '''
+    err_msg = str(exc)
+    return (
+        'too many attached databases' in err_msg
+        or 'no such column' in err_msg
+        or 'no such table' in err_msg
+    )
+
+
+def _warn_attached_query_fallback(method_name, exc):
+    logging.warning(
+        'SqliteEventLogStorage.{method_name}: Falling back to querying each run separately, '
+        'the databases of the runs could not be queried together: {str_exc}'.format(
+            method_name=method_name, str_exc=str(exc)
+        )
+    )
+
+
 class SqliteEventLogStorageWatchdog(PatternMatchingEventHandler):
     def __init__(self, event_log_storage, run_id, callback, start_cursor, **kwargs):
         self._event_log_storage = check.inst_param(
@@ -7,6 +7,7 @@ from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.types.dagster_type import DagsterType
 from dagster.utils.backcompat import canonicalize_backcompat_args
+from dagster.utils.tracing import trace_span
 
 from .intermediate_store import IntermediateStore
 
@@ -32,6 +33,10 @@ class IntermediatesManager(six.with_metaclass(ABCMeta)):  # pylint: disable=no-i
     def copy_intermediate_from_run(self, context, run_id, step_output_handle):
         pass
 
+    @abstractmethod
+    def has_intermediate_in_run(self, context, run_id, step_output_handle):
+        pass
+
     @abstractproperty
     def is_persistent(self):
         pass
@@ -93,6 +98,9 @@ class InMemoryIntermediatesManager(IntermediatesManager):
     def copy_intermediate_from_run(self, context, run_id, step_output_handle):
         check.failed('not implemented in in memory')
 
+    def has_intermediate_in_run(self, context, run_id, step_output_handle):
+        check.failed('not implemented in in memory')
+
     @property
     def is_persistent(self):
         return False
@@ -118,11 +126,17 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
         check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
         check.invariant(self.has_intermediate(context, step_output_handle))
 
-        return self._intermediate_store.get_value(
-            context=context,
-            dagster_type=canonicalize_dagster_type,
-            paths=self._get_paths(step_output_handle),
-        )
+        with trace_span(
+            'get_intermediate',
+            'intermediates',
+            step_key=step_output_handle.step_key,
+            output_name=step_output_handle.output_name,
+        ):
+            return self._intermediate_store.get_value(
+                context=context,
+                dagster_type=canonicalize_dagster_type,
+                paths=self._get_paths(step_output_handle),
+            )
 
     def set_intermediate(
         self, context, dagster_type=None, step_output_handle=None, value=None, runtime_type=None
@@ -140,12 +154,18 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
                 % (step_output_handle.step_key, step_output_handle.output_name)
             )
 
-        return self._intermediate_store.set_value(
-            obj=value,
-            context=context,
-            dagster_type=canonicalize_dagster_type,
-            paths=self._get_paths(step_output_handle),
-        )
+        with trace_span(
+            'set_intermediate',
+            'intermediates',
+            step_key=step_output_handle.step_key,
+            output_name=step_output_handle.output_name,
+        ):
+            return self._intermediate_store.set_value(
+                obj=value,
+                context=context,
+                dagster_type=canonicalize_dagster_type,
+                paths=self._get_paths(step_output_handle),
+            )
 
     def has_intermediate(self, context, step_output_handle):
         check.inst_param(context, 'context', SystemPipelineExecutionContext)
@@ -158,6 +178,90 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
             context, run_id, self._get_paths(step_output_handle)
         )
 
+    def has_intermediate_in_run(self, context, run_id, step_output_handle):
+        check.inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.str_param(run_id, 'run_id')
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+
+        return self._intermediate_store.has_object_in_run(
+            context, run_id, self._get_paths(step_output_handle)
+        )
+
     @property
     def is_persistent(self):
         return True
+
+
+class FusedStepsIntermediatesManager(IntermediatesManager):
+    '''Wraps the intermediates manager of a run to hand off the outputs of fused steps to the steps
+    they are fused with in memory, see ``dagster.core.execution.step_fusion``.
+
+    If ``persist`` is set, handed off outputs are also written to the wrapped manager, and the in
+    memory copy is dropped once it has been read by the consuming step.
+    '''
+
+    def __init__(self, intermediates_manager, handoff_handles, persist=True):
+        self._intermediates_manager = check.inst_param(
+            intermediates_manager, 'intermediates_manager', IntermediatesManager
+        )
+        self._handoff_handles = check.set_param(
+            handoff_handles, 'handoff_handles', of_type=StepOutputHandle
+        )
+        self._persist = check.bool_param(persist, 'persist')
+        self._values = {}
+
+    def get_intermediate(
+        self, context, dagster_type=None, step_output_handle=None, runtime_type=None
+    ):
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+
+        if step_output_handle in self._values:
+            if self._persist:
+                return self._values.pop(step_output_handle)
+            return self._values[step_output_handle]
+
+        return self._intermediates_manager.get_intermediate(
+            context,
+            dagster_type=dagster_type,
+            step_output_handle=step_output_handle,
+            runtime_type=runtime_type,
+        )
+
+    def set_intermediate(
+        self, context, dagster_type=None, step_output_handle=None, value=None, runtime_type=None
+    ):
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+
+        if step_output_handle in self._handoff_handles:
+            self._values[step_output_handle] = value
+            if not self._persist:
+                return None
+
+        return self._intermediates_manager.set_intermediate(
+            context,
+            dagster_type=dagster_type,
+            step_output_handle=step_output_handle,
+            value=value,
+            runtime_type=runtime_type,
+        )
+
+    def has_intermediate(self, context, step_output_handle):
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+
+        return step_output_handle in self._values or self._intermediates_manager.has_intermediate(
+            context, step_output_handle
+        )
+
+    def copy_intermediate_from_run(self, context, run_id, step_output_handle):
+        return self._intermediates_manager.copy_intermediate_from_run(
+            context, run_id, step_output_handle
+        )
+
+    def has_intermediate_in_run(self, context, run_id, step_output_handle):
+        return self._intermediates_manager.has_intermediate_in_run(
+            context, run_id, step_output_handle
+        )
+
+    @property
+    def is_persistent(self):
+        return self._intermediates_manager.is_persistent
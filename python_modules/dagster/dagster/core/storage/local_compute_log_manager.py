@@ -1,5 +1,6 @@
 import hashlib
 import os
+import shutil
 import sys
 from collections import defaultdict
 from contextlib import contextmanager
@@ -77,6 +78,12 @@ class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
             filename = "{}.{}".format(hashlib.md5(key.encode('utf-8')).hexdigest(), extension)
         return os.path.join(self._run_directory(run_id), filename)
 
+    def delete_logs(self, run_id):
+        check.str_param(run_id, 'run_id')
+        run_directory = self._run_directory(run_id)
+        if os.path.exists(run_directory):
+            shutil.rmtree(run_directory)
+
     def read_logs_file(self, run_id, key, io_type, cursor=0, max_bytes=MAX_BYTES_FILE_READ):
         path = self.get_local_path(run_id, key, io_type)
 
@@ -0,0 +1,175 @@
+import hashlib
+import os
+import shutil
+import uuid
+from contextlib import contextmanager
+
+from dagster import check
+from dagster.core.definitions.events import EventMetadataEntry
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.pipeline_run import PipelineRun
+from dagster.utils import mkdir_p
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024  # 1 GB
+
+LOCK_EXTENSION = '.lock'
+
+
+class LocalFileCache(object):
+    '''A cache, on local disk, of the contents of files in object stores like S3 or GCS, shared by
+    the steps and runs that read them on a host.
+
+    Entries are keyed by the location of a file and the version of its contents, e.g. the bucket,
+    key and ETag of an S3 object, so a file that changes is fetched again. When the entries take up
+    more than ``max_bytes``, the least recently read are evicted. Processes sharing the cache
+    directory coordinate through lock files, so a file is only fetched once.
+
+    If it is created for a run, the cache reports each read as an engine event of the run, with
+    the number of hits and misses so far.
+
+    Args:
+        base_dir (str): The directory in which to store the entries.
+        max_bytes (Optional[int]): The most bytes the entries may take up.
+            (default: DEFAULT_MAX_BYTES)
+        instance (Optional[DagsterInstance]): The instance of the run to report reads to.
+        pipeline_run (Optional[PipelineRun]): The run to report reads to.
+    '''
+
+    def __init__(self, base_dir, max_bytes=None, instance=None, pipeline_run=None):
+        self._base_dir = check.str_param(base_dir, 'base_dir')
+        self._max_bytes = (
+            check.opt_int_param(max_bytes, 'max_bytes')
+            if max_bytes is not None
+            else DEFAULT_MAX_BYTES
+        )
+        self._instance = check.opt_inst_param(instance, 'instance', DagsterInstance)
+        self._pipeline_run = check.opt_inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def for_run(instance, pipeline_run, max_bytes=None):
+        '''A cache in the ``file_cache`` directory of the instance, reporting reads to the run.'''
+        check.inst_param(instance, 'instance', DagsterInstance)
+        return LocalFileCache(
+            os.path.join(instance.root_directory, 'file_cache'),
+            max_bytes=max_bytes,
+            instance=instance,
+            pipeline_run=pipeline_run,
+        )
+
+    def copy_to(self, cache_key, fetch_fn, dest_path, description=None):
+        '''Copy the contents of a file to a local path, fetching them into the cache if they are
+        not cached.
+
+        Args:
+            cache_key (List[str]): The location of the file and the version of its contents.
+            fetch_fn (Callable[[str], None]): Called with a local path to write the contents of the
+                file to, when they are not cached.
+            dest_path (str): The path to copy the contents to.
+            description (Optional[str]): How to refer to the file in the events reporting reads.
+
+        Returns:
+            bool: Whether the contents were cached.
+        '''
+        check.list_param(cache_key, 'cache_key', of_type=str)
+        check.callable_param(fetch_fn, 'fetch_fn')
+        check.str_param(dest_path, 'dest_path')
+        check.opt_str_param(description, 'description')
+
+        mkdir_p(self._base_dir)
+        entry_path = os.path.join(
+            self._base_dir, hashlib.sha1('/'.join(cache_key).encode('utf-8')).hexdigest()
+        )
+
+        with _file_lock(entry_path + LOCK_EXTENSION):
+            hit = os.path.exists(entry_path)
+            if hit:
+                # the modification times of the entries order them for eviction
+                os.utime(entry_path, None)
+            else:
+                temp_path = '{}.{}.tmp'.format(entry_path, uuid.uuid4().hex)
+                try:
+                    fetch_fn(temp_path)
+                    os.rename(temp_path, entry_path)
+                finally:
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+
+            # a copy rather than a link, since the caller may write to its copy
+            shutil.copyfile(entry_path, dest_path)
+
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self._evict()
+
+        self._report_read(hit, description or '/'.join(cache_key), os.path.getsize(dest_path))
+        return hit
+
+    def _evict(self):
+        with _file_lock(os.path.join(self._base_dir, LOCK_EXTENSION)):
+            entries = []
+            for name in os.listdir(self._base_dir):
+                path = os.path.join(self._base_dir, name)
+                if name.endswith(LOCK_EXTENSION) or name.endswith('.tmp'):
+                    continue
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    # evicted by another process
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total_bytes = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total_bytes <= self._max_bytes:
+                    break
+                with _file_lock(path + LOCK_EXTENSION):
+                    if os.path.exists(path):
+                        os.remove(path)
+                total_bytes -= size
+
+    def _report_read(self, hit, description, num_bytes):
+        if self._instance is None or self._pipeline_run is None:
+            return
+
+        from dagster.core.events import EngineEventData
+
+        self._instance.report_engine_event(
+            '{verb} {description} {preposition} the local file cache.'.format(
+                verb='Read' if hit else 'Fetched',
+                description=description,
+                preposition='from' if hit else 'into',
+            ),
+            self._pipeline_run,
+            EngineEventData(
+                [
+                    EventMetadataEntry.text('hit' if hit else 'miss', 'result'),
+                    EventMetadataEntry.text(str(num_bytes), 'bytes'),
+                    EventMetadataEntry.text(str(self.hits), 'hits'),
+                    EventMetadataEntry.text(str(self.misses), 'misses'),
+                ]
+            ),
+            LocalFileCache,
+        )
+
+
+@contextmanager
+def _file_lock(path):
+    if fcntl is None:
+        yield
+        return
+
+    with open(path, 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
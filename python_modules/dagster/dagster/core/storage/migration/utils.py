@@ -21,3 +21,10 @@ def has_column(table_name, column_name):
         return False
     columns = [x.get('name') for x in get_inspector().get_columns(table_name)]
     return column_name in columns
+
+
+def has_index(table_name, index_name):
+    if not has_table(table_name):
+        return False
+    indexes = [x.get('name') for x in get_inspector().get_indexes(table_name)]
+    return index_name in indexes
@@ -21,6 +21,10 @@ class LocalArtifactStorage(ConfigurableClass):
         check.str_param(run_id, 'run_id')
         return os.path.join(self.base_dir, 'storage', run_id, 'files')
 
+    def trace_dir(self, run_id):
+        check.str_param(run_id, 'run_id')
+        return os.path.join(self.base_dir, 'storage', run_id, 'traces')
+
     def intermediates_dir(self, run_id):
         return os.path.join(self.base_dir, 'storage', run_id, '')
 
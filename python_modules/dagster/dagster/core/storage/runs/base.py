@@ -91,6 +91,43 @@ class RunStorage(six.with_metaclass(ABCMeta)):
             bool
         '''
 
+    @abstractmethod
+    def get_run_ids_updated_before(self, updated_before, filters=None, limit=None):
+        '''Return the ids of the runs that match the given filter and were last updated, e.g. by
+        finishing, before a time.
+
+        Args:
+            updated_before (float): A unix timestamp.
+            filters (Optional[PipelineRunsFilter]) -- The PipelineRunFilter to filter runs by
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+
+        Returns:
+            List[str]: The run ids, least recently added first.
+        '''
+
+    @abstractmethod
+    def get_run_status_by_partition(self, partition_set_name):
+        '''Fetch the status of the most recent run of each partition of a partition set.
+
+        Args:
+            partition_set_name (str): The name of the partition set.
+
+        Returns:
+            Dict[str, PipelineRunStatus]: The status of the most recent run of each partition, by
+                partition name. Partitions that have not been run are omitted.
+        '''
+
+    @abstractmethod
+    def get_successful_partition_names(self, partition_set_name):
+        '''Fetch the names of the partitions of a partition set that have a successful run.
+
+        Args:
+            partition_set_name (str): The name of the partition set.
+
+        Returns:
+            Set[str]: The names of the partitions with at least one successful run.
+        '''
+
     @abstractmethod
     def has_pipeline_snapshot(self, pipeline_snapshot_id):
         '''Check to see if storage contains a pipeline snapshot.
@@ -167,6 +204,38 @@ class RunStorage(six.with_metaclass(ABCMeta)):
             ExecutionPlanSnapshot
         '''
 
+    @abstractmethod
+    def add_step_cache_entry(self, step_cache_entry):
+        '''Record that the outputs of a step computed under a cache key are available in the
+        intermediates of a run.
+
+        Args:
+            step_cache_entry (StepCacheEntry)
+        '''
+
+    @abstractmethod
+    def get_step_cache_entries(self, cache_key=None):
+        '''Fetch the index entries recorded for a cache key, most recent first.
+
+        Args:
+            cache_key (Optional[str]): Fetch the entries of every cache key if not set.
+
+        Returns:
+            List[StepCacheEntry]
+        '''
+
+    @abstractmethod
+    def evict_step_cache_entries(self, before_timestamp=None, max_entries=None):
+        '''Remove step cache index entries.
+
+        Args:
+            before_timestamp (Optional[float]): Remove entries recorded before this unix timestamp.
+            max_entries (Optional[int]): Remove the oldest entries in excess of this count.
+
+        Returns:
+            int: The number of entries removed.
+        '''
+
     @abstractmethod
     def wipe(self):
         '''Clears the run storage.'''
@@ -175,5 +244,15 @@ class RunStorage(six.with_metaclass(ABCMeta)):
     def delete_run(self, run_id):
         '''Remove a run from storage'''
 
+    def delete_runs(self, run_ids):
+        '''Remove runs from storage. Storages that can remove many runs at once, e.g. in a single
+        transaction, should override this.
+
+        Args:
+            run_ids (List[str]): The ids of the runs to remove.
+        '''
+        for run_id in run_ids:
+            self.delete_run(run_id)
+
     def dispose(self):
         '''Explicit lifecycle management.'''
@@ -1,3 +1,4 @@
+import time
 from collections import OrderedDict, defaultdict
 
 from dagster import check
@@ -11,6 +12,8 @@ from dagster.core.snap.pipeline_snapshot import PipelineSnapshot, create_pipelin
 from dagster.utils import frozendict
 
 from ..pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
+from ..step_cache import StepCacheEntry
+from ..tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
 from .base import RunStorage
 
 
@@ -24,6 +27,8 @@ class InMemoryRunStorage(RunStorage):
         self._run_tags = defaultdict(dict)
         self._pipeline_snapshots = OrderedDict()
         self._ep_snapshots = OrderedDict()
+        self._step_cache_entries = []
+        self._run_update_timestamps = {}
 
     def add_run(self, pipeline_run):
         check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
@@ -40,6 +45,7 @@ class InMemoryRunStorage(RunStorage):
                 )
 
         self._runs[pipeline_run.run_id] = pipeline_run
+        self._run_update_timestamps[pipeline_run.run_id] = time.time()
         if pipeline_run.tags and len(pipeline_run.tags) > 0:
             self._run_tags[pipeline_run.run_id] = frozendict(pipeline_run.tags)
 
@@ -56,6 +62,9 @@ class InMemoryRunStorage(RunStorage):
             self._runs[run_id] = run.with_status(PipelineRunStatus.SUCCESS)
         elif event.event_type == DagsterEventType.PIPELINE_FAILURE:
             self._runs[run_id] = self._runs[run_id].with_status(PipelineRunStatus.FAILURE)
+        else:
+            return
+        self._run_update_timestamps[run_id] = time.time()
 
     def get_runs(self, filters=None, cursor=None, limit=None):
         check.opt_inst_param(filters, 'filters', PipelineRunsFilter)
@@ -119,6 +128,40 @@ class InMemoryRunStorage(RunStorage):
 
         return sorted([(k, v) for k, v in all_tags.items()], key=lambda x: x[0])
 
+    def get_run_ids_updated_before(self, updated_before, filters=None, limit=None):
+        check.float_param(updated_before, 'updated_before')
+        check.opt_int_param(limit, 'limit')
+
+        run_ids = [
+            run.run_id
+            for run in reversed(self.get_runs(filters))
+            if self._run_update_timestamps[run.run_id] < updated_before
+        ]
+        return run_ids[:limit] if limit else run_ids
+
+    def get_run_status_by_partition(self, partition_set_name):
+        check.str_param(partition_set_name, 'partition_set_name')
+
+        statuses = {}
+        # runs are kept in the order they were added, so more recent runs overwrite older ones
+        for run in self._runs.values():
+            if run.tags.get(PARTITION_SET_TAG) == partition_set_name and run.tags.get(
+                PARTITION_NAME_TAG
+            ):
+                statuses[run.tags[PARTITION_NAME_TAG]] = run.status
+        return statuses
+
+    def get_successful_partition_names(self, partition_set_name):
+        check.str_param(partition_set_name, 'partition_set_name')
+
+        return {
+            run.tags[PARTITION_NAME_TAG]
+            for run in self._runs.values()
+            if run.status == PipelineRunStatus.SUCCESS
+            and run.tags.get(PARTITION_SET_TAG) == partition_set_name
+            and run.tags.get(PARTITION_NAME_TAG)
+        }
+
     def has_run(self, run_id):
         check.str_param(run_id, 'run_id')
         return run_id in self._runs
@@ -126,8 +169,12 @@ class InMemoryRunStorage(RunStorage):
     def delete_run(self, run_id):
         check.str_param(run_id, 'run_id')
         del self._runs[run_id]
+        del self._run_update_timestamps[run_id]
         if run_id in self._run_tags:
             del self._run_tags[run_id]
+        self._step_cache_entries = [
+            entry for entry in self._step_cache_entries if entry.run_id != run_id
+        ]
 
     def has_pipeline_snapshot(self, pipeline_snapshot_id):
         check.str_param(pipeline_snapshot_id, 'pipeline_snapshot_id')
@@ -157,5 +204,31 @@ class InMemoryRunStorage(RunStorage):
         check.str_param(execution_plan_snapshot_id, 'execution_plan_snapshot_id')
         return self._ep_snapshots[execution_plan_snapshot_id]
 
+    def add_step_cache_entry(self, step_cache_entry):
+        check.inst_param(step_cache_entry, 'step_cache_entry', StepCacheEntry)
+        self._step_cache_entries.append(step_cache_entry)
+
+    def get_step_cache_entries(self, cache_key=None):
+        check.opt_str_param(cache_key, 'cache_key')
+        return [
+            entry
+            for entry in reversed(self._step_cache_entries)
+            if cache_key is None or entry.cache_key == cache_key
+        ]
+
+    def evict_step_cache_entries(self, before_timestamp=None, max_entries=None):
+        check.opt_float_param(before_timestamp, 'before_timestamp')
+        check.opt_int_param(max_entries, 'max_entries')
+
+        entries = self._step_cache_entries
+        if max_entries is not None:
+            entries = entries[-max_entries:] if max_entries else []
+        if before_timestamp is not None:
+            entries = [entry for entry in entries if entry.timestamp >= before_timestamp]
+
+        num_evicted = len(self._step_cache_entries) - len(entries)
+        self._step_cache_entries = entries
+        return num_evicted
+
     def wipe(self):
         self._init_storage()
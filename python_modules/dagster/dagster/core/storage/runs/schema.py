@@ -36,3 +36,16 @@ SnapshotsTable = db.Table(
     db.Column('snapshot_body', db.LargeBinary, nullable=False),
     db.Column('snapshot_type', db.String(63), nullable=False),
 )
+
+StepCacheTable = db.Table(
+    'step_cache',
+    RunStorageSqlMetadata,
+    db.Column('id', db.Integer, primary_key=True, autoincrement=True),
+    db.Column('cache_key', db.String(255), nullable=False),
+    db.Column('run_id', db.String(255), nullable=False),
+    db.Column('step_key', db.String),
+    db.Column('entry_body', db.String),
+    db.Column('create_timestamp', db.DateTime, server_default=db.text('CURRENT_TIMESTAMP')),
+)
+
+db.Index('idx_step_cache_cache_key', StepCacheTable.c.cache_key)
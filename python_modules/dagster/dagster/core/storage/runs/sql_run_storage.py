@@ -18,10 +18,13 @@ from dagster.core.snap.execution_plan_snapshot import (
 from dagster.core.snap.pipeline_snapshot import PipelineSnapshot, create_pipeline_snapshot_id
 from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 from dagster.seven import JSONDecodeError
+from dagster.utils import utc_datetime_from_timestamp
 
 from ..pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
+from ..step_cache import StepCacheEntry
+from ..tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
 from .base import RunStorage
-from .schema import RunTagsTable, RunsTable, SnapshotsTable
+from .schema import RunTagsTable, RunsTable, SnapshotsTable, StepCacheTable
 
 
 class SnapshotType(Enum):
@@ -122,7 +125,7 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
                 .values(
                     status=new_pipeline_status.value,
                     run_body=serialize_dagster_namedtuple(run.with_status(new_pipeline_status)),
-                    update_timestamp=datetime.now(),
+                    update_timestamp=datetime.utcnow(),
                 )
             )
 
@@ -230,6 +233,106 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
             result[r[0]].add(r[1])
         return sorted(list([(k, v) for k, v in result.items()]), key=lambda x: x[0])
 
+    def get_run_ids_updated_before(self, updated_before, filters=None, limit=None):
+        check.float_param(updated_before, 'updated_before')
+        filters = check.opt_inst_param(
+            filters, 'filters', PipelineRunsFilter, default=PipelineRunsFilter()
+        )
+        check.opt_int_param(limit, 'limit')
+
+        if filters.tags:
+            base_query = db.select([RunsTable.c.run_id]).select_from(
+                RunsTable.outerjoin(RunTagsTable, RunsTable.c.run_id == RunTagsTable.c.run_id)
+            )
+        else:
+            base_query = db.select([RunsTable.c.run_id]).select_from(RunsTable)
+
+        # the update timestamps of runs are in UTC, like the CURRENT_TIMESTAMP they default to
+        query = (
+            self._add_filters_to_query(base_query, filters)
+            .where(RunsTable.c.update_timestamp < utc_datetime_from_timestamp(updated_before))
+            .order_by(RunsTable.c.id.asc())
+        )
+        if limit:
+            query = query.limit(limit)
+
+        return [row[0] for row in self.fetchall(query)]
+
+    def get_run_status_by_partition(self, partition_set_name):
+        check.str_param(partition_set_name, 'partition_set_name')
+
+        partition_set_tags = RunTagsTable.alias('partition_set_tags')
+        partition_tags = RunTagsTable.alias('partition_tags')
+
+        # the most recent run of each partition is the one with the greatest id
+        last_runs = (
+            db.select(
+                [
+                    partition_tags.c.value.label('partition'),
+                    db.func.max(RunsTable.c.id).label('id'),
+                ]
+            )
+            .select_from(
+                RunsTable.join(
+                    partition_set_tags,
+                    db.and_(
+                        RunsTable.c.run_id == partition_set_tags.c.run_id,
+                        partition_set_tags.c.key == PARTITION_SET_TAG,
+                    ),
+                ).join(
+                    partition_tags,
+                    db.and_(
+                        RunsTable.c.run_id == partition_tags.c.run_id,
+                        partition_tags.c.key == PARTITION_NAME_TAG,
+                    ),
+                )
+            )
+            .where(partition_set_tags.c.value == partition_set_name)
+            .group_by(partition_tags.c.value)
+            .alias('last_runs')
+        )
+        query = db.select([last_runs.c.partition, RunsTable.c.status]).select_from(
+            last_runs.join(RunsTable, RunsTable.c.id == last_runs.c.id)
+        )
+
+        rows = self.fetchall(query)
+        return {partition: PipelineRunStatus(status) for partition, status in rows}
+
+    def get_successful_partition_names(self, partition_set_name):
+        check.str_param(partition_set_name, 'partition_set_name')
+
+        partition_set_tags = RunTagsTable.alias('partition_set_tags')
+        partition_tags = RunTagsTable.alias('partition_tags')
+
+        query = (
+            db.select([partition_tags.c.value])
+            .select_from(
+                RunsTable.join(
+                    partition_set_tags,
+                    db.and_(
+                        RunsTable.c.run_id == partition_set_tags.c.run_id,
+                        partition_set_tags.c.key == PARTITION_SET_TAG,
+                    ),
+                ).join(
+                    partition_tags,
+                    db.and_(
+                        RunsTable.c.run_id == partition_tags.c.run_id,
+                        partition_tags.c.key == PARTITION_NAME_TAG,
+                    ),
+                )
+            )
+            .where(
+                db.and_(
+                    partition_set_tags.c.value == partition_set_name,
+                    RunsTable.c.status == PipelineRunStatus.SUCCESS.value,
+                )
+            )
+            .distinct()
+        )
+
+        rows = self.fetchall(query)
+        return {row[0] for row in rows}
+
     def has_run(self, run_id):
         check.str_param(run_id, 'run_id')
         return bool(self.get_run_by_id(run_id))
@@ -237,8 +340,29 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
     def delete_run(self, run_id):
         check.str_param(run_id, 'run_id')
         query = db.delete(RunsTable).where(RunsTable.c.run_id == run_id)
+        remove_step_cache_entries = db.delete(StepCacheTable).where(
+            StepCacheTable.c.run_id == run_id
+        )
         with self.connect() as conn:
             conn.execute(query)
+            conn.execute(remove_step_cache_entries)
+
+    def delete_runs(self, run_ids):
+        check.list_param(run_ids, 'run_ids', of_type=str)
+        if not run_ids:
+            return
+
+        with self.connect() as conn:
+            with conn.begin():
+                self._delete_runs(conn, run_ids)
+
+    def _delete_runs(self, conn, run_ids):
+        '''Delete a batch of runs with the given connection, which must be in a transaction.'''
+        # one statement per table for the whole batch. The tags are deleted explicitly, since
+        # SQLite does not enforce the foreign key they cascade on.
+        conn.execute(db.delete(StepCacheTable).where(StepCacheTable.c.run_id.in_(run_ids)))
+        conn.execute(db.delete(RunTagsTable).where(RunTagsTable.c.run_id.in_(run_ids)))
+        conn.execute(db.delete(RunsTable).where(RunsTable.c.run_id.in_(run_ids)))
 
     def has_pipeline_snapshot(self, pipeline_snapshot_id):
         check.str_param(pipeline_snapshot_id, 'pipeline_snapshot_id')
@@ -296,6 +420,61 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
 
         return defensively_unpack_pipeline_snapshot_query(logging, row) if row else None
 
+    def add_step_cache_entry(self, step_cache_entry):
+        check.inst_param(step_cache_entry, 'step_cache_entry', StepCacheEntry)
+
+        with self.connect() as conn:
+            conn.execute(
+                StepCacheTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    cache_key=step_cache_entry.cache_key,
+                    run_id=step_cache_entry.run_id,
+                    step_key=step_cache_entry.step_key,
+                    entry_body=serialize_dagster_namedtuple(step_cache_entry),
+                    create_timestamp=datetime.utcfromtimestamp(step_cache_entry.timestamp),
+                )
+            )
+
+    def get_step_cache_entries(self, cache_key=None):
+        check.opt_str_param(cache_key, 'cache_key')
+
+        query = db.select([StepCacheTable.c.entry_body]).order_by(StepCacheTable.c.id.desc())
+        if cache_key is not None:
+            query = query.where(StepCacheTable.c.cache_key == cache_key)
+        rows = self.fetchall(query)
+        return [deserialize_json_to_dagster_namedtuple(row[0]) for row in rows]
+
+    def evict_step_cache_entries(self, before_timestamp=None, max_entries=None):
+        check.opt_float_param(before_timestamp, 'before_timestamp')
+        check.opt_int_param(max_entries, 'max_entries')
+
+        conditions = []
+        if before_timestamp is not None:
+            conditions.append(
+                StepCacheTable.c.create_timestamp < datetime.utcfromtimestamp(before_timestamp)
+            )
+
+        if max_entries is not None:
+            # everything at or below the id of the newest entry past the limit goes
+            threshold_row = self.fetchone(
+                db.select([StepCacheTable.c.id])
+                .order_by(StepCacheTable.c.id.desc())
+                .offset(max_entries)
+                .limit(1)
+            )
+            if threshold_row:
+                conditions.append(StepCacheTable.c.id <= threshold_row[0])
+
+        if not conditions:
+            return 0
+
+        with self.connect() as conn:
+            result = conn.execute(
+                StepCacheTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    db.or_(*conditions)
+                )
+            )
+            return result.rowcount
+
     def wipe(self):
         '''Clears the run storage.'''
         with self.connect() as conn:
@@ -303,6 +482,7 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
             conn.execute(RunsTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(RunTagsTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(SnapshotsTable.delete())  # pylint: disable=no-value-for-parameter
+            conn.execute(StepCacheTable.delete())  # pylint: disable=no-value-for-parameter
 
 
 GET_PIPELINE_SNAPSHOT_QUERY_ID = 'get-pipeline-snapshot'
@@ -16,7 +16,7 @@ from dagster.seven import urljoin, urlparse
 from dagster.utils import mkdir_p
 
 from ...sql import check_alembic_revision, create_engine, get_alembic_config, stamp_alembic_rev
-from ..schema import RunStorageSqlMetadata, RunTagsTable, RunsTable
+from ..schema import RunStorageSqlMetadata, RunTagsTable, RunsTable, StepCacheTable
 from ..sql_run_storage import SqlRunStorage
 
 
@@ -126,6 +126,10 @@ class SqliteRunStorage(SqlRunStorage, ConfigurableClass):
         check.str_param(run_id, 'run_id')
         remove_tags = db.delete(RunTagsTable).where(RunTagsTable.c.run_id == run_id)
         remove_run = db.delete(RunsTable).where(RunsTable.c.run_id == run_id)
+        remove_step_cache_entries = db.delete(StepCacheTable).where(
+            StepCacheTable.c.run_id == run_id
+        )
         with self.connect() as conn:
             conn.execute(remove_tags)
             conn.execute(remove_run)
+            conn.execute(remove_step_cache_entries)
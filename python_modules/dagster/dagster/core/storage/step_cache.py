@@ -0,0 +1,31 @@
+from collections import namedtuple
+
+from dagster import check
+from dagster.serdes import whitelist_for_serdes
+
+
+@whitelist_for_serdes
+class StepCacheEntry(
+    namedtuple('_StepCacheEntry', 'cache_key run_id step_key output_names timestamp')
+):
+    '''Index entry recording that the outputs of a step, computed under a given cache key, were
+    persisted in the intermediates of a run.
+
+    Args:
+        cache_key (str): The content-addressed key of the step, see
+            :py:func:`dagster.core.execution.step_cache.resolve_step_cache_keys`.
+        run_id (str): The run whose intermediates hold the cached outputs.
+        step_key (str): The key of the step in that run.
+        output_names (List[str]): The outputs that were written by the step.
+        timestamp (float): When the entry was recorded.
+    '''
+
+    def __new__(cls, cache_key, run_id, step_key, output_names, timestamp):
+        return super(StepCacheEntry, cls).__new__(
+            cls,
+            cache_key=check.str_param(cache_key, 'cache_key'),
+            run_id=check.str_param(run_id, 'run_id'),
+            step_key=check.str_param(step_key, 'step_key'),
+            output_names=check.list_param(output_names, 'output_names', of_type=str),
+            timestamp=check.float_param(timestamp, 'timestamp'),
+        )
@@ -16,6 +16,24 @@ ROOT_RUN_ID_TAG = '{prefix}root_run_id'.format(prefix=SYSTEM_TAG_PREFIX)
 
 RESUME_RETRY_TAG = '{prefix}is_resume_retry'.format(prefix=SYSTEM_TAG_PREFIX)
 
+CODE_VERSION_TAG = '{prefix}code_version'.format(prefix=SYSTEM_TAG_PREFIX)
+
+PROFILE_STEPS_TAG = '{prefix}profile_steps'.format(prefix=SYSTEM_TAG_PREFIX)
+
+RESOURCE_INIT_CONCURRENCY_TAG = '{prefix}resource_init_concurrency'.format(prefix=SYSTEM_TAG_PREFIX)
+
+STEP_CACHE_TAG = '{prefix}step_cache'.format(prefix=SYSTEM_TAG_PREFIX)
+
+STEP_FUSION_TAG = '{prefix}step_fusion'.format(prefix=SYSTEM_TAG_PREFIX)
+
+STEP_PRIORITY_POLICY_TAG = '{prefix}step_priority_policy'.format(prefix=SYSTEM_TAG_PREFIX)
+
+STEP_RESOURCE_REQUIREMENTS_TAG = '{prefix}resource_requirements'.format(prefix=SYSTEM_TAG_PREFIX)
+
+TRACE_TAG = '{prefix}trace'.format(prefix=SYSTEM_TAG_PREFIX)
+
+TYPE_CHECK_POLICY_TAG = '{prefix}type_check_policy'.format(prefix=SYSTEM_TAG_PREFIX)
+
 
 def check_tags(obj, name):
     check.opt_dict_param(obj, name, key_type=str, value_type=str)
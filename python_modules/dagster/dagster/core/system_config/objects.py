@@ -1,7 +1,14 @@
 '''System-provided config objects and constructors.'''
-from collections import namedtuple
+import copy
+import hashlib
+import os
+import threading
+import weakref
+from collections import OrderedDict, namedtuple
 
-from dagster import check
+import six
+
+from dagster import check, seven
 from dagster.core.definitions.environment_schema import create_environment_type
 from dagster.core.definitions.pipeline import PipelineDefinition
 from dagster.core.errors import DagsterInvalidConfigError
@@ -66,38 +73,114 @@ class EnvironmentConfig(
         successful, we instiate an EnvironmentConfig object.
 
         In case the environment_dict is invalid, this method raises a DagsterInvalidConfigError
-        '''
-        from dagster.config.validate import process_config
-        from .composite_descent import composite_descent
 
+        Successful builds are memoized per pipeline definition, keyed by the mode and a hash of the
+        environment dict and of the environment variables it sources config from, since the same
+        config is built over and over again during a run. Every build gets its own copy of the
+        config values, which solids are free to mutate.
+        '''
         check.inst_param(pipeline, 'pipeline', PipelineDefinition)
         environment_dict = check.opt_dict_param(environment_dict, 'environment_dict')
         check.opt_str_param(mode, 'mode')
 
         mode = mode or pipeline.get_default_mode_name()
-        environment_type = create_environment_type(pipeline, mode)
-
-        config_evr = process_config(environment_type, environment_dict)
-        if not config_evr.success:
-            raise DagsterInvalidConfigError(
-                'Error in config for pipeline {}'.format(pipeline.name),
-                config_evr.errors,
-                environment_dict,
+
+        cache_key = _environment_config_cache_key(mode, environment_dict)
+        if cache_key is None:
+            return _build_environment_config(pipeline, environment_dict, mode)
+
+        with _ENVIRONMENT_CONFIG_CACHE_LOCK:
+            cache = _ENVIRONMENT_CONFIG_CACHE.setdefault(pipeline, OrderedDict())
+            cached_environment_config = cache.pop(cache_key, None)
+            if cached_environment_config is not None:
+                cache[cache_key] = cached_environment_config
+
+        if cached_environment_config is not None:
+            # hand back the caller's own dict rather than the one the entry was built from
+            return copy.deepcopy(cached_environment_config)._replace(
+                original_config_dict=environment_dict
             )
 
-        config_value = config_evr.value
+        # built outside of the lock, two threads missing on the same key both build the config
+        # and the last one to finish wins, which is harmless
+        environment_config = _build_environment_config(pipeline, environment_dict, mode)
+
+        with _ENVIRONMENT_CONFIG_CACHE_LOCK:
+            cache[cache_key] = copy.deepcopy(environment_config)
+            while len(cache) > _ENVIRONMENT_CONFIG_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        return environment_config
+
+
+_ENVIRONMENT_CONFIG_CACHE_SIZE = 32
+
+_ENVIRONMENT_CONFIG_CACHE = weakref.WeakKeyDictionary()
+
+# EnvironmentConfig.build is called concurrently by threaded engines and by dagit
+_ENVIRONMENT_CONFIG_CACHE_LOCK = threading.Lock()
 
-        solid_config_dict = composite_descent(pipeline, config_value.get('solids', {}))
 
-        return EnvironmentConfig(
-            solids=solid_config_dict,
-            execution=ExecutionConfig.from_dict(config_value.get('execution')),
-            storage=StorageConfig.from_dict(config_value.get('storage')),
-            loggers=config_value.get('loggers'),
-            original_config_dict=environment_dict,
-            resources=config_value.get('resources'),
+def _environment_config_cache_key(mode, environment_dict):
+    try:
+        environment_json = seven.json.dumps(environment_dict, sort_keys=True)
+    except (TypeError, ValueError):
+        # not every config value is json serializable (e.g. Any-typed config), such configs are
+        # not memoized
+        return None
+
+    m = hashlib.sha1()  # so that hexdigest is 40, not 64 bytes
+    m.update(environment_json.encode())
+    # config sourced from environment variables is resolved when the config is built, so the
+    # values of the variables are part of the key for long-lived processes to see them change
+    env_values = {name: os.getenv(name) for name in _env_source_names(environment_dict)}
+    if env_values:
+        m.update(seven.json.dumps(env_values, sort_keys=True).encode())
+    return (mode, m.hexdigest())
+
+
+def _env_source_names(config_value):
+    '''The names of the environment variables of the ``{'env': ...}`` sources in a config value.'''
+    if isinstance(config_value, dict):
+        if len(config_value) == 1 and isinstance(config_value.get('env'), six.string_types):
+            yield config_value['env']
+        else:
+            for value in config_value.values():
+                for name in _env_source_names(value):
+                    yield name
+    elif isinstance(config_value, list):
+        for value in config_value:
+            for name in _env_source_names(value):
+                yield name
+
+
+def _build_environment_config(pipeline, environment_dict, mode):
+    from dagster.config.validate import process_config
+    from .composite_descent import composite_descent
+
+    environment_type = create_environment_type(pipeline, mode)
+
+    config_evr = process_config(environment_type, environment_dict)
+    if not config_evr.success:
+        raise DagsterInvalidConfigError(
+            'Error in config for pipeline {}'.format(pipeline.name),
+            config_evr.errors,
+            environment_dict,
         )
 
+    config_value = config_evr.value
+
+    solid_config_dict = composite_descent(pipeline, config_value.get('solids', {}))
+
+    return EnvironmentConfig(
+        solids=solid_config_dict,
+        execution=ExecutionConfig.from_dict(config_value.get('execution')),
+        storage=StorageConfig.from_dict(config_value.get('storage')),
+        loggers=config_value.get('loggers'),
+        original_config_dict=environment_dict,
+        resources=config_value.get('resources'),
+    )
+
 
 class ExecutionConfig(
     namedtuple('_ExecutionConfig', 'execution_engine_name execution_engine_config')
@@ -16,6 +16,7 @@ from dagster.serdes import whitelist_for_serdes
 from .builtin_config_schemas import BuiltinSchemas
 from .config_schema import InputHydrationConfig, OutputMaterializationConfig
 from .marshal import PickleSerializationStrategy, SerializationStrategy
+from .type_check_policy import TypeCheckPolicy, resolve_type_check_policy
 
 
 @whitelist_for_serdes
@@ -267,6 +268,8 @@ class BuiltinScalarDagsterType(DagsterType):
 
 
 class _Int(BuiltinScalarDagsterType):
+    python_types = six.integer_types
+
     def __init__(self):
         super(_Int, self).__init__(
             name='Int',
@@ -276,7 +279,7 @@ class _Int(BuiltinScalarDagsterType):
         )
 
     def type_check_scalar_value(self, value):
-        return _fail_if_not_of_type(value, six.integer_types, 'int')
+        return _fail_if_not_of_type(value, self.python_types, 'int')
 
 
 def _typemismatch_error_str(value, expected_type_desc):
@@ -294,6 +297,8 @@ def _fail_if_not_of_type(value, value_type, value_type_desc):
 
 
 class _String(BuiltinScalarDagsterType):
+    python_types = six.string_types
+
     def __init__(self):
         super(_String, self).__init__(
             name='String',
@@ -303,10 +308,12 @@ class _String(BuiltinScalarDagsterType):
         )
 
     def type_check_scalar_value(self, value):
-        return _fail_if_not_of_type(value, six.string_types, 'string')
+        return _fail_if_not_of_type(value, self.python_types, 'string')
 
 
 class _Path(BuiltinScalarDagsterType):
+    python_types = six.string_types
+
     def __init__(self):
         super(_Path, self).__init__(
             name='Path',
@@ -316,10 +323,12 @@ class _Path(BuiltinScalarDagsterType):
         )
 
     def type_check_scalar_value(self, value):
-        return _fail_if_not_of_type(value, six.string_types, 'string')
+        return _fail_if_not_of_type(value, self.python_types, 'string')
 
 
 class _Float(BuiltinScalarDagsterType):
+    python_types = (float,)
+
     def __init__(self):
         super(_Float, self).__init__(
             name='Float',
@@ -329,10 +338,12 @@ class _Float(BuiltinScalarDagsterType):
         )
 
     def type_check_scalar_value(self, value):
-        return _fail_if_not_of_type(value, float, 'float')
+        return _fail_if_not_of_type(value, self.python_types, 'float')
 
 
 class _Bool(BuiltinScalarDagsterType):
+    python_types = (bool,)
+
     def __init__(self):
         super(_Bool, self).__init__(
             name='Bool',
@@ -342,7 +353,7 @@ class _Bool(BuiltinScalarDagsterType):
         )
 
     def type_check_scalar_value(self, value):
-        return _fail_if_not_of_type(value, bool, 'bool')
+        return _fail_if_not_of_type(value, self.python_types, 'bool')
 
 
 class Anyish(DagsterType):
@@ -574,10 +585,60 @@ def _create_list_input_schema(inner_type):
     return ListInputSchema(inner_type)
 
 
+def bulk_type_check_passes(item_type, items):
+    '''Whether all the items pass the type check of the item type, decided in bulk. Only
+    ``Any`` and (optionally ``Optional``) builtin scalar item types can be decided this way, which
+    is done by the set of the python types of the items. A False return means that the items have
+    to be checked one by one.'''
+    if item_type is Any:
+        return True
+
+    if isinstance(item_type, BuiltinScalarDagsterType):
+        python_types = item_type.python_types
+    elif item_type.kind == DagsterTypeKind.NULLABLE and isinstance(
+        item_type.inner_type, BuiltinScalarDagsterType
+    ):
+        python_types = tuple(item_type.inner_type.python_types) + (type(None),)
+    else:
+        return False
+
+    return all(issubclass(python_type, python_types) for python_type in set(map(type, items)))
+
+
+def type_check_items(context, item_type, items, type_check_policy=None):
+    '''Type check the items of a collection value against an item type.
+
+    Which items are checked is governed by the type check policy, see
+    :py:class:`~dagster.TypeCheckPolicy`. Items are first checked in bulk, see
+    :py:func:`bulk_type_check_passes`, only falling back to per item type checks if that is not
+    conclusive.
+
+    Returns:
+        TypeCheck: The type check of the first failing item, or a successful type check.
+    '''
+    check.inst_param(item_type, 'item_type', DagsterType)
+    check.opt_inst_param(type_check_policy, 'type_check_policy', TypeCheckPolicy)
+
+    items = resolve_type_check_policy(context, type_check_policy).select_items(items)
+
+    if bulk_type_check_passes(item_type, items):
+        return TypeCheck(success=True)
+
+    for item in items:
+        item_check = item_type.type_check(context, item)
+        if not item_check.success:
+            return item_check
+
+    return TypeCheck(success=True)
+
+
 class ListType(DagsterType):
-    def __init__(self, inner_type):
+    def __init__(self, inner_type, type_check_policy=None):
         key = 'List.' + inner_type.key
         self.inner_type = inner_type
+        self.type_check_policy = check.opt_inst_param(
+            type_check_policy, 'type_check_policy', TypeCheckPolicy
+        )
         super(ListType, self).__init__(
             key=key,
             name=None,
@@ -595,12 +656,7 @@ class ListType(DagsterType):
         if not value_check.success:
             return value_check
 
-        for item in value:
-            item_check = self.inner_type.type_check(context, item)
-            if not item_check.success:
-                return item_check
-
-        return TypeCheck(success=True)
+        return type_check_items(context, self.inner_type, value, self.type_check_policy)
 
     @property
     def inner_types(self):
@@ -616,19 +672,19 @@ class DagsterListApi:
         check.not_none_param(inner_type, 'inner_type')
         return _List(resolve_dagster_type(inner_type))
 
-    def __call__(self, inner_type):
+    def __call__(self, inner_type, type_check_policy=None):
         check.not_none_param(inner_type, 'inner_type')
-        return _List(inner_type)
+        return _List(inner_type, type_check_policy)
 
 
 List = DagsterListApi()
 
 
-def _List(inner_type):
+def _List(inner_type, type_check_policy=None):
     check.inst_param(inner_type, 'inner_type', DagsterType)
     if inner_type is Nothing:
         raise DagsterInvalidDefinitionError('Type Nothing can not be wrapped in List or Optional')
-    return ListType(inner_type)
+    return ListType(inner_type, type_check_policy)
 
 
 class Stringish(DagsterType):
@@ -2,7 +2,13 @@ from dagster import check
 from dagster.config.field_utils import Permissive
 
 from .config_schema import input_hydration_config
-from .dagster_type import DagsterType, PythonObjectDagsterType, resolve_dagster_type
+from .dagster_type import (
+    DagsterType,
+    PythonObjectDagsterType,
+    bulk_type_check_passes,
+    resolve_dagster_type,
+)
+from .type_check_policy import TypeCheckPolicy, resolve_type_check_policy
 
 
 @input_hydration_config(Permissive())
@@ -19,9 +25,12 @@ PythonDict = PythonObjectDagsterType(
 
 
 class _TypedPythonDict(DagsterType):
-    def __init__(self, key_type, value_type):
+    def __init__(self, key_type, value_type, type_check_policy=None):
         self.key_type = check.inst_param(key_type, 'key_type', DagsterType)
         self.value_type = check.inst_param(value_type, 'value_type', DagsterType)
+        self.type_check_policy = check.opt_inst_param(
+            type_check_policy, 'type_check_policy', TypeCheckPolicy
+        )
         super(_TypedPythonDict, self).__init__(
             key='TypedPythonDict.{}.{}'.format(key_type.key, value_type.key),
             name=None,
@@ -39,7 +48,16 @@ class _TypedPythonDict(DagsterType):
                 ),
             )
 
-        for key, value in value.items():
+        items = resolve_type_check_policy(context, self.type_check_policy).select_items(
+            value.items()
+        )
+
+        if bulk_type_check_passes(self.key_type, [key for key, _ in items]) and (
+            bulk_type_check_passes(self.value_type, [value for _, value in items])
+        ):
+            return TypeCheck(success=True)
+
+        for key, value in items:
             key_check = self.key_type.type_check(context, key)
             if not key_check.success:
                 return key_check
@@ -64,11 +82,11 @@ class _TypedPythonDict(DagsterType):
         return [self.key_type.key, self.value_type.key]
 
 
-def create_typed_runtime_dict(key_dagster_type, value_dagster_type):
+def create_typed_runtime_dict(key_dagster_type, value_dagster_type, type_check_policy=None):
     key_type = resolve_dagster_type(key_dagster_type)
     value_type = resolve_dagster_type(value_dagster_type)
 
-    return _TypedPythonDict(key_type, value_type)
+    return _TypedPythonDict(key_type, value_type, type_check_policy)
 
 
 class DagsterDictApi(object):
@@ -3,7 +3,13 @@ from dagster.config.config_type import Array
 from dagster.core.types.dagster_type import DagsterTypeKind
 
 from .config_schema import InputHydrationConfig
-from .dagster_type import DagsterType, PythonObjectDagsterType, resolve_dagster_type
+from .dagster_type import (
+    DagsterType,
+    PythonObjectDagsterType,
+    resolve_dagster_type,
+    type_check_items,
+)
+from .type_check_policy import TypeCheckPolicy
 
 PythonSet = PythonObjectDagsterType(
     set, 'PythonSet', description='''Represents a python dictionary to pass between solids'''
@@ -32,8 +38,11 @@ class TypedSetInputHydrationConfig(InputHydrationConfig):
 
 
 class _TypedPythonSet(DagsterType):
-    def __init__(self, item_dagster_type):
+    def __init__(self, item_dagster_type, type_check_policy=None):
         self.item_type = item_dagster_type
+        self.type_check_policy = check.opt_inst_param(
+            type_check_policy, 'type_check_policy', TypeCheckPolicy
+        )
         super(_TypedPythonSet, self).__init__(
             key='TypedPythonSet.{}'.format(item_dagster_type.key),
             name=None,
@@ -56,12 +65,7 @@ class _TypedPythonSet(DagsterType):
                 ),
             )
 
-        for item in value:
-            item_check = self.item_type.type_check(context, item)
-            if not item_check.success:
-                return item_check
-
-        return TypeCheck(success=True)
+        return type_check_items(context, self.item_type, value, self.type_check_policy)
 
     @property
     def display_name(self):
@@ -76,7 +80,7 @@ class _TypedPythonSet(DagsterType):
         return [self.item_type.key]
 
 
-def create_typed_runtime_set(item_dagster_type):
+def create_typed_runtime_set(item_dagster_type, type_check_policy=None):
     item_dagster_type = resolve_dagster_type(item_dagster_type)
 
     check.invariant(
@@ -84,12 +88,15 @@ def create_typed_runtime_set(item_dagster_type):
         'Cannot create the runtime type Set[Nothing]. Use List type for fan-in.',
     )
 
-    return _TypedPythonSet(item_dagster_type)
+    return _TypedPythonSet(item_dagster_type, type_check_policy)
 
 
 class DagsterSetApi:
     def __getitem__(self, inner_type):
         return create_typed_runtime_set(inner_type)
 
+    def __call__(self, inner_type, type_check_policy=None):
+        return create_typed_runtime_set(inner_type, type_check_policy)
+
 
 Set = DagsterSetApi()
@@ -4,6 +4,7 @@ from dagster.core.types.dagster_type import DagsterTypeKind
 
 from .config_schema import InputHydrationConfig
 from .dagster_type import DagsterType, PythonObjectDagsterType, resolve_dagster_type
+from .type_check_policy import TypeCheckPolicy, resolve_type_check_policy
 
 PythonTuple = PythonObjectDagsterType(tuple, 'PythonTuple', description='Represents a python tuple')
 
@@ -28,11 +29,14 @@ class TypedTupleInputHydrationConfig(InputHydrationConfig):
 
 
 class _TypedPythonTuple(DagsterType):
-    def __init__(self, dagster_types):
+    def __init__(self, dagster_types, type_check_policy=None):
         all_have_input_configs = all(
             (dagster_type.input_hydration_config for dagster_type in dagster_types)
         )
         self.dagster_types = dagster_types
+        self.type_check_policy = check.opt_inst_param(
+            type_check_policy, 'type_check_policy', TypeCheckPolicy
+        )
         super(_TypedPythonTuple, self).__init__(
             key='TypedPythonTuple' + '.'.join(map(lambda t: t.key, dagster_types)),
             name=None,
@@ -61,7 +65,11 @@ class _TypedPythonTuple(DagsterType):
                 ).format(key=self.key, n=len(self.dagster_types), m=len(value)),
             )
 
-        for item, dagster_type in zip(value, self.dagster_types):
+        entries = resolve_type_check_policy(context, self.type_check_policy).select_items(
+            list(zip(value, self.dagster_types))
+        )
+
+        for item, dagster_type in entries:
             item_check = dagster_type.type_check(context, item)
             if not item_check.success:
                 return item_check
@@ -83,7 +91,9 @@ class _TypedPythonTuple(DagsterType):
         return [dt.key for dt in self.dagster_types]
 
 
-def create_typed_tuple(*dagster_type_args):
+def create_typed_tuple(*dagster_type_args, **kwargs):
+    type_check_policy = kwargs.pop('type_check_policy', None)
+    check.invariant(not kwargs, 'Unexpected keyword arguments {}'.format(list(kwargs.keys())))
     dagster_types = list(map(resolve_dagster_type, dagster_type_args))
 
     check.invariant(
@@ -91,7 +101,7 @@ def create_typed_tuple(*dagster_type_args):
         'Cannot create a runtime tuple containing inner type Nothing. Use List for fan-in',
     )
 
-    return _TypedPythonTuple(dagster_types)
+    return _TypedPythonTuple(dagster_types, type_check_policy)
 
 
 class DagsterTupleApi:
@@ -102,5 +112,13 @@ class DagsterTupleApi:
         else:
             return create_typed_tuple(tuple_types)
 
+    def __call__(self, tuple_types, type_check_policy=None):
+        check.param_invariant(
+            isinstance(tuple_types, (list, tuple)),
+            'tuple_types',
+            'Must be a list or tuple of types',
+        )
+        return create_typed_tuple(*tuple_types, type_check_policy=type_check_policy)
+
 
 Tuple = DagsterTupleApi()
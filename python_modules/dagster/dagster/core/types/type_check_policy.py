@@ -0,0 +1,127 @@
+import random
+from collections import namedtuple
+from enum import Enum as PythonEnum
+from itertools import islice
+
+from dagster import check
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.storage.tags import TYPE_CHECK_POLICY_TAG
+
+
+class TypeCheckPolicyMode(PythonEnum):
+    FULL = 'full'
+    FIRST = 'first'
+    SAMPLE = 'sample'
+    SKIP = 'skip'
+
+
+class TypeCheckPolicy(namedtuple('_TypeCheckPolicy', 'mode limit')):
+    '''Controls which items of a collection value the type checks of collection types
+    (``List``, ``Set``, ``Dict`` and ``Tuple``) check against their item types.
+
+    By default every item is checked. A policy can be set for a single collection type, e.g.
+    ``List(Int, type_check_policy=TypeCheckPolicy.first(1000))``, or for all collection types that
+    do not set one themselves for a run, using the ``dagster/type_check_policy`` run tag with one of
+    the values ``full``, ``skip``, ``first:<n>`` or ``sample:<n>``.
+
+    The type of the collection itself is always checked.
+    '''
+
+    def __new__(cls, mode, limit=None):
+        check.inst_param(mode, 'mode', TypeCheckPolicyMode)
+        check.opt_int_param(limit, 'limit')
+        if mode in (TypeCheckPolicyMode.FIRST, TypeCheckPolicyMode.SAMPLE):
+            check.param_invariant(
+                limit is not None and limit > 0, 'limit', 'Must provide a positive limit'
+            )
+        else:
+            check.param_invariant(limit is None, 'limit', 'Only first and sample take a limit')
+
+        return super(TypeCheckPolicy, cls).__new__(cls, mode, limit)
+
+    @staticmethod
+    def full():
+        '''Check every item.'''
+        return TypeCheckPolicy(TypeCheckPolicyMode.FULL)
+
+    @staticmethod
+    def first(limit):
+        '''Check the first ``limit`` items, in iteration order.'''
+        return TypeCheckPolicy(TypeCheckPolicyMode.FIRST, limit)
+
+    @staticmethod
+    def sample(limit):
+        '''Check ``limit`` items chosen uniformly at random.'''
+        return TypeCheckPolicy(TypeCheckPolicyMode.SAMPLE, limit)
+
+    @staticmethod
+    def skip():
+        '''Do not check the items.'''
+        return TypeCheckPolicy(TypeCheckPolicyMode.SKIP)
+
+    @staticmethod
+    def from_tag_value(tag_value):
+        check.str_param(tag_value, 'tag_value')
+
+        mode_str, _, limit_str = tag_value.partition(':')
+        try:
+            mode = TypeCheckPolicyMode(mode_str.strip().lower())
+            limit = int(limit_str) if limit_str else None
+            return TypeCheckPolicy(mode, limit)
+        except (ValueError, check.CheckError):
+            raise DagsterInvariantViolationError(
+                'Invalid value "{tag_value}" for tag {tag}. Expected one of "full", "skip", '
+                '"first:<n>" or "sample:<n>".'.format(
+                    tag_value=tag_value, tag=TYPE_CHECK_POLICY_TAG
+                )
+            )
+
+    def select_items(self, items):
+        '''Select the items of a collection to check.
+
+        Args:
+            items (Iterable): The items of the collection. Must be sized and re-iterable, like a
+                list, set or dict view.
+
+        Returns:
+            Iterable: The items to check, re-iterable.
+        '''
+        if self.mode == TypeCheckPolicyMode.FULL:
+            return items
+
+        if self.mode == TypeCheckPolicyMode.SKIP:
+            return []
+
+        if self.limit >= len(items):
+            return items
+
+        if self.mode == TypeCheckPolicyMode.FIRST:
+            return list(islice(items, self.limit))
+
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
+        return [items[idx] for idx in sorted(random.sample(range(len(items)), self.limit))]
+
+
+def resolve_type_check_policy(context, type_check_policy):
+    '''The policy set on a collection type wins over the policy set for the run.'''
+    if type_check_policy is not None:
+        return type_check_policy
+
+    run_type_check_policy = (
+        type_check_policy_for_run(context.pipeline_run) if context is not None else None
+    )
+    return run_type_check_policy or TypeCheckPolicy.full()
+
+
+def type_check_policy_for_run(pipeline_run):
+    '''The policy set for a run by its ``dagster/type_check_policy`` tag, if any.
+
+    Runs validate the tag when they start, so that an invalid value fails the run before any
+    steps execute rather than the steps with collection outputs.
+
+    Returns:
+        Optional[TypeCheckPolicy]
+    '''
+    tag_value = pipeline_run.tags.get(TYPE_CHECK_POLICY_TAG)
+    return TypeCheckPolicy.from_tag_value(tag_value) if tag_value else None
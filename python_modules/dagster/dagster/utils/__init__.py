@@ -162,6 +162,12 @@ class frozenlist(list):
     def __readonly__(self, *args, **kwargs):
         raise RuntimeError("Cannot modify ReadOnlyList")
 
+    # For a list, the default behavior for pickle (and copy) is to iteratively call extend or
+    # append, so the items are passed to the constructor instead.
+
+    def __reduce__(self):
+        return (frozenlist, (list(self),))
+
     __setitem__ = __readonly__
     __delitem__ = __readonly__
     append = __readonly__
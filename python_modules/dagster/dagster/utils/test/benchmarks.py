@@ -0,0 +1,143 @@
+'''Registers benchmarks, times them and compares their results against a baseline. Benchmarks are
+run with ``python -m dagster_tests.benchmarks.runner``.
+'''
+import datetime
+import importlib
+import platform
+import time
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+
+from dagster import check
+from dagster.version import __version__
+
+DEFAULT_THRESHOLD = 0.2
+
+_BENCHMARKS = OrderedDict()
+
+
+class SkipBenchmark(Exception):
+    '''Raised by a benchmark to skip it, e.g. when a database it needs is not available.'''
+
+
+class Benchmark(namedtuple('_Benchmark', 'name fn params')):
+    def case_name(self, params):
+        if not params:
+            return self.name
+        return '{name}[{params}]'.format(
+            name=self.name,
+            params=','.join('{k}={v}'.format(k=k, v=v) for k, v in sorted(params.items())),
+        )
+
+
+def benchmark(name=None, params=None):
+    '''Register a benchmark.
+
+    The decorated function is a generator called with the keyword arguments of each of the params.
+    It does any setup, yields the function to time, and does any teardown once it is timed.
+
+    Args:
+        name (Optional[str]): The name of the benchmark. (default: the name of the function)
+        params (Optional[List[Dict[str, Any]]]): The keyword arguments of each case of the
+            benchmark. (default: one case with no arguments)
+    '''
+
+    def _wrap(fn):
+        benchmark_name = name or fn.__name__
+        # modules loaded again from their files, e.g. by the handles of repositories, register
+        # their benchmarks again, replacing them
+        _BENCHMARKS[benchmark_name] = Benchmark(
+            benchmark_name,
+            contextmanager(fn),
+            check.opt_list_param(params, 'params', of_type=dict) or [{}],
+        )
+        return fn
+
+    return _wrap
+
+
+def load_benchmarks(modules):
+    for module in modules:
+        importlib.import_module(module)
+    return list(_BENCHMARKS.values())
+
+
+def time_case(benchmark_def, params, repeats):
+    '''Returns the seconds taken by each of repeats calls of the function of a case, after a
+    warm up call.'''
+    with benchmark_def.fn(**params) as fn:
+        fn()
+        timings = []
+        for _ in range(repeats):
+            start = time.time()
+            fn()
+            timings.append(time.time() - start)
+    return timings
+
+
+def run_benchmarks(benchmarks, repeats=5, filters=None, quick=False, echo=None):
+    '''Time the cases of the benchmarks.
+
+    Returns:
+        Dict[str, Any]: The results, with the environment they were measured in.
+    '''
+    check.list_param(benchmarks, 'benchmarks', of_type=Benchmark)
+    check.int_param(repeats, 'repeats')
+    filters = check.opt_list_param(filters, 'filters', of_type=str)
+    echo = check.opt_callable_param(echo, 'echo', default=lambda _: None)
+
+    results = OrderedDict()
+    for benchmark_def in benchmarks:
+        for params in benchmark_def.params[:1] if quick else benchmark_def.params:
+            case_name = benchmark_def.case_name(params)
+            if filters and not any(f in case_name for f in filters):
+                continue
+            try:
+                timings = time_case(benchmark_def, params, 1 if quick else repeats)
+            except SkipBenchmark as exc:
+                echo('{case_name}: skipped, {reason}'.format(case_name=case_name, reason=exc))
+                continue
+            results[case_name] = {
+                'median': sorted(timings)[len(timings) // 2],
+                'min': min(timings),
+                'timings': timings,
+            }
+            echo(
+                '{case_name}: {median_ms:.2f} ms'.format(
+                    case_name=case_name, median_ms=results[case_name]['median'] * 1000
+                )
+            )
+
+    return {
+        'dagster_version': __version__,
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': datetime.datetime.utcnow().isoformat(),
+        'results': results,
+    }
+
+
+Comparison = namedtuple('Comparison', 'case_name baseline current ratio regressed')
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    '''Compare the medians of the cases measured in both runs.
+
+    Returns:
+        List[Comparison]: A comparison of each case, regressed if its median grew by more than
+            the threshold, as a fraction of the baseline.
+    '''
+    check.dict_param(baseline, 'baseline')
+    check.dict_param(current, 'current')
+    check.float_param(threshold, 'threshold')
+
+    comparisons = []
+    for case_name, result in current['results'].items():
+        if case_name not in baseline['results']:
+            continue
+        baseline_median = baseline['results'][case_name]['median']
+        ratio = result['median'] / baseline_median if baseline_median else float('inf')
+        comparisons.append(
+            Comparison(case_name, baseline_median, result['median'], ratio, ratio > 1 + threshold)
+        )
+    return comparisons
@@ -1,11 +1,19 @@
+import time
+
 import pytest
+import sqlalchemy as db
 
 from dagster.core.definitions import PipelineDefinition
 from dagster.core.errors import DagsterRunAlreadyExists, DagsterSnapshotDoesNotExist
+from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.core.snap.pipeline_snapshot import create_pipeline_snapshot_id
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
+from dagster.core.storage.runs import SqlRunStorage
+from dagster.core.storage.runs.schema import RunTagsTable
+from dagster.core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
 from dagster.core.utils import make_new_run_id
 from dagster.serdes import serialize_pp
+from dagster.seven import mock
 
 
 class TestRunStorage:
@@ -435,6 +443,92 @@ class TestRunStorage:
         assert list(storage.get_runs()) == []
         assert run_id not in [key for key, value in storage.get_run_tags()]
 
+    def test_delete_runs(self, storage):
+        run_ids = [make_new_run_id() for _ in range(3)]
+        for i, run_id in enumerate(run_ids):
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    pipeline_name='some_pipeline',
+                    tags={'foo': 'bar', 'run': str(i)},
+                )
+            )
+
+        storage.delete_runs(run_ids[:2])
+        assert [run.run_id for run in storage.get_runs()] == run_ids[2:]
+        # the tags of the deleted runs are gone with them
+        assert dict(storage.get_run_tags()) == {'foo': {'bar'}, 'run': {'2'}}
+        assert storage.get_runs(PipelineRunsFilter(tags={'run': '0'})) == []
+
+        storage.delete_runs([])
+        assert len(storage.get_runs()) == 1
+
+    def test_delete_runs_rolls_back_on_failure(self, storage):
+        if not isinstance(storage, SqlRunStorage):
+            pytest.skip('Only SQL run storages delete runs in a transaction')
+
+        run_ids = [make_new_run_id() for _ in range(2)]
+        for run_id in run_ids:
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id, pipeline_name='some_pipeline', tags={'foo': 'bar'}
+                )
+            )
+
+        def _fail_after_deleting_tags(conn, run_ids):
+            conn.execute(db.delete(RunTagsTable).where(RunTagsTable.c.run_id.in_(run_ids)))
+            raise Exception('Failed mid-delete')
+
+        with mock.patch.object(storage, '_delete_runs', side_effect=_fail_after_deleting_tags):
+            with pytest.raises(Exception, match='Failed mid-delete'):
+                storage.delete_runs(run_ids)
+
+        # the deleted tags are rolled back with the rest of the transaction
+        assert {run.run_id for run in storage.get_runs()} == set(run_ids)
+        assert len(storage.get_runs(PipelineRunsFilter(tags={'foo': 'bar'}))) == 2
+
+    def test_get_run_ids_updated_before(self, storage):
+        one, two, three = [make_new_run_id() for _ in range(3)]
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=one,
+                pipeline_name='some_pipeline',
+                tags={'foo': 'bar'},
+                status=PipelineRunStatus.SUCCESS,
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=two, pipeline_name='some_pipeline', status=PipelineRunStatus.FAILURE
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=three, pipeline_name='other_pipeline', status=PipelineRunStatus.SUCCESS
+            )
+        )
+
+        # a margin of seconds, the resolution the update timestamps of runs are stored at
+        assert storage.get_run_ids_updated_before(time.time() - 2) == []
+        assert storage.get_run_ids_updated_before(time.time() + 2) == [one, two, three]
+        assert storage.get_run_ids_updated_before(time.time() + 2, limit=2) == [one, two]
+        assert storage.get_run_ids_updated_before(
+            time.time() + 2, PipelineRunsFilter(status=PipelineRunStatus.SUCCESS)
+        ) == [one, three]
+        assert storage.get_run_ids_updated_before(
+            time.time() + 2, PipelineRunsFilter(pipeline_name='some_pipeline')
+        ) == [one, two]
+        assert storage.get_run_ids_updated_before(
+            time.time() + 2, PipelineRunsFilter(tags={'foo': 'bar'})
+        ) == [one]
+
+        # updating a run moves its update timestamp
+        storage.handle_run_event(
+            one, DagsterEvent(DagsterEventType.PIPELINE_FAILURE.value, 'some_pipeline')
+        )
+        assert storage.get_run_ids_updated_before(time.time() - 2) == []
+        assert storage.get_run_ids_updated_before(time.time() + 2) == [one, two, three]
+
     def test_wipe_tags(self, storage):
         run_id = 'some_run_id'
         run = PipelineRun(run_id=run_id, pipeline_name='a_pipeline', tags={'foo': 'bar'})
@@ -539,3 +633,115 @@ class TestRunStorage:
         storage.wipe()
 
         assert not storage.has_execution_plan_snapshot(snapshot_id)
+
+    @staticmethod
+    def add_step_cache_entries(storage, num_entries, now):
+        from dagster.core.storage.step_cache import StepCacheEntry
+
+        for idx in range(num_entries):
+            storage.add_step_cache_entry(
+                StepCacheEntry(
+                    cache_key='key_{}'.format(idx % 2),
+                    run_id='run_{}'.format(idx),
+                    step_key='add_one.compute',
+                    output_names=['result'],
+                    timestamp=now - 100 * (num_entries - idx),
+                )
+            )
+
+    def test_step_cache_entries(self, storage):
+        self.add_step_cache_entries(storage, 5, time.time())
+
+        # newest first
+        assert [entry.run_id for entry in storage.get_step_cache_entries('key_0')] == [
+            'run_4',
+            'run_2',
+            'run_0',
+        ]
+        assert [entry.run_id for entry in storage.get_step_cache_entries('key_1')] == [
+            'run_3',
+            'run_1',
+        ]
+        assert storage.get_step_cache_entries('nope') == []
+        assert [entry.run_id for entry in storage.get_step_cache_entries()] == [
+            'run_4',
+            'run_3',
+            'run_2',
+            'run_1',
+            'run_0',
+        ]
+
+        storage.wipe()
+        assert storage.get_step_cache_entries('key_0') == []
+
+    def test_evict_step_cache_entries_by_age(self, storage):
+        now = time.time()
+        self.add_step_cache_entries(storage, 5, now)
+
+        assert storage.evict_step_cache_entries() == 0
+        # run_0 to run_2 were recorded 500, 400 and 300 seconds ago
+        assert storage.evict_step_cache_entries(before_timestamp=now - 250) == 3
+        assert [entry.run_id for entry in storage.get_step_cache_entries('key_0')] == ['run_4']
+        assert [entry.run_id for entry in storage.get_step_cache_entries('key_1')] == ['run_3']
+
+        assert storage.evict_step_cache_entries(before_timestamp=now - 250) == 0
+
+    def test_evict_step_cache_entries_by_count(self, storage):
+        self.add_step_cache_entries(storage, 5, time.time())
+
+        assert storage.evict_step_cache_entries(max_entries=5) == 0
+        # the oldest entries go first
+        assert storage.evict_step_cache_entries(max_entries=2) == 3
+        assert [entry.run_id for entry in storage.get_step_cache_entries('key_0')] == ['run_4']
+        assert [entry.run_id for entry in storage.get_step_cache_entries('key_1')] == ['run_3']
+
+        assert storage.evict_step_cache_entries(max_entries=0) == 2
+        assert storage.get_step_cache_entries('key_0') == []
+
+    def test_evict_step_cache_entries_by_age_and_count(self, storage):
+        now = time.time()
+        self.add_step_cache_entries(storage, 5, now)
+
+        # either condition evicts an entry
+        assert storage.evict_step_cache_entries(before_timestamp=now - 450, max_entries=3) == 2
+        assert [entry.run_id for entry in storage.get_step_cache_entries('key_0')] == [
+            'run_4',
+            'run_2',
+        ]
+
+    def test_run_status_by_partition(self, storage):
+        for partition_set_name, partition_name, status in [
+            ('foo_set', 'one', PipelineRunStatus.FAILURE),
+            ('foo_set', 'one', PipelineRunStatus.SUCCESS),
+            ('foo_set', 'two', PipelineRunStatus.SUCCESS),
+            ('foo_set', 'two', PipelineRunStatus.STARTED),
+            ('foo_set', 'four', PipelineRunStatus.FAILURE),
+            ('bar_set', 'three', PipelineRunStatus.SUCCESS),
+        ]:
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=make_new_run_id(),
+                    pipeline_name='foo_pipeline',
+                    status=status,
+                    tags={
+                        PARTITION_SET_TAG: partition_set_name,
+                        PARTITION_NAME_TAG: partition_name,
+                    },
+                )
+            )
+        storage.add_run(TestRunStorage.build_run(run_id=make_new_run_id(), pipeline_name='foo'))
+
+        assert storage.get_run_status_by_partition('foo_set') == {
+            'one': PipelineRunStatus.SUCCESS,
+            'two': PipelineRunStatus.STARTED,
+            'four': PipelineRunStatus.FAILURE,
+        }
+        assert storage.get_run_status_by_partition('bar_set') == {
+            'three': PipelineRunStatus.SUCCESS
+        }
+        assert storage.get_run_status_by_partition('baz_set') == {}
+
+        # a partition has succeeded if any of its runs did, even if a later run did not
+        assert storage.get_successful_partition_names('foo_set') == {'one', 'two'}
+        assert storage.get_successful_partition_names('bar_set') == {'three'}
+        assert storage.get_successful_partition_names('baz_set') == set()
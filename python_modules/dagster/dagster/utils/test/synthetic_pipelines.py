@@ -0,0 +1,123 @@
+'''Synthetic pipelines of parameterized width, depth and fan-in, e.g. for benchmarks.'''
+from dagster import (
+    DependencyDefinition,
+    Field,
+    InputDefinition,
+    Int,
+    Output,
+    OutputDefinition,
+    PipelineDefinition,
+    SolidDefinition,
+    SolidInvocation,
+    check,
+)
+
+
+def _source_solid_def():
+    def _compute(context, _inputs):
+        yield Output(context.solid_config['value'])
+
+    return SolidDefinition(
+        name='source',
+        input_defs=[],
+        output_defs=[OutputDefinition(Int)],
+        compute_fn=_compute,
+        config={'value': Field(Int, is_required=False, default_value=1)},
+    )
+
+
+# the pipelines of a repository must share the definitions of the solids with the same names
+_SOURCE_SOLID_DEF = _source_solid_def()
+
+_ADD_SOLID_DEFS = {}
+
+
+def _add_solid_def(fan_in):
+    if fan_in not in _ADD_SOLID_DEFS:
+        _ADD_SOLID_DEFS[fan_in] = _build_add_solid_def(fan_in)
+    return _ADD_SOLID_DEFS[fan_in]
+
+
+def _build_add_solid_def(fan_in):
+    def _compute(context, inputs):
+        yield Output(sum(inputs.values()) * context.solid_config['multiplier'])
+
+    return SolidDefinition(
+        name='add_{fan_in}'.format(fan_in=fan_in),
+        input_defs=[InputDefinition('num_{i}'.format(i=i), Int) for i in range(fan_in)],
+        output_defs=[OutputDefinition(Int)],
+        compute_fn=_compute,
+        config={'multiplier': Field(Int, is_required=False, default_value=1)},
+    )
+
+
+def solid_name(layer, index):
+    return 'solid_{layer}_{index}'.format(layer=layer, index=index)
+
+
+def define_synthetic_pipeline(width, depth, fan_in=1, name=None):
+    '''A pipeline of depth layers of width solids each, with integer outputs.
+
+    The solids of the first layer have no inputs. Every other solid sums the outputs of fan_in
+    solids of the layer before it, so the pipeline has width * depth solids and
+    width * (depth - 1) * fan_in dependencies. All of the solids have optional config.
+    '''
+    check.int_param(width, 'width')
+    check.int_param(depth, 'depth')
+    check.param_invariant(1 <= fan_in <= width, 'fan_in', 'fan_in must be between 1 and width')
+    check.opt_str_param(name, 'name')
+
+    source = _SOURCE_SOLID_DEF
+    add = _add_solid_def(fan_in)
+
+    dependencies = {}
+    for index in range(width):
+        dependencies[SolidInvocation('source', solid_name(0, index))] = {}
+    for layer in range(1, depth):
+        for index in range(width):
+            dependencies[SolidInvocation(add.name, solid_name(layer, index))] = {
+                'num_{i}'.format(i=i): DependencyDefinition(
+                    solid_name(layer - 1, (index + i) % width)
+                )
+                for i in range(fan_in)
+            }
+
+    return PipelineDefinition(
+        name=name
+        or 'synthetic_{width}_{depth}_{fan_in}'.format(width=width, depth=depth, fan_in=fan_in),
+        solid_defs=[source, add] if depth > 1 else [source],
+        dependencies=dependencies,
+    )
+
+
+def synthetic_environment_dict(width, depth, value=1):
+    '''Config for every solid of a synthetic pipeline.'''
+    solids = {}
+    for index in range(width):
+        solids[solid_name(0, index)] = {'config': {'value': value}}
+    for layer in range(1, depth):
+        for index in range(width):
+            solids[solid_name(layer, index)] = {'config': {'multiplier': 1}}
+    return {'solids': solids}
+
+
+# The subprocesses of the multiprocess engine rebuild pipelines by calling a function of a module,
+# so the pipelines executed with it are defined by functions of this module. Every step is executed
+# in a new process, so they are small.
+MULTIPROCESS_SHAPES = {
+    'wide': (8, 1, 1),
+    'deep': (1, 8, 1),
+    'fan_in': (4, 2, 4),
+}
+
+
+def define_wide_pipeline():
+    return define_synthetic_pipeline(*MULTIPROCESS_SHAPES['wide'], name='wide')
+
+
+def define_deep_pipeline():
+    return define_synthetic_pipeline(*MULTIPROCESS_SHAPES['deep'], name='deep')
+
+
+def define_fan_in_pipeline():
+    return define_synthetic_pipeline(*MULTIPROCESS_SHAPES['fan_in'], name='fan_in')
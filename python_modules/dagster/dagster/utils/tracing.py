@@ -0,0 +1,171 @@
+'''Tracing of where the wall time of a run goes.
+
+Code is instrumented with :py:func:`trace_span`, e.g.
+
+    with trace_span('set_intermediate', 'intermediates', step_key=step_key):
+        ...
+
+Spans are only recorded while a :py:class:`Tracer` is active in the executing thread. Otherwise
+``trace_span`` returns a shared no-op context manager, so instrumented code pays no more than a
+thread local lookup.
+
+Recorded spans are exported in the Chrome trace event format, which can be loaded in
+chrome://tracing, Perfetto or speedscope.
+'''
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+from dagster import check
+
+_ACTIVE = threading.local()
+
+
+class Span(namedtuple('_Span', 'name category start duration pid tid args')):
+    '''A timed section of code.
+
+    Args:
+        name (str): What the code did, e.g. ``store_event``.
+        category (str): The part of the system the code belongs to, e.g. ``event_log``.
+        start (float): Seconds since the epoch.
+        duration (float): Seconds.
+        pid (int): The process the code executed in.
+        tid (int): The thread the code executed in.
+        args (Dict[str, str]): Details of the span, e.g. the step it was executed for.
+    '''
+
+    def to_chrome_trace_event(self):
+        return {
+            'name': self.name,
+            'cat': self.category,
+            'ph': 'X',
+            'ts': int(self.start * 1e6),
+            'dur': int(self.duration * 1e6),
+            'pid': self.pid,
+            'tid': self.tid,
+            'args': self.args,
+        }
+
+
+class Tracer(object):
+    '''Collects the spans recorded while it is active.'''
+
+    def __init__(self):
+        self._spans = []
+
+    @property
+    def spans(self):
+        return list(self._spans)
+
+    def record(self, name, category, start, duration, args=None):
+        # list.append is atomic, spans can be recorded from any thread the tracer is active in
+        self._spans.append(
+            Span(
+                name,
+                category,
+                start,
+                duration,
+                os.getpid(),
+                threading.current_thread().ident,
+                args or {},
+            )
+        )
+
+    def trace_iterator(self, iterator):
+        '''Activate the tracer while the iterator is advanced, but not in the code consuming it.'''
+        iterator = iter(iterator)
+        while True:
+            with active_tracer(self):
+                try:
+                    value = next(iterator)
+                except StopIteration:
+                    return
+            yield value
+
+    def chrome_trace_events(self):
+        return [span.to_chrome_trace_event() for span in self._spans]
+
+
+def get_active_tracer():
+    '''The tracer active in this thread, if any.
+
+    Returns:
+        Optional[Tracer]
+    '''
+    return getattr(_ACTIVE, 'tracer', None)
+
+
+@contextmanager
+def active_tracer(tracer):
+    '''Activate a tracer in this thread. A ``None`` tracer deactivates tracing.'''
+    check.opt_inst_param(tracer, 'tracer', Tracer)
+    previous = get_active_tracer()
+    _ACTIVE.tracer = tracer
+    try:
+        yield tracer
+    finally:
+        _ACTIVE.tracer = previous
+
+
+class _NoopSpan(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _RecordingSpan(object):
+    __slots__ = ['_tracer', '_name', '_category', '_args', '_start']
+
+    def __init__(self, tracer, name, category, args):
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._tracer.record(
+            self._name, self._category, self._start, time.time() - self._start, self._args
+        )
+        return False
+
+
+def trace_span(name, category, **args):
+    '''Time a section of code as a span of the active tracer, if any.
+
+    Args:
+        name (str): What the code does.
+        category (str): The part of the system the code belongs to.
+        **args (str): Details of the span.
+    '''
+    tracer = getattr(_ACTIVE, 'tracer', None)
+    if tracer is None:
+        return _NOOP_SPAN
+    return _RecordingSpan(tracer, name, category, args)
+
+
+def write_chrome_trace(path, events):
+    '''Write trace events to a file in the Chrome trace event format.'''
+    check.str_param(path, 'path')
+    check.list_param(events, 'events', dict)
+    with open(path, 'w') as trace_file:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, trace_file)
+
+
+def read_chrome_trace(path):
+    '''Read the trace events of a file in the Chrome trace event format.'''
+    check.str_param(path, 'path')
+    with open(path) as trace_file:
+        return json.load(trace_file)['traceEvents']
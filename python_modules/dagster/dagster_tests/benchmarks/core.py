@@ -0,0 +1,168 @@
+'''Benchmarks of building execution plans and config, executing pipelines and serdes.'''
+import itertools
+import time
+
+from dagster import (
+    ExecutionTargetHandle,
+    Int,
+    List,
+    Set,
+    String,
+    Tuple,
+    TypeCheckPolicy,
+    check,
+    execute_pipeline,
+    seven,
+)
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster.core.events.log import DagsterEventRecord
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.instance import DagsterInstance
+from dagster.core.system_config.objects import EnvironmentConfig
+from dagster.core.types.dagster_type import resolve_dagster_type
+from dagster.core.types.python_dict import create_typed_runtime_dict
+from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+from dagster.utils.test import synthetic_pipelines
+from dagster.utils.test.benchmarks import benchmark
+from dagster.utils.test.synthetic_pipelines import (
+    define_synthetic_pipeline,
+    synthetic_environment_dict,
+)
+
+SHAPES = [
+    dict(width=10, depth=10, fan_in=1),
+    dict(width=100, depth=1, fan_in=1),
+    dict(width=1, depth=100, fan_in=1),
+    dict(width=20, depth=5, fan_in=20),
+]
+
+# the console logger would otherwise dominate the time taken to execute pipelines
+QUIET_LOGGERS = {'console': {'config': {'log_level': 'CRITICAL'}}}
+
+
+@benchmark(params=SHAPES)
+def execution_plan_build(width, depth, fan_in):
+    pipeline_def = define_synthetic_pipeline(width, depth, fan_in)
+    environment_config = EnvironmentConfig.build(
+        pipeline_def, synthetic_environment_dict(width, depth)
+    )
+    yield lambda: ExecutionPlan.build(pipeline_def, environment_config)
+
+
+@benchmark(params=SHAPES)
+def environment_config_build(width, depth, fan_in):
+    pipeline_def = define_synthetic_pipeline(width, depth, fan_in)
+    # a new value every time, so every build validates the config rather than hitting the memo
+    values = itertools.count()
+    yield lambda: EnvironmentConfig.build(
+        pipeline_def, synthetic_environment_dict(width, depth, value=next(values))
+    )
+
+
+@benchmark(params=SHAPES)
+def environment_config_build_memoized(width, depth, fan_in):
+    pipeline_def = define_synthetic_pipeline(width, depth, fan_in)
+    environment_dict = synthetic_environment_dict(width, depth)
+    yield lambda: EnvironmentConfig.build(pipeline_def, environment_dict)
+
+
+@benchmark(params=SHAPES)
+def execute_pipeline_in_process(width, depth, fan_in):
+    pipeline_def = define_synthetic_pipeline(width, depth, fan_in)
+    environment_dict = dict(synthetic_environment_dict(width, depth), loggers=QUIET_LOGGERS)
+    instance = DagsterInstance.ephemeral()
+    yield lambda: execute_pipeline(
+        pipeline_def, environment_dict=environment_dict, instance=instance
+    )
+
+
+@benchmark(
+    params=[
+        dict(shape='wide', max_concurrent=4),
+        dict(shape='deep', max_concurrent=4),
+        dict(shape='fan_in', max_concurrent=4),
+    ]
+)
+def execute_pipeline_multiprocess(shape, max_concurrent):
+    # the subprocesses load the pipeline from the file of the module defining it
+    pipeline_def = ExecutionTargetHandle.for_pipeline_python_file(
+        synthetic_pipelines.__file__, 'define_{shape}_pipeline'.format(shape=shape)
+    ).build_pipeline_definition()
+    environment_dict = {
+        'storage': {'filesystem': {}},
+        'execution': {'multiprocess': {'config': {'max_concurrent': max_concurrent}}},
+        'loggers': QUIET_LOGGERS,
+    }
+    with seven.TemporaryDirectory() as tempdir:
+        instance = DagsterInstance.local_temp(tempdir)
+        yield lambda: execute_pipeline(
+            pipeline_def, environment_dict=environment_dict, instance=instance
+        )
+
+
+@benchmark(params=SHAPES)
+def serdes_pipeline_snapshot(width, depth, fan_in):
+    pipeline_snapshot = define_synthetic_pipeline(width, depth, fan_in).get_pipeline_snapshot()
+    yield lambda: deserialize_json_to_dagster_namedtuple(
+        serialize_dagster_namedtuple(pipeline_snapshot)
+    )
+
+
+@benchmark(params=[dict(events=1000)])
+def serdes_event_records(events):
+    records = [
+        DagsterEventRecord(
+            None,
+            str(i),
+            'debug',
+            '',
+            'run_id',
+            time.time(),
+            step_key='solid.compute',
+            dagster_event=DagsterEvent(
+                DagsterEventType.ENGINE_EVENT.value,
+                'pipeline',
+                step_key='solid.compute',
+                event_specific_data=EngineEventData.in_process(999),
+            ),
+        )
+        for i in range(events)
+    ]
+    yield lambda: [
+        deserialize_json_to_dagster_namedtuple(serialize_dagster_namedtuple(record))
+        for record in records
+    ]
+
+
+def _collection_type_and_value(collection, items, type_check_policy):
+    if collection == 'list':
+        return List(resolve_dagster_type(Int), type_check_policy), list(range(items))
+    if collection == 'set':
+        return Set(Int, type_check_policy), set(range(items))
+    if collection == 'dict':
+        return (
+            create_typed_runtime_dict(String, Int, type_check_policy),
+            {str(i): i for i in range(items)},
+        )
+    if collection == 'tuple':
+        return Tuple([Int] * items, type_check_policy), tuple(range(items))
+    check.failed('Unknown collection {collection}'.format(collection=collection))
+
+
+@benchmark(
+    params=[
+        dict(collection=collection, items=items, policy=policy)
+        for collection, items in [
+            ('list', 100000),
+            ('set', 100000),
+            ('dict', 100000),
+            ('tuple', 1000),
+        ]
+        for policy in ['full', 'first:100', 'sample:100', 'skip']
+    ]
+)
+def type_check_collection(collection, items, policy):
+    dagster_type, value = _collection_type_and_value(
+        collection, items, TypeCheckPolicy.from_tag_value(policy)
+    )
+    yield lambda: dagster_type.type_check(None, value)
@@ -0,0 +1,160 @@
+'''Cost of storing events in the in-memory event log storage of ephemeral instances.
+
+Compares the chunked event log buffer of InMemoryEventLogStorage against the persistent vector it
+replaced, which type checked and copied the path to the tail of the vector on every append and
+called the handlers of a run while holding its lock. Both storing events directly and executing
+large toy pipelines, of the kind the test suites execute, against an ephemeral instance are timed.
+Run with:
+
+    python -m dagster_tests.benchmarks.in_memory_event_log --solids 200 --logs-per-solid 50
+'''
+import time
+
+import click
+import pyrsistent
+
+from dagster import check, execute_pipeline, seven
+from dagster.core.definitions import PipelineDefinition, SolidDefinition
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster.core.events.log import DagsterEventRecord, EventRecord
+from dagster.core.instance import DagsterInstance, InstanceType
+from dagster.core.instance.ref import compute_logs_directory
+from dagster.core.storage.event_log import InMemoryEventLogStorage
+from dagster.core.storage.local_compute_log_manager import NoOpComputeLogManager
+from dagster.core.storage.root import LocalArtifactStorage
+from dagster.core.storage.runs import InMemoryRunStorage
+
+
+# the console logger would otherwise dominate the execution time
+QUIET_ENVIRONMENT = {'loggers': {'console': {'config': {'log_level': 'CRITICAL'}}}}
+
+
+class EventLogSequence(pyrsistent.CheckedPVector):
+    __type__ = EventRecord
+
+
+class PersistentVectorEventLogStorage(InMemoryEventLogStorage):
+    '''The in-memory event log storage as it was, keeping the events of runs in persistent vectors.
+    '''
+
+    def __init__(self):
+        super(PersistentVectorEventLogStorage, self).__init__()
+        self._pvector_logs = {}
+
+    def get_logs_for_run(self, run_id, cursor=-1):
+        with self._lock[run_id]:
+            return self._pvector_logs.get(run_id, EventLogSequence())[cursor + 1 :]
+
+    def get_logs_count_for_run(self, run_id):
+        with self._lock[run_id]:
+            return len(self._pvector_logs.get(run_id, EventLogSequence()))
+
+    def store_event(self, event):
+        check.inst_param(event, 'event', EventRecord)
+        run_id = event.run_id
+        with self._lock[run_id]:
+            self._pvector_logs[run_id] = self._pvector_logs.get(run_id, EventLogSequence()).append(
+                event
+            )
+            for handler in self._handlers[run_id]:
+                handler(event)
+
+
+STORAGES = [
+    ('persistent vector', PersistentVectorEventLogStorage),
+    ('chunked buffer', InMemoryEventLogStorage),
+]
+
+
+def _engine_event(run_id, message):
+    return DagsterEventRecord(
+        None,
+        message,
+        'debug',
+        '',
+        run_id,
+        time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ENGINE_EVENT.value,
+            'nonce',
+            event_specific_data=EngineEventData.in_process(999),
+        ),
+    )
+
+
+def time_store_events(storage_cls, n_events):
+    '''Returns the seconds taken to store n_events events of a run, and read them back.'''
+    storage = storage_cls()
+    events = [_engine_event('foo', str(i)) for i in range(n_events)]
+    start = time.time()
+    for event in events:
+        storage.store_event(event)
+    assert len(storage.get_logs_for_run('foo')) == n_events
+    return time.time() - start
+
+
+def define_toy_pipeline(n_solids, n_logs_per_solid):
+    '''A pipeline of n_solids independent solids, each of which logs n_logs_per_solid messages.'''
+
+    def _compute(context, _inputs):
+        for i in range(n_logs_per_solid):
+            context.log.info(str(i))
+
+    return PipelineDefinition(
+        name='toy_pipeline',
+        solid_defs=[
+            SolidDefinition(
+                name='solid_{i}'.format(i=i), input_defs=[], output_defs=[], compute_fn=_compute,
+            )
+            for i in range(n_solids)
+        ],
+    )
+
+
+def time_execute_pipeline(storage_cls, pipeline_def):
+    '''Returns the seconds taken to execute the pipeline against an ephemeral instance.'''
+    with seven.TemporaryDirectory() as tempdir:
+        instance = DagsterInstance(
+            InstanceType.EPHEMERAL,
+            local_artifact_storage=LocalArtifactStorage(tempdir),
+            run_storage=InMemoryRunStorage(),
+            event_storage=storage_cls(),
+            compute_log_manager=NoOpComputeLogManager(compute_logs_directory(tempdir)),
+        )
+        start = time.time()
+        result = execute_pipeline(
+            pipeline_def, environment_dict=QUIET_ENVIRONMENT, instance=instance
+        )
+        elapsed = time.time() - start
+        assert result.success
+    return elapsed
+
+
+@click.command()
+@click.option('--events', default=100000, help='The number of events to store directly.')
+@click.option('--solids', default=200, help='The number of solids of the toy pipeline.')
+@click.option('--logs-per-solid', default=50, help='The number of messages each solid logs.')
+@click.option('--repeats', default=3, help='The number of times to time each measurement.')
+def main(events, solids, logs_per_solid, repeats):
+    pipeline_def = define_toy_pipeline(solids, logs_per_solid)
+    instance = DagsterInstance.ephemeral()
+    run_id = execute_pipeline(
+        pipeline_def, environment_dict=QUIET_ENVIRONMENT, instance=instance
+    ).run_id
+    click.echo(
+        'The toy pipeline stores {n_events} events, of which {n_logs} are log messages'.format(
+            n_events=len(instance.all_logs(run_id)), n_logs=solids * logs_per_solid
+        )
+    )
+
+    click.echo('{:>18} {:>16} {:>20}'.format('storage', 'store_event (s)', 'execute_pipeline (s)'))
+    for name, storage_cls in STORAGES:
+        store_elapsed = min(time_store_events(storage_cls, events) for _ in range(repeats))
+        execute_elapsed = min(
+            time_execute_pipeline(storage_cls, pipeline_def) for _ in range(repeats)
+        )
+        click.echo('{:>18} {:16.2f} {:20.2f}'.format(name, store_elapsed, execute_elapsed))
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,96 @@
+'''Latency of resolving the status of every partition of a partition set from run storage.
+
+Compares fetching the runs of each partition with one tag-filtered query, the way partition
+schedules used to pick the last empty partition, against fetching the partitions that have a
+successful run, and the status of the most recent run of every partition, in one query each. Run
+with:
+
+    python -m dagster_tests.benchmarks.partition_status --partitions 10000
+'''
+import time
+
+import click
+
+from dagster import seven
+from dagster.core.definitions.pipeline import ExecutionSelector
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
+from dagster.core.storage.runs import SqliteRunStorage
+from dagster.core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
+
+PARTITION_SET_NAME = 'daily'
+
+
+def _partition_name(i):
+    return 'partition_{i}'.format(i=i)
+
+
+def add_partition_runs(storage, n_partitions, n_runs_per_partition):
+    for i in range(n_partitions):
+        for _ in range(n_runs_per_partition):
+            storage.add_run(
+                PipelineRun(
+                    pipeline_name='foo',
+                    selector=ExecutionSelector('foo'),
+                    status=PipelineRunStatus.SUCCESS,
+                    tags={
+                        PARTITION_SET_TAG: PARTITION_SET_NAME,
+                        PARTITION_NAME_TAG: _partition_name(i),
+                    },
+                )
+            )
+
+
+def successful_partitions_per_partition_queries(storage, n_partitions):
+    successful = set()
+    for i in range(n_partitions):
+        runs = storage.get_runs(
+            PipelineRunsFilter(
+                tags={PARTITION_SET_TAG: PARTITION_SET_NAME, PARTITION_NAME_TAG: _partition_name(i)}
+            )
+        )
+        if any(run.status == PipelineRunStatus.SUCCESS for run in runs):
+            successful.add(_partition_name(i))
+    return successful
+
+
+def successful_partitions_query(storage, _n_partitions):
+    return storage.get_successful_partition_names(PARTITION_SET_NAME)
+
+
+def status_by_partition_grouped_query(storage, _n_partitions):
+    return storage.get_run_status_by_partition(PARTITION_SET_NAME)
+
+
+@click.command()
+@click.option('--partitions', default=10000, help='The number of partitions.')
+@click.option('--runs-per-partition', default=2, help='The number of runs of each partition.')
+def main(partitions, runs_per_partition):
+    with seven.TemporaryDirectory() as base_dir:
+        storage = SqliteRunStorage.from_local(base_dir)
+
+        start = time.time()
+        add_partition_runs(storage, partitions, runs_per_partition)
+        click.echo(
+            'Added {n_runs} runs in {elapsed:.1f}s'.format(
+                n_runs=partitions * runs_per_partition, elapsed=time.time() - start
+            )
+        )
+
+        results = []
+        for name, fn in [
+            ('per-partition queries', successful_partitions_per_partition_queries),
+            ('successful partitions', successful_partitions_query),
+            ('grouped status query', status_by_partition_grouped_query),
+        ]:
+            start = time.time()
+            statuses = fn(storage, partitions)
+            elapsed = time.time() - start
+            assert len(statuses) == partitions
+            results.append((name, elapsed))
+
+    for name, elapsed in results:
+        click.echo('{name:>22}: {elapsed_ms:10.1f} ms'.format(name=name, elapsed_ms=elapsed * 1000))
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
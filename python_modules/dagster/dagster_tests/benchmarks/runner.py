@@ -0,0 +1,104 @@
+'''A runner for the benchmarks of the execution and storage hot paths.
+
+Benchmarks are registered with :py:func:`dagster.utils.test.benchmarks.benchmark`, in the modules
+passed to the runner with --module. Each case of a benchmark is timed, its results are written to a
+JSON file, and are compared against the results of a baseline run, e.g. of the base commit of a
+change:
+
+    git checkout master
+    python -m dagster_tests.benchmarks.runner --output baseline.json
+    git checkout my-change
+    python -m dagster_tests.benchmarks.runner --output results.json --baseline baseline.json
+
+The runner exits with a non-zero status if the median of a case regressed by more than the
+threshold. --filter selects the cases whose names contain a string, and --quick times only the
+first case of every benchmark, once, e.g. to check that the benchmarks still run.
+'''
+import sys
+
+import click
+
+from dagster import seven
+from dagster.utils.test.benchmarks import (
+    DEFAULT_THRESHOLD,
+    compare_results,
+    load_benchmarks,
+    run_benchmarks,
+)
+
+DEFAULT_MODULES = ['dagster_tests.benchmarks.core', 'dagster_tests.benchmarks.storage']
+
+
+@click.command()
+@click.option(
+    '--module',
+    'modules',
+    multiple=True,
+    help='A module registering benchmarks. Can be passed more than once. (default: {})'.format(
+        ', '.join(DEFAULT_MODULES)
+    ),
+)
+@click.option(
+    '--filter',
+    'filters',
+    multiple=True,
+    help='Only run the cases whose names contain this. Can be passed more than once.',
+)
+@click.option('--repeats', default=5, help='The number of times to time each case.')
+@click.option('--quick', is_flag=True, help='Time only the first case of each benchmark, once.')
+@click.option('--output', type=click.Path(), help='The file to write the results to.')
+@click.option(
+    '--baseline', type=click.Path(exists=True), help='The results of a run to compare against.'
+)
+@click.option(
+    '--threshold',
+    default=DEFAULT_THRESHOLD,
+    help='The fraction by which a median may grow before it is a regression.',
+)
+def main(modules, filters, repeats, quick, output, baseline, threshold):
+    benchmarks = load_benchmarks(list(modules) or DEFAULT_MODULES)
+    results = run_benchmarks(
+        benchmarks, repeats=repeats, filters=list(filters), quick=quick, echo=click.echo
+    )
+
+    if output:
+        with open(output, 'w') as fd:
+            seven.json.dump(results, fd, indent=2)
+
+    if not baseline:
+        return
+
+    with open(baseline, 'r') as fd:
+        comparisons = compare_results(seven.json.load(fd), results, threshold)
+
+    width = max([len('case')] + [len(comparison.case_name) for comparison in comparisons])
+    click.echo('')
+    click.echo(
+        '{:<{width}} {:>14} {:>14} {:>8}'.format(
+            'case', 'baseline (ms)', 'current (ms)', 'ratio', width=width
+        )
+    )
+    for comparison in comparisons:
+        click.echo(
+            '{:<{width}} {:14.2f} {:14.2f} {:8.2f}{}'.format(
+                comparison.case_name,
+                comparison.baseline * 1000,
+                comparison.current * 1000,
+                comparison.ratio,
+                '  REGRESSED' if comparison.regressed else '',
+                width=width,
+            )
+        )
+
+    regressions = [comparison for comparison in comparisons if comparison.regressed]
+    if regressions:
+        click.echo(
+            '{n} of {total} cases regressed by more than {pct:.0f}%'.format(
+                n=len(regressions), total=len(comparisons), pct=threshold * 100
+            )
+        )
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
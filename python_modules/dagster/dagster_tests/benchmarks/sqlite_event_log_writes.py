@@ -0,0 +1,90 @@
+'''Write throughput of the SQLite event log storages under concurrent writers.
+
+Each writer process stores events for one run, the way the step processes of the multiprocess
+engine do, and several writers share each run. Run with:
+
+    python -m dagster_tests.benchmarks.sqlite_event_log_writes --runs 4 --writers-per-run 4
+'''
+import multiprocessing
+import time
+
+import click
+
+from dagster import seven
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster.core.events.log import DagsterEventRecord
+from dagster.core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqliteEventLogStorage,
+)
+
+STORAGES = {
+    'per-run': SqliteEventLogStorage,
+    'consolidated': ConsolidatedSqliteEventLogStorage,
+}
+
+
+def _engine_event(run_id, message):
+    return DagsterEventRecord(
+        None,
+        message,
+        'debug',
+        '',
+        run_id,
+        time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ENGINE_EVENT.value,
+            'nonce',
+            event_specific_data=EngineEventData.in_process(999),
+        ),
+    )
+
+
+def _write_events(storage_name, base_dir, run_id, n_events):
+    storage = STORAGES[storage_name](base_dir)
+    for i in range(n_events):
+        storage.store_event(_engine_event(run_id, str(i)))
+
+
+def measure_write_throughput(storage_name, n_runs, n_writers_per_run, n_events):
+    '''Returns the number of events stored per second by all of the writers together.'''
+    with seven.TemporaryDirectory() as base_dir:
+        # create the storage, and the databases of the runs, before timing the writes
+        for run_id in range(n_runs):
+            _write_events(storage_name, base_dir, str(run_id), 1)
+
+        processes = [
+            multiprocessing.Process(
+                target=_write_events, args=(storage_name, base_dir, str(run_id), n_events)
+            )
+            for run_id in range(n_runs)
+            for _ in range(n_writers_per_run)
+        ]
+        start = time.time()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            if process.exitcode != 0:
+                raise Exception('A writer failed with exit code {}'.format(process.exitcode))
+        elapsed = time.time() - start
+
+    return len(processes) * n_events / elapsed
+
+
+@click.command()
+@click.option('--runs', default=4, help='The number of runs to write events for.')
+@click.option('--writers-per-run', default=4, help='The number of processes writing each run.')
+@click.option('--events', default=200, help='The number of events each process writes.')
+def main(runs, writers_per_run, events):
+    for storage_name in sorted(STORAGES):
+        click.echo(
+            '{storage_name:>12}: {throughput:8.1f} events/s'.format(
+                storage_name=storage_name,
+                throughput=measure_write_throughput(storage_name, runs, writers_per_run, events),
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
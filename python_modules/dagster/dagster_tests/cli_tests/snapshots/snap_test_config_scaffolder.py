@@ -22,6 +22,8 @@ snapshots['test_basic_solids_config 1'] = {
         'multiprocess': {
             'config': {
                 'max_concurrent': 0,
+                'resources': {
+                },
                 'retries': {
                     'disabled': {
                     },
@@ -85,6 +87,8 @@ snapshots['test_two_modes 2'] = {
         'multiprocess': {
             'config': {
                 'max_concurrent': 0,
+                'resources': {
+                },
                 'retries': {
                     'disabled': {
                     },
@@ -148,6 +152,8 @@ snapshots['test_two_modes 4'] = {
         'multiprocess': {
             'config': {
                 'max_concurrent': 0,
+                'resources': {
+                },
                 'retries': {
                     'disabled': {
                     },
@@ -35,6 +35,7 @@ from dagster.cli.pipeline import (
     pipeline_print_command,
     pipeline_scaffold_command,
 )
+from dagster.cli.instance import purge_command
 from dagster.cli.run import run_list_command, run_wipe_command
 from dagster.cli.schedule import (
     schedule_list_command,
@@ -648,6 +649,45 @@ def test_run_wipe_incorrect_delete_message():
     assert result.exit_code == 0
 
 
+def test_instance_purge_dry_run():
+    runner = CliRunner()
+    result = runner.invoke(
+        purge_command, ['--older-than-days', '30', '--status', 'SUCCESS', '--dry-run']
+    )
+    assert result.exit_code == 0
+    assert 'Found 0 runs to purge.' in result.output
+
+
+def test_instance_purge_no_runs():
+    runner = CliRunner()
+    result = runner.invoke(purge_command, ['--older-than-days', '30', '--tag', 'foo=bar'])
+    assert result.exit_code == 0
+    assert 'No runs to purge.' in result.output
+
+
+def test_instance_purge_bad_tag():
+    runner = CliRunner()
+    result = runner.invoke(purge_command, ['--older-than-days', '30', '--tag', 'foo'])
+    assert result.exit_code == 2
+    assert 'Tags must be given as KEY=VALUE' in result.output
+
+
+def test_instance_purge_deletes_the_confirmed_runs():
+    with mock.patch('dagster.core.instance.DagsterInstance.get') as _instance:
+        instance = _instance.return_value
+        instance.purge_runs.return_value = ['foo', 'bar']
+        instance.delete_runs.return_value = ['foo', 'bar']
+
+        runner = CliRunner()
+        result = runner.invoke(purge_command, ['--older-than-days', '30'], input='y\n')
+        assert result.exit_code == 0
+        assert 'Purged 2 runs.' in result.output
+
+        # the runs are selected once, for the confirmation prompt, and those runs are deleted
+        assert instance.purge_runs.call_count == 1
+        assert instance.delete_runs.call_args[0][0] == ['foo', 'bar']
+
+
 @schedules
 def define_bar_scheduler():
     return [
@@ -25,7 +25,7 @@ def test_0_6_4():
             match=re.escape(
                 'Instance is out of date and must be migrated (SqliteEventLogStorage for run '
                 'c7a6c4d7-6c88-46d0-8baa-d4937c3cefe5). Database is at revision None, head is '
-                '3b1e175a2be3. Please run `dagster instance migrate`.'
+                '5d1c8c5a2f4e. Please run `dagster instance migrate`.'
             ),
         ):
             for run in runs:
@@ -52,7 +52,7 @@ def test_0_6_6_sqlite_exc():
             match=re.escape(
                 'Instance is out of date and must be migrated (SqliteEventLogStorage for run '
                 '89296095-892d-4a15-aa0d-9018d1580945). Database is at revision None, head is '
-                '3b1e175a2be3. Please run `dagster instance migrate`.'
+                '5d1c8c5a2f4e. Please run `dagster instance migrate`.'
             ),
         ):
             instance._event_storage.get_logs_for_run('89296095-892d-4a15-aa0d-9018d1580945')
@@ -118,6 +118,16 @@ def test_event_log_migration():
                 step_key_records.append(row_data)
         assert len(step_key_records) > 0
 
+        db_path = os.path.join(
+            test_dir, 'history', 'runs', '6405c4a0-3ccc-4600-af81-b5ee197f8528.db'
+        )
+        assert {
+            'idx_event_logs_run_id',
+            'idx_event_logs_step_key',
+            'idx_event_logs_event_type',
+            'idx_event_logs_materialization_label',
+        } <= set(get_sqlite3_indexes(db_path, 'event_logs'))
+
 
 def get_sqlite3_tables(db_path):
     con = sqlite3.connect(db_path)
@@ -126,6 +136,13 @@ def get_sqlite3_tables(db_path):
     return [r[0] for r in cursor.fetchall()]
 
 
+def get_sqlite3_indexes(db_path, table_name):
+    con = sqlite3.connect(db_path)
+    cursor = con.cursor()
+    cursor.execute('PRAGMA index_list("{}");'.format(table_name))
+    return [r[1] for r in cursor.fetchall()]
+
+
 def get_current_alembic_version(db_path):
     con = sqlite3.connect(db_path)
     cursor = con.cursor()
@@ -168,7 +185,7 @@ def test_snapshot_0_7_6_pre_add_pipeline_snapshot():
         assert str(exc_info.value) == (
             'Instance is out of date and must be migrated (Sqlite run '
             'storage requires migration). Database is at revision '
-            '9fe9e746268c, head is c63a27054f08. Please run `dagster '
+            '9fe9e746268c, head is 3e0770016702. Please run `dagster '
             'instance migrate`.'
         )
 
@@ -177,7 +194,7 @@ def test_snapshot_0_7_6_pre_add_pipeline_snapshot():
         # Make sure the schema is migrated
         instance.upgrade()
 
-        assert get_current_alembic_version(db_path) == 'c63a27054f08'
+        assert get_current_alembic_version(db_path) == '3e0770016702'
 
         assert 'snapshots' in get_sqlite3_tables(db_path)
         assert {'id', 'snapshot_id', 'snapshot_body', 'snapshot_type'} == set(
@@ -223,7 +240,7 @@ def test_downgrade_and_upgrade():
         # Make sure the schema is migrated
         instance.upgrade()
 
-        assert get_current_alembic_version(db_path) == 'c63a27054f08'
+        assert get_current_alembic_version(db_path) == '3e0770016702'
 
         assert 'snapshots' in get_sqlite3_tables(db_path)
         assert {'id', 'snapshot_id', 'snapshot_body', 'snapshot_type'} == set(
@@ -244,7 +261,7 @@ def test_downgrade_and_upgrade():
 
         instance.upgrade()
 
-        assert get_current_alembic_version(db_path) == 'c63a27054f08'
+        assert get_current_alembic_version(db_path) == '3e0770016702'
 
         assert 'snapshots' in get_sqlite3_tables(db_path)
         assert {'id', 'snapshot_id', 'snapshot_body', 'snapshot_type'} == set(
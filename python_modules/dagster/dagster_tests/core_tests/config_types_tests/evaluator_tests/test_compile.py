@@ -0,0 +1,83 @@
+import pytest
+
+from dagster import Any, Enum, EnumValue, Field, Float, Int, Noneable, Permissive, Selector, String
+from dagster.config.compile import compile_config_type
+from dagster.config.field_utils import convert_potential_field
+from dagster.config.validate import traverse_and_process_config
+
+
+def _config_type():
+    return convert_potential_field(
+        {
+            'an_int': Int,
+            'a_float': Field(Float, is_required=False, default_value=2),
+            'optional_string': Field(Noneable(String), is_required=False),
+            'color': Field(
+                Enum('Color', [EnumValue('RED'), EnumValue('BLUE')]),
+                is_required=False,
+                default_value='RED',
+            ),
+            'things': Field(
+                [{'name': String, 'size': Field(Int, default_value=1)}], is_required=False
+            ),
+            'permissive': Field(
+                Permissive({'known': Field(Int, default_value=3)}), is_required=False
+            ),
+            'anything': Field(Any, is_required=False),
+            'storage': Field(
+                Selector(
+                    {'in_memory': Field({}, is_required=False), 'filesystem': {'path': String}}
+                ),
+                is_required=False,
+            ),
+        }
+    ).config_type
+
+
+@pytest.mark.parametrize(
+    'config_value',
+    [
+        {'an_int': 1},
+        {'an_int': 1, 'a_float': 3, 'optional_string': None},
+        {'an_int': 1, 'optional_string': 'foo', 'color': 'BLUE'},
+        {'an_int': 1, 'things': [{'name': 'a'}, {'name': 'b', 'size': 2}]},
+        {'an_int': 1, 'things': []},
+        {'an_int': 1, 'permissive': {'extra': [1, 2]}},
+        {'an_int': 1, 'anything': {'nested': object}},
+        {'an_int': 1, 'storage': {'in_memory': None}},
+        {'an_int': 1, 'storage': {'filesystem': {'path': '/tmp'}}},
+        # invalid values
+        {},
+        {'an_int': 'one'},
+        {'an_int': 1, 'not_a_field': 1},
+        {'an_int': 1, 'color': 'GREEN'},
+        {'an_int': 1, 'things': [{'size': 2}]},
+        {'an_int': 1, 'storage': {'in_memory': {}, 'filesystem': {'path': '/tmp'}}},
+        {'an_int': 1, 'storage': {}},
+        None,
+    ],
+)
+def test_compiled_processor_matches_traversal(config_value):
+    config_type = _config_type()
+
+    expected = traverse_and_process_config(config_type, config_value)
+    result = compile_config_type(config_type)(config_value)
+
+    assert result.success == expected.success
+    assert result.value == expected.value
+    assert [error.message for error in result.errors] == [
+        error.message for error in expected.errors
+    ]
+
+
+def test_compiled_processor_post_processes():
+    config_type = _config_type()
+
+    value = compile_config_type(config_type)({'an_int': 1}).value
+    assert isinstance(value['a_float'], float)
+    assert value['color'] == 'RED'
+
+
+def test_compiled_processor_is_cached():
+    config_type = _config_type()
+    assert compile_config_type(config_type) is compile_config_type(config_type)
@@ -0,0 +1,172 @@
+import os
+import pstats
+import time
+
+import pytest
+
+from dagster import (
+    DagsterInvariantViolationError,
+    DependencyDefinition,
+    ExecutionTargetHandle,
+    InputDefinition,
+    Int,
+    OutputDefinition,
+    PipelineDefinition,
+    execute_pipeline,
+    solid,
+)
+from dagster.core.events import DagsterEventType
+from dagster.core.execution.profiling import (
+    PROFILE_SCOPE_COMPUTE,
+    PROFILE_SCOPE_STEP,
+    PROFILER_CPROFILE,
+    PROFILER_SAMPLE,
+    StepProfileConfig,
+)
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.tags import PROFILE_STEPS_TAG
+from dagster.seven import TemporaryDirectory
+
+
+def busy_work(seconds):
+    start = time.time()
+    total = 0
+    while time.time() - start < seconds:
+        total += sum(range(100))
+    return total
+
+
+def define_profiled_pipeline():
+    @solid(output_defs=[OutputDefinition(Int)])
+    def emit_one(_):
+        busy_work(0.05)
+        return 1
+
+    @solid(input_defs=[InputDefinition('num', Int)], output_defs=[OutputDefinition(Int)])
+    def add_one(_, num):
+        busy_work(0.05)
+        return num + 1
+
+    return PipelineDefinition(
+        name='profiled_pipeline',
+        solid_defs=[emit_one, add_one],
+        dependencies={'add_one': {'num': DependencyDefinition('emit_one')}},
+    )
+
+
+def _step_events(result, step_key):
+    return [event for event in result.event_list if event.step_key == step_key]
+
+
+def _profile_event(events):
+    profile_events = [
+        event
+        for event in events
+        if event.event_type == DagsterEventType.ENGINE_EVENT and event.message.startswith('Wrote ')
+    ]
+    assert len(profile_events) == 1
+    return profile_events[0]
+
+
+def _metadata(event):
+    return {entry.label: entry.entry_data for entry in event.event_specific_data.metadata_entries}
+
+
+def test_step_profile_config_from_tag_value():
+    assert StepProfileConfig.from_tag_value('cprofile') == StepProfileConfig(
+        PROFILER_CPROFILE, PROFILE_SCOPE_COMPUTE
+    )
+    assert StepProfileConfig.from_tag_value('Sample:step') == StepProfileConfig(
+        PROFILER_SAMPLE, PROFILE_SCOPE_STEP
+    )
+
+    for tag_value in ['', 'yappi', 'cprofile:solid']:
+        with pytest.raises(DagsterInvariantViolationError):
+            StepProfileConfig.from_tag_value(tag_value)
+
+
+@pytest.mark.parametrize('tag_value', ['cprofile', 'cprofile:step'])
+def test_cprofile_steps(tag_value):
+    with TemporaryDirectory() as temp_dir:
+        result = execute_pipeline(
+            define_profiled_pipeline(),
+            environment_dict={'storage': {'filesystem': {}}},
+            instance=DagsterInstance.local_temp(temp_dir),
+            tags={PROFILE_STEPS_TAG: tag_value},
+        )
+        assert result.success
+
+        for step_key in ['emit_one.compute', 'add_one.compute']:
+            events = _step_events(result, step_key)
+            profile_event = _profile_event(events)
+            # the profile is emitted just before the step succeeds
+            assert events[events.index(profile_event) + 1].is_step_success
+
+            metadata = _metadata(profile_event)
+            assert os.path.isfile(metadata['profile'].path)
+            stats = pstats.Stats(metadata['profile'].path)
+            assert any(function[2] == 'busy_work' for function in stats.stats)
+            assert any('busy_work' in label for label in metadata)
+
+
+def test_sample_steps():
+    with TemporaryDirectory() as temp_dir:
+        result = execute_pipeline(
+            define_profiled_pipeline(),
+            environment_dict={'storage': {'filesystem': {}}},
+            instance=DagsterInstance.local_temp(temp_dir),
+            tags={PROFILE_STEPS_TAG: 'sample'},
+        )
+        assert result.success
+
+        metadata = _metadata(_profile_event(_step_events(result, 'add_one.compute')))
+        with open(metadata['profile'].path) as profile_file:
+            stacks = profile_file.read().splitlines()
+        assert stacks
+        assert all(int(line.rsplit(' ', 1)[1]) >= 0 for line in stacks)
+        assert any('(add_one);' in line and '(busy_work)' in line for line in stacks)
+
+
+def test_profile_failed_step():
+    @solid
+    def fails(_):
+        busy_work(0.01)
+        raise Exception('failed')
+
+    with TemporaryDirectory() as temp_dir:
+        result = execute_pipeline(
+            PipelineDefinition(name='failing_pipeline', solid_defs=[fails]),
+            environment_dict={'storage': {'filesystem': {}}},
+            instance=DagsterInstance.local_temp(temp_dir),
+            tags={PROFILE_STEPS_TAG: 'cprofile'},
+            raise_on_error=False,
+        )
+        assert not result.success
+
+        events = _step_events(result, 'fails.compute')
+        profile_event = _profile_event(events)
+        assert events[events.index(profile_event) + 1].is_step_failure
+
+
+def test_profile_steps_multiprocess():
+    pipeline_def = ExecutionTargetHandle.for_pipeline_python_file(
+        __file__, 'define_profiled_pipeline'
+    ).build_pipeline_definition()
+
+    with TemporaryDirectory() as temp_dir:
+        result = execute_pipeline(
+            pipeline_def,
+            environment_dict={'storage': {'filesystem': {}}, 'execution': {'multiprocess': {}}},
+            instance=DagsterInstance.local_temp(temp_dir),
+            tags={PROFILE_STEPS_TAG: 'cprofile'},
+        )
+        assert result.success
+
+        for step_key in ['emit_one.compute', 'add_one.compute']:
+            metadata = _metadata(_profile_event(_step_events(result, step_key)))
+            assert os.path.isfile(metadata['profile'].path)
+
+
+def test_invalid_profile_steps_tag():
+    with pytest.raises(DagsterInvariantViolationError):
+        execute_pipeline(define_profiled_pipeline(), tags={PROFILE_STEPS_TAG: 'yappi'})
@@ -0,0 +1,118 @@
+import sys
+import time
+
+import pytest
+
+from dagster import (
+    DependencyDefinition,
+    ExecutionTargetHandle,
+    PipelineDefinition,
+    execute_pipeline,
+    solid,
+)
+from dagster.core.execution.plan.objects import StepResourceUsage
+from dagster.core.execution.resource_usage import ResourceUsageMeter
+from dagster.core.instance import DagsterInstance
+from dagster.seven import TemporaryDirectory
+
+skip_if_no_getrusage = pytest.mark.skipif(
+    sys.platform == 'win32', reason='resource usage is not measured on Windows'
+)
+
+
+def busy_work(seconds):
+    start = time.time()
+    total = 0
+    while time.time() - start < seconds:
+        total += sum(range(100))
+    return total
+
+
+def define_metered_pipeline():
+    @solid
+    def emit_one(_):
+        busy_work(0.2)
+        return 1
+
+    @solid
+    def add_one(_, num):
+        return num + 1
+
+    return PipelineDefinition(
+        name='metered_pipeline',
+        solid_defs=[emit_one, add_one],
+        dependencies={'add_one': {'num': DependencyDefinition('emit_one')}},
+    )
+
+
+@skip_if_no_getrusage
+def test_resource_usage_meter():
+    meter = ResourceUsageMeter()
+    busy_work(0.1)
+    usage = meter.measure()
+
+    assert isinstance(usage, StepResourceUsage)
+    assert usage.cpu_seconds > 0.05
+    assert usage.max_rss_bytes > 0
+    assert usage.read_bytes >= 0
+    assert usage.write_bytes >= 0
+
+
+def _assert_step_stats_have_resource_usage(result, instance):
+    step_stats = {stats.step_key: stats for stats in instance.get_run_step_stats(result.run_id)}
+    assert set(step_stats) == {'emit_one.compute', 'add_one.compute'}
+    for stats in step_stats.values():
+        assert stats.resource_usage.max_rss_bytes > 0
+
+    # the busy step used more CPU than the one that did next to nothing
+    assert (
+        step_stats['emit_one.compute'].resource_usage.cpu_seconds
+        > step_stats['add_one.compute'].resource_usage.cpu_seconds
+    )
+
+
+@skip_if_no_getrusage
+def test_step_resource_usage():
+    with TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        result = execute_pipeline(define_metered_pipeline(), instance=instance)
+        assert result.success
+
+        success_events = [event for event in result.event_list if event.is_step_success]
+        assert len(success_events) == 2
+        assert all(event.event_specific_data.resource_usage for event in success_events)
+
+        _assert_step_stats_have_resource_usage(result, instance)
+
+
+@skip_if_no_getrusage
+def test_step_resource_usage_multiprocess():
+    pipeline_def = ExecutionTargetHandle.for_pipeline_python_file(
+        __file__, 'define_metered_pipeline'
+    ).build_pipeline_definition()
+
+    with TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        result = execute_pipeline(
+            pipeline_def,
+            environment_dict={'storage': {'filesystem': {}}, 'execution': {'multiprocess': {}}},
+            instance=instance,
+        )
+        assert result.success
+
+        _assert_step_stats_have_resource_usage(result, instance)
+
+
+@skip_if_no_getrusage
+def test_failed_step_resource_usage():
+    @solid
+    def fails(_):
+        raise Exception('failed')
+
+    result = execute_pipeline(
+        PipelineDefinition(name='failing_pipeline', solid_defs=[fails]), raise_on_error=False
+    )
+    assert not result.success
+
+    (failure_event,) = [event for event in result.event_list if event.is_step_failure]
+    assert failure_event.event_specific_data.resource_usage.max_rss_bytes > 0
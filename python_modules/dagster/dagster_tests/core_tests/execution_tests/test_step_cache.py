@@ -0,0 +1,239 @@
+import os
+import time
+
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    Int,
+    OutputDefinition,
+    PipelineDefinition,
+    execute_pipeline,
+    solid,
+)
+from dagster.core.events import DagsterEventType
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.step_cache import resolve_step_cache_keys
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.step_cache import StepCacheEntry
+from dagster.core.storage.tags import CODE_VERSION_TAG, STEP_CACHE_TAG
+from dagster.core.system_config.objects import EnvironmentConfig
+from dagster.seven import TemporaryDirectory
+
+
+def define_cached_pipeline(calls, add_one_tags=None, add_two_tags=None):
+    @solid(
+        input_defs=[InputDefinition('num', Int)],
+        output_defs=[OutputDefinition(Int)],
+        tags=add_one_tags if add_one_tags is not None else {CODE_VERSION_TAG: '1'},
+    )
+    def add_one(_, num):
+        calls.append('add_one')
+        return num + 1
+
+    @solid(
+        input_defs=[InputDefinition('num', Int)],
+        output_defs=[OutputDefinition(Int)],
+        tags=add_two_tags if add_two_tags is not None else {CODE_VERSION_TAG: '1'},
+    )
+    def add_two(_, num):
+        calls.append('add_two')
+        return num + 2
+
+    @solid(input_defs=[InputDefinition('num', Int)], output_defs=[OutputDefinition(Int)])
+    def add_three(_, num):
+        calls.append('add_three')
+        return num + 3
+
+    return PipelineDefinition(
+        name='step_cache_pipeline',
+        solid_defs=[add_one, add_two, add_three],
+        dependencies={
+            'add_two': {'num': DependencyDefinition('add_one')},
+            'add_three': {'num': DependencyDefinition('add_two')},
+        },
+    )
+
+
+def environment_dict_for(num):
+    return {
+        'solids': {'add_one': {'inputs': {'num': {'value': num}}}},
+        'storage': {'filesystem': {}},
+    }
+
+
+def _cache_hits(result):
+    cache_hits = []
+    for event in result.event_list:
+        if event.event_type != DagsterEventType.ENGINE_EVENT or not event.event_specific_data:
+            continue
+        cache_hit = event.event_specific_data.step_cache_hit_data
+        if cache_hit:
+            assert cache_hit['step_key'] == event.step_key
+            cache_hits.append(cache_hit)
+    return cache_hits
+
+
+def _cache_hit_step_keys(result):
+    return [cache_hit['step_key'] for cache_hit in _cache_hits(result)]
+
+
+def test_step_cache_hit():
+    calls = []
+    pipeline_def = define_cached_pipeline(calls)
+
+    with TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+
+        first = execute_pipeline(pipeline_def, environment_dict_for(3), instance=instance)
+        assert first.success
+        assert calls == ['add_one', 'add_two', 'add_three']
+        assert _cache_hit_step_keys(first) == []
+
+        calls[:] = []
+        second = execute_pipeline(pipeline_def, environment_dict_for(3), instance=instance)
+        assert second.success
+        # add_three has no code version, so it always executes
+        assert calls == ['add_three']
+        assert _cache_hit_step_keys(second) == ['add_one.compute', 'add_two.compute']
+        # the outputs are linked from the run that computed them
+        assert {cache_hit['source_run_id'] for cache_hit in _cache_hits(second)} == {first.run_id}
+        assert second.result_for_solid('add_two').output_value() == 6
+        assert second.result_for_solid('add_three').output_value() == 9
+
+
+def test_step_cache_miss_on_changed_inputs_or_version():
+    calls = []
+
+    with TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+
+        execute_pipeline(define_cached_pipeline(calls), environment_dict_for(3), instance=instance)
+
+        calls[:] = []
+        result = execute_pipeline(
+            define_cached_pipeline(calls), environment_dict_for(4), instance=instance
+        )
+        assert result.success
+        assert calls == ['add_one', 'add_two', 'add_three']
+
+        calls[:] = []
+        result = execute_pipeline(
+            define_cached_pipeline(calls, add_one_tags={CODE_VERSION_TAG: '2'}),
+            environment_dict_for(4),
+            instance=instance,
+        )
+        assert result.success
+        # the upstream version change invalidates the downstream step as well
+        assert calls == ['add_one', 'add_two', 'add_three']
+
+
+def test_step_cache_disabled_by_run_tag():
+    calls = []
+    pipeline_def = define_cached_pipeline(calls)
+
+    with TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        execute_pipeline(pipeline_def, environment_dict_for(3), instance=instance)
+
+        calls[:] = []
+        result = execute_pipeline(
+            pipeline_def,
+            environment_dict_for(3),
+            tags={STEP_CACHE_TAG: 'false'},
+            instance=instance,
+        )
+        assert result.success
+        assert calls == ['add_one', 'add_two', 'add_three']
+
+
+def test_step_cache_keys_require_cacheable_upstream():
+    pipeline_def = define_cached_pipeline([], add_one_tags={}, add_two_tags={})
+    environment_dict = environment_dict_for(3)
+    execution_plan = create_execution_plan(pipeline_def, environment_dict)
+    environment_config = EnvironmentConfig.build(pipeline_def, environment_dict)
+
+    cache_keys = resolve_step_cache_keys(execution_plan, environment_config, 'default')
+    assert cache_keys == {
+        'add_one.compute': None,
+        'add_two.compute': None,
+        'add_three.compute': None,
+    }
+
+    pipeline_def = define_cached_pipeline([], add_two_tags={})
+    execution_plan = create_execution_plan(pipeline_def, environment_dict)
+    cache_keys = resolve_step_cache_keys(execution_plan, environment_config, 'default')
+    assert cache_keys['add_one.compute']
+    assert cache_keys['add_two.compute'] is None
+    assert cache_keys['add_three.compute'] is None
+
+
+def test_step_cache_eviction():
+    instance = DagsterInstance.ephemeral()
+    now = time.time()
+    for i in range(5):
+        instance.add_step_cache_entry(
+            StepCacheEntry(
+                cache_key='key_{}'.format(i % 2),
+                run_id='run_{}'.format(i),
+                step_key='add_one.compute',
+                output_names=['result'],
+                timestamp=now - 100 * (5 - i),
+            )
+        )
+
+    assert [entry.run_id for entry in instance.get_step_cache_entries('key_0')] == [
+        'run_4',
+        'run_2',
+        'run_0',
+    ]
+
+    assert instance.evict_step_cache(max_age_seconds=250) == 3
+    assert [entry.run_id for entry in instance.get_step_cache_entries('key_0')] == ['run_4']
+
+    assert instance.evict_step_cache(max_entries=1) == 1
+    assert instance.get_step_cache_entries('key_1') == []
+    assert len(instance.get_step_cache_entries('key_0')) == 1
+
+
+def test_step_cache_eviction_by_size():
+    with TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        now = time.time()
+        for i in range(4):
+            run_id = 'run_{}'.format(i)
+            instance.add_step_cache_entry(
+                StepCacheEntry(
+                    cache_key='key_{}'.format(i),
+                    run_id=run_id,
+                    step_key='add_one.compute',
+                    output_names=['result'],
+                    timestamp=now - 100 * (4 - i),
+                )
+            )
+            output_dir = os.path.join(
+                instance.intermediates_directory(run_id), 'intermediates', 'add_one.compute'
+            )
+            os.makedirs(output_dir)
+            with open(os.path.join(output_dir, 'result'), 'wb') as fd:
+                fd.write(b'x' * 10)
+
+        # outputs that are not stored under the instance count for nothing
+        instance.add_step_cache_entry(
+            StepCacheEntry(
+                cache_key='key_4',
+                run_id='run_4',
+                step_key='add_one.compute',
+                output_names=['result'],
+                timestamp=now,
+            )
+        )
+
+        assert instance.evict_step_cache(max_bytes=100) == 0
+        assert instance.evict_step_cache(max_bytes=25) == 2
+        assert [entry.run_id for entry in instance.get_step_cache_entries()] == [
+            'run_4',
+            'run_3',
+            'run_2',
+        ]
+        assert instance.evict_step_cache(max_bytes=0) == 2
+        assert [entry.run_id for entry in instance.get_step_cache_entries()] == ['run_4']
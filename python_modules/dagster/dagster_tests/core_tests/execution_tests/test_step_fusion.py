@@ -0,0 +1,171 @@
+import pytest
+
+from dagster import (
+    DagsterEventType,
+    DagsterInvariantViolationError,
+    ExecutionTargetHandle,
+    InputDefinition,
+    Int,
+    check,
+    execute_pipeline,
+    lambda_solid,
+    pipeline,
+    solid,
+)
+from dagster.core.events import DagsterEvent
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.objects import StepRetryData, StepSuccessData
+from dagster.core.execution.retries import Retries, RetryMode
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.tags import STEP_FUSION_TAG
+from dagster.utils.test import create_test_pipeline_execution_context
+
+
+@lambda_solid
+def emit_one():
+    return 1
+
+
+@lambda_solid(input_defs=[InputDefinition('num', Int)])
+def add_one(num):
+    return num + 1
+
+
+@lambda_solid(input_defs=[InputDefinition('num', Int)])
+def double(num):
+    return num * 2
+
+
+@solid(input_defs=[InputDefinition('num', Int)], tags={STEP_FUSION_TAG: 'false'})
+def not_fused(_, num):
+    return num
+
+
+@lambda_solid(input_defs=[InputDefinition('left', Int), InputDefinition('right', Int)])
+def total(left, right):
+    return left + right
+
+
+@pipeline
+def fusion_pipeline():
+    # emit_one -> add_one -> double is a linear chain, emit_one_2 fans out to two steps
+    fanned_out = emit_one.alias('emit_one_2')()
+    total(double(add_one(emit_one())), not_fused(add_one.alias('add_one_2')(fanned_out)))
+    double.alias('double_2')(fanned_out)
+
+
+def define_fusion_pipeline():
+    return fusion_pipeline
+
+
+def test_fused_step_successors():
+    execution_plan = create_execution_plan(fusion_pipeline)
+
+    assert execution_plan.fused_step_successors() == {
+        'emit_one.compute': 'add_one.compute',
+        'add_one.compute': 'double.compute',
+    }
+
+    # only steps that are both being executed are fused
+    subset_plan = execution_plan.build_subset_plan(['add_one.compute', 'double.compute'])
+    assert subset_plan.fused_step_successors() == {'add_one.compute': 'double.compute'}
+
+
+def _step_success_event(step_key):
+    return DagsterEvent(
+        event_type_value=DagsterEventType.STEP_SUCCESS.value,
+        pipeline_name='fusion_pipeline',
+        step_key=step_key,
+        event_specific_data=StepSuccessData(duration_ms=1.0),
+    )
+
+
+def test_claim_fused_steps():
+    execution_plan = create_execution_plan(fusion_pipeline)
+    active_execution = execution_plan.start(retries=Retries(RetryMode.DISABLED), fuse_steps=True)
+
+    steps = {step.key: step for step in active_execution.get_steps_to_execute()}
+    assert set(steps.keys()) == {'emit_one.compute', 'emit_one_2.compute'}
+
+    assert [step.key for step in active_execution.claim_fused_steps(steps['emit_one.compute'])] == [
+        'add_one.compute',
+        'double.compute',
+    ]
+    assert active_execution.claim_fused_steps(steps['emit_one_2.compute']) == []
+
+    # fused steps are in flight, they are not vended again
+    for step_key in ['emit_one.compute', 'add_one.compute']:
+        active_execution.handle_event(_step_success_event(step_key))
+    assert active_execution.get_steps_to_execute() == []
+
+    # a fused step that does not report completion is failed along with the step it is fused with
+    active_execution.verify_complete(create_test_pipeline_execution_context(), 'emit_one.compute')
+    assert 'double.compute' in active_execution._failed  # pylint: disable=protected-access
+
+
+def test_fused_steps_released_on_retry():
+    execution_plan = create_execution_plan(fusion_pipeline)
+    active_execution = execution_plan.start(retries=Retries(RetryMode.ENABLED), fuse_steps=True)
+
+    step = [
+        step for step in active_execution.get_steps_to_execute() if step.key == 'emit_one.compute'
+    ][0]
+    active_execution.claim_fused_steps(step)
+    active_execution.handle_event(
+        DagsterEvent(
+            event_type_value=DagsterEventType.STEP_UP_FOR_RETRY.value,
+            pipeline_name='fusion_pipeline',
+            step_key='emit_one.compute',
+            event_specific_data=StepRetryData(error=None, seconds_to_wait=None),
+        )
+    )
+    active_execution.verify_complete(create_test_pipeline_execution_context(), 'emit_one.compute')
+
+    assert 'emit_one.compute' in [step.key for step in active_execution.get_steps_to_execute()]
+    assert not active_execution._failed  # pylint: disable=protected-access
+
+
+def _subprocess_launches(result):
+    return [
+        event
+        for event in result.event_list
+        if event.is_engine_event and event.message.startswith('Launching subprocess for')
+    ]
+
+
+@pytest.mark.parametrize('fusion', ['true', 'in_memory'])
+def test_multiprocess_step_fusion(fusion):
+    pipe = ExecutionTargetHandle.for_pipeline_python_file(
+        __file__, 'define_fusion_pipeline'
+    ).build_pipeline_definition()
+    environment_dict = {'storage': {'filesystem': {}}, 'execution': {'multiprocess': {}}}
+    instance = DagsterInstance.local_temp()
+
+    result = execute_pipeline(
+        pipe, environment_dict=environment_dict, instance=instance, tags={STEP_FUSION_TAG: fusion},
+    )
+    assert result.success
+    assert result.result_for_solid('total').output_value() == 6
+
+    # every step still reports its own events
+    assert {event.step_key for event in result.step_event_list if event.is_step_success} == set(
+        create_execution_plan(pipe, environment_dict).step_keys_to_execute
+    )
+
+    # the chain of three steps is executed in a single subprocess
+    assert len(_subprocess_launches(result)) == 6
+
+    # outputs handed off within the chain are only persisted if requested
+    if fusion == 'true':
+        assert result.result_for_solid('add_one').output_value() == 2
+    else:
+        with pytest.raises(check.CheckError):
+            result.result_for_solid('add_one').output_value()
+
+    # outputs consumed outside of a chain are always persisted
+    assert result.result_for_solid('double').output_value() == 4
+
+
+def test_invalid_step_fusion_tag():
+    with pytest.raises(DagsterInvariantViolationError):
+        execute_pipeline(fusion_pipeline, tags={STEP_FUSION_TAG: 'yes'})
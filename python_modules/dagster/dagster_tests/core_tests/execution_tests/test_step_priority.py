@@ -0,0 +1,196 @@
+import heapq
+import random
+
+import pytest
+
+from dagster import (
+    DagsterInvariantViolationError,
+    DependencyDefinition,
+    ExecutionTargetHandle,
+    InputDefinition,
+    PipelineDefinition,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.active import default_sort_key
+from dagster.core.execution.retries import Retries, RetryMode
+from dagster.core.execution.step_priority import (
+    critical_path_priorities,
+    recent_step_durations,
+    step_priority_sort_key_fn,
+)
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.tags import STEP_PRIORITY_POLICY_TAG
+from dagster.utils.test import create_test_pipeline_execution_context
+
+
+def _node_solid(name, num_inputs):
+    return lambda_solid(
+        name=name,
+        input_defs=[InputDefinition('input_{}'.format(idx)) for idx in range(num_inputs)],
+    )(lambda **kwargs: None)
+
+
+def define_dag_pipeline(name, parents):
+    '''A pipeline with a solid for every node of a DAG, given the parents of every node.'''
+    return PipelineDefinition(
+        name=name,
+        solid_defs=[_node_solid(node, len(node_parents)) for node, node_parents in parents.items()],
+        dependencies={
+            node: {
+                'input_{}'.format(idx): DependencyDefinition(parent)
+                for idx, parent in enumerate(node_parents)
+            }
+            for node, node_parents in parents.items()
+        },
+    )
+
+
+def _step_key(node):
+    return '{}.compute'.format(node)
+
+
+def simulate_makespan(execution_plan, durations, concurrency, sort_key_fn=None):
+    '''Simulate executing a plan with a given concurrency, returning the wall time.'''
+    active_execution = execution_plan.start(Retries(RetryMode.DISABLED), sort_key_fn=sort_key_fn)
+    running = []
+    now = 0.0
+    while not active_execution.is_complete:
+        if len(running) < concurrency:
+            for step in active_execution.get_steps_to_execute(limit=concurrency - len(running)):
+                heapq.heappush(running, (now + durations[step.key], step.key))
+
+        now, step_key = heapq.heappop(running)
+        active_execution.mark_success(step_key)
+
+    return now
+
+
+def _random_dag(rng, num_levels, width):
+    parents = {}
+    levels = []
+    for level in range(num_levels):
+        nodes = ['node_{}_{}'.format(level, idx) for idx in range(rng.randint(1, width))]
+        for node in nodes:
+            parents[node] = (
+                rng.sample(levels[-1], rng.randint(1, min(2, len(levels[-1])))) if levels else []
+            )
+        levels.append(nodes)
+
+    return parents
+
+
+def test_critical_path_priorities():
+    pipeline_def = define_dag_pipeline(
+        'diamond', {'start': [], 'short': ['start'], 'long': ['start'], 'end': ['short', 'long']}
+    )
+    execution_plan = create_execution_plan(pipeline_def)
+
+    assert critical_path_priorities(execution_plan, {}) == {}
+
+    priorities = critical_path_priorities(
+        execution_plan, {'start.compute': 1.0, 'short.compute': 1.0, 'long.compute': 5.0}
+    )
+    # end.compute takes the median of the known durations
+    assert priorities == {
+        'end.compute': 1.0,
+        'long.compute': 6.0,
+        'short.compute': 2.0,
+        'start.compute': 7.0,
+    }
+
+
+def test_critical_path_beats_tag_order():
+    # the long chain is sorted last by step key, so ordering by the tag alone starts the leaves first
+    parents = {'a_leaf_{}'.format(idx): [] for idx in range(4)}
+    parents.update({'z_chain_0': [], 'z_chain_1': ['z_chain_0'], 'z_chain_2': ['z_chain_1']})
+    durations = {_step_key(node): 1.0 for node in parents}
+    durations[_step_key('z_chain_0')] = 3.0
+    durations[_step_key('z_chain_1')] = 3.0
+    durations[_step_key('z_chain_2')] = 3.0
+
+    execution_plan = create_execution_plan(define_dag_pipeline('chain_and_leaves', parents))
+    priorities = critical_path_priorities(execution_plan, durations)
+
+    tag_makespan = simulate_makespan(execution_plan, durations, 2)
+    critical_path_makespan = simulate_makespan(
+        execution_plan,
+        durations,
+        2,
+        sort_key_fn=lambda step: (default_sort_key(step), -1 * priorities[step.key]),
+    )
+    assert tag_makespan == 11.0
+    assert critical_path_makespan == 9.0
+
+
+def test_critical_path_simulation_on_synthetic_dags():
+    rng = random.Random(12345)
+    tag_total = 0.0
+    critical_path_total = 0.0
+    for idx in range(20):
+        parents = _random_dag(rng, num_levels=6, width=6)
+        durations = {_step_key(node): rng.choice([1.0, 1.0, 2.0, 10.0]) for node in parents}
+        execution_plan = create_execution_plan(
+            define_dag_pipeline('synthetic_{}'.format(idx), parents)
+        )
+        priorities = critical_path_priorities(execution_plan, durations)
+
+        tag_total += simulate_makespan(execution_plan, durations, 3)
+        critical_path_total += simulate_makespan(
+            execution_plan,
+            durations,
+            3,
+            sort_key_fn=lambda step, priorities=priorities: (
+                default_sort_key(step),
+                -1 * priorities[step.key],
+            ),
+        )
+
+    assert critical_path_total < tag_total
+
+
+def test_step_priority_sort_key_fn():
+    instance = DagsterInstance.local_temp()
+    pipeline_def = define_dag_pipeline('history', {'start': [], 'end': ['start']})
+
+    context = create_test_pipeline_execution_context()
+    execution_plan = create_execution_plan(pipeline_def)
+    assert step_priority_sort_key_fn(context, execution_plan) is default_sort_key
+
+    assert recent_step_durations(instance, 'history') == {}
+    for _ in range(2):
+        assert execute_pipeline(pipeline_def, instance=instance).success
+
+    durations = recent_step_durations(instance, 'history')
+    assert set(durations.keys()) == {'start.compute', 'end.compute'}
+    assert all(duration >= 0 for duration in durations.values())
+
+
+def define_tagged_pipeline():
+    return define_dag_pipeline('tagged', {'start': [], 'end': ['start']})
+
+
+def test_step_priority_policy_run_tag():
+    instance = DagsterInstance.local_temp()
+    pipeline_def = ExecutionTargetHandle.for_pipeline_python_file(
+        __file__, 'define_tagged_pipeline'
+    ).build_pipeline_definition()
+    environment_dict = {'storage': {'filesystem': {}}, 'execution': {'multiprocess': {}}}
+
+    # the first run has no history to go on, the second one the durations of the first
+    for _ in range(2):
+        assert execute_pipeline(
+            pipeline_def,
+            environment_dict=environment_dict,
+            instance=instance,
+            tags={STEP_PRIORITY_POLICY_TAG: 'critical_path'},
+        ).success
+
+    with pytest.raises(DagsterInvariantViolationError):
+        execute_pipeline(
+            pipeline_def,
+            environment_dict=environment_dict,
+            instance=instance,
+            tags={STEP_PRIORITY_POLICY_TAG: 'shortest_first'},
+        )
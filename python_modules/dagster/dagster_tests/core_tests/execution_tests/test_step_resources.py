@@ -0,0 +1,157 @@
+import time
+
+import pytest
+
+from dagster import (
+    DagsterInvariantViolationError,
+    ExecutionTargetHandle,
+    PipelineDefinition,
+    execute_pipeline,
+    solid,
+)
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.retries import Retries, RetryMode
+from dagster.core.execution.step_resources import StepResourcePool, get_step_resource_requirements
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.tags import STEP_RESOURCE_REQUIREMENTS_TAG
+from dagster.seven import TemporaryDirectory
+
+
+def _sleeping_solid(name, requirements):
+    @solid(name=name, tags={STEP_RESOURCE_REQUIREMENTS_TAG: requirements})
+    def _solid(_):
+        time.sleep(0.5)
+
+    return _solid
+
+
+def define_resource_hungry_pipeline():
+    return PipelineDefinition(
+        name='resource_hungry_pipeline',
+        solid_defs=[
+            _sleeping_solid('big_1', {'memory': 6}),
+            _sleeping_solid('big_2', {'memory': 6}),
+            _sleeping_solid('small', {'memory': 2}),
+            _sleeping_solid('unconstrained', {'gpu': 1}),
+        ],
+    )
+
+
+def _step_keys(steps):
+    return [step.key for step in steps]
+
+
+def test_get_step_resource_requirements():
+    assert get_step_resource_requirements({}) == {}
+    assert get_step_resource_requirements(
+        {STEP_RESOURCE_REQUIREMENTS_TAG: '{"cpu": 2, "db_connections": 1}'}
+    ) == {'cpu': 2.0, 'db_connections': 1.0}
+
+    for tag_value in ['2', 'not json', '{"cpu": -1}', '{"cpu": "2"}', '{"cpu": true}']:
+        with pytest.raises(DagsterInvariantViolationError):
+            get_step_resource_requirements({STEP_RESOURCE_REQUIREMENTS_TAG: tag_value})
+
+
+def test_pack_ready_steps():
+    execution_plan = create_execution_plan(define_resource_hungry_pipeline())
+    active_execution = execution_plan.start(Retries(RetryMode.DISABLED))
+    pool = StepResourcePool({'memory': 8})
+
+    # a step that does not fit does not hold back the steps after it that do
+    assert _step_keys(active_execution.get_steps_to_execute(admit_fn=pool.try_acquire)) == [
+        'big_1.compute',
+        'small.compute',
+        'unconstrained.compute',
+    ]
+    assert pool.in_use() == {'memory': 8.0}
+    assert active_execution.get_steps_to_execute(admit_fn=pool.try_acquire) == []
+
+    pool.release('small.compute')
+    assert active_execution.get_steps_to_execute(admit_fn=pool.try_acquire) == []
+
+    pool.release('big_1.compute')
+    assert _step_keys(active_execution.get_steps_to_execute(admit_fn=pool.try_acquire)) == [
+        'big_2.compute'
+    ]
+
+
+def test_pack_ready_steps_with_limit():
+    execution_plan = create_execution_plan(define_resource_hungry_pipeline())
+    active_execution = execution_plan.start(Retries(RetryMode.DISABLED))
+    pool = StepResourcePool({'memory': 8})
+
+    assert _step_keys(
+        active_execution.get_steps_to_execute(limit=1, admit_fn=pool.try_acquire)
+    ) == ['big_1.compute']
+    # steps beyond the limit are not admitted, and hold no resources
+    assert pool.in_use() == {'memory': 6.0}
+
+
+def test_step_exceeding_capacity():
+    pool = StepResourcePool({'memory': 4})
+    with pytest.raises(DagsterInvariantViolationError, match='big_1.compute requires 6.0'):
+        pool.check_execution_plan(create_execution_plan(define_resource_hungry_pipeline()))
+
+
+def test_invalid_capacities():
+    with pytest.raises(DagsterInvariantViolationError):
+        StepResourcePool({'memory': 'lots'})
+
+
+def _step_intervals(instance, run_id):
+    starts = {}
+    intervals = {}
+    for record in instance.all_logs(run_id):
+        if not record.is_dagster_event:
+            continue
+        if record.dagster_event.event_type_value == 'STEP_START':
+            starts[record.step_key] = record.timestamp
+        elif record.dagster_event.is_step_success:
+            intervals[record.step_key] = (starts[record.step_key], record.timestamp)
+    return intervals
+
+
+def _overlap(interval, other_interval):
+    return interval[0] < other_interval[1] and other_interval[0] < interval[1]
+
+
+def test_multiprocess_resource_capacities():
+    pipeline_def = ExecutionTargetHandle.for_pipeline_python_file(
+        __file__, 'define_resource_hungry_pipeline'
+    ).build_pipeline_definition()
+
+    with TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        result = execute_pipeline(
+            pipeline_def,
+            environment_dict={
+                'storage': {'filesystem': {}},
+                'execution': {
+                    'multiprocess': {'config': {'max_concurrent': 4, 'resources': {'memory': 8}}}
+                },
+            },
+            instance=instance,
+        )
+        assert result.success
+
+        intervals = _step_intervals(instance, result.run_id)
+
+    assert len(intervals) == 4
+    assert not _overlap(intervals['big_1.compute'], intervals['big_2.compute'])
+
+
+def test_multiprocess_step_exceeding_capacity():
+    pipeline_def = ExecutionTargetHandle.for_pipeline_python_file(
+        __file__, 'define_resource_hungry_pipeline'
+    ).build_pipeline_definition()
+
+    with TemporaryDirectory() as temp_dir:
+        with pytest.raises(DagsterInvariantViolationError, match='more than its capacity'):
+            execute_pipeline(
+                pipeline_def,
+                environment_dict={
+                    'storage': {'filesystem': {}},
+                    'execution': {'multiprocess': {'config': {'resources': {'memory': 4}}}},
+                },
+                instance=DagsterInstance.local_temp(temp_dir),
+            )
@@ -0,0 +1,164 @@
+import os
+
+import pytest
+
+from dagster import (
+    DagsterInvariantViolationError,
+    DependencyDefinition,
+    ExecutionTargetHandle,
+    ModeDefinition,
+    PipelineDefinition,
+    execute_pipeline,
+    execute_pipeline_iterator,
+    resource,
+    solid,
+)
+from dagster.core.execution.tracing import TRACE_FILENAME, summarize_trace
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.tags import TRACE_TAG
+from dagster.seven import TemporaryDirectory
+from dagster.utils.tracing import read_chrome_trace
+
+
+def define_traced_pipeline():
+    @resource
+    def a_resource(_):
+        yield 'value'
+
+    @solid(required_resource_keys={'a_resource'})
+    def emit_one(_):
+        return 1
+
+    @solid
+    def add_one(_, num):
+        return num + 1
+
+    return PipelineDefinition(
+        name='traced_pipeline',
+        solid_defs=[emit_one, add_one],
+        mode_defs=[ModeDefinition(resource_defs={'a_resource': a_resource})],
+        dependencies={'add_one': {'num': DependencyDefinition('emit_one')}},
+    )
+
+
+def _trace_event(events):
+    (trace_event,) = [event for event in events if event.message.startswith('Wrote trace')]
+    return trace_event
+
+
+def _read_trace(trace_event):
+    entries = {
+        entry.label: entry.entry_data for entry in trace_event.event_specific_data.metadata_entries
+    }
+    return read_chrome_trace(entries['trace'].path)
+
+
+def test_trace_run():
+    with TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        result = execute_pipeline(
+            define_traced_pipeline(),
+            environment_dict={'storage': {'filesystem': {}}},
+            instance=instance,
+            tags={TRACE_TAG: 'true'},
+        )
+        assert result.success
+
+        events = result.event_list
+        trace_event = _trace_event(events)
+        # the trace is written once the resources of the run have been torn down
+        assert events[-1] == trace_event
+        assert 'PIPELINE_SUCCESS' in [event.event_type_value for event in events]
+
+        trace = _read_trace(trace_event)
+        assert os.listdir(instance.trace_directory(result.run_id)) == [TRACE_FILENAME]
+
+    spans = {(event['cat'], event['name']) for event in trace}
+    assert spans == {
+        ('plan', 'build_execution_plan'),
+        ('resources', 'init_resource'),
+        ('resources', 'teardown_resource'),
+        ('step', 'execute_step'),
+        ('step', 'load_inputs'),
+        ('step', 'compute'),
+        ('step', 'type_check'),
+        ('intermediates', 'get_intermediate'),
+        ('intermediates', 'set_intermediate'),
+        ('event_log', 'store_event'),
+    }
+    assert {event['args']['step_key'] for event in trace if event['name'] == 'execute_step'} == {
+        'emit_one.compute',
+        'add_one.compute',
+    }
+
+
+def test_trace_run_iterator():
+    with TemporaryDirectory() as temp_dir:
+        events = list(
+            execute_pipeline_iterator(
+                define_traced_pipeline(),
+                environment_dict={'storage': {'filesystem': {}}},
+                instance=DagsterInstance.local_temp(temp_dir),
+                tags={TRACE_TAG: 'true'},
+            )
+        )
+        trace = _read_trace(_trace_event(events))
+
+    assert {event['name'] for event in trace} >= {'build_execution_plan', 'compute'}
+
+
+def test_trace_run_multiprocess():
+    pipeline_def = ExecutionTargetHandle.for_pipeline_python_file(
+        __file__, 'define_traced_pipeline'
+    ).build_pipeline_definition()
+
+    with TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        result = execute_pipeline(
+            pipeline_def,
+            environment_dict={'storage': {'filesystem': {}}, 'execution': {'multiprocess': {}}},
+            instance=instance,
+            tags={TRACE_TAG: 'true'},
+        )
+        assert result.success
+
+        trace = _read_trace(_trace_event(result.event_list))
+        # the traces of the step subprocesses are merged into the trace of the run
+        assert os.listdir(instance.trace_directory(result.run_id)) == [TRACE_FILENAME]
+
+    step_pids = {event['pid'] for event in trace if event['name'] == 'execute_step'}
+    assert len(step_pids) == 2
+    assert os.getpid() not in step_pids
+
+
+def test_untraced_run():
+    with TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        for tags in [{}, {TRACE_TAG: 'false'}]:
+            result = execute_pipeline(
+                define_traced_pipeline(),
+                environment_dict={'storage': {'filesystem': {}}},
+                instance=instance,
+                tags=tags,
+            )
+            assert result.success
+            assert not any(event.message.startswith('Wrote trace') for event in result.event_list)
+            assert not os.path.exists(instance.trace_directory(result.run_id))
+
+
+def test_invalid_trace_tag():
+    with pytest.raises(DagsterInvariantViolationError):
+        execute_pipeline(define_traced_pipeline(), tags={TRACE_TAG: 'yes'})
+
+
+def test_summarize_trace():
+    events = [
+        {'cat': 'step', 'name': 'compute', 'dur': 3000000},
+        {'cat': 'step', 'name': 'compute', 'dur': 1000000},
+        {'cat': 'event_log', 'name': 'store_event', 'dur': 1000000},
+    ]
+    assert summarize_trace(events) == [
+        ('step.compute', 2, 4.0),
+        ('event_log.store_event', 1, 1.0),
+    ]
+    assert summarize_trace(events, limit=1) == [('step.compute', 2, 4.0)]
@@ -0,0 +1,79 @@
+import pytest
+
+from dagster import (
+    DagsterEventType,
+    ExecutionTargetHandle,
+    InputDefinition,
+    Int,
+    check,
+    lambda_solid,
+    pipeline,
+    seven,
+)
+from dagster.core.events import DagsterEvent
+from dagster.core.execution.worker import execute_run_steps
+from dagster.core.instance import DagsterInstance
+from dagster.serdes import deserialize_json_to_dagster_namedtuple
+
+
+@lambda_solid
+def emit_one():
+    return 1
+
+
+@lambda_solid(input_defs=[InputDefinition('num', Int)])
+def add_one(num):
+    return num + 1
+
+
+@pipeline
+def worker_pipeline():
+    add_one(emit_one())
+
+
+def define_worker_pipeline():
+    return worker_pipeline
+
+
+def _execute_step(handle, instance, run_id, step_key):
+    events = [
+        deserialize_json_to_dagster_namedtuple(serialized_event)
+        for serialized_event in execute_run_steps(handle, instance, run_id, [step_key])
+    ]
+    assert all(isinstance(event, DagsterEvent) for event in events)
+    return events
+
+
+def _step_event_types(events, step_key):
+    return [event.event_type for event in events if event.step_key == step_key]
+
+
+def test_execute_run_steps():
+    handle = ExecutionTargetHandle.for_pipeline_python_file(__file__, 'define_worker_pipeline')
+
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        pipeline_run = instance.create_run_for_pipeline(
+            worker_pipeline, environment_dict={'storage': {'filesystem': {}}}
+        )
+
+        # steps are executed one at a time, the way engines dispatch them to workers
+        emit_events = _execute_step(handle, instance, pipeline_run.run_id, 'emit_one.compute')
+        assert DagsterEventType.STEP_SUCCESS in _step_event_types(emit_events, 'emit_one.compute')
+        assert not _step_event_types(emit_events, 'add_one.compute')
+
+        add_events = _execute_step(handle, instance, pipeline_run.run_id, 'add_one.compute')
+        add_event_types = _step_event_types(add_events, 'add_one.compute')
+        assert add_event_types[0] == DagsterEventType.STEP_START
+        assert add_event_types[-1] == DagsterEventType.STEP_SUCCESS
+        # the input was loaded from the output the first worker stored
+        assert DagsterEventType.STEP_INPUT in add_event_types
+
+        # the events were recorded on the run as well
+        assert instance.get_run_stats(pipeline_run.run_id).steps_succeeded == 2
+
+
+def test_execute_run_steps_unknown_run():
+    handle = ExecutionTargetHandle.for_pipeline_python_file(__file__, 'define_worker_pipeline')
+    with pytest.raises(check.CheckError):
+        execute_run_steps(handle, DagsterInstance.ephemeral(), 'not_a_run', ['emit_one.compute'])
@@ -0,0 +1,51 @@
+from dagster import Partition, PartitionSetDefinition, RepositoryDefinition, lambda_solid, pipeline
+from dagster.core.definitions.partition import last_empty_partition
+from dagster.core.definitions.schedule import ScheduleExecutionContext
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
+
+
+@lambda_solid
+def noop():
+    pass
+
+
+@pipeline
+def noop_pipeline():
+    noop()
+
+
+def test_last_empty_partition():
+    partition_set = PartitionSetDefinition(
+        name='letters', pipeline_name='noop_pipeline', partition_fn=lambda: ['a', 'b', 'c'],
+    )
+    instance = DagsterInstance.ephemeral()
+    context = ScheduleExecutionContext(
+        instance, RepositoryDefinition('test', pipeline_defs=[noop_pipeline])
+    )
+
+    def add_run(partition_name, status):
+        instance.add_run(
+            PipelineRun(
+                pipeline_name='noop_pipeline',
+                status=status,
+                tags=partition_set.tags_for_partition(Partition(partition_name)),
+            )
+        )
+
+    assert last_empty_partition(context, partition_set).name == 'c'
+
+    add_run('c', PipelineRunStatus.FAILURE)
+    assert last_empty_partition(context, partition_set).name == 'c'
+
+    add_run('c', PipelineRunStatus.SUCCESS)
+    assert last_empty_partition(context, partition_set).name == 'b'
+
+    # a partition that has succeeded is not empty, even if it is being run again
+    add_run('c', PipelineRunStatus.STARTED)
+    add_run('b', PipelineRunStatus.SUCCESS)
+    add_run('b', PipelineRunStatus.FAILURE)
+    assert last_empty_partition(context, partition_set).name == 'a'
+
+    add_run('a', PipelineRunStatus.SUCCESS)
+    assert last_empty_partition(context, partition_set) is None
@@ -0,0 +1,144 @@
+import pytest
+
+from dagster import (
+    DagsterInvariantViolationError,
+    DagsterType,
+    DagsterTypeCheckDidNotPass,
+    Int,
+    List,
+    Optional,
+    OutputDefinition,
+    Set,
+    String,
+    Tuple,
+    TypeCheckPolicy,
+    execute_pipeline,
+    lambda_solid,
+    pipeline,
+)
+from dagster.core.storage.tags import TYPE_CHECK_POLICY_TAG
+from dagster.core.types.dagster_type import bulk_type_check_passes, resolve_dagster_type
+from dagster.core.types.python_dict import create_typed_runtime_dict
+
+
+def test_bulk_type_check():
+    int_type = resolve_dagster_type(Int)
+    assert bulk_type_check_passes(int_type, [1, 2, True])
+    assert not bulk_type_check_passes(int_type, [1, 2, 'three'])
+    assert bulk_type_check_passes(Optional[String], ['one', None])
+    assert not bulk_type_check_passes(resolve_dagster_type(String), ['one', None])
+    assert bulk_type_check_passes(int_type, [])
+
+
+def test_list_of_scalars_fails_on_first_bad_item():
+    res = List[Int].type_check(None, [1, 2, 'three', 'four'])
+    assert not res.success
+    assert res.description == 'Value "three" of python type "str" must be a int.'
+
+
+def _counting_type(calls):
+    def _type_check(_, value):
+        calls.append(value)
+        return isinstance(value, int)
+
+    return DagsterType(name='CountingInt', type_check_fn=_type_check)
+
+
+def test_type_check_policies():
+    calls = []
+    counting_type = _counting_type(calls)
+    values = list(range(100))
+
+    assert List(counting_type).type_check(None, values).success
+    assert len(calls) == 100
+
+    calls[:] = []
+    assert List(counting_type, TypeCheckPolicy.first(10)).type_check(None, values).success
+    assert calls == list(range(10))
+
+    calls[:] = []
+    assert List(counting_type, TypeCheckPolicy.sample(10)).type_check(None, values).success
+    assert len(calls) == 10
+    assert calls == sorted(calls)
+
+    calls[:] = []
+    assert Set(counting_type, TypeCheckPolicy.sample(10)).type_check(None, set(values)).success
+    assert len(calls) == 10
+
+    calls[:] = []
+    assert (
+        create_typed_runtime_dict(String, counting_type, TypeCheckPolicy.first(5))
+        .type_check(None, {str(value): value for value in values})
+        .success
+    )
+    assert len(calls) == 5
+
+    calls[:] = []
+    assert (
+        Tuple([counting_type] * 20, TypeCheckPolicy.first(5))
+        .type_check(None, tuple(range(20)))
+        .success
+    )
+    assert calls == list(range(5))
+
+    calls[:] = []
+    assert List(counting_type, TypeCheckPolicy.skip()).type_check(None, ['not an int']).success
+    assert calls == []
+
+    # the collection type itself is always checked
+    assert not List(counting_type, TypeCheckPolicy.skip()).type_check(None, 'not a list').success
+    assert not Tuple([counting_type], TypeCheckPolicy.skip()).type_check(None, (1, 2)).success
+
+
+def test_type_check_policy_from_tag_value():
+    assert TypeCheckPolicy.from_tag_value('full') == TypeCheckPolicy.full()
+    assert TypeCheckPolicy.from_tag_value('skip') == TypeCheckPolicy.skip()
+    assert TypeCheckPolicy.from_tag_value('first:100') == TypeCheckPolicy.first(100)
+    assert TypeCheckPolicy.from_tag_value('sample:5') == TypeCheckPolicy.sample(5)
+
+    for tag_value in ['some', 'first', 'sample:0', 'skip:10', 'first:many']:
+        with pytest.raises(DagsterInvariantViolationError):
+            TypeCheckPolicy.from_tag_value(tag_value)
+
+
+def test_type_check_policy_run_tag():
+    @lambda_solid(output_def=OutputDefinition(List[Int]))
+    def emit_list():
+        return [1, 2, 'three']
+
+    @lambda_solid(
+        output_def=OutputDefinition(List(resolve_dagster_type(Int), TypeCheckPolicy.full()))
+    )
+    def emit_list_always_checked():
+        return [1, 2, 'three']
+
+    @pipeline
+    def list_pipeline():
+        emit_list()
+
+    @pipeline
+    def always_checked_pipeline():
+        emit_list_always_checked()
+
+    with pytest.raises(DagsterTypeCheckDidNotPass):
+        execute_pipeline(list_pipeline)
+
+    assert execute_pipeline(list_pipeline, tags={TYPE_CHECK_POLICY_TAG: 'first:2'}).success
+
+    # a policy set on the type wins over the run tag
+    with pytest.raises(DagsterTypeCheckDidNotPass):
+        execute_pipeline(always_checked_pipeline, tags={TYPE_CHECK_POLICY_TAG: 'skip'})
+
+
+def test_invalid_type_check_policy_run_tag():
+    @lambda_solid
+    def emit_one():
+        return 1
+
+    @pipeline
+    def no_collections_pipeline():
+        emit_one()
+
+    # the run fails on the invalid tag even though no step has a collection output
+    with pytest.raises(DagsterInvariantViolationError):
+        execute_pipeline(no_collections_pipeline, tags={TYPE_CHECK_POLICY_TAG: 'some'})
@@ -11,7 +11,7 @@ snapshots[
 ] = '''{
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": false,
-  "pipeline_snapshot_id": "88528edde2ed64da3c39cca0da8ba2f7586c1a5d",
+  "pipeline_snapshot_id": "cc590a1fd3a666fa2faf5da633fbe255e8c19fb7",
   "steps": [
     {
       "__class__": "ExecutionStepSnap",
@@ -38,7 +38,7 @@ snapshots[
 ] = '''{
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": false,
-  "pipeline_snapshot_id": "1691c5e70cd7109224358f6675452d940f08e1a6",
+  "pipeline_snapshot_id": "04eff99d2ee8ed4cd83c4f2ca07cdc3c355086f2",
   "steps": [
     {
       "__class__": "ExecutionStepSnap",
@@ -95,7 +95,7 @@ snapshots[
 ] = '''{
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": false,
-  "pipeline_snapshot_id": "e61e01bb1f6fadbce2ece3f0fb2928321b7b8d73",
+  "pipeline_snapshot_id": "cb549972f4a8fe7f03ce1852cb1a53090f87f87e",
   "steps": [
     {
       "__class__": "ExecutionStepSnap",
@@ -241,7 +241,7 @@ snapshots[
 ] = '''{
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": false,
-  "pipeline_snapshot_id": "461e10ad028bb57704740a711df701a79c409359",
+  "pipeline_snapshot_id": "96c939d6ab94444e89e80fba68584ccf2f42c49b",
   "steps": [
     {
       "__class__": "ExecutionStepSnap",
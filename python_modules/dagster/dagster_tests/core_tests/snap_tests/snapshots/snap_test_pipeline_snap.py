@@ -85,6 +85,18 @@ snapshots['test_pipeline_snap_all_props 1'] = '''{
         },
         "type_param_keys": null
       },
+      "Permissive": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [],
+        "given_name": null,
+        "key": "Permissive",
+        "kind": {
+          "__enum__": "ConfigTypeKind.PERMISSIVE_SHAPE"
+        },
+        "type_param_keys": null
+      },
       "ScalarUnion.Bool-Selector.931bb6ad8aa201c3e984966c80b27fb6679bef93": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -216,7 +228,7 @@ snapshots['test_pipeline_snap_all_props 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975": {
+      "Selector.33cb8f0191896a9e0fdef70f75faf6ad03d05800": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -237,11 +249,11 @@ snapshots['test_pipeline_snap_all_props 1'] = '''{
             "description": null,
             "is_required": false,
             "name": "multiprocess",
-            "type_key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e"
+            "type_key": "Shape.4827576e9ff96a1cf7efaf14e5e10eb533656cd7"
           }
         ],
         "given_name": null,
-        "key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975",
+        "key": "Selector.33cb8f0191896a9e0fdef70f75faf6ad03d05800",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -469,65 +481,38 @@ snapshots['test_pipeline_snap_all_props 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Shape.11eb576307bebdc05b7f94a19ed6823cad2ba923": {
+      "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "\\"INFO\\"",
             "description": null,
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "log_level",
+            "type_key": "String"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"noop_solid\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.cfd4403245ea53e9035af8ce213022fec90f29bf"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_value_as_json_str": "\\"dagster\\"",
             "description": null,
             "is_required": false,
-            "name": "storage",
-            "type_key": "Selector.efc7a1aa788fafe8121049790c968cbf2ebc247b"
+            "name": "name",
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Shape.11eb576307bebdc05b7f94a19ed6823cad2ba923",
+        "key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "type_param_keys": null
       },
-      "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
+      "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -535,30 +520,21 @@ snapshots['test_pipeline_snap_all_props 1'] = '''{
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "\\"INFO\\"",
-            "description": null,
-            "is_required": false,
-            "name": "log_level",
-            "type_key": "String"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "\\"dagster\\"",
+            "default_value_as_json_str": "{\\"log_level\\": \\"INFO\\", \\"name\\": \\"dagster\\"}",
             "description": null,
             "is_required": false,
-            "name": "name",
-            "type_key": "String"
+            "name": "config",
+            "type_key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441"
           }
         ],
         "given_name": null,
-        "key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441",
+        "key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "type_param_keys": null
       },
-      "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
+      "Shape.4827576e9ff96a1cf7efaf14e5e10eb533656cd7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -566,15 +542,15 @@ snapshots['test_pipeline_snap_all_props 1'] = '''{
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"log_level\\": \\"INFO\\", \\"name\\": \\"dagster\\"}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441"
+            "type_key": "Shape.f73e75f2070e70065bfdf3896b682a9865bb4743"
           }
         ],
         "given_name": null,
-        "key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb",
+        "key": "Shape.4827576e9ff96a1cf7efaf14e5e10eb533656cd7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -646,7 +622,7 @@ snapshots['test_pipeline_snap_all_props 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+      "Shape.96583b5d2f259ced5e142ba353090cb8997fac25": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -657,39 +633,66 @@ snapshots['test_pipeline_snap_all_props 1'] = '''{
             "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
+            "name": "execution",
+            "type_key": "Selector.33cb8f0191896a9e0fdef70f75faf6ad03d05800"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"noop_solid\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.cfd4403245ea53e9035af8ce213022fec90f29bf"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "storage",
+            "type_key": "Selector.efc7a1aa788fafe8121049790c968cbf2ebc247b"
           }
         ],
         "given_name": null,
-        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+        "key": "Shape.96583b5d2f259ced5e142ba353090cb8997fac25",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "type_param_keys": null
       },
-      "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023": {
+      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
+            "name": "marker_to_close",
+            "type_key": "String"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -702,7 +705,7 @@ snapshots['test_pipeline_snap_all_props 1'] = '''{
           }
         ],
         "given_name": null,
-        "key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023",
+        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -830,7 +833,7 @@ snapshots['test_pipeline_snap_all_props 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e": {
+      "Shape.f73e75f2070e70065bfdf3896b682a9865bb4743": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -838,15 +841,33 @@ snapshots['test_pipeline_snap_all_props 1'] = '''{
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "0",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023"
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacities of the resources that steps declare they require with the dagster/resource_requirements tag, by resource name.",
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Permissive"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           }
         ],
         "given_name": null,
-        "key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e",
+        "key": "Shape.f73e75f2070e70065bfdf3896b682a9865bb4743",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -1115,6 +1136,18 @@ snapshots['test_empty_pipeline_snap_snapshot 1'] = '''{
         },
         "type_param_keys": null
       },
+      "Permissive": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [],
+        "given_name": null,
+        "key": "Permissive",
+        "kind": {
+          "__enum__": "ConfigTypeKind.PERMISSIVE_SHAPE"
+        },
+        "type_param_keys": null
+      },
       "ScalarUnion.Bool-Selector.931bb6ad8aa201c3e984966c80b27fb6679bef93": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -1246,7 +1279,7 @@ snapshots['test_empty_pipeline_snap_snapshot 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975": {
+      "Selector.33cb8f0191896a9e0fdef70f75faf6ad03d05800": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -1267,11 +1300,11 @@ snapshots['test_empty_pipeline_snap_snapshot 1'] = '''{
             "description": null,
             "is_required": false,
             "name": "multiprocess",
-            "type_key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e"
+            "type_key": "Shape.4827576e9ff96a1cf7efaf14e5e10eb533656cd7"
           }
         ],
         "given_name": null,
-        "key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975",
+        "key": "Selector.33cb8f0191896a9e0fdef70f75faf6ad03d05800",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -1499,65 +1532,38 @@ snapshots['test_empty_pipeline_snap_snapshot 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Shape.11eb576307bebdc05b7f94a19ed6823cad2ba923": {
+      "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975"
-          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "\\"INFO\\"",
             "description": null,
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "log_level",
+            "type_key": "String"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"noop_solid\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.cfd4403245ea53e9035af8ce213022fec90f29bf"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_value_as_json_str": "\\"dagster\\"",
             "description": null,
             "is_required": false,
-            "name": "storage",
-            "type_key": "Selector.efc7a1aa788fafe8121049790c968cbf2ebc247b"
+            "name": "name",
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Shape.11eb576307bebdc05b7f94a19ed6823cad2ba923",
+        "key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "type_param_keys": null
       },
-      "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
+      "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -1565,30 +1571,21 @@ snapshots['test_empty_pipeline_snap_snapshot 1'] = '''{
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "\\"INFO\\"",
-            "description": null,
-            "is_required": false,
-            "name": "log_level",
-            "type_key": "String"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "\\"dagster\\"",
+            "default_value_as_json_str": "{\\"log_level\\": \\"INFO\\", \\"name\\": \\"dagster\\"}",
             "description": null,
             "is_required": false,
-            "name": "name",
-            "type_key": "String"
+            "name": "config",
+            "type_key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441"
           }
         ],
         "given_name": null,
-        "key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441",
+        "key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "type_param_keys": null
       },
-      "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
+      "Shape.4827576e9ff96a1cf7efaf14e5e10eb533656cd7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -1596,15 +1593,15 @@ snapshots['test_empty_pipeline_snap_snapshot 1'] = '''{
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"log_level\\": \\"INFO\\", \\"name\\": \\"dagster\\"}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441"
+            "type_key": "Shape.f73e75f2070e70065bfdf3896b682a9865bb4743"
           }
         ],
         "given_name": null,
-        "key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb",
+        "key": "Shape.4827576e9ff96a1cf7efaf14e5e10eb533656cd7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -1676,7 +1673,7 @@ snapshots['test_empty_pipeline_snap_snapshot 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+      "Shape.96583b5d2f259ced5e142ba353090cb8997fac25": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -1687,39 +1684,66 @@ snapshots['test_empty_pipeline_snap_snapshot 1'] = '''{
             "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
+            "name": "execution",
+            "type_key": "Selector.33cb8f0191896a9e0fdef70f75faf6ad03d05800"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"noop_solid\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.cfd4403245ea53e9035af8ce213022fec90f29bf"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "storage",
+            "type_key": "Selector.efc7a1aa788fafe8121049790c968cbf2ebc247b"
           }
         ],
         "given_name": null,
-        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+        "key": "Shape.96583b5d2f259ced5e142ba353090cb8997fac25",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "type_param_keys": null
       },
-      "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023": {
+      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
+            "name": "marker_to_close",
+            "type_key": "String"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -1732,7 +1756,7 @@ snapshots['test_empty_pipeline_snap_snapshot 1'] = '''{
           }
         ],
         "given_name": null,
-        "key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023",
+        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -1860,7 +1884,7 @@ snapshots['test_empty_pipeline_snap_snapshot 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e": {
+      "Shape.f73e75f2070e70065bfdf3896b682a9865bb4743": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -1868,15 +1892,33 @@ snapshots['test_empty_pipeline_snap_snapshot 1'] = '''{
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "0",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023"
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacities of the resources that steps declare they require with the dagster/resource_requirements tag, by resource name.",
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Permissive"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           }
         ],
         "given_name": null,
-        "key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e",
+        "key": "Shape.f73e75f2070e70065bfdf3896b682a9865bb4743",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -2064,7 +2106,7 @@ snapshots['test_empty_pipeline_snap_snapshot 1'] = '''{
   "tags": {}
 }'''
 
-snapshots['test_pipeline_snap_all_props 2'] = '634a36c067acaf9f10f37ac0ceb916d8c564160b'
+snapshots['test_pipeline_snap_all_props 2'] = '6283ef1407367069a6866d0dc7cdf22cc59a3e94'
 
 snapshots['test_two_invocations_deps_snap 1'] = '''{
   "__class__": "PipelineSnapshot",
@@ -2145,6 +2187,18 @@ snapshots['test_two_invocations_deps_snap 1'] = '''{
         },
         "type_param_keys": null
       },
+      "Permissive": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [],
+        "given_name": null,
+        "key": "Permissive",
+        "kind": {
+          "__enum__": "ConfigTypeKind.PERMISSIVE_SHAPE"
+        },
+        "type_param_keys": null
+      },
       "ScalarUnion.Bool-Selector.931bb6ad8aa201c3e984966c80b27fb6679bef93": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -2276,7 +2330,7 @@ snapshots['test_two_invocations_deps_snap 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975": {
+      "Selector.33cb8f0191896a9e0fdef70f75faf6ad03d05800": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -2297,11 +2351,11 @@ snapshots['test_two_invocations_deps_snap 1'] = '''{
             "description": null,
             "is_required": false,
             "name": "multiprocess",
-            "type_key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e"
+            "type_key": "Shape.4827576e9ff96a1cf7efaf14e5e10eb533656cd7"
           }
         ],
         "given_name": null,
-        "key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975",
+        "key": "Selector.33cb8f0191896a9e0fdef70f75faf6ad03d05800",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -2529,7 +2583,7 @@ snapshots['test_two_invocations_deps_snap 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Shape.0c3cca72f7600cd351847db4d50cfab8fa0fd170": {
+      "Shape.206dd45b50244a2b3cc60d4e3d1e4a536fa075b5": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -2541,7 +2595,7 @@ snapshots['test_two_invocations_deps_snap 1'] = '''{
             "description": null,
             "is_required": false,
             "name": "execution",
-            "type_key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975"
+            "type_key": "Selector.33cb8f0191896a9e0fdef70f75faf6ad03d05800"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -2581,7 +2635,7 @@ snapshots['test_two_invocations_deps_snap 1'] = '''{
           }
         ],
         "given_name": null,
-        "key": "Shape.0c3cca72f7600cd351847db4d50cfab8fa0fd170",
+        "key": "Shape.206dd45b50244a2b3cc60d4e3d1e4a536fa075b5",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -2640,6 +2694,28 @@ snapshots['test_two_invocations_deps_snap 1'] = '''{
         },
         "type_param_keys": null
       },
+      "Shape.4827576e9ff96a1cf7efaf14e5e10eb533656cd7": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.f73e75f2070e70065bfdf3896b682a9865bb4743"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.4827576e9ff96a1cf7efaf14e5e10eb533656cd7",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "type_param_keys": null
+      },
       "Shape.4ce319f0b244b33c363530397798177d6b1ef2ea": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -2737,37 +2813,6 @@ snapshots['test_two_invocations_deps_snap 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "type_param_keys": null
-      },
       "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -2868,7 +2913,7 @@ snapshots['test_two_invocations_deps_snap 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Shape.ff6673a2d8e7c67de99e344cd2ea2a603cb1fa5b": {
+      "Shape.f73e75f2070e70065bfdf3896b682a9865bb4743": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -2876,30 +2921,39 @@ snapshots['test_two_invocations_deps_snap 1'] = '''{
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "0",
             "description": null,
             "is_required": false,
-            "name": "one",
-            "type_key": "Shape.e9ab42dd7e072d71d5b3be8febf5e4d8022dfc05"
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacities of the resources that steps declare they require with the dagster/resource_requirements tag, by resource name.",
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Permissive"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "two",
-            "type_key": "Shape.e9ab42dd7e072d71d5b3be8febf5e4d8022dfc05"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           }
         ],
         "given_name": null,
-        "key": "Shape.ff6673a2d8e7c67de99e344cd2ea2a603cb1fa5b",
+        "key": "Shape.f73e75f2070e70065bfdf3896b682a9865bb4743",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "type_param_keys": null
       },
-      "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e": {
+      "Shape.ff6673a2d8e7c67de99e344cd2ea2a603cb1fa5b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -2907,15 +2961,24 @@ snapshots['test_two_invocations_deps_snap 1'] = '''{
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023"
+            "name": "one",
+            "type_key": "Shape.e9ab42dd7e072d71d5b3be8febf5e4d8022dfc05"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "two",
+            "type_key": "Shape.e9ab42dd7e072d71d5b3be8febf5e4d8022dfc05"
           }
         ],
         "given_name": null,
-        "key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e",
+        "key": "Shape.ff6673a2d8e7c67de99e344cd2ea2a603cb1fa5b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -3110,7 +3173,7 @@ snapshots['test_two_invocations_deps_snap 1'] = '''{
   "tags": {}
 }'''
 
-snapshots['test_two_invocations_deps_snap 2'] = 'd89efc442db557ae228f5e56016ff487ff1d43a6'
+snapshots['test_two_invocations_deps_snap 2'] = '8a154e4add0b049eb046aaef30c558f7cb36d65e'
 
 snapshots['test_basic_dep_fan_out 1'] = '''{
   "__class__": "PipelineSnapshot",
@@ -3191,6 +3254,18 @@ snapshots['test_basic_dep_fan_out 1'] = '''{
         },
         "type_param_keys": null
       },
+      "Permissive": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [],
+        "given_name": null,
+        "key": "Permissive",
+        "kind": {
+          "__enum__": "ConfigTypeKind.PERMISSIVE_SHAPE"
+        },
+        "type_param_keys": null
+      },
       "ScalarUnion.Bool-Selector.931bb6ad8aa201c3e984966c80b27fb6679bef93": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -3322,7 +3397,7 @@ snapshots['test_basic_dep_fan_out 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975": {
+      "Selector.33cb8f0191896a9e0fdef70f75faf6ad03d05800": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -3343,11 +3418,11 @@ snapshots['test_basic_dep_fan_out 1'] = '''{
             "description": null,
             "is_required": false,
             "name": "multiprocess",
-            "type_key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e"
+            "type_key": "Shape.4827576e9ff96a1cf7efaf14e5e10eb533656cd7"
           }
         ],
         "given_name": null,
-        "key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975",
+        "key": "Selector.33cb8f0191896a9e0fdef70f75faf6ad03d05800",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -3668,6 +3743,28 @@ snapshots['test_basic_dep_fan_out 1'] = '''{
         },
         "type_param_keys": null
       },
+      "Shape.4827576e9ff96a1cf7efaf14e5e10eb533656cd7": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.f73e75f2070e70065bfdf3896b682a9865bb4743"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.4827576e9ff96a1cf7efaf14e5e10eb533656cd7",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "type_param_keys": null
+      },
       "Shape.4ce319f0b244b33c363530397798177d6b1ef2ea": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -3765,38 +3862,7 @@ snapshots['test_basic_dep_fan_out 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "type_param_keys": null
-      },
-      "Shape.bfdfd77baac9a6815ee5ed34e203f005aea52dd8": {
+      "Shape.9ee6e016e406cbe5442e3edc384477f7d7f580d2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -3808,7 +3874,7 @@ snapshots['test_basic_dep_fan_out 1'] = '''{
             "description": null,
             "is_required": false,
             "name": "execution",
-            "type_key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975"
+            "type_key": "Selector.33cb8f0191896a9e0fdef70f75faf6ad03d05800"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -3848,7 +3914,7 @@ snapshots['test_basic_dep_fan_out 1'] = '''{
           }
         ],
         "given_name": null,
-        "key": "Shape.bfdfd77baac9a6815ee5ed34e203f005aea52dd8",
+        "key": "Shape.9ee6e016e406cbe5442e3edc384477f7d7f580d2",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -3954,7 +4020,7 @@ snapshots['test_basic_dep_fan_out 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e": {
+      "Shape.f73e75f2070e70065bfdf3896b682a9865bb4743": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -3962,15 +4028,33 @@ snapshots['test_basic_dep_fan_out 1'] = '''{
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "0",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023"
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacities of the resources that steps declare they require with the dagster/resource_requirements tag, by resource name.",
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Permissive"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           }
         ],
         "given_name": null,
-        "key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e",
+        "key": "Shape.f73e75f2070e70065bfdf3896b682a9865bb4743",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -4221,7 +4305,7 @@ snapshots['test_basic_dep_fan_out 1'] = '''{
   "tags": {}
 }'''
 
-snapshots['test_basic_dep_fan_out 2'] = 'ab880e36b41951910b62fbf8608554c970bec0ba'
+snapshots['test_basic_dep_fan_out 2'] = '8d78bbd5876663c82745af94ee192120f1c8b1a3'
 
 snapshots['test_basic_fan_in 1'] = '''{
   "__class__": "PipelineSnapshot",
@@ -4302,6 +4386,18 @@ snapshots['test_basic_fan_in 1'] = '''{
         },
         "type_param_keys": null
       },
+      "Permissive": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [],
+        "given_name": null,
+        "key": "Permissive",
+        "kind": {
+          "__enum__": "ConfigTypeKind.PERMISSIVE_SHAPE"
+        },
+        "type_param_keys": null
+      },
       "ScalarUnion.Bool-Selector.931bb6ad8aa201c3e984966c80b27fb6679bef93": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -4433,7 +4529,7 @@ snapshots['test_basic_fan_in 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975": {
+      "Selector.33cb8f0191896a9e0fdef70f75faf6ad03d05800": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4454,11 +4550,11 @@ snapshots['test_basic_fan_in 1'] = '''{
             "description": null,
             "is_required": false,
             "name": "multiprocess",
-            "type_key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e"
+            "type_key": "Shape.4827576e9ff96a1cf7efaf14e5e10eb533656cd7"
           }
         ],
         "given_name": null,
-        "key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975",
+        "key": "Selector.33cb8f0191896a9e0fdef70f75faf6ad03d05800",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -4761,29 +4857,29 @@ snapshots['test_basic_fan_in 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Shape.4ce319f0b244b33c363530397798177d6b1ef2ea": {
+      "Shape.4827576e9ff96a1cf7efaf14e5e10eb533656cd7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
-            "is_required": true,
-            "name": "path",
-            "type_key": "Path"
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.f73e75f2070e70065bfdf3896b682a9865bb4743"
           }
         ],
         "given_name": null,
-        "key": "Shape.4ce319f0b244b33c363530397798177d6b1ef2ea",
+        "key": "Shape.4827576e9ff96a1cf7efaf14e5e10eb533656cd7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "type_param_keys": null
       },
-      "Shape.4f02a5555bbcb7f76db149f86ba957c7da79ea80": {
+      "Shape.4ce319f0b244b33c363530397798177d6b1ef2ea": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4793,49 +4889,13 @@ snapshots['test_basic_fan_in 1'] = '''{
             "default_provided": false,
             "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"take_nothings\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.22ec23494d42efd1fc79b1c449e6ff51f1d1afbb"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "storage",
-            "type_key": "Selector.efc7a1aa788fafe8121049790c968cbf2ebc247b"
+            "is_required": true,
+            "name": "path",
+            "type_key": "Path"
           }
         ],
         "given_name": null,
-        "key": "Shape.4f02a5555bbcb7f76db149f86ba957c7da79ea80",
+        "key": "Shape.4ce319f0b244b33c363530397798177d6b1ef2ea",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -4916,37 +4976,6 @@ snapshots['test_basic_fan_in 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "type_param_keys": null
-      },
       "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -5047,23 +5076,99 @@ snapshots['test_basic_fan_in 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e": {
+      "Shape.f09206b819ce7f0459cafb4d850f30bc7abcc87f": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.33cb8f0191896a9e0fdef70f75faf6ad03d05800"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023"
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"take_nothings\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.22ec23494d42efd1fc79b1c449e6ff51f1d1afbb"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "storage",
+            "type_key": "Selector.efc7a1aa788fafe8121049790c968cbf2ebc247b"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.f09206b819ce7f0459cafb4d850f30bc7abcc87f",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "type_param_keys": null
+      },
+      "Shape.f73e75f2070e70065bfdf3896b682a9865bb4743": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacities of the resources that steps declare they require with the dagster/resource_requirements tag, by resource name.",
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Permissive"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           }
         ],
         "given_name": null,
-        "key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e",
+        "key": "Shape.f73e75f2070e70065bfdf3896b682a9865bb4743",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -5307,7 +5412,7 @@ snapshots['test_basic_fan_in 1'] = '''{
   "tags": {}
 }'''
 
-snapshots['test_basic_fan_in 2'] = 'ad4ff4a4b528d6a1bfc6f296757f96bd5888e0d6'
+snapshots['test_basic_fan_in 2'] = '7c2ab95eccb1efc37ee58b7ce06aa37433d577b6'
 
 snapshots['test_empty_pipeline_snap_props 1'] = '''{
   "__class__": "PipelineSnapshot",
@@ -5388,6 +5493,18 @@ snapshots['test_empty_pipeline_snap_props 1'] = '''{
         },
         "type_param_keys": null
       },
+      "Permissive": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [],
+        "given_name": null,
+        "key": "Permissive",
+        "kind": {
+          "__enum__": "ConfigTypeKind.PERMISSIVE_SHAPE"
+        },
+        "type_param_keys": null
+      },
       "ScalarUnion.Bool-Selector.931bb6ad8aa201c3e984966c80b27fb6679bef93": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -5519,7 +5636,7 @@ snapshots['test_empty_pipeline_snap_props 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975": {
+      "Selector.33cb8f0191896a9e0fdef70f75faf6ad03d05800": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5540,11 +5657,11 @@ snapshots['test_empty_pipeline_snap_props 1'] = '''{
             "description": null,
             "is_required": false,
             "name": "multiprocess",
-            "type_key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e"
+            "type_key": "Shape.4827576e9ff96a1cf7efaf14e5e10eb533656cd7"
           }
         ],
         "given_name": null,
-        "key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975",
+        "key": "Selector.33cb8f0191896a9e0fdef70f75faf6ad03d05800",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -5772,65 +5889,38 @@ snapshots['test_empty_pipeline_snap_props 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Shape.11eb576307bebdc05b7f94a19ed6823cad2ba923": {
+      "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "\\"INFO\\"",
             "description": null,
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "log_level",
+            "type_key": "String"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"noop_solid\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.cfd4403245ea53e9035af8ce213022fec90f29bf"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_value_as_json_str": "\\"dagster\\"",
             "description": null,
             "is_required": false,
-            "name": "storage",
-            "type_key": "Selector.efc7a1aa788fafe8121049790c968cbf2ebc247b"
+            "name": "name",
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Shape.11eb576307bebdc05b7f94a19ed6823cad2ba923",
+        "key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "type_param_keys": null
       },
-      "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
+      "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5838,30 +5928,21 @@ snapshots['test_empty_pipeline_snap_props 1'] = '''{
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "\\"INFO\\"",
-            "description": null,
-            "is_required": false,
-            "name": "log_level",
-            "type_key": "String"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "\\"dagster\\"",
+            "default_value_as_json_str": "{\\"log_level\\": \\"INFO\\", \\"name\\": \\"dagster\\"}",
             "description": null,
             "is_required": false,
-            "name": "name",
-            "type_key": "String"
+            "name": "config",
+            "type_key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441"
           }
         ],
         "given_name": null,
-        "key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441",
+        "key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "type_param_keys": null
       },
-      "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
+      "Shape.4827576e9ff96a1cf7efaf14e5e10eb533656cd7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5869,15 +5950,15 @@ snapshots['test_empty_pipeline_snap_props 1'] = '''{
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"log_level\\": \\"INFO\\", \\"name\\": \\"dagster\\"}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441"
+            "type_key": "Shape.f73e75f2070e70065bfdf3896b682a9865bb4743"
           }
         ],
         "given_name": null,
-        "key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb",
+        "key": "Shape.4827576e9ff96a1cf7efaf14e5e10eb533656cd7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -5949,7 +6030,7 @@ snapshots['test_empty_pipeline_snap_props 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+      "Shape.96583b5d2f259ced5e142ba353090cb8997fac25": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5960,39 +6041,66 @@ snapshots['test_empty_pipeline_snap_props 1'] = '''{
             "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
+            "name": "execution",
+            "type_key": "Selector.33cb8f0191896a9e0fdef70f75faf6ad03d05800"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"noop_solid\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.cfd4403245ea53e9035af8ce213022fec90f29bf"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "storage",
+            "type_key": "Selector.efc7a1aa788fafe8121049790c968cbf2ebc247b"
           }
         ],
         "given_name": null,
-        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+        "key": "Shape.96583b5d2f259ced5e142ba353090cb8997fac25",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "type_param_keys": null
       },
-      "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023": {
+      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
+            "name": "marker_to_close",
+            "type_key": "String"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -6005,7 +6113,7 @@ snapshots['test_empty_pipeline_snap_props 1'] = '''{
           }
         ],
         "given_name": null,
-        "key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023",
+        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -6133,7 +6241,7 @@ snapshots['test_empty_pipeline_snap_props 1'] = '''{
         },
         "type_param_keys": null
       },
-      "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e": {
+      "Shape.f73e75f2070e70065bfdf3896b682a9865bb4743": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -6141,15 +6249,33 @@ snapshots['test_empty_pipeline_snap_props 1'] = '''{
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "0",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023"
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacities of the resources that steps declare they require with the dagster/resource_requirements tag, by resource name.",
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Permissive"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           }
         ],
         "given_name": null,
-        "key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e",
+        "key": "Shape.f73e75f2070e70065bfdf3896b682a9865bb4743",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -6337,7 +6463,7 @@ snapshots['test_empty_pipeline_snap_props 1'] = '''{
   "tags": {}
 }'''
 
-snapshots['test_empty_pipeline_snap_props 2'] = '88528edde2ed64da3c39cca0da8ba2f7586c1a5d'
+snapshots['test_empty_pipeline_snap_props 2'] = 'cc590a1fd3a666fa2faf5da633fbe255e8c19fb7'
 
 snapshots['test_deserialize_solid_def_snaps_multi_type_config 1'] = '''{
   "__class__": "ConfigTypeSnap",
@@ -1,6 +1,7 @@
 import multiprocessing
 import os
 import sys
+import threading
 import time
 import traceback
 from contextlib import contextmanager
@@ -19,14 +20,22 @@ from dagster.core.events import (
     StepMaterializationData,
 )
 from dagster.core.events.log import DagsterEventRecord
-from dagster.core.execution.plan.objects import StepFailureData, StepSuccessData
+from dagster.core.execution.plan.objects import (
+    StepFailureData,
+    StepResourceUsage,
+    StepSuccessData,
+)
 from dagster.core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
     InMemoryEventLogStorage,
     SqlEventLogStorageMetadata,
     SqlEventLogStorageTable,
     SqliteEventLogStorage,
 )
+from dagster.core.storage.event_log.in_memory import EVENT_LOG_CHUNK_SIZE
+from dagster.core.storage.event_log.migration import consolidate_sqlite_event_logs
 from dagster.core.storage.sql import create_engine
+from dagster.seven import mock
 
 
 @contextmanager
@@ -40,9 +49,19 @@ def create_sqlite_run_event_logstorage():
         yield SqliteEventLogStorage(tmpdir_path)
 
 
+@contextmanager
+def create_consolidated_sqlite_event_log_storage():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        yield ConsolidatedSqliteEventLogStorage(tmpdir_path)
+
+
 event_storage_test = pytest.mark.parametrize(
     'event_storage_factory_cm_fn',
-    [create_in_memory_event_log_storage, create_sqlite_run_event_logstorage],
+    [
+        create_in_memory_event_log_storage,
+        create_sqlite_run_event_logstorage,
+        create_consolidated_sqlite_event_log_storage,
+    ],
 )
 
 
@@ -51,7 +70,7 @@ def test_init_log_storage(event_storage_factory_cm_fn):
     with event_storage_factory_cm_fn() as storage:
         if isinstance(storage, InMemoryEventLogStorage):
             assert not storage.is_persistent
-        elif isinstance(storage, SqliteEventLogStorage):
+        elif isinstance(storage, (SqliteEventLogStorage, ConsolidatedSqliteEventLogStorage)):
             assert storage.is_persistent
         else:
             raise Exception("Invalid event storage type")
@@ -112,11 +131,20 @@ def test_event_log_storage_store_with_multiple_runs(event_storage_factory_cm_fn)
 
         for run_id in runs:
             assert len(storage.get_logs_for_run(run_id)) == 1
+            assert storage.get_logs_count_for_run(run_id) == 1
             assert storage.get_stats_for_run(run_id).steps_succeeded == 1
 
+        stats = storage.get_stats_for_runs(runs)
+        assert set(stats.keys()) == set(runs)
+        assert all(stats[run_id] == storage.get_stats_for_run(run_id) for run_id in runs)
+        assert storage.get_step_stats_for_runs(runs) == {
+            run_id: storage.get_step_stats_for_run(run_id) for run_id in runs
+        }
+
         storage.wipe()
         for run_id in runs:
             assert len(storage.get_logs_for_run(run_id)) == 0
+            assert storage.get_logs_count_for_run(run_id) == 0
 
 
 @event_storage_test
@@ -224,6 +252,82 @@ def test_event_log_delete(event_storage_factory_cm_fn):
         assert len(storage.get_logs_for_run('foo')) == 0
 
 
+@event_storage_test
+def test_event_log_delete_events_for_runs(event_storage_factory_cm_fn):
+    with event_storage_factory_cm_fn() as storage:
+        for run_id in ['foo', 'bar', 'baz']:
+            storage.store_event(_engine_event('Message', run_id))
+
+        storage.delete_events_for_runs(['foo', 'bar'])
+        assert len(storage.get_logs_for_run('foo')) == 0
+        assert len(storage.get_logs_for_run('bar')) == 0
+        assert len(storage.get_logs_for_run('baz')) == 1
+
+
+def test_in_memory_event_log_across_chunks():
+    storage = InMemoryEventLogStorage()
+    n_events = 2 * EVENT_LOG_CHUNK_SIZE + 3
+    for i in range(n_events):
+        storage.store_event(_engine_event(str(i), 'foo'))
+
+    assert storage.get_logs_count_for_run('foo') == n_events
+    assert [event.message for event in storage.get_logs_for_run('foo')] == [
+        str(i) for i in range(n_events)
+    ]
+    for cursor in [
+        EVENT_LOG_CHUNK_SIZE - 2,
+        EVENT_LOG_CHUNK_SIZE - 1,
+        EVENT_LOG_CHUNK_SIZE,
+        n_events - 2,
+        n_events - 1,
+        n_events + 5,
+    ]:
+        assert [event.message for event in storage.get_logs_for_run('foo', cursor)] == [
+            str(i) for i in range(cursor + 1, n_events)
+        ]
+
+
+def test_in_memory_event_log_handler_ends_watch():
+    storage = InMemoryEventLogStorage()
+    watched = []
+
+    def _handler(event):
+        watched.append(event.message)
+        # handlers are called without holding the lock of the run, so can call the storage
+        assert storage.get_logs_count_for_run('foo') == len(watched)
+        storage.end_watch('foo', _handler)
+
+    storage.watch('foo', -1, _handler)
+    storage.store_event(_engine_event('first', 'foo'))
+    storage.store_event(_engine_event('second', 'foo'))
+    assert watched == ['first']
+
+
+def test_in_memory_event_log_handlers_see_events_in_order():
+    storage = InMemoryEventLogStorage()
+    watched = []
+
+    def _handler(event):
+        # a slow handler, so that concurrent writers store events while it is called
+        time.sleep(0.001)
+        watched.append(event.message)
+
+    storage.watch('foo', -1, _handler)
+
+    def _store_events(writer):
+        for i in range(20):
+            storage.store_event(_engine_event('{writer}-{i}'.format(writer=writer, i=i), 'foo'))
+
+    threads = [threading.Thread(target=_store_events, args=(writer,)) for writer in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(watched) == 80
+    assert watched == [event.message for event in storage.get_logs_for_run('foo')]
+
+
 @event_storage_test
 def test_event_log_get_stats_without_start_and_success(event_storage_factory_cm_fn):
     # When an event log doesn't have a PIPELINE_START or PIPELINE_SUCCESS | PIPELINE_FAILURE event,
@@ -320,11 +424,15 @@ def test_event_log_step_stats(event_storage_factory_cm_fn):
         assert a_stats.step_key == 'A'
         assert a_stats.status.value == 'SUCCESS'
         assert a_stats.end_time - a_stats.start_time == 100
+        assert a_stats.resource_usage == StepResourceUsage(
+            cpu_seconds=1.5, max_rss_bytes=1024, read_bytes=512, write_bytes=0
+        )
 
         b_stats = [stats for stats in step_stats if stats.step_key == 'B'][0]
         assert b_stats.step_key == 'B'
         assert b_stats.status.value == 'FAILURE'
         assert b_stats.end_time - b_stats.start_time == 50
+        assert b_stats.resource_usage.write_bytes == 512
 
         c_stats = [stats for stats in step_stats if stats.step_key == 'C'][0]
         assert c_stats.step_key == 'C'
@@ -337,6 +445,7 @@ def test_event_log_step_stats(event_storage_factory_cm_fn):
         assert d_stats.end_time - d_stats.start_time == 150
         assert len(d_stats.materializations) == 3
         assert len(d_stats.expectation_results) == 2
+        assert d_stats.resource_usage is None
 
 
 def _stats_records(run_id):
@@ -348,7 +457,12 @@ def _stats_records(run_id):
             'A',
             now - 225,
             DagsterEventType.STEP_SUCCESS,
-            StepSuccessData(duration_ms=100000.0),
+            StepSuccessData(
+                duration_ms=100000.0,
+                resource_usage=StepResourceUsage(
+                    cpu_seconds=1.5, max_rss_bytes=1024, read_bytes=512, write_bytes=0
+                ),
+            ),
         ),
         _event_record(run_id, 'B', now - 225, DagsterEventType.STEP_START),
         _event_record(
@@ -356,7 +470,13 @@ def _stats_records(run_id):
             'B',
             now - 175,
             DagsterEventType.STEP_FAILURE,
-            StepFailureData(error=None, user_failure_data=None),
+            StepFailureData(
+                error=None,
+                user_failure_data=None,
+                resource_usage=StepResourceUsage(
+                    cpu_seconds=0.5, max_rss_bytes=2048, read_bytes=0, write_bytes=512
+                ),
+            ),
         ),
         _event_record(run_id, 'C', now - 175, DagsterEventType.STEP_START),
         _event_record(run_id, 'C', now - 150, DagsterEventType.STEP_SKIPPED),
@@ -420,3 +540,245 @@ def _event_record(run_id, step_key, timestamp, event_type, event_specific_data=N
             event_specific_data=event_specific_data,
         ),
     )
+
+
+def _engine_event(message, run_id):
+    return DagsterEventRecord(
+        None,
+        message,
+        'debug',
+        '',
+        run_id,
+        time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ENGINE_EVENT.value,
+            'nonce',
+            event_specific_data=EngineEventData.in_process(999),
+        ),
+    )
+
+
+@event_storage_test
+def test_event_log_storage_pagination_interleaved_runs(event_storage_factory_cm_fn):
+    with event_storage_factory_cm_fn() as storage:
+        for i in range(3):
+            storage.store_event(_engine_event('foo_{i}'.format(i=i), 'foo'))
+            storage.store_event(_engine_event('bar_{i}'.format(i=i), 'bar'))
+
+        assert [event.message for event in storage.get_logs_for_run('bar', 0)] == [
+            'bar_1',
+            'bar_2',
+        ]
+        assert [event.message for event in storage.get_logs_for_run('foo', 1)] == ['foo_2']
+        assert storage.get_stats_for_runs(['foo', 'bar'])
+
+
+def store_events(tmpdir_path, run_id, n_events):
+    storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+    for i in range(n_events):
+        storage.store_event(_engine_event(str(i), run_id))
+
+
+def test_concurrent_consolidated_sqlite_event_log_writers():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        ps = [
+            multiprocessing.Process(target=store_events, args=(tmpdir_path, str(i), 20))
+            for i in range(5)
+        ]
+        for p in ps:
+            p.start()
+        for p in ps:
+            p.join()
+            assert p.exitcode == 0
+
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+        assert sorted(storage.get_all_run_ids()) == [str(i) for i in range(5)]
+        for i in range(5):
+            assert [event.message for event in storage.get_logs_for_run(str(i))] == [
+                str(j) for j in range(20)
+            ]
+
+
+def test_consolidate_sqlite_event_logs():
+    with seven.TemporaryDirectory() as source_dir:
+        with seven.TemporaryDirectory() as dest_dir:
+            source = SqliteEventLogStorage(source_dir)
+            for run_id in ['foo', 'bar']:
+                for i in range(3):
+                    source.store_event(_engine_event(str(i), run_id))
+
+            dest = ConsolidatedSqliteEventLogStorage(dest_dir)
+            assert sorted(consolidate_sqlite_event_logs(source, dest)) == ['bar', 'foo']
+            assert consolidate_sqlite_event_logs(source, dest) == []
+
+            for run_id in ['foo', 'bar']:
+                assert [event.message for event in dest.get_logs_for_run(run_id)] == [
+                    '0',
+                    '1',
+                    '2',
+                ]
+                assert dest.get_stats_for_run(run_id) == source.get_stats_for_run(run_id)
+
+
+def _step_event(event_type, event_specific_data, run_id, step_key, timestamp=None):
+    return DagsterEventRecord(
+        None,
+        'Message',
+        'debug',
+        '',
+        run_id,
+        timestamp if timestamp is not None else time.time(),
+        step_key=step_key,
+        dagster_event=DagsterEvent(
+            event_type.value, 'nonce', step_key=step_key, event_specific_data=event_specific_data,
+        ),
+    )
+
+
+@event_storage_test
+def test_event_log_step_stats_for_step_keys(event_storage_factory_cm_fn):
+    with event_storage_factory_cm_fn() as storage:
+        for run_id in ['foo', 'bar']:
+            for step_key in ['a.compute', 'b.compute']:
+                storage.store_event(
+                    _step_event(
+                        DagsterEventType.STEP_SUCCESS,
+                        StepSuccessData(duration_ms=100.0),
+                        run_id,
+                        step_key,
+                    )
+                )
+
+        step_stats = storage.get_step_stats_for_runs(['foo', 'bar'], step_keys=['b.compute'])
+        assert set(step_stats.keys()) == {'foo', 'bar'}
+        for run_id in ['foo', 'bar']:
+            assert [stats.step_key for stats in step_stats[run_id]] == ['b.compute']
+            assert step_stats[run_id][0].run_id == run_id
+
+
+@event_storage_test
+def test_event_log_materialization_history(event_storage_factory_cm_fn):
+    with event_storage_factory_cm_fn() as storage:
+        now = time.time()
+        for i, run_id in enumerate(['foo', 'bar', 'baz']):
+            for label in ['table', 'other_table']:
+                storage.store_event(
+                    _step_event(
+                        DagsterEventType.STEP_MATERIALIZATION,
+                        StepMaterializationData(Materialization(label=label)),
+                        run_id,
+                        'a.compute',
+                        timestamp=now + i,
+                    )
+                )
+
+        history = storage.get_materialization_history('table')
+        assert [event.run_id for event in history] == ['baz', 'bar', 'foo']
+        assert all(
+            event.dagster_event.event_specific_data.materialization.label == 'table'
+            for event in history
+        )
+        assert [event.run_id for event in storage.get_materialization_history('table', 2)] == [
+            'baz',
+            'bar',
+        ]
+        assert storage.get_materialization_history('missing') == []
+
+
+@event_storage_test
+def test_event_log_materialization_history_after_delete(event_storage_factory_cm_fn):
+    with event_storage_factory_cm_fn() as storage:
+        for run_id in ['foo', 'bar']:
+            storage.store_event(
+                _step_event(
+                    DagsterEventType.STEP_MATERIALIZATION,
+                    StepMaterializationData(Materialization(label='table')),
+                    run_id,
+                    'a.compute',
+                )
+            )
+
+        storage.delete_events('foo')
+        assert [event.run_id for event in storage.get_materialization_history('table')] == ['bar']
+
+        storage.wipe()
+        assert storage.get_materialization_history('table') == []
+
+
+def test_sqlite_materialization_history_does_not_open_run_databases():
+    with create_sqlite_run_event_logstorage() as storage:
+        for run_id in ['foo', 'bar']:
+            storage.store_event(
+                _step_event(
+                    DagsterEventType.STEP_MATERIALIZATION,
+                    StepMaterializationData(Materialization(label='table')),
+                    run_id,
+                    'a.compute',
+                )
+            )
+            storage.store_event(_engine_event('Not a materialization', run_id))
+
+        with mock.patch.object(storage, 'connect') as connect:
+            history = storage.get_materialization_history('table')
+
+        assert sorted(event.run_id for event in history) == ['bar', 'foo']
+        assert not connect.called
+
+        # only materializations are stored in the index, with their label extracted
+        engine = create_engine('sqlite:///{}'.format(storage.materialization_index_path))
+        rows = engine.execute(
+            sqlalchemy.select(
+                [SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.materialization_label]
+            )
+        ).fetchall()
+        engine.dispose()
+        assert sorted(rows) == [('bar', 'table'), ('foo', 'table')]
+
+
+def test_sqlite_stats_for_runs_fall_back_past_the_attach_limit():
+    with create_sqlite_run_event_logstorage() as storage:
+        runs = ['run_{}'.format(idx) for idx in range(12)]
+        for run_id in runs:
+            storage.store_event(_engine_event('Run started', run_id))
+
+        # batches larger than SQLite's limit on attached databases fail to attach
+        with mock.patch(
+            'dagster.core.storage.event_log.sqlite.sqlite_event_log.MAX_ATTACHED_DATABASES', 20
+        ):
+            with mock.patch('logging.warning') as warning:
+                stats = storage.get_stats_for_runs(runs)
+                step_stats = storage.get_step_stats_for_runs(runs)
+
+        assert stats == {run_id: storage.get_stats_for_run(run_id) for run_id in runs}
+        assert step_stats == {run_id: [] for run_id in runs}
+        assert warning.call_count == 2
+        assert 'too many attached databases' in warning.call_args[0][0]
+
+
+def test_sqlite_stats_for_runs_raise_other_errors():
+    with create_sqlite_run_event_logstorage() as storage:
+        storage.store_event(_engine_event('Run started', 'foo'))
+
+        error = sqlalchemy.exc.OperationalError('SELECT', {}, Exception('disk I/O error'))
+        with mock.patch.object(storage, '_connect_attached', side_effect=error):
+            with pytest.raises(sqlalchemy.exc.OperationalError, match='disk I/O error'):
+                storage.get_stats_for_runs(['foo'])
+            with pytest.raises(sqlalchemy.exc.OperationalError, match='disk I/O error'):
+                storage.get_step_stats_for_runs(['foo'])
+
+
+def test_sqlite_materialization_index_rebuilt_on_upgrade():
+    with create_sqlite_run_event_logstorage() as storage:
+        storage.store_event(
+            _step_event(
+                DagsterEventType.STEP_MATERIALIZATION,
+                StepMaterializationData(Materialization(label='table')),
+                'foo',
+                'a.compute',
+            )
+        )
+        os.unlink(storage.materialization_index_path)
+        assert storage.get_materialization_history('table') == []
+
+        storage.upgrade()
+        assert [event.run_id for event in storage.get_materialization_history('table')] == ['foo']
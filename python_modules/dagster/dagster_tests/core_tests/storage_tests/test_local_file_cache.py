@@ -1,8 +1,12 @@
 import io
 import os
+import time
 
 from dagster import LocalFileHandle
+from dagster.core.instance import DagsterInstance
 from dagster.core.storage.file_cache import FSFileCache
+from dagster.core.storage.local_file_cache import LocalFileCache
+from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.utils.temp_file import get_temp_dir
 
 
@@ -31,3 +35,96 @@ def test_empty_file_cache():
     with get_temp_dir() as temp_dir:
         file_cache = FSFileCache(temp_dir)
         assert not file_cache.has_file_object('kjdfkd')
+
+
+def _writer(contents, calls):
+    def _write(path):
+        calls.append(path)
+        with open(path, 'wb') as ff:
+            ff.write(contents)
+
+    return _write
+
+
+def test_local_file_cache_reuses_entries():
+    with get_temp_dir() as temp_dir:
+        cache = LocalFileCache(os.path.join(temp_dir, 'cache'))
+        calls = []
+
+        assert not cache.copy_to(
+            ['b', 'k', '1'], _writer(b'foo', calls), os.path.join(temp_dir, 'a')
+        )
+        assert cache.copy_to(['b', 'k', '1'], _writer(b'foo', calls), os.path.join(temp_dir, 'b'))
+        assert len(calls) == 1
+        with open(os.path.join(temp_dir, 'b'), 'rb') as ff:
+            assert ff.read() == b'foo'
+
+        # a new version of the file is fetched again
+        assert not cache.copy_to(
+            ['b', 'k', '2'], _writer(b'bar', calls), os.path.join(temp_dir, 'c')
+        )
+        assert len(calls) == 2
+        assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_local_file_cache_copies_are_not_shared():
+    with get_temp_dir() as temp_dir:
+        cache = LocalFileCache(os.path.join(temp_dir, 'cache'))
+        calls = []
+
+        cache.copy_to(['b', 'k', '1'], _writer(b'foo', calls), os.path.join(temp_dir, 'a'))
+        with open(os.path.join(temp_dir, 'a'), 'wb') as ff:
+            ff.write(b'changed by a solid')
+
+        # writing to a copy does not change the cached contents
+        assert cache.copy_to(['b', 'k', '1'], _writer(b'foo', calls), os.path.join(temp_dir, 'b'))
+        with open(os.path.join(temp_dir, 'b'), 'rb') as ff:
+            assert ff.read() == b'foo'
+        assert len(calls) == 1
+
+
+def test_local_file_cache_evicts_least_recently_read():
+    with get_temp_dir() as temp_dir:
+        cache = LocalFileCache(os.path.join(temp_dir, 'cache'), max_bytes=6)
+        calls = []
+        dest = os.path.join(temp_dir, 'dest')
+
+        cache.copy_to(['a'], _writer(b'aaa', calls), dest)
+        time.sleep(0.01)
+        cache.copy_to(['b'], _writer(b'bbb', calls), dest)
+        time.sleep(0.01)
+        assert cache.copy_to(['a'], _writer(b'aaa', calls), dest)
+        time.sleep(0.01)
+        cache.copy_to(['c'], _writer(b'ccc', calls), dest)
+
+        assert cache.copy_to(['a'], _writer(b'aaa', calls), dest)
+        assert not cache.copy_to(['b'], _writer(b'bbb', calls), dest)
+        with open(dest, 'rb') as ff:
+            assert ff.read() == b'bbb'
+
+
+def test_local_file_cache_reports_reads():
+    with get_temp_dir() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        pipeline_run = instance.add_run(PipelineRun(pipeline_name='foo', run_id='bar'))
+        cache = LocalFileCache.for_run(instance, pipeline_run)
+        dest = os.path.join(instance.root_directory, 'dest')
+        cache.copy_to(['a'], _writer(b'aaa', []), dest, description='s3://a')
+        cache.copy_to(['a'], _writer(b'aaa', []), dest, description='s3://a')
+
+        events = [
+            record.dagster_event
+            for record in instance.all_logs('bar')
+            if record.is_dagster_event and record.dagster_event.is_engine_event
+        ]
+        assert [event.message for event in events] == [
+            '[LocalFileCache] Fetched s3://a into the local file cache.',
+            '[LocalFileCache] Read s3://a from the local file cache.',
+        ]
+        assert [
+            {
+                entry.label: entry.entry_data.text
+                for entry in event.event_specific_data.metadata_entries
+            }
+            for event in events
+        ][-1] == {'result': 'hit', 'bytes': '3', 'hits': '1', 'misses': '1'}
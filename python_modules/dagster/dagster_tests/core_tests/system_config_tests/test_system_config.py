@@ -1,4 +1,5 @@
 import re
+import threading
 
 from dagster import (
     Any,
@@ -13,6 +14,7 @@ from dagster import (
     SolidDefinition,
     SolidInvocation,
     String,
+    StringSource,
     execute_pipeline,
     lambda_solid,
     pipeline,
@@ -26,8 +28,14 @@ from dagster.core.definitions.environment_configs import (
     define_solid_config_cls,
     define_solid_dictionary_cls,
 )
-from dagster.core.system_config.objects import EnvironmentConfig, SolidConfig
+from dagster.core.system_config.objects import (
+    EnvironmentConfig,
+    SolidConfig,
+    _build_environment_config,
+)
+from dagster.core.test_utils import environ
 from dagster.loggers import default_loggers
+from dagster.seven import mock
 
 
 def create_creation_data(pipeline_def):
@@ -619,3 +627,94 @@ def test_storage_in_memory_config():
 
 def test_directly_init_environment_config():
     EnvironmentConfig()
+
+
+def test_environment_config_build_is_memoized():
+    @solid(config=Int)
+    def with_config(context):
+        return context.solid_config
+
+    pipeline_def = PipelineDefinition(name='memoized_pipeline', solid_defs=[with_config])
+
+    environment_dict = {'solids': {'with_config': {'config': 1}}}
+    with mock.patch(
+        'dagster.core.system_config.objects._build_environment_config',
+        wraps=_build_environment_config,
+    ) as build_mock:
+        first = EnvironmentConfig.build(pipeline_def, environment_dict)
+        second = EnvironmentConfig.build(pipeline_def, {'solids': {'with_config': {'config': 1}}})
+    assert build_mock.call_count == 1
+    assert second.solids == first.solids
+    assert second.original_config_dict == environment_dict
+
+    other = EnvironmentConfig.build(pipeline_def, {'solids': {'with_config': {'config': 2}}})
+    assert other.solids['with_config'].config == 2
+    assert first.solids['with_config'].config == 1
+
+
+def test_environment_config_build_sees_env_changes():
+    @solid(config=StringSource)
+    def with_env_config(context):
+        return context.solid_config
+
+    pipeline_def = PipelineDefinition(name='env_pipeline', solid_defs=[with_env_config])
+    environment_dict = {
+        'solids': {'with_env_config': {'config': {'env': 'DAGSTER_TEST_ENV_CONFIG'}}}
+    }
+
+    with environ({'DAGSTER_TEST_ENV_CONFIG': 'foo'}):
+        first = EnvironmentConfig.build(pipeline_def, environment_dict)
+        assert first.solids['with_env_config'].config == 'foo'
+        assert EnvironmentConfig.build(pipeline_def, environment_dict).solids == first.solids
+
+    with environ({'DAGSTER_TEST_ENV_CONFIG': 'bar'}):
+        second = EnvironmentConfig.build(pipeline_def, environment_dict)
+        assert second.solids['with_env_config'].config == 'bar'
+
+
+def test_memoized_environment_config_is_not_shared_across_runs():
+    @solid(config=Field(Any))
+    def appends_to_config(context):
+        context.solid_config['items'].append(len(context.solid_config['items']) + 1)
+        return context.solid_config['items']
+
+    @pipeline
+    def mutating_pipeline():
+        appends_to_config()
+
+    environment_dict = {'solids': {'appends_to_config': {'config': {'items': []}}}}
+    for _ in range(3):
+        result = execute_pipeline(mutating_pipeline, environment_dict)
+        assert result.result_for_solid('appends_to_config').output_value() == [1]
+
+    assert environment_dict == {'solids': {'appends_to_config': {'config': {'items': []}}}}
+
+
+def test_environment_config_build_is_thread_safe():
+    @solid(config=Int)
+    def with_config(context):
+        return context.solid_config
+
+    pipeline_def = PipelineDefinition(name='threaded_pipeline', solid_defs=[with_config])
+
+    errors = []
+
+    def _build_configs(offset):
+        try:
+            # more distinct configs than the cache holds, so that threads also race on eviction
+            for idx in range(100):
+                value = (idx + offset) % 40
+                environment_config = EnvironmentConfig.build(
+                    pipeline_def, {'solids': {'with_config': {'config': value}}}
+                )
+                assert environment_config.solids['with_config'].config == value
+        except Exception as exc:  # pylint: disable=broad-except
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_build_configs, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
@@ -1,4 +1,7 @@
+import os
+
 from dagster import PipelineDefinition, execute_pipeline, pipeline, solid
+from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.core.execution.api import create_execution_plan
 from dagster.core.instance import DagsterInstance
 from dagster.core.snap.execution_plan_snapshot import (
@@ -87,3 +90,49 @@ def test_create_execution_plan_snapshot():
 
     assert run.execution_plan_snapshot_id == ep_snapshot_id
     assert run.execution_plan_snapshot_id == create_execution_plan_snapshot_id(ep_snapshot)
+
+
+def test_purge_runs(tmpdir):
+    @solid
+    def noop_solid(_):
+        pass
+
+    @pipeline
+    def noop_pipeline():
+        noop_solid()
+
+    instance = DagsterInstance.local_temp(str(tmpdir))
+    environment_dict = {'storage': {'filesystem': {}}}
+    finished_run_ids = [
+        execute_pipeline(noop_pipeline, environment_dict=environment_dict, instance=instance).run_id
+        for _ in range(3)
+    ]
+    live_run = instance.get_or_create_run(
+        pipeline_name='noop_pipeline', run_id='live_run', pipeline_snapshot=None
+    )
+    instance.handle_run_event(
+        live_run.run_id, DagsterEvent(DagsterEventType.PIPELINE_START.value, 'noop_pipeline'),
+    )
+
+    for run_id in finished_run_ids:
+        assert os.path.exists(instance.intermediates_directory(run_id))
+        assert instance.compute_log_manager.is_watch_completed(run_id, 'noop_solid.compute')
+
+    assert instance.purge_runs(3600) == []
+    assert instance.purge_runs(0, dry_run=True) == finished_run_ids
+    assert len(instance.get_runs()) == 4
+
+    progress = []
+    assert (
+        instance.purge_runs(
+            0, batch_size=2, progress_fn=lambda done, total: progress.append((done, total))
+        )
+        == finished_run_ids
+    )
+    assert progress == [(2, 3), (3, 3)]
+
+    assert [run.run_id for run in instance.get_runs()] == [live_run.run_id]
+    for run_id in finished_run_ids:
+        assert not os.path.exists(instance.intermediates_directory(run_id))
+        assert not instance.compute_log_manager.is_watch_completed(run_id, 'noop_solid.compute')
+        assert instance.all_logs(run_id) == []
@@ -1,7 +1,11 @@
+import time
+
 import pytest
 
 from dagster import (
     DagsterEventType,
+    DagsterInvalidDefinitionError,
+    DagsterInvariantViolationError,
     DagsterResourceFunctionError,
     ExecutionTargetHandle,
     Field,
@@ -19,6 +23,7 @@ from dagster.core.events.log import EventRecord, LogMessageRecord, construct_eve
 from dagster.core.execution.api import create_execution_plan, execute_plan
 from dagster.core.execution.config import RunConfig
 from dagster.core.instance import DagsterInstance
+from dagster.core.storage.tags import RESOURCE_INIT_CONCURRENCY_TAG
 
 
 def define_string_resource():
@@ -773,3 +778,125 @@ def test_single_step_resource_event_logs():
         iter([message for message in log_messages if message.user_message == USER_RESOURCE_MESSAGE])
     )
     assert resource_log_message.step_key == 'resource_solid.compute'
+
+
+def define_dependent_resources_pipeline(called, fail_resource=None, init_times=None):
+    def _resource(name, required_resource_keys=None):
+        @resource(required_resource_keys=required_resource_keys)
+        def _resource_fn(init_context):
+            init_start = time.time()
+            time.sleep(0.5)
+            if name == fail_resource:
+                raise Exception('Failed to initialize {name}'.format(name=name))
+            if init_times is not None:
+                init_times[name] = (init_start, time.time())
+            called.append(('init', name))
+            yield name + ''.join(
+                getattr(init_context.resources, key) for key in sorted(required_resource_keys or [])
+            )
+            called.append(('teardown', name))
+
+        return _resource_fn
+
+    @solid(required_resource_keys={'client'})
+    def a_solid(context):
+        return context.resources.client
+
+    return PipelineDefinition(
+        name='dependent_resources_pipeline',
+        solid_defs=[a_solid],
+        mode_defs=[
+            ModeDefinition(
+                resource_defs={
+                    'client': _resource('client', {'credentials', 'connection'}),
+                    'connection': _resource('connection'),
+                    'credentials': _resource('credentials'),
+                    'unused': _resource('unused'),
+                }
+            )
+        ],
+    )
+
+
+@pytest.mark.parametrize('concurrency', ['1', '4'])
+def test_resource_dependencies(concurrency):
+    called = []
+    init_times = {}
+    result = execute_pipeline(
+        define_dependent_resources_pipeline(called, init_times=init_times),
+        tags={RESOURCE_INIT_CONCURRENCY_TAG: concurrency},
+    )
+
+    assert result.success
+
+    # required resources are initialized first, and torn down last
+    inits = [name for event, name in called if event == 'init']
+    assert set(inits[:2]) == {'connection', 'credentials'}
+    assert inits[2:] == ['client']
+    assert [name for event, name in called if event == 'teardown'] == list(reversed(inits))
+
+    # overlapping init times are what tell the resources were initialized at the same time
+    starts, ends = zip(init_times['connection'], init_times['credentials'])
+    client_start, _ = init_times['client']
+    assert client_start >= max(ends)
+    if concurrency == '1':
+        assert min(ends) <= max(starts)
+    else:
+        # resources that do not depend on each other are initialized at the same time
+        assert max(starts) < min(ends)
+
+    assert result.result_for_solid('a_solid').output_value() == 'clientconnectioncredentials'
+
+
+@pytest.mark.parametrize('concurrency', ['1', '4'])
+def test_resource_dependency_failure(concurrency):
+    called = []
+    result = execute_pipeline(
+        define_dependent_resources_pipeline(called, fail_resource='credentials'),
+        tags={RESOURCE_INIT_CONCURRENCY_TAG: concurrency},
+        raise_on_error=False,
+    )
+
+    assert not result.success
+    assert any(
+        event.event_type_value == DagsterEventType.PIPELINE_INIT_FAILURE.value
+        for event in result.event_list
+    )
+    # resources initialized before the failure are still torn down
+    assert ('init', 'client') not in called
+    inits = [name for event, name in called if event == 'init']
+    assert [name for event, name in called if event == 'teardown'] == list(reversed(inits))
+
+
+def test_invalid_resource_dependencies():
+    @resource(required_resource_keys={'b'})
+    def resource_a(_):
+        return 'A'
+
+    @resource(required_resource_keys={'a'})
+    def resource_b(_):
+        return 'B'
+
+    @solid
+    def a_solid(_):
+        pass
+
+    with pytest.raises(DagsterInvalidDefinitionError, match='is not provided by mode'):
+        PipelineDefinition(
+            solid_defs=[a_solid], mode_defs=[ModeDefinition(resource_defs={'a': resource_a})],
+        )
+
+    with pytest.raises(DagsterInvalidDefinitionError, match='in a cycle'):
+        PipelineDefinition(
+            solid_defs=[a_solid],
+            mode_defs=[ModeDefinition(resource_defs={'a': resource_a, 'b': resource_b})],
+        )
+
+
+def test_invalid_resource_init_concurrency_tag():
+    for tag_value in ['0', 'many']:
+        with pytest.raises(DagsterInvariantViolationError):
+            execute_pipeline(
+                define_dependent_resources_pipeline([]),
+                tags={RESOURCE_INIT_CONCURRENCY_TAG: tag_value},
+            )
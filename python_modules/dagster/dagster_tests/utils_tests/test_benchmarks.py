@@ -0,0 +1,94 @@
+from contextlib import contextmanager
+
+from dagster import execute_pipeline
+from dagster.utils.test.benchmarks import (
+    Benchmark,
+    SkipBenchmark,
+    compare_results,
+    load_benchmarks,
+    run_benchmarks,
+)
+from dagster.utils.test.synthetic_pipelines import (
+    define_synthetic_pipeline,
+    synthetic_environment_dict,
+)
+
+
+def test_synthetic_pipeline():
+    pipeline_def = define_synthetic_pipeline(width=3, depth=4, fan_in=2)
+    assert len(pipeline_def.solids) == 12
+    assert len(pipeline_def.solid_named('solid_3_0').input_dict) == 2
+
+    result = execute_pipeline(
+        pipeline_def, environment_dict=synthetic_environment_dict(3, 4, value=2)
+    )
+    assert result.success
+    # each solid of a layer sums two outputs of the layer before it
+    assert result.result_for_solid('solid_3_0').output_value() == 2 * 2 ** 3
+
+
+def test_run_benchmarks():
+    calls = []
+
+    def _timed(value):
+        calls.append(value)
+        yield lambda: calls.append('timed')
+        calls.append('teardown')
+
+    def _skipped():
+        raise SkipBenchmark('not available')
+        yield  # pylint: disable=unreachable
+
+    benchmarks = [
+        Benchmark('timed', contextmanager(_timed), [dict(value=1), dict(value=2)]),
+        Benchmark('skipped', contextmanager(_skipped), [{}]),
+    ]
+
+    results = run_benchmarks(benchmarks, repeats=2)
+    assert list(results['results'].keys()) == ['timed[value=1]', 'timed[value=2]']
+    assert len(results['results']['timed[value=1]']['timings']) == 2
+    # a warm up call, then the timed calls
+    assert calls == [
+        1,
+        'timed',
+        'timed',
+        'timed',
+        'teardown',
+        2,
+        'timed',
+        'timed',
+        'timed',
+        'teardown',
+    ]
+
+    assert list(run_benchmarks(benchmarks, quick=True)['results'].keys()) == ['timed[value=1]']
+    assert list(run_benchmarks(benchmarks, filters=['2'])['results'].keys()) == ['timed[value=2]']
+
+
+def test_compare_results():
+    baseline = {'results': {'a': {'median': 1.0}, 'b': {'median': 1.0}, 'c': {'median': 1.0}}}
+    current = {'results': {'a': {'median': 1.1}, 'b': {'median': 1.5}, 'd': {'median': 1.0}}}
+
+    comparisons = compare_results(baseline, current, threshold=0.2)
+    assert [(c.case_name, c.regressed) for c in comparisons] == [('a', False), ('b', True)]
+
+
+def test_quick_benchmarks():
+    benchmarks = load_benchmarks(
+        ['dagster_tests.benchmarks.core', 'dagster_tests.benchmarks.storage']
+    )
+    # pipelines executed in subprocesses take seconds, so only the others are run
+    results = run_benchmarks(
+        benchmarks,
+        quick=True,
+        filters=['execution_plan_build', 'environment_config_build', 'serdes', 'event_log'],
+    )
+    assert {case_name.split('[')[0] for case_name in results['results']} == {
+        'execution_plan_build',
+        'environment_config_build',
+        'environment_config_build_memoized',
+        'serdes_pipeline_snapshot',
+        'serdes_event_records',
+        'event_log_write',
+        'event_log_read',
+    }
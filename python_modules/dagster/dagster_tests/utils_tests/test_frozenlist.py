@@ -0,0 +1,25 @@
+import copy
+import pickle
+
+import pytest
+
+from dagster.utils import frozenlist
+
+
+def test_frozenlist():
+    test_list = frozenlist([1, 2, 3])
+    with pytest.raises(RuntimeError):
+        test_list.append(4)
+
+
+def test_frozenlist_copy_and_pickle():
+    test_list = frozenlist([1, [2, 3]])
+
+    copied = copy.deepcopy(test_list)
+    assert copied == test_list
+    assert isinstance(copied, frozenlist)
+    assert copied[1] is not test_list[1]
+
+    unpickled = pickle.loads(pickle.dumps(test_list))
+    assert unpickled == test_list
+    assert isinstance(unpickled, frozenlist)
@@ -0,0 +1,84 @@
+import os
+import threading
+
+from dagster.seven import TemporaryDirectory
+from dagster.utils.tracing import (
+    Tracer,
+    active_tracer,
+    get_active_tracer,
+    read_chrome_trace,
+    trace_span,
+    write_chrome_trace,
+)
+
+
+def test_trace_span_without_tracer():
+    assert get_active_tracer() is None
+    with trace_span('noop', 'test') as span:
+        assert span is not None
+
+
+def test_trace_span():
+    tracer = Tracer()
+    with active_tracer(tracer):
+        assert get_active_tracer() is tracer
+        with trace_span('outer', 'test', key='value'):
+            with trace_span('inner', 'test'):
+                pass
+    assert get_active_tracer() is None
+
+    inner, outer = tracer.spans
+    assert (inner.name, outer.name) == ('inner', 'outer')
+    assert outer.category == 'test'
+    assert outer.args == {'key': 'value'}
+    assert outer.pid == os.getpid()
+    assert outer.start <= inner.start
+    assert outer.duration >= inner.duration >= 0
+
+
+def test_active_tracer_is_thread_local():
+    tracer = Tracer()
+    with active_tracer(tracer):
+        thread = threading.Thread(target=lambda: trace_span('other_thread', 'test').__enter__())
+        thread.start()
+        thread.join()
+        with trace_span('this_thread', 'test'):
+            pass
+
+    assert [span.name for span in tracer.spans] == ['this_thread']
+
+
+def test_trace_iterator():
+    tracer = Tracer()
+
+    def _gen():
+        for i in range(3):
+            with trace_span('produce', 'test'):
+                pass
+            yield i
+
+    for _ in tracer.trace_iterator(_gen()):
+        # the consumer of the iterator is not traced
+        assert get_active_tracer() is None
+        with trace_span('consume', 'test'):
+            pass
+
+    assert [span.name for span in tracer.spans] == ['produce'] * 3
+
+
+def test_write_chrome_trace():
+    tracer = Tracer()
+    with active_tracer(tracer):
+        with trace_span('span', 'test', key='value'):
+            pass
+
+    with TemporaryDirectory() as temp_dir:
+        trace_path = os.path.join(temp_dir, 'trace.json')
+        write_chrome_trace(trace_path, tracer.chrome_trace_events())
+        (event,) = read_chrome_trace(trace_path)
+
+    assert event['name'] == 'span'
+    assert event['cat'] == 'test'
+    assert event['ph'] == 'X'
+    assert event['args'] == {'key': 'value'}
+    assert event['dur'] >= 0
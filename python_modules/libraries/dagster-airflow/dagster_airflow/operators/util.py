@@ -3,15 +3,14 @@ import os
 
 import dateutil.parser
 from airflow.exceptions import AirflowException, AirflowSkipException
-from dagster_graphql.client.mutations import execute_execute_plan_mutation
-from dagster_graphql.client.query import EXECUTE_PLAN_MUTATION
-from dagster_graphql.client.util import construct_variables
 
-from dagster import DagsterEventType, check, seven
+from dagster import DagsterEventType, check
 from dagster.core.definitions.pipeline import ExecutionSelector
 from dagster.core.events import DagsterEvent
+from dagster.core.execution.worker import execute_run_steps
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.pipeline_run import PipelineRunStatus
+from dagster.serdes import deserialize_json_to_dagster_namedtuple
 
 
 def check_events_for_failures(events):
@@ -112,16 +111,17 @@ def invoke_steps_within_python_operator(
 
     run_id = dag_run.run_id
 
-    variables = construct_variables(mode, environment_dict, pipeline_name, run_id, step_keys)
-    variables = add_airflow_tags(variables, ts)
-
     logging.info(
-        'Executing GraphQL query: {query}\n'.format(query=EXECUTE_PLAN_MUTATION)
-        + 'with variables:\n'
-        + seven.json.dumps(variables, indent=2)
+        'Executing steps {step_keys} of pipeline {pipeline_name}'.format(
+            step_keys=', '.join(step_keys), pipeline_name=pipeline_name
+        )
+    )
+    # without an instance to record the run on, the run and its events only live for the
+    # duration of the task
+    instance = (
+        DagsterInstance.from_ref(instance_ref) if instance_ref else DagsterInstance.ephemeral()
     )
-    instance = DagsterInstance.from_ref(instance_ref) if instance_ref else None
-    if instance:
+    try:
         instance.get_or_create_run(
             pipeline_name=pipeline_name,
             run_id=run_id,
@@ -129,13 +129,19 @@ def invoke_steps_within_python_operator(
             mode=mode,
             selector=ExecutionSelector(pipeline_name),
             step_keys_to_execute=None,
-            tags=None,
+            tags=None if instance_ref else airflow_tags_for_ts(ts),
             status=PipelineRunStatus.MANAGED,
             pipeline_snapshot=pipeline_snapshot,
             execution_plan_snapshot=execution_plan_snapshot,
         )
 
-    events = execute_execute_plan_mutation(handle, variables, instance_ref=instance_ref,)
+        events = [
+            deserialize_json_to_dagster_namedtuple(serialized_event)
+            for serialized_event in execute_run_steps(handle, instance, run_id, step_keys)
+        ]
+    finally:
+        instance.dispose()
+
     check_events_for_failures(events)
     check_events_for_skips(events)
     return events
@@ -147,13 +153,21 @@ def add_airflow_tags(variables, ts):
 
     # If an Airflow timestamp string is provided, stash it (and the converted version) in tags
     if ts is not None:
-        tags = [
-            {'key': 'airflow_ts', 'value': ts},
-            {
-                'key': 'execution_epoch_time',
-                'value': '%f' % convert_airflow_datestr_to_epoch_ts(ts),
-            },
+        variables['executionParams']['executionMetadata']['tags'] = [
+            {'key': key, 'value': value} for key, value in sorted(airflow_tags_for_ts(ts).items())
         ]
-        variables['executionParams']['executionMetadata']['tags'] = tags
 
     return variables
+
+
+def airflow_tags_for_ts(ts):
+    '''The tags that record the Airflow timestamp of the task that executes a run.'''
+    check.opt_str_param(ts, 'ts')
+
+    if ts is None:
+        return {}
+
+    return {
+        'airflow_ts': ts,
+        'execution_epoch_time': '%f' % convert_airflow_datestr_to_epoch_ts(ts),
+    }
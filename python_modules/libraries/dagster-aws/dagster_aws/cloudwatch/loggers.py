@@ -1,9 +1,13 @@
 import datetime
 import logging
+import threading
+import time
 
 import boto3
+from six.moves import queue
 
 from dagster import Field, StringSource, check, logger, seven
+from dagster.core.events import DagsterEventType
 from dagster.core.log_manager import coerce_valid_log_level
 
 # The maximum batch size is 1,048,576 bytes, and this size is calculated as the sum of all event
@@ -11,6 +15,30 @@ from dagster.core.log_manager import coerce_valid_log_level
 MAXIMUM_BATCH_SIZE = 1048576
 OVERHEAD = 26
 
+# The maximum number of log events in a batch
+MAXIMUM_BATCH_COUNT = 10000
+
+# How long records wait in the buffer for more records to batch them with
+FLUSH_INTERVAL_SECONDS = 1
+
+# How many times a batch is sent again when CloudWatch rejects it for a stale sequence token or
+# is unavailable, before its records are dropped
+MAXIMUM_RETRIES = 3
+
+# The handler ships everything buffered and stops its thread as soon as it logs one of these,
+# before the run exits
+PIPELINE_END_EVENT_TYPES = {
+    DagsterEventType.PIPELINE_SUCCESS,
+    DagsterEventType.PIPELINE_FAILURE,
+    DagsterEventType.PIPELINE_INIT_FAILURE,
+}
+
+# Put in the buffer to have the shipper send the records before it without waiting for more
+_FLUSH = object()
+
+# Put in the buffer to have the shipper send the records before it and exit
+_STOP = object()
+
 EPOCH = datetime.datetime(1970, 1, 1)
 
 # For real
@@ -23,6 +51,17 @@ def millisecond_timestamp(dt):
 
 
 class CloudwatchLogsHandler(logging.Handler):
+    '''Ships log records to a CloudWatch log stream.
+
+    Records are buffered, and a background thread sends them to CloudWatch in batches of up to
+    MAXIMUM_BATCH_COUNT records and MAXIMUM_BATCH_SIZE bytes, at least every ``flush_interval``
+    seconds. Flushing the handler blocks until the buffered records are sent.
+
+    Logging the end of a pipeline or closing the handler also blocks until the buffered records are
+    sent, and stops the thread, since nothing closes the handlers of the loggers of a run. The
+    records logged after that, e.g. by the teardown of resources, are sent as they are logged.
+    '''
+
     def __init__(
         self,
         log_group_name,
@@ -30,6 +69,8 @@ class CloudwatchLogsHandler(logging.Handler):
         aws_region=None,
         aws_secret_access_key=None,
         aws_access_key_id=None,
+        flush_interval=FLUSH_INTERVAL_SECONDS,
+        log_level=logging.NOTSET,
     ):
         self.client = boto3.client(
             'logs',
@@ -42,6 +83,11 @@ class CloudwatchLogsHandler(logging.Handler):
         self.log_stream_name = check.str_param(log_stream_name, 'log_stream_name')
         self.overhead = OVERHEAD
         self.maximum_batch_size = MAXIMUM_BATCH_SIZE
+        self.maximum_batch_count = MAXIMUM_BATCH_COUNT
+        self.flush_interval = check.numeric_param(flush_interval, 'flush_interval')
+        # Records below the level are not shipped, but the handler sees them so that it can flush on
+        # the end of the pipeline, which is logged at debug level
+        self.log_level = check.int_param(log_level, 'log_level')
         self.sequence_token = None
 
         self.check_log_group()
@@ -49,6 +95,14 @@ class CloudwatchLogsHandler(logging.Handler):
 
         super(CloudwatchLogsHandler, self).__init__()
 
+        self._buffer = queue.Queue()
+        # guards _shipping, so that no record is buffered after the shipper was told to stop
+        self._lock = threading.Lock()
+        self._shipping = True
+        self._shipper = threading.Thread(target=self._ship, name='cloudwatch-log-shipper')
+        self._shipper.daemon = True
+        self._shipper.start()
+
     def check_log_group(self):
         # Check that log group exists
         log_group_exists = False
@@ -113,62 +167,153 @@ class CloudwatchLogsHandler(logging.Handler):
         logging.exception(str(exc))
 
     def emit(self, record):
-        self._emit(record, retry=False)
+        if record.levelno >= self.log_level:
+            self._buffer_record(record)
 
-    def retry(self, record):
-        self._emit(record, retry=True)
+        dagster_event = record.dagster_meta.get('dagster_event')
+        if dagster_event is not None and dagster_event.event_type in PIPELINE_END_EVENT_TYPES:
+            self._stop_shipper()
 
-    def _emit(self, record, retry=False):
-        message = seven.json.dumps(record.__dict__)
-        timestamp = millisecond_timestamp(
-            datetime.datetime.strptime(record.dagster_meta['log_timestamp'], '%Y-%m-%dT%H:%M:%S.%f')
-        )
+    def _buffer_record(self, record):
+        try:
+            log_event = {
+                'timestamp': millisecond_timestamp(
+                    datetime.datetime.strptime(
+                        record.dagster_meta['log_timestamp'], '%Y-%m-%dT%H:%M:%S.%f'
+                    )
+                ),
+                'message': seven.json.dumps(record.__dict__),
+            }
+        except Exception as exc:  # pylint: disable=broad-except
+            self.log_error(record, exc)
+            return
+
+        with self._lock:
+            if self._shipping:
+                self._buffer.put(log_event)
+                return
+
+        self._put_log_events([log_event])
+
+    def _stop_shipper(self):
+        with self._lock:
+            if not self._shipping:
+                return
+            self._shipping = False
+            self._buffer.put(_STOP)
+
+        self._shipper.join()
+
+    def flush(self):
+        '''Block until all the records logged so far have been sent to CloudWatch.'''
+        with self._lock:
+            if not self._shipping:
+                return
+            self._buffer.put(_FLUSH)
+
+        self._buffer.join()
+
+    def close(self):
+        self._stop_shipper()
+        super(CloudwatchLogsHandler, self).close()
+
+    def _ship(self):
+        while True:
+            log_events, batch_size, deadline = [], 0, None
+
+            while len(log_events) < self.maximum_batch_count:
+                try:
+                    log_event = self._buffer.get(
+                        timeout=None if deadline is None else max(deadline - time.time(), 0)
+                    )
+                except queue.Empty:
+                    break
+
+                if log_event is _STOP:
+                    self._ship_batch(log_events)
+                    self._buffer.task_done()
+                    return
+
+                if log_event is _FLUSH:
+                    self._buffer.task_done()
+                    break
+
+                if deadline is None:
+                    deadline = time.time() + self.flush_interval
+
+                event_size = len(log_event['message'].encode('utf-8')) + self.overhead
+                if batch_size + event_size > self.maximum_batch_size:
+                    self._ship_batch(log_events)
+                    log_events, batch_size = [], 0
+
+                log_events.append(log_event)
+                batch_size += event_size
+
+            self._ship_batch(log_events)
+
+    def _ship_batch(self, log_events):
+        if log_events:
+            self._put_log_events(log_events)
+
+        for _ in log_events:
+            self._buffer.task_done()
+
+    def _put_log_events(self, log_events):
+        # CloudWatch requires the events of a batch to be in chronological order
         params = {
             'logGroupName': self.log_group_name,
             'logStreamName': self.log_stream_name,
-            'logEvents': [{'timestamp': timestamp, 'message': message}],
+            'logEvents': sorted(log_events, key=lambda log_event: log_event['timestamp']),
         }
-        if self.sequence_token is not None:
-            params['sequenceToken'] = self.sequence_token
 
-        try:
-            res = self.client.put_log_events(**params)
-            self.sequence_token = res['nextSequenceToken']
-            log_events_rejected = res.get('rejectedLogEventsInfo')
-            if log_events_rejected is not None:
-                logging.error('Cloudwatch logger: log events rejected: {res}'.format(res=res))
-        except self.client.exceptions.InvalidSequenceTokenException as exc:
-            if not retry:
-                self.check_log_stream()
-                self.retry(record)
-            else:
-                self.log_error(record, exc)
-        except self.client.exceptions.DataAlreadyAcceptedException as exc:
-            logging.error('Cloudwatch logger: log events already accepted: {res}'.format(res=res))
-        except self.client.exceptions.InvalidParameterException as exc:
-            logging.error(
-                'Cloudwatch logger: Invalid parameter exception while logging: {res}'.format(
-                    res=res
+        for attempt in range(MAXIMUM_RETRIES + 1):
+            if self.sequence_token is not None:
+                params['sequenceToken'] = self.sequence_token
+
+            try:
+                res = self.client.put_log_events(**params)
+                self.sequence_token = res['nextSequenceToken']
+                log_events_rejected = res.get('rejectedLogEventsInfo')
+                if log_events_rejected is not None:
+                    logging.error('Cloudwatch logger: log events rejected: {res}'.format(res=res))
+                return
+            except self.client.exceptions.InvalidSequenceTokenException as exc:
+                # another writer to the log stream advanced the sequence token
+                self.sequence_token = exc.response.get('expectedSequenceToken')
+                error = exc
+            except self.client.exceptions.ServiceUnavailableException as exc:
+                time.sleep(0.1 * 2 ** attempt)
+                error = exc
+            except self.client.exceptions.DataAlreadyAcceptedException as exc:
+                logging.error(
+                    'Cloudwatch logger: log events already accepted: {exc}'.format(exc=exc)
                 )
-            )
-        except self.client.exceptions.ResourceNotFoundException as exc:
-            logging.error(
-                'Cloudwatch logger: Resource not found. Check that the log stream or log group '
-                'was not deleted: {res}'.format(res=res)
-            )
-        except self.client.exceptions.ServiceUnavailableException as exc:
-            if not retry:
-                self.retry(record)
-            else:
-                logging.error('Cloudwatch logger: Service unavailable: {res}'.format(res=res))
-        except self.client.exceptions.ServiceUnavailableException as exc:
-            if not retry:
-                self.retry(record)
-            else:
+                return
+            except self.client.exceptions.InvalidParameterException as exc:
+                logging.error(
+                    'Cloudwatch logger: Invalid parameter exception while logging: {exc}'.format(
+                        exc=exc
+                    )
+                )
+                return
+            except self.client.exceptions.ResourceNotFoundException as exc:
+                logging.error(
+                    'Cloudwatch logger: Resource not found. Check that the log stream or log group '
+                    'was not deleted: {exc}'.format(exc=exc)
+                )
+                return
+            except Exception as exc:  # pylint: disable=broad-except
                 logging.error(
-                    'Cloudwatch logger: Unrecognized client. Check your AWS access key id and '
-                    'secret key: {res}'.format(res=res)
+                    'Cloudwatch logger: Error while logging. Check your AWS access key id and '
+                    'secret key: {exc}'.format(exc=exc)
                 )
+                return
+
+        logging.error(
+            'Cloudwatch logger: Dropped {count} log events after {retries} retries: {error}'.format(
+                count=len(log_events), retries=MAXIMUM_RETRIES, error=error
+            )
+        )
 
 
 @logger(
@@ -226,7 +371,8 @@ def cloudwatch_logger(init_context):
     name = init_context.logger_config['name']
 
     klass = logging.getLoggerClass()
-    logger_ = klass(name, level=level)
+    # the handler filters by the level
+    logger_ = klass(name, level=logging.DEBUG)
 
     logger_.addHandler(
         CloudwatchLogsHandler(
@@ -235,6 +381,7 @@ def cloudwatch_logger(init_context):
             aws_region=init_context.logger_config.get('aws_region'),
             aws_secret_access_key=init_context.logger_config.get('aws_secret_access_key'),
             aws_access_key_id=init_context.logger_config.get('aws_access_key_id'),
+            log_level=level,
         )
     )
     return logger_
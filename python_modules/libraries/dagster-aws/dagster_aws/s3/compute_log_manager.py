@@ -1,19 +1,29 @@
 import os
+import threading
+from collections import namedtuple
 from contextlib import contextmanager
 
 from dagster import Field, check, seven
 from dagster.core.storage.compute_log_manager import (
+    MAX_BYTES_CHUNK_READ,
     MAX_BYTES_FILE_READ,
     ComputeIOType,
     ComputeLogFileData,
     ComputeLogManager,
 )
 from dagster.core.storage.local_compute_log_manager import IO_TYPE_EXTENSION, LocalComputeLogManager
+from dagster.core.storage.local_file_cache import LocalFileCache
 from dagster.serdes import ConfigurableClass, ConfigurableClassData
-from dagster.utils import ensure_dir, ensure_file
+from dagster.utils import ensure_file
 
 from .utils import create_s3_session
 
+# Reads of logs in S3 fetch, and cache, blocks of this many bytes
+BLOCK_SIZE = MAX_BYTES_CHUNK_READ
+
+# The most bytes of blocks of logs in S3 that are cached on local disk
+MAX_BYTES_BLOCK_CACHE = 64 * BLOCK_SIZE
+
 
 class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
     '''Logs solid compute function stdout and stderr to S3.
@@ -30,27 +40,43 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
             bucket: "mycorp-dagster-compute-logs"
             local_dir: "/tmp/cool"
             prefix: "dagster-test-"
+            upload_interval: 30
+
+    While a step executes, the logs written since the last upload are uploaded every
+    ``upload_interval`` seconds as separate chunk objects. When the step finishes, the complete
+    logs are uploaded and the chunks deleted. Other hosts read logs from S3 with ranged GETs of the
+    bytes they need, and cache the blocks they fetch in the ``block_cache`` directory of
+    ``local_dir``, where they are reused across runs and processes.
 
     Args:
         bucket (str): The name of the s3 bucket to which to log.
         local_dir (Optional[str]): Path to the local directory in which to stage logs. Default:
             ``dagster.seven.get_system_temp_directory()``.
         prefix (Optional[str]): Prefix for the log file keys.
+        upload_interval (Optional[int]): How often, in seconds, to upload the logs of executing
+            steps. If not set, logs are only uploaded when steps finish.
         inst_data (Optional[ConfigurableClassData]): Serializable representation of the compute
             log manager when newed up from config.
     '''
 
-    def __init__(self, bucket, local_dir=None, inst_data=None, prefix='dagster'):
+    def __init__(
+        self, bucket, local_dir=None, inst_data=None, prefix='dagster', upload_interval=None
+    ):
         self._s3_session = create_s3_session()
         self._s3_bucket = check.str_param(bucket, 'bucket')
         self._s3_prefix = check.str_param(prefix, 'prefix')
+        self._upload_interval = check.opt_int_param(upload_interval, 'upload_interval')
         self._download_urls = {}
+        self._uploaders = {}
 
         # proxy calls to local compute log manager (for subscriptions, etc)
         if not local_dir:
             local_dir = seven.get_system_temp_directory()
 
         self.local_manager = LocalComputeLogManager(local_dir)
+        self._block_cache = LocalFileCache(
+            os.path.join(local_dir, 'block_cache'), max_bytes=MAX_BYTES_BLOCK_CACHE
+        )
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
 
     @contextmanager
@@ -71,6 +97,7 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
             'bucket': str,
             'local_dir': Field(str, is_required=False),
             'prefix': Field(str, is_required=False, default_value='dagster'),
+            'upload_interval': Field(int, is_required=False),
         }
 
     @staticmethod
@@ -82,12 +109,23 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
 
     def on_watch_start(self, pipeline_run, step_key):
         self.local_manager.on_watch_start(pipeline_run, step_key)
+        if self._upload_interval:
+            key = self.local_manager.get_key(pipeline_run, step_key)
+            uploader = _ChunkUploader(self, pipeline_run.run_id, key, self._upload_interval)
+            self._uploaders[(pipeline_run.run_id, key)] = uploader
+            uploader.start()
 
     def on_watch_finish(self, pipeline_run, step_key):
         self.local_manager.on_watch_finish(pipeline_run, step_key)
         key = self.local_manager.get_key(pipeline_run, step_key)
+        uploader = self._uploaders.pop((pipeline_run.run_id, key), None)
+        if uploader:
+            uploader.stop()
         self._upload_from_local(pipeline_run.run_id, key, ComputeIOType.STDOUT)
         self._upload_from_local(pipeline_run.run_id, key, ComputeIOType.STDERR)
+        if uploader:
+            self._delete_chunks(pipeline_run.run_id, key, ComputeIOType.STDOUT)
+            self._delete_chunks(pipeline_run.run_id, key, ComputeIOType.STDERR)
 
     def is_watch_completed(self, run_id, key):
         return self.local_manager.is_watch_completed(run_id, key)
@@ -95,6 +133,9 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
     def download_url(self, run_id, key, io_type):
         if not self.is_watch_completed(run_id, key):
             return self.local_manager.download_url(run_id, key, io_type)
+        return self._s3_download_url(run_id, key, io_type)
+
+    def _s3_download_url(self, run_id, key, io_type):
         key = self._bucket_key(run_id, key, io_type)
         if key in self._download_urls:
             return self._download_urls[key]
@@ -105,23 +146,30 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
         return url
 
     def read_logs_file(self, run_id, key, io_type, cursor=0, max_bytes=MAX_BYTES_FILE_READ):
-        if self._should_download(run_id, key, io_type):
-            self._download_to_local(run_id, key, io_type)
+        if not os.path.exists(self.get_local_path(run_id, key, io_type)):
+            # the logs were written on another host
+            segments = self._remote_segments(run_id, key, io_type)
+            if segments:
+                try:
+                    return self._read_remote_logs(run_id, key, io_type, segments, cursor, max_bytes)
+                except self._s3_session.exceptions.NoSuchKey:
+                    # the step finished, and its chunks were deleted, since they were listed
+                    segments = self._remote_segments(run_id, key, io_type)
+                    return self._read_remote_logs(run_id, key, io_type, segments, cursor, max_bytes)
+
         data = self.local_manager.read_logs_file(run_id, key, io_type, cursor, max_bytes)
         return self._from_local_file_data(run_id, key, io_type, data)
 
+    def delete_logs(self, run_id):
+        check.str_param(run_id, 'run_id')
+        self.local_manager.delete_logs(run_id)
+        self._delete_objects(
+            self._list_objects('/'.join([self._s3_prefix, 'storage', run_id, 'compute_logs', '']))
+        )
+
     def on_subscribe(self, subscription):
         self.local_manager.on_subscribe(subscription)
 
-    def _should_download(self, run_id, key, io_type):
-        local_path = self.get_local_path(run_id, key, io_type)
-        if os.path.exists(local_path):
-            return False
-        s3_objects = self._s3_session.list_objects(
-            Bucket=self._s3_bucket, Prefix=self._bucket_key(run_id, key, io_type)
-        )
-        return len(s3_objects) > 0
-
     def _from_local_file_data(self, run_id, key, io_type, local_file_data):
         is_complete = self.is_watch_completed(run_id, key)
         path = (
@@ -138,6 +186,86 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
             self.download_url(run_id, key, io_type),
         )
 
+    def _remote_segments(self, run_id, key, io_type):
+        '''The S3 objects holding the logs, in order. The chunks uploaded while the step executes
+        if there are any, otherwise the complete logs uploaded when it finished.
+
+        Returns:
+            List[_LogSegment]
+        '''
+        chunks_prefix = self._chunks_prefix(run_id, key, io_type)
+        chunks = sorted(self._list_objects(chunks_prefix), key=lambda obj: obj['Key'])
+        if chunks:
+            return [
+                _LogSegment(
+                    obj['Key'], obj['ETag'], int(obj['Key'][len(chunks_prefix) :]), obj['Size']
+                )
+                for obj in chunks
+            ]
+
+        bucket_key = self._bucket_key(run_id, key, io_type)
+        for obj in self._list_objects(bucket_key):
+            if obj['Key'] == bucket_key:
+                return [_LogSegment(bucket_key, obj['ETag'], 0, obj['Size'])]
+
+        return []
+
+    def _read_remote_logs(self, run_id, key, io_type, segments, cursor, max_bytes):
+        size = segments[-1].offset + segments[-1].size
+        end = min(cursor + max_bytes, size)
+
+        data = b''
+        for segment in segments:
+            if segment.offset + segment.size <= cursor or segment.offset >= end:
+                continue
+            data += self._read_segment(
+                segment, max(cursor - segment.offset, 0), min(end - segment.offset, segment.size)
+            )
+
+        is_complete = segments[0].s3_key == self._bucket_key(run_id, key, io_type)
+        return ComputeLogFileData(
+            's3://{}/{}'.format(self._s3_bucket, self._bucket_key(run_id, key, io_type)),
+            data.decode('utf-8'),
+            cursor + len(data),
+            size,
+            self._s3_download_url(run_id, key, io_type) if is_complete else None,
+        )
+
+    def _read_segment(self, segment, start, end):
+        '''Read the bytes [start, end) of an object, a block at a time.'''
+        data = b''
+        for block in range(start // BLOCK_SIZE, (end - 1) // BLOCK_SIZE + 1):
+            block_data = self._read_block(segment, block)
+            offset = block * BLOCK_SIZE
+            data += block_data[max(start - offset, 0) : end - offset]
+
+        return data
+
+    def _read_block(self, segment, block):
+        '''Read a block of an object through the block cache.'''
+        block_start = block * BLOCK_SIZE
+        block_end = min(block_start + BLOCK_SIZE, segment.size)
+
+        def _fetch_block(path):
+            block_data = self._s3_session.get_object(
+                Bucket=self._s3_bucket,
+                Key=segment.s3_key,
+                Range='bytes={}-{}'.format(block_start, block_end - 1),
+            )['Body'].read()
+            with open(path, 'wb') as f:
+                f.write(block_data)
+
+        with seven.TemporaryDirectory() as temp_dir:
+            block_path = os.path.join(temp_dir, 'block')
+            # objects are immutable once uploaded, and the etag changes if one is uploaded again
+            self._block_cache.copy_to(
+                ['s3', self._s3_bucket, segment.s3_key, segment.etag, str(block)],
+                _fetch_block,
+                block_path,
+            )
+            with open(block_path, 'rb') as f:
+                return f.read()
+
     def _upload_from_local(self, run_id, key, io_type):
         path = self.get_local_path(run_id, key, io_type)
         ensure_file(path)
@@ -145,14 +273,46 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
         with open(path, 'rb') as data:
             self._s3_session.upload_fileobj(data, self._s3_bucket, key)
 
-    def _download_to_local(self, run_id, key, io_type):
+    def _upload_chunk(self, run_id, key, io_type, offset):
+        '''Upload the logs written since offset as a chunk, and return the offset of their end.'''
         path = self.get_local_path(run_id, key, io_type)
-        ensure_dir(os.path.dirname(path))
-        with open(path, 'wb') as fileobj:
-            self._s3_session.download_fileobj(
-                self._s3_bucket, self._bucket_key(run_id, key, io_type), fileobj
+        if not os.path.exists(path):
+            return offset
+
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+
+        if data:
+            self._s3_session.put_object(
+                Bucket=self._s3_bucket,
+                Key=self._chunks_prefix(run_id, key, io_type) + '{:020d}'.format(offset),
+                Body=data,
+            )
+        return offset + len(data)
+
+    def _delete_chunks(self, run_id, key, io_type):
+        self._delete_objects(self._list_objects(self._chunks_prefix(run_id, key, io_type)))
+
+    def _delete_objects(self, objects):
+        # delete_objects takes at most 1000 keys
+        for i in range(0, len(objects), 1000):
+            self._s3_session.delete_objects(
+                Bucket=self._s3_bucket,
+                Delete={'Objects': [{'Key': obj['Key']} for obj in objects[i : i + 1000]]},
             )
 
+    def _list_objects(self, prefix):
+        paginator = self._s3_session.get_paginator('list_objects_v2')
+        return [
+            obj
+            for page in paginator.paginate(Bucket=self._s3_bucket, Prefix=prefix)
+            for obj in page.get('Contents', [])
+        ]
+
+    def _chunks_prefix(self, run_id, key, io_type):
+        return self._bucket_key(run_id, key, io_type) + '.chunks/'
+
     def _bucket_key(self, run_id, key, io_type):
         check.inst_param(io_type, 'io_type', ComputeIOType)
         extension = IO_TYPE_EXTENSION[io_type]
@@ -164,3 +324,34 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
             '{}.{}'.format(key, extension),
         ]
         return '/'.join(paths)  # s3 path delimiter
+
+
+class _LogSegment(namedtuple('_LogSegment', 's3_key etag offset size')):
+    '''An S3 object holding the bytes [offset, offset + size) of a log file.'''
+
+
+class _ChunkUploader(threading.Thread):
+    '''Periodically uploads the logs of an executing step written since its last upload.'''
+
+    def __init__(self, manager, run_id, key, interval):
+        super(_ChunkUploader, self).__init__(name='s3-compute-log-uploader')
+        self.daemon = True
+        self._manager = manager
+        self._run_id = run_id
+        self._key = key
+        self._interval = interval
+        self._offsets = {io_type: 0 for io_type in ComputeIOType}
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self._interval):
+            for io_type in ComputeIOType:
+                self._offsets[
+                    io_type
+                ] = self._manager._upload_chunk(  # pylint: disable=protected-access
+                    self._run_id, self._key, io_type, self._offsets[io_type]
+                )
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
@@ -9,6 +9,7 @@ from dagster.core.storage.file_manager import (
     TempfileManager,
     check_file_like_obj,
 )
+from dagster.core.storage.local_file_cache import LocalFileCache
 
 
 @usable_as_dagster_type
@@ -35,10 +36,13 @@ class S3FileHandle(FileHandle):
 
 
 class S3FileManager(FileManager):
-    def __init__(self, s3_session, s3_bucket, s3_base_key):
+    def __init__(self, s3_session, s3_bucket, s3_base_key, local_file_cache=None):
         self._s3_session = s3_session
         self._s3_bucket = check.str_param(s3_bucket, 's3_bucket')
         self._s3_base_key = check.str_param(s3_base_key, 's3_base_key')
+        self._local_file_cache = check.opt_inst_param(
+            local_file_cache, 'local_file_cache', LocalFileCache
+        )
         self._local_handle_cache = {}
         self._temp_file_manager = TempfileManager()
 
@@ -51,13 +55,27 @@ class S3FileManager(FileManager):
             # instigate download
             temp_file_obj = self._temp_file_manager.tempfile()
             temp_name = temp_file_obj.name
-            self._s3_session.download_file(
-                Bucket=file_handle.s3_bucket, Key=file_handle.s3_key, Filename=temp_name
-            )
+            if self._local_file_cache:
+                etag = self._s3_session.head_object(
+                    Bucket=file_handle.s3_bucket, Key=file_handle.s3_key
+                )['ETag']
+                self._local_file_cache.copy_to(
+                    ['s3', file_handle.s3_bucket, file_handle.s3_key, etag],
+                    lambda path: self._download_file(file_handle, path),
+                    temp_name,
+                    description=file_handle.s3_path,
+                )
+            else:
+                self._download_file(file_handle, temp_name)
             self._local_handle_cache[file_handle.s3_path] = temp_name
 
         return file_handle
 
+    def _download_file(self, file_handle, path):
+        self._s3_session.download_file(
+            Bucket=file_handle.s3_bucket, Key=file_handle.s3_key, Filename=path
+        )
+
     @contextmanager
     def read(self, file_handle, mode='rb'):
         check.inst_param(file_handle, 'file_handle', S3FileHandle)
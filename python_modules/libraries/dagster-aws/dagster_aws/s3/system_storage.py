@@ -1,5 +1,6 @@
-from dagster import Field, String, SystemStorageData, system_storage
+from dagster import Field, Int, String, SystemStorageData, system_storage
 from dagster.core.storage.intermediates_manager import IntermediateStoreIntermediatesManager
+from dagster.core.storage.local_file_cache import LocalFileCache
 from dagster.core.storage.system_storage import fs_system_storage, mem_system_storage
 
 from .file_manager import S3FileManager
@@ -12,6 +13,12 @@ from .intermediate_store import S3IntermediateStore
     config={
         's3_bucket': Field(String),
         's3_prefix': Field(String, is_required=False, default_value='dagster'),
+        'file_cache_max_bytes': Field(
+            Int,
+            is_required=False,
+            description='If set, files read from S3 are cached on local disk in the instance '
+            'directory, shared between runs, up to this many bytes.',
+        ),
     },
     required_resource_keys={'s3'},
 )
@@ -47,17 +54,26 @@ def s3_system_storage(init_context):
             config:
               s3_bucket: my-cool-bucket
               s3_prefix: good/prefix-for-files-
+
+    Setting ``file_cache_max_bytes`` caches the files read through the file manager on local disk,
+    so that steps and runs on the same host reading the same files only download them once.
     '''
     s3_session = init_context.resources.s3
     s3_key = '{prefix}/storage/{run_id}/files'.format(
         prefix=init_context.system_storage_config['s3_prefix'],
         run_id=init_context.pipeline_run.run_id,
     )
+    file_cache_max_bytes = init_context.system_storage_config.get('file_cache_max_bytes')
     return SystemStorageData(
         file_manager=S3FileManager(
             s3_session=s3_session,
             s3_bucket=init_context.system_storage_config['s3_bucket'],
             s3_base_key=s3_key,
+            local_file_cache=LocalFileCache.for_run(
+                init_context.instance, init_context.pipeline_run, max_bytes=file_cache_max_bytes
+            )
+            if file_cache_max_bytes is not None
+            else None,
         ),
         intermediates_manager=IntermediateStoreIntermediatesManager(
             S3IntermediateStore(
@@ -1,12 +1,17 @@
 import datetime
 import json
+import logging
+import threading
 import time
 
+import boto3
 import pytest
 from dagster_aws.cloudwatch import cloudwatch_logger
-from dagster_aws.cloudwatch.loggers import millisecond_timestamp
+from dagster_aws.cloudwatch.loggers import CloudwatchLogsHandler, millisecond_timestamp
+from moto import mock_logs
 
 from dagster import ModeDefinition, execute_pipeline, pipeline, solid
+from dagster.core.log_manager import DagsterLogManager
 
 from .conftest import AWS_REGION, TEST_CLOUDWATCH_LOG_GROUP_NAME, TEST_CLOUDWATCH_LOG_STREAM_NAME
 
@@ -114,3 +119,181 @@ def test_cloudwatch_logging(cloudwatch_client):
         attempt_num += 1
 
     assert found_orig_message
+
+
+@mock_logs
+def test_cloudwatch_logging_ships_on_pipeline_end():
+    client = boto3.client('logs', AWS_REGION)
+    client.create_log_group(logGroupName=TEST_CLOUDWATCH_LOG_GROUP_NAME)
+    client.create_log_stream(
+        logGroupName=TEST_CLOUDWATCH_LOG_GROUP_NAME, logStreamName=TEST_CLOUDWATCH_LOG_STREAM_NAME
+    )
+
+    res = execute_pipeline(
+        hello_cloudwatch_pipeline,
+        {
+            'loggers': {
+                'cloudwatch': {
+                    'config': {
+                        'log_group_name': TEST_CLOUDWATCH_LOG_GROUP_NAME,
+                        'log_stream_name': TEST_CLOUDWATCH_LOG_STREAM_NAME,
+                        'aws_region': AWS_REGION,
+                    }
+                }
+            }
+        },
+    )
+
+    # the records buffered by the handler were shipped when the end of the pipeline was logged,
+    # even though that is below the level of the logger
+    events = client.get_log_events(
+        logGroupName=TEST_CLOUDWATCH_LOG_GROUP_NAME, logStreamName=TEST_CLOUDWATCH_LOG_STREAM_NAME,
+    )['events']
+    messages = [json.loads(event['message'])['dagster_meta'] for event in events]
+    assert [message['run_id'] for message in messages] == [res.run_id, res.run_id]
+    assert [message['orig_message'] for message in messages] == [
+        'Hello, Cloudwatch!',
+        'This is an error',
+    ]
+
+
+@mock_logs
+def test_cloudwatch_logs_handler_batches():
+    client = boto3.client('logs', AWS_REGION)
+    client.create_log_group(logGroupName=TEST_CLOUDWATCH_LOG_GROUP_NAME)
+    client.create_log_stream(
+        logGroupName=TEST_CLOUDWATCH_LOG_GROUP_NAME, logStreamName=TEST_CLOUDWATCH_LOG_STREAM_NAME
+    )
+
+    handler = CloudwatchLogsHandler(
+        TEST_CLOUDWATCH_LOG_GROUP_NAME, TEST_CLOUDWATCH_LOG_STREAM_NAME, aws_region=AWS_REGION
+    )
+    batches = []
+    put_log_events = handler.client.put_log_events
+
+    def record_batch(**params):
+        batches.append(len(params['logEvents']))
+        return put_log_events(**params)
+
+    handler.client.put_log_events = record_batch
+    handler.maximum_batch_count = 40
+
+    logger_ = logging.Logger('test_cloudwatch_logs_handler_batches')
+    logger_.addHandler(handler)
+    log_manager = DagsterLogManager('some_run_id', {}, [logger_])
+    for i in range(100):
+        log_manager.info('Message {}'.format(i))
+
+    handler.flush()
+
+    assert sum(batches) == 100
+    assert len(batches) < 100
+    assert max(batches) <= 40
+
+    # another writer advanced the sequence token of the log stream
+    stale_sequence_token = handler.sequence_token
+    handler.sequence_token = 'stale'
+
+    def reject_stale_sequence_token(**params):
+        if params['sequenceToken'] == 'stale':
+            raise handler.client.exceptions.InvalidSequenceTokenException(
+                {
+                    'Error': {'Code': 'InvalidSequenceTokenException', 'Message': 'stale'},
+                    'expectedSequenceToken': stale_sequence_token,
+                },
+                'PutLogEvents',
+            )
+        return record_batch(**params)
+
+    handler.client.put_log_events = reject_stale_sequence_token
+    log_manager.info('After the other writer')
+    handler.close()
+
+    events = client.get_log_events(
+        logGroupName=TEST_CLOUDWATCH_LOG_GROUP_NAME, logStreamName=TEST_CLOUDWATCH_LOG_STREAM_NAME,
+    )['events']
+    assert len(events) == 101
+    assert json.loads(events[-1]['message'])['dagster_meta']['orig_message'] == (
+        'After the other writer'
+    )
+
+
+def _shipper_threads():
+    return [thread for thread in threading.enumerate() if thread.name == 'cloudwatch-log-shipper']
+
+
+@mock_logs
+def test_cloudwatch_logs_handler_close_stops_shipper():
+    client = boto3.client('logs', AWS_REGION)
+    client.create_log_group(logGroupName=TEST_CLOUDWATCH_LOG_GROUP_NAME)
+    client.create_log_stream(
+        logGroupName=TEST_CLOUDWATCH_LOG_GROUP_NAME, logStreamName=TEST_CLOUDWATCH_LOG_STREAM_NAME
+    )
+
+    shipper_threads = _shipper_threads()
+    handlers = [
+        CloudwatchLogsHandler(
+            TEST_CLOUDWATCH_LOG_GROUP_NAME, TEST_CLOUDWATCH_LOG_STREAM_NAME, aws_region=AWS_REGION
+        )
+        for _ in range(3)
+    ]
+    assert len(_shipper_threads()) == len(shipper_threads) + 3
+
+    logger_ = logging.Logger('test_cloudwatch_logs_handler_close_stops_shipper')
+    logger_.addHandler(handlers[0])
+    log_manager = DagsterLogManager('some_run_id', {}, [logger_])
+    log_manager.info('Before closing')
+
+    for handler in handlers:
+        handler.close()
+
+    # the records buffered when the handler was closed were shipped before its thread exited
+    assert _shipper_threads() == shipper_threads
+    events = client.get_log_events(
+        logGroupName=TEST_CLOUDWATCH_LOG_GROUP_NAME, logStreamName=TEST_CLOUDWATCH_LOG_STREAM_NAME,
+    )['events']
+    assert [json.loads(event['message'])['dagster_meta']['orig_message'] for event in events] == [
+        'Before closing'
+    ]
+
+    # closing again, or flushing a closed handler, does not block
+    handlers[0].close()
+    handlers[0].flush()
+
+    # records logged after that are sent as they are logged
+    log_manager.info('After closing')
+    events = client.get_log_events(
+        logGroupName=TEST_CLOUDWATCH_LOG_GROUP_NAME, logStreamName=TEST_CLOUDWATCH_LOG_STREAM_NAME,
+    )['events']
+    assert [json.loads(event['message'])['dagster_meta']['orig_message'] for event in events] == [
+        'Before closing',
+        'After closing',
+    ]
+
+
+@mock_logs
+def test_cloudwatch_logging_stops_shipper_on_pipeline_end():
+    client = boto3.client('logs', AWS_REGION)
+    client.create_log_group(logGroupName=TEST_CLOUDWATCH_LOG_GROUP_NAME)
+    client.create_log_stream(
+        logGroupName=TEST_CLOUDWATCH_LOG_GROUP_NAME, logStreamName=TEST_CLOUDWATCH_LOG_STREAM_NAME
+    )
+
+    shipper_threads = _shipper_threads()
+    for _ in range(3):
+        res = execute_pipeline(
+            hello_cloudwatch_pipeline,
+            {
+                'loggers': {
+                    'cloudwatch': {
+                        'config': {
+                            'log_group_name': TEST_CLOUDWATCH_LOG_GROUP_NAME,
+                            'log_stream_name': TEST_CLOUDWATCH_LOG_STREAM_NAME,
+                            'aws_region': AWS_REGION,
+                        }
+                    }
+                }
+            },
+        )
+        assert res.success
+        assert _shipper_threads() == shipper_threads
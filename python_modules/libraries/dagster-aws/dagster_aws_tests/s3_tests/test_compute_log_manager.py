@@ -1,5 +1,6 @@
 import os
 import sys
+import time
 
 import boto3
 import six
@@ -12,6 +13,7 @@ from dagster.core.storage.compute_log_manager import ComputeIOType
 from dagster.core.storage.event_log import SqliteEventLogStorage
 from dagster.core.storage.root import LocalArtifactStorage
 from dagster.core.storage.runs import SqliteRunStorage
+from dagster.seven import mock
 
 HELLO_WORLD = 'Hello World'
 SEPARATOR = os.linesep if (os.name == 'nt' and sys.version_info < (3,)) else '\n'
@@ -88,6 +90,95 @@ def test_compute_log_manager(s3_bucket):
         for expected in EXPECTED_LOGS:
             assert expected in stderr.data
 
+        # Check both the local and the uploaded logs are deleted
+        manager.delete_logs(result.run_id)
+        assert not os.path.exists(compute_logs_dir)
+        assert 'Contents' not in s3.list_objects_v2(
+            Bucket=s3_bucket, Prefix='my_prefix/storage/{run_id}/'.format(run_id=result.run_id),
+        )
+
+
+@mock_s3
+def test_compute_log_manager_chunked_upload(s3_bucket):
+    s3 = boto3.client('s3')
+    s3.create_bucket(Bucket=s3_bucket)
+
+    with seven.TemporaryDirectory() as temp_dir:
+        manager = S3ComputeLogManager(
+            bucket=s3_bucket, prefix='my_prefix', local_dir=temp_dir, upload_interval=1
+        )
+        # a manager on another host, with none of the logs on its disk
+        other_host_dir = os.path.join(temp_dir, 'other_host')
+        other_host_manager = S3ComputeLogManager(
+            bucket=s3_bucket, prefix='my_prefix', local_dir=other_host_dir
+        )
+
+        @solid
+        def long_running(context):
+            print(HELLO_WORLD)
+            sys.stdout.flush()
+
+            # the logs are readable from the other host while the step is still executing
+            for _ in range(100):
+                stdout = other_host_manager.read_logs_file(
+                    context.run_id, 'long_running.compute', ComputeIOType.STDOUT
+                )
+                if stdout.data:
+                    return stdout.data
+                time.sleep(0.1)
+
+        @pipeline
+        def long_running_pipeline():
+            long_running()
+
+        instance = DagsterInstance(
+            instance_type=InstanceType.PERSISTENT,
+            local_artifact_storage=LocalArtifactStorage(temp_dir),
+            run_storage=SqliteRunStorage.from_local(temp_dir),
+            event_storage=SqliteEventLogStorage(temp_dir),
+            compute_log_manager=manager,
+        )
+        result = execute_pipeline(long_running_pipeline, instance=instance)
+        assert result.result_for_solid('long_running').output_value() == HELLO_WORLD + SEPARATOR
+
+        # the chunks are deleted once the complete logs are uploaded
+        s3_keys = [obj['Key'] for obj in s3.list_objects_v2(Bucket=s3_bucket)['Contents']]
+        assert '.chunks/' not in ''.join(s3_keys)
+        assert (
+            'my_prefix/storage/{run_id}/compute_logs/long_running.compute.out'.format(
+                run_id=result.run_id
+            )
+            in s3_keys
+        )
+
+        # ranged reads of the complete logs
+        stdout = other_host_manager.read_logs_file(
+            result.run_id, 'long_running.compute', ComputeIOType.STDOUT, cursor=6, max_bytes=5
+        )
+        assert stdout.data == 'World'
+        assert stdout.cursor == 11
+        assert stdout.size == len(HELLO_WORLD + SEPARATOR)
+        assert stdout.download_url
+        assert not os.path.exists(
+            other_host_manager.get_local_path(
+                result.run_id, 'long_running.compute', ComputeIOType.STDOUT
+            )
+        )
+
+        # the fetched blocks are cached on disk, for later processes on the host to reuse
+        restarted_manager = S3ComputeLogManager(
+            bucket=s3_bucket, prefix='my_prefix', local_dir=other_host_dir
+        )
+        with mock.patch.object(
+            restarted_manager._s3_session,  # pylint: disable=protected-access
+            'get_object',
+            side_effect=Exception('Fetched a cached block'),
+        ):
+            stdout = restarted_manager.read_logs_file(
+                result.run_id, 'long_running.compute', ComputeIOType.STDOUT, cursor=6, max_bytes=5
+            )
+        assert stdout.data == 'World'
+
 
 @mock_s3
 def test_compute_log_manager_from_config(s3_bucket):
@@ -18,7 +18,9 @@ from dagster import (
     pipeline,
     solid,
 )
+from dagster.core.storage.local_file_cache import LocalFileCache
 from dagster.seven import mock
+from dagster.utils.temp_file import get_temp_dir
 
 # For deps
 
@@ -182,3 +184,34 @@ def test_depends_on_s3_resource_file_manager():
     assert '/'.join(comps[:-1]) == 'dagster/storage/{run_id}/files'.format(run_id=result.run_id)
 
     assert uuid.UUID(comps[-1])
+
+
+def test_s3_file_manager_read_through_local_file_cache():
+    state = {'called': 0}
+    bar_bytes = 'bar'.encode()
+
+    class S3Mock(mock.MagicMock):
+        def head_object(self, *_args, **_kwargs):
+            return {'ETag': '"etag"'}
+
+        def download_file(self, *_args, **kwargs):
+            state['called'] += 1
+            with open(kwargs.get('Filename'), 'wb') as ff:
+                ff.write(bar_bytes)
+
+    s3_mock = S3Mock()
+    file_handle = S3FileHandle('some-bucket', 'some-key/kdjfkjdkfjkd')
+    with get_temp_dir() as temp_dir:
+        local_file_cache = LocalFileCache(temp_dir)
+
+        # file managers of different steps or runs share the cache
+        for _ in range(2):
+            file_manager = S3FileManager(
+                s3_mock, 'some-bucket', 'some-key', local_file_cache=local_file_cache
+            )
+            with file_manager.read(file_handle) as file_obj:
+                assert file_obj.read() == bar_bytes
+            file_manager.delete_local_temp()
+
+        assert state['called'] == 1
+        assert (local_file_cache.hits, local_file_cache.misses) == (1, 1)
@@ -29,7 +29,8 @@ class dict_wrapper(object):
 
 
 class CeleryConfig(
-    namedtuple('CeleryConfig', 'broker backend include config_source retries'), ExecutorConfig,
+    namedtuple('CeleryConfig', 'broker backend include config_source retries resources'),
+    ExecutorConfig,
 ):
     '''Configuration class for the Celery execution engine.
 
@@ -39,10 +40,12 @@ class CeleryConfig(
         include (Optional[List[str]]): List of modules every worker should import.
         config_source (Optional[Dict]): Config settings for the Celery app.
         retries (Retries): Controls retry behavior
+        resources (Optional[Dict[str, float]]): The capacities of the resources that steps declare
+            they require with the ``dagster/resource_requirements`` tag, by resource name.
     '''
 
     def __new__(
-        cls, retries, broker=None, backend=None, include=None, config_source=None,
+        cls, retries, broker=None, backend=None, include=None, config_source=None, resources=None,
     ):
 
         return super(CeleryConfig, cls).__new__(
@@ -54,6 +57,7 @@ class CeleryConfig(
                 dict(DEFAULT_CONFIG, **check.opt_dict_param(config_source, 'config_source'))
             ),
             retries=check.inst_param(retries, 'retries', Retries),
+            resources=check.opt_dict_param(resources, 'resources', key_type=str),
         )
 
     @staticmethod
@@ -1,13 +1,16 @@
+import socket
 import sys
 import time
 
 from dagster import check
 from dagster.core.engine.engine_base import Engine
 from dagster.core.errors import DagsterSubprocessError
-from dagster.core.events import DagsterEvent, EngineEventData
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.plan.plan import ExecutionPlan
-from dagster.serdes import deserialize_json_to_dagster_namedtuple
+from dagster.core.execution.step_fusion import is_step_fusion_enabled
+from dagster.core.execution.step_priority import step_priority_sort_key_fn
+from dagster.core.execution.step_resources import StepResourcePool
 from dagster.utils.error import serializable_error_info_from_exc_info
 from dagster.utils.net import is_local_uri
 
@@ -54,6 +57,13 @@ class CeleryEngine(Engine):
                 'Cannot use in-memory storage with Celery, use filesystem, S3, or GCS',
             )
 
+        # workers write the events of their steps to the event log of the run, where the engine
+        # reads them back
+        check.invariant(
+            pipeline_context.instance.is_persistent,
+            'Celery execution requires a persistent DagsterInstance',
+        )
+
         app = make_app(celery_config)
 
         priority_for_step = lambda step: (
@@ -65,43 +75,63 @@ class CeleryEngine(Engine):
         )
         _warn_on_priority_misuse(pipeline_context, execution_plan)
 
+        resource_pool = StepResourcePool(celery_config.resources)
+        resource_pool.check_execution_plan(execution_plan)
+
         step_results = {}  # Dict[ExecutionStep, celery.AsyncResult]
+        step_keys_for_task = {}  # Dict[step_key, List[step_key]], the steps each task executes
         step_errors = {}
+        worker_errors = []  # List[SerializableErrorInfo], from failures that have no step key
         completed_steps = set({})  # Set[step_key]
         active_execution = execution_plan.start(
-            retries=pipeline_context.executor_config.retries, sort_key_fn=priority_for_step
+            retries=pipeline_context.executor_config.retries,
+            sort_key_fn=step_priority_sort_key_fn(
+                pipeline_context, execution_plan, sort_key_fn=priority_for_step
+            ),
+            fuse_steps=is_step_fusion_enabled(pipeline_context.pipeline_run),
+        )
+        worker_events = _WorkerEventStream(
+            pipeline_context.instance, pipeline_context.pipeline_run.run_id
         )
         stopping = False
 
         while (not active_execution.is_complete and not stopping) or step_results:
 
-            results_to_pop = []
-            for step_key, result in sorted(
-                step_results.items(), key=lambda x: priority_for_key(x[0])
+            # all the events of a finished task are in the event log, so find the finished tasks
+            # before reading it
+            ready_step_keys = [
+                step_key
+                for step_key, result in sorted(
+                    step_results.items(), key=lambda x: priority_for_key(x[0])
+                )
+                if result.ready()
+            ]
+
+            for event in worker_events.read_events(
+                {key for step_keys in step_keys_for_task.values() for key in step_keys}
             ):
-                if result.ready():
-                    try:
-                        step_events = result.get()
-                    except Exception as e:  # pylint: disable=broad-except
-                        # We will want to do more to handle the exception here.. maybe subclass Task
-                        # Certainly yield an engine or pipeline event
-                        step_events = []
-                        step_errors[step_key] = serializable_error_info_from_exc_info(
-                            sys.exc_info()
-                        )
-                        stopping = True
-                    for step_event in step_events:
-                        event = deserialize_json_to_dagster_namedtuple(step_event)
-                        yield event
-                        active_execution.handle_event(event)
-
-                    results_to_pop.append(step_key)
-                    completed_steps.add(step_key)
-
-            for step_key in results_to_pop:
-                if step_key in step_results:
-                    del step_results[step_key]
-                    active_execution.verify_complete(pipeline_context, step_key)
+                yield event
+                active_execution.handle_event(event)
+                if event.event_type == DagsterEventType.PIPELINE_INIT_FAILURE:
+                    # a worker could not set up the run to execute its steps, e.g. because a
+                    # resource failed to initialize there, so its steps will never finish
+                    worker_errors.append(event.pipeline_init_failure_data.error)
+                    stopping = True
+
+            for step_key in ready_step_keys:
+                try:
+                    step_results[step_key].get()
+                except Exception:  # pylint: disable=broad-except
+                    # We will want to do more to handle the exception here.. maybe subclass Task
+                    # Certainly yield an engine or pipeline event
+                    step_errors[step_key] = serializable_error_info_from_exc_info(sys.exc_info())
+                    stopping = True
+
+                del step_results[step_key]
+                del step_keys_for_task[step_key]
+                resource_pool.release(step_key)
+                completed_steps.add(step_key)
+                active_execution.verify_complete(pipeline_context, step_key)
 
             # process skips from failures or uncovered inputs
             for event in active_execution.skipped_step_events_iterator(pipeline_context):
@@ -116,18 +146,33 @@ class CeleryEngine(Engine):
             # which they are scheduled (and the following m-n steps will be executed in priority
             # order, provided that it takes longer to execute a step than to schedule it). The test
             # case has m >> n to exhibit this behavior in the absence of this sort step.
-            for step in active_execution.get_steps_to_execute():
+            for step in active_execution.get_steps_to_execute(admit_fn=resource_pool.try_acquire):
                 try:
-                    queue = step.tags.get('dagster-celery/queue', task_default_queue)
+                    queue = _get_step_queue(step)
+                    # only steps bound for the same queue, and that fit within the resources the
+                    # step holds, are executed by the same task
+                    can_fuse_with_resources = resource_pool.can_fuse_fn(step)
+                    fused_steps = active_execution.claim_fused_steps(
+                        step,
+                        can_fuse_fn=lambda upstream_step, fused_step: (
+                            _get_step_queue(upstream_step) == _get_step_queue(fused_step)
+                            and can_fuse_with_resources(upstream_step, fused_step)
+                        ),
+                    )
+                    step_keys = [step.key] + [fused_step.key for fused_step in fused_steps]
                     yield DagsterEvent.engine_event(
                         pipeline_context,
-                        'Submitting celery task for step "{step_key}" to queue "{queue}".'.format(
-                            step_key=step.key, queue=queue
+                        'Submitting celery task for {steps} to queue "{queue}".'.format(
+                            steps=', '.join('step "{}"'.format(step_key) for step_key in step_keys),
+                            queue=queue,
                         ),
                         EngineEventData(marker_start=DELEGATE_MARKER),
                         step_key=step.key,
                     )
-                    step_results[step.key] = _submit_task(app, pipeline_context, step, queue)
+                    step_results[step.key] = _submit_task(
+                        app, pipeline_context, step, queue, fused_steps
+                    )
+                    step_keys_for_task[step.key] = step_keys
                 except Exception:
                     yield DagsterEvent.engine_event(
                         pipeline_context,
@@ -138,9 +183,9 @@ class CeleryEngine(Engine):
                     )
                     raise
 
-            time.sleep(TICK_SECONDS)
+            _wait_for_step_results(app, step_results.values(), TICK_SECONDS)
 
-        if step_errors:
+        if step_errors or worker_errors:
             raise DagsterSubprocessError(
                 'During celery execution errors occurred in workers:\n{error_list}'.format(
                     error_list='\n'.join(
@@ -148,15 +193,82 @@ class CeleryEngine(Engine):
                             '[{step}]: {err}'.format(step=key, err=err.to_string())
                             for key, err in step_errors.items()
                         ]
+                        + ['[worker]: {err}'.format(err=err.to_string()) for err in worker_errors]
                     )
                 ),
-                subprocess_error_infos=list(step_errors.values()),
+                subprocess_error_infos=list(step_errors.values()) + worker_errors,
+            )
+
+
+class _WorkerEventStream(object):
+    '''Reads the events that celery workers write to the event log of a run as they execute steps,
+    so that the engine can yield them while the tasks are still running.'''
+
+    def __init__(self, instance, run_id):
+        self._instance = instance
+        self._run_id = run_id
+        # the events written before the engine started are not the workers'
+        self._cursor = instance.logs_count(run_id) - 1
+
+    def read_events(self, step_keys):
+        '''The events for the given steps written since the last read, along with the events
+        without a step key, such as the failure of a worker to initialize the run.
+
+        The engine writes events to the same event log, and yields those itself when it writes
+        them, so they are skipped.
+
+        Args:
+            step_keys (Set[str]): The keys of the steps executing in workers.
+
+        Returns:
+            List[DagsterEvent]
+        '''
+        records = self._instance.logs_after(self._run_id, self._cursor)
+        self._cursor += len(records)
+
+        return [
+            record.dagster_event
+            for record in records
+            if record.is_dagster_event
+            and (
+                record.dagster_event.step_key is None or record.dagster_event.step_key in step_keys
             )
+            and not _is_delegation_event(record.dagster_event)
+        ]
+
+
+def _is_delegation_event(event):
+    return event.is_engine_event and event.engine_event_data.marker_start == DELEGATE_MARKER
+
+
+def _wait_for_step_results(app, step_results, timeout):
+    '''Wait until one of the celery tasks executing steps finishes, for at most timeout seconds.
 
+    Result backends that push task results to the client, like rpc and redis, end the wait as
+    soon as a task finishes. Other result backends are checked again once the timeout elapses.
+    '''
+    if not step_results or any(result.ready() for result in step_results):
+        return
 
-def _submit_task(app, pipeline_context, step, queue):
+    if not app.backend.is_async:
+        time.sleep(timeout)
+        return
+
+    try:
+        app.backend.result_consumer.drain_events(timeout=timeout)
+    except socket.timeout:
+        pass
+
+
+def _get_step_queue(step):
+    return step.tags.get('dagster-celery/queue', task_default_queue)
+
+
+def _submit_task(app, pipeline_context, step, queue, fused_steps=None):
     from .tasks import create_task
 
+    fused_steps = check.opt_list_param(fused_steps, 'fused_steps')
+
     run_priority = _get_run_priority(pipeline_context)
     step_priority = int(step.tags.get('dagster-celery/priority', task_default_priority))
     priority = run_priority + step_priority
@@ -167,12 +279,16 @@ def _submit_task(app, pipeline_context, step, queue):
         instance_ref_dict=pipeline_context.instance.get_ref().to_dict(),
         handle_dict=pipeline_context.execution_target_handle.to_dict(),
         run_id=pipeline_context.pipeline_run.run_id,
-        step_keys=[step.key],
+        step_keys=[step.key] + [fused_step.key for fused_step in fused_steps],
         retries_dict=pipeline_context.executor_config.retries.for_inner_plan().to_config(),
     )
-    return task_signature.apply_async(
+    result = task_signature.apply_async(
         priority=priority, queue=queue, routing_key='{queue}.execute_plan'.format(queue=queue),
     )
+    if not app.conf.task_always_eager:
+        # have backends that push task results, like rpc and redis, deliver this one to the engine
+        app.backend.add_pending_result(result)
+    return result
 
 
 def _get_run_priority(context):
@@ -31,6 +31,13 @@ from .config import CeleryConfig
             is_required=False,
             description='Additional settings for the Celery app.',
         ),
+        'resources': Field(
+            Permissive(),
+            is_required=False,
+            description='The capacities of the resources that steps declare they require with '
+            'the dagster/resource_requirements tag, by resource name. Limits the steps of a run '
+            'that are submitted at once.',
+        ),
         'retries': get_retries_config(),
     },
 )
@@ -78,6 +85,9 @@ def celery_executor(init_context):
               config_source: # Dict[str, Any]: Any additional parameters to pass to the
                   #...       # Celery workers. This dict will be passed as the `config_source`
                   #...       # argument of celery.Celery().
+              resources: # Dict[str, float]: The capacities of the resources that steps
+                  #...   # require, e.g. db_connections: 2. Steps are only submitted while the
+                  #...   # steps of the run already submitted leave enough of each resource.
 
     Note that the YAML you provide here must align with the configuration with which the Celery
     workers on which you hope to run were started. If, for example, you point the executor at a
@@ -92,4 +102,5 @@ def celery_executor(init_context):
         config_source=init_context.executor_config.get('config_source'),
         include=init_context.executor_config.get('include'),
         retries=Retries.from_config(init_context.executor_config['retries']),
+        resources=init_context.executor_config.get('resources'),
     )
@@ -8,7 +8,6 @@ from dagster.core.events import EngineEventData
 from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
 from dagster.core.execution.retries import Retries
 from dagster.core.instance import InstanceRef
-from dagster.serdes import serialize_dagster_namedtuple
 from dagster.seven import is_module_available
 
 from .engine import DELEGATE_MARKER, CeleryEngine
@@ -44,28 +43,27 @@ def create_task(celery_app, **task_kwargs):
             step_keys_to_execute=pipeline_run.step_keys_to_execute,
         ).build_subset_plan(step_keys)
 
-        engine_event = instance.report_engine_event(
+        instance.report_engine_event(
             'Executing steps {} in celery worker'.format(step_keys_str),
             pipeline_run,
             EngineEventData(
                 [EventMetadataEntry.text(step_keys_str, 'step_keys'),], marker_end=DELEGATE_MARKER,
             ),
             CeleryEngine,
-            step_key=execution_plan.step_key_for_single_step_plans(),
+            # the first step is the one the engine submitted the task for
+            step_key=step_keys[0],
         )
 
-        events = [engine_event]
-        for step_event in execute_plan_iterator(
+        # the events are written to the event log of the run as the steps execute, and the engine
+        # reads them from there, so they aren't returned through the result backend
+        for _ in execute_plan_iterator(
             execution_plan,
             pipeline_run=pipeline_run,
             environment_dict=pipeline_run.environment_dict,
             instance=instance,
             retries=retries,
         ):
-            events.append(step_event)
-
-        serialized_events = [serialize_dagster_namedtuple(event) for event in events]
-        return serialized_events
+            pass
 
     return _execute_plan
 
@@ -1,7 +1,10 @@
 import pytest
 from celery.contrib.testing import worker
 from celery.contrib.testing.app import setup_default_app
-from dagster_celery.tasks import make_app
+from dagster_celery.config import CeleryConfig
+from dagster_celery.tasks import create_task, make_app
+
+from dagster.core.execution.retries import Retries, RetryMode
 
 
 @pytest.fixture(scope='session')
@@ -16,3 +19,21 @@ def dagster_celery_app():
 def dagster_celery_worker(dagster_celery_app):  # pylint: disable=redefined-outer-name
     with worker.start_worker(dagster_celery_app, perform_ping_check=False) as w:
         yield w
+
+
+IN_MEMORY_BROKER = 'memory://'
+IN_MEMORY_BACKEND = 'rpc://'
+
+
+@pytest.fixture(scope='function')
+def dagster_celery_in_memory_worker():
+    '''A celery worker, on a thread of the test process, for runs whose celery executor is
+    configured with the IN_MEMORY_BROKER and IN_MEMORY_BACKEND, so no broker has to be running.'''
+    app = make_app(
+        CeleryConfig(
+            retries=Retries(RetryMode.DISABLED), broker=IN_MEMORY_BROKER, backend=IN_MEMORY_BACKEND,
+        )
+    )
+    create_task(app)
+    with worker.start_worker(app, perform_ping_check=False) as w:
+        yield w
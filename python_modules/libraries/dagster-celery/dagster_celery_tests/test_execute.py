@@ -3,10 +3,12 @@
 
 import os
 import shutil
+import time
 from contextlib import contextmanager
 
 import pytest
 from dagster_celery import celery_executor
+from dagster_celery_tests.conftest import IN_MEMORY_BACKEND, IN_MEMORY_BROKER
 
 from dagster import (
     CompositeSolidExecutionResult,
@@ -25,6 +27,7 @@ from dagster import (
     execute_pipeline_iterator,
     lambda_solid,
     pipeline,
+    resource,
     seven,
     solid,
 )
@@ -164,6 +167,64 @@ def engine_error():
     subtract(a, b)
 
 
+@solid(config=str)
+def wait_for_signal(context):
+    # the test creates the signal file once the engine has yielded the start of this step
+    for _ in range(300):
+        if os.path.exists(context.solid_config):
+            return 1
+        time.sleep(0.1)
+
+    raise Exception('Timed out waiting for {}'.format(context.solid_config))
+
+
+@pipeline(mode_defs=celery_mode_defs)
+def test_signal_pipeline():
+    add_one(wait_for_signal())
+
+
+@resource(config=str)
+def fails_in_workers(init_context):
+    # the resource is initialized by the run before it is by the worker executing its step
+    if os.path.exists(init_context.resource_config):
+        raise Exception('Could not connect from the worker')
+    with open(init_context.resource_config, 'w'):
+        pass
+
+
+@solid(required_resource_keys={'fails_in_workers'})
+def uses_resource(_):
+    return 1
+
+
+@pipeline(
+    mode_defs=[
+        ModeDefinition(
+            resource_defs={'fails_in_workers': fails_in_workers},
+            executor_defs=default_executors + [celery_executor],
+        )
+    ]
+)
+def test_worker_resource_init_failure():
+    uses_resource()
+
+
+@solid(tags={'dagster/resource_requirements': {'db_connections': 1}})
+def query_one(_):
+    return 1
+
+
+@solid(tags={'dagster/resource_requirements': {'db_connections': 1}})
+def query_two(_):
+    return 2
+
+
+@pipeline(mode_defs=celery_mode_defs)
+def test_resource_requirements_pipeline():
+    query_one()
+    query_two()
+
+
 @contextmanager
 def execute_pipeline_on_celery(pipeline_name,):
     with seven.TemporaryDirectory() as tempdir:
@@ -290,6 +351,77 @@ def test_execute_fails_pipeline_on_celery(dagster_celery_worker):
         assert result.result_for_solid('should_never_execute').skipped
 
 
+def test_execute_on_celery_in_memory_broker(dagster_celery_in_memory_worker):
+    with seven.TemporaryDirectory() as tempdir:
+        signal_path = os.path.join(tempdir, 'signal')
+        events = []
+        for event in execute_pipeline_iterator(
+            ExecutionTargetHandle.for_pipeline_python_file(
+                __file__, 'test_signal_pipeline'
+            ).build_pipeline_definition(),
+            environment_dict={
+                'storage': {'filesystem': {'config': {'base_dir': tempdir}}},
+                'execution': {
+                    'celery': {'config': {'broker': IN_MEMORY_BROKER, 'backend': IN_MEMORY_BACKEND}}
+                },
+                'solids': {'wait_for_signal': {'config': signal_path}},
+            },
+            instance=DagsterInstance.local_temp(tempdir=tempdir),
+        ):
+            events.append(event)
+            # the worker is still executing the step, so its events are streamed to the engine
+            if (
+                event.event_type_value == 'STEP_START'
+                and event.step_key == 'wait_for_signal.compute'
+            ):
+                with open(signal_path, 'w'):
+                    pass
+
+        assert os.path.exists(signal_path)
+        assert [event.event_type_value for event in events if event.is_step_success] == [
+            'STEP_SUCCESS',
+            'STEP_SUCCESS',
+        ]
+        assert events[-1].is_pipeline_success
+
+
+def test_execute_on_celery_with_resource_capacities(dagster_celery_in_memory_worker):
+    with seven.TemporaryDirectory() as tempdir:
+        events = list(
+            execute_pipeline_iterator(
+                ExecutionTargetHandle.for_pipeline_python_file(
+                    __file__, 'test_resource_requirements_pipeline'
+                ).build_pipeline_definition(),
+                environment_dict={
+                    'storage': {'filesystem': {'config': {'base_dir': tempdir}}},
+                    'execution': {
+                        'celery': {
+                            'config': {
+                                'broker': IN_MEMORY_BROKER,
+                                'backend': IN_MEMORY_BACKEND,
+                                'resources': {'db_connections': 1},
+                            }
+                        }
+                    },
+                },
+                instance=DagsterInstance.local_temp(tempdir=tempdir),
+            )
+        )
+
+    assert events[-1].is_pipeline_success
+    # the second step is only submitted once the first one has released the connection
+    (first_success_index, _) = [
+        index for index, event in enumerate(events) if event.is_step_success
+    ]
+    submission_indexes = [
+        index
+        for index, event in enumerate(events)
+        if event.is_engine_event and event.message.startswith('Submitting celery task')
+    ]
+    assert len(submission_indexes) == 2
+    assert submission_indexes[0] < first_success_index < submission_indexes[1]
+
+
 def test_execute_eagerly_on_celery():
     with seven.TemporaryDirectory() as tempdir:
         instance = DagsterInstance.local_temp(tempdir=tempdir)
@@ -441,3 +573,34 @@ def test_engine_error():
                 },
                 instance=DagsterInstance.local_temp(tempdir=tempdir),
             )
+
+
+def test_worker_resource_init_failure_fails_run():
+    events = []
+    with pytest.raises(DagsterSubprocessError) as exc_info:
+        with seven.TemporaryDirectory() as tempdir:
+            for event in execute_pipeline_iterator(
+                ExecutionTargetHandle.for_pipeline_python_file(
+                    __file__, 'test_worker_resource_init_failure',
+                ).build_pipeline_definition(),
+                environment_dict={
+                    'storage': {'filesystem': {'config': {'base_dir': tempdir}}},
+                    'execution': {
+                        'celery': {'config': {'config_source': {'task_always_eager': True}}}
+                    },
+                    'resources': {'fails_in_workers': {'config': os.path.join(tempdir, 'marker')}},
+                },
+                instance=DagsterInstance.local_temp(tempdir=tempdir),
+            ):
+                events.append(event)
+
+    assert 'Could not connect from the worker' in str(exc_info.value)
+
+    # the failure of the worker reaches the run, instead of only being written to its event log
+    init_failures = [event for event in events if event.event_type_value == 'PIPELINE_INIT_FAILURE']
+    assert len(init_failures) == 1
+    assert (
+        'Could not connect from the worker'
+        in init_failures[0].pipeline_init_failure_data.error.message
+    )
+    assert events[-1].event_type_value == 'PIPELINE_FAILURE'
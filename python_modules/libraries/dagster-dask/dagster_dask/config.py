@@ -5,7 +5,10 @@ from dagster.core.execution.config import ExecutorConfig
 
 
 class DaskConfig(
-    namedtuple('DaskConfig', 'address timeout scheduler_file direct_to_workers heartbeat_interval'),
+    namedtuple(
+        'DaskConfig',
+        'address timeout scheduler_file direct_to_workers heartbeat_interval resources',
+    ),
     ExecutorConfig,
 ):
     '''DaskConfig - configuration for the Dask execution engine
@@ -17,6 +20,10 @@ class DaskConfig(
         direct_to_workers (Optional[bool]): Whether or not to connect directly to the workers, or
             to ask the scheduler to serve as intermediary.
         heartbeat_interval (Optional[int]): Time in milliseconds between heartbeats to scheduler.
+        resources (Optional[Dict[str, float]]): The abstract resources of each worker, by resource
+            name. Only these resources are requested of dask for the requirements that steps
+            declare with the ``dagster/resource_requirements`` tag. The workers of a local cluster
+            are started with them.
     '''
 
     def __new__(
@@ -26,6 +33,7 @@ class DaskConfig(
         scheduler_file=None,
         direct_to_workers=False,
         heartbeat_interval=None,
+        resources=None,
     ):
         return super(DaskConfig, cls).__new__(
             cls,
@@ -34,6 +42,7 @@ class DaskConfig(
             scheduler_file=check.opt_str_param(scheduler_file, 'scheduler_file'),
             direct_to_workers=check.opt_bool_param(direct_to_workers, 'direct_to_workers'),
             heartbeat_interval=check.opt_int_param(heartbeat_interval, 'heartbeat_interval'),
+            resources=check.opt_dict_param(resources, 'resources', key_type=str),
         )
 
     @staticmethod
@@ -66,6 +75,8 @@ class DaskConfig(
             # We may want to try to figure out a way to enforce this on remote Dask clusters against
             # which users run Dagster workloads.
             dask_cfg['threads_per_worker'] = 1
+            if self.resources:
+                dask_cfg['resources'] = self.resources
 
         for cfg_param in [
             'address',
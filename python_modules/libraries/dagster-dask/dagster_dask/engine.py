@@ -1,12 +1,16 @@
 import dask
 import dask.distributed
-from dagster_graphql.client.mutations import execute_execute_plan_mutation
 
 from dagster import check, seven
 from dagster.core.engine.engine_base import Engine
 from dagster.core.events import DagsterEvent
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.step_priority import step_priorities_for_execution
+from dagster.core.execution.step_resources import get_step_resource_requirements
+from dagster.core.execution.worker import execute_run_steps
+from dagster.core.instance import DagsterInstance
+from dagster.serdes import deserialize_json_to_dagster_namedtuple
 from dagster.utils import frozentags
 from dagster.utils.net import is_local_uri
 
@@ -16,22 +20,37 @@ from .config import DaskConfig
 DASK_RESOURCE_REQUIREMENTS_KEY = 'dagster-dask/resource_requirements'
 
 
-def query_on_dask_worker(
-    handle, variables, dependencies, instance_ref=None
+def execute_step_on_dask_worker(
+    handle, instance_ref, run_id, step_key, dependencies
 ):  # pylint: disable=unused-argument
     '''Note that we need to pass "dependencies" to ensure Dask sequences futures during task
     scheduling, even though we do not use this argument within the function.
     '''
-    return execute_execute_plan_mutation(handle, variables, instance_ref=instance_ref)
+    instance = DagsterInstance.from_ref(instance_ref)
+    try:
+        return execute_run_steps(handle, instance, run_id, [step_key])
+    finally:
+        instance.dispose()
 
 
-def get_dask_resource_requirements(tags):
+def get_dask_resource_requirements(tags, worker_resources=None):
+    '''The abstract resources a step requires of the dask workers executing it.
+
+    Defaults to the requirements of the ``dagster/resource_requirements`` tag, which the other
+    engines pack steps against, of the resources the workers are configured with. Dask never starts
+    a task that requires a resource no worker has.
+    '''
     check.inst_param(tags, 'tags', frozentags)
+    worker_resources = check.opt_dict_param(worker_resources, 'worker_resources', key_type=str)
     req_str = tags.get(DASK_RESOURCE_REQUIREMENTS_KEY)
     if req_str is not None:
         return seven.json.loads(req_str)
 
-    return {}
+    return {
+        name: amount
+        for name, amount in get_step_resource_requirements(tags).items()
+        if name in worker_resources
+    }
 
 
 class DaskEngine(Engine):  # pylint: disable=no-init
@@ -80,6 +99,9 @@ class DaskEngine(Engine):  # pylint: disable=no-init
 
         instance = pipeline_context.instance
 
+        # dask starts the ready tasks with the highest priority first
+        step_priorities = step_priorities_for_execution(pipeline_context, execution_plan)
+
         with dask.distributed.Client(**dask_config.build_dict(pipeline_name)) as client:
             execution_futures = []
             execution_futures_dict = {}
@@ -93,29 +115,18 @@ class DaskEngine(Engine):  # pylint: disable=no-init
                         for key in step_input.dependency_keys:
                             dependencies.append(execution_futures_dict[key])
 
-                    environment_dict = dict(
-                        pipeline_context.environment_dict, execution={'in_process': {}}
-                    )
-                    variables = {
-                        'executionParams': {
-                            'selector': {'name': pipeline_name},
-                            'environmentConfigData': environment_dict,
-                            'mode': pipeline_context.mode_def.name,
-                            'executionMetadata': {'runId': pipeline_context.pipeline_run.run_id},
-                            'stepKeys': [step.key],
-                        }
-                    }
-
                     dask_task_name = '%s.%s' % (pipeline_name, step.key)
 
                     future = client.submit(
-                        query_on_dask_worker,
+                        execute_step_on_dask_worker,
                         pipeline_context.execution_target_handle,
-                        variables,
-                        dependencies,
                         instance.get_ref(),
+                        pipeline_context.pipeline_run.run_id,
+                        step.key,
+                        dependencies,
                         key=dask_task_name,
-                        resources=get_dask_resource_requirements(step.tags),
+                        resources=get_dask_resource_requirements(step.tags, dask_config.resources),
+                        priority=step_priorities.get(step.key, 0),
                     )
 
                     execution_futures.append(future)
@@ -124,7 +135,9 @@ class DaskEngine(Engine):  # pylint: disable=no-init
             # This tells Dask to awaits the step executions and retrieve their results to the
             # master
             for future in dask.distributed.as_completed(execution_futures):
-                for step_event in future.result():
-                    check.inst(step_event, DagsterEvent)
+                for serialized_event in future.result():
+                    step_event = check.inst(
+                        deserialize_json_to_dagster_namedtuple(serialized_event), DagsterEvent
+                    )
 
                     yield step_event
@@ -1,4 +1,4 @@
-from dagster import Bool, Field, Int, String
+from dagster import Bool, Field, Int, Permissive, String
 from dagster.core.definitions.executor import check_cross_process_constraints, executor
 
 from .config import DaskConfig
@@ -33,6 +33,12 @@ from .config import DaskConfig
             is_required=False,
             description='Time in milliseconds between heartbeats to scheduler.',
         ),
+        'resources': Field(
+            Permissive(),
+            is_required=False,
+            description='The abstract resources of each worker, by resource name. Steps request '
+            'these resources of dask with the dagster/resource_requirements tag.',
+        ),
     },
 )
 def dask_executor(init_context):
@@ -54,8 +60,15 @@ def dask_executor(init_context):
             # intermediary
             direct_to_workers?: False,
             heartbeat_interval?: 1000,  # Time in milliseconds between heartbeats to scheduler
+            resources?: {'GPU': 1},  # The abstract resources of each worker
         }
 
+    Steps request the abstract resources of the workers they execute on with the
+    ``dagster-dask/resource_requirements`` tag, which is passed to dask as is, or with the
+    ``dagster/resource_requirements`` tag shared with the other engines, of which only the
+    requirements of the ``resources`` configured here are passed to dask. Dask holds tasks that
+    request resources no worker has, so the other requirements of the shared tag are left out.
+
     If you'd like to configure a dask executor in addition to the
     :py:class:`~dagster.default_executors`, you should add it to the ``executor_defs`` defined on a
     :py:class:`~dagster.ModeDefinition` as follows:
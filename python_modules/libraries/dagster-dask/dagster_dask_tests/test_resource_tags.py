@@ -1,3 +1,4 @@
+from dagster_dask.config import DaskConfig
 from dagster_dask.engine import get_dask_resource_requirements
 
 from dagster import solid
@@ -11,3 +12,22 @@ def test_resource_tags():
     reqs = get_dask_resource_requirements(boop.tags)
     assert reqs['GPU'] == 1
     assert reqs['MEMORY'] == 10e9
+
+
+def test_resource_requirements_tag():
+    @solid(tags={'dagster/resource_requirements': {'GPU': 1, 'db_connections': 1}})
+    def bop(_):
+        pass
+
+    # only the resources the workers have are requested of dask, which would hold the task forever
+    # otherwise
+    assert get_dask_resource_requirements(bop.tags) == {}
+    assert get_dask_resource_requirements(bop.tags, {'GPU': 2}) == {'GPU': 1.0}
+
+
+def test_worker_resources_config():
+    assert DaskConfig(resources={'GPU': 2}).build_dict('pipeline')['resources'] == {'GPU': 2}
+    # the workers of a remote cluster are started with their resources on their own
+    assert 'resources' not in DaskConfig(
+        address='tcp://10.0.0.1:8786', resources={'GPU': 2}
+    ).build_dict('pipeline')
@@ -11,6 +11,7 @@ from dagster.core.storage.file_manager import (
     TempfileManager,
     check_file_like_obj,
 )
+from dagster.core.storage.local_file_cache import LocalFileCache
 
 
 @usable_as_dagster_type
@@ -37,10 +38,13 @@ class GCSFileHandle(FileHandle):
 
 
 class GCSFileManager(FileManager):
-    def __init__(self, client, gcs_bucket, gcs_base_key):
+    def __init__(self, client, gcs_bucket, gcs_base_key, local_file_cache=None):
         self._client = check.inst_param(client, 'client', storage.client.Client)
         self._gcs_bucket = check.str_param(gcs_bucket, 'gcs_bucket')
         self._gcs_base_key = check.str_param(gcs_base_key, 'gcs_base_key')
+        self._local_file_cache = check.opt_inst_param(
+            local_file_cache, 'local_file_cache', LocalFileCache
+        )
         self._local_handle_cache = {}
         self._temp_file_manager = TempfileManager()
 
@@ -54,7 +58,16 @@ class GCSFileManager(FileManager):
             temp_file_obj = self._temp_file_manager.tempfile()
             temp_name = temp_file_obj.name
             bucket_obj = self._client.get_bucket(file_handle.gcs_bucket)
-            bucket_obj.blob(file_handle.gcs_key).download_to_file(temp_file_obj)
+            if self._local_file_cache:
+                blob = bucket_obj.get_blob(file_handle.gcs_key)
+                self._local_file_cache.copy_to(
+                    ['gcs', file_handle.gcs_bucket, file_handle.gcs_key, blob.etag],
+                    blob.download_to_filename,
+                    temp_name,
+                    description=file_handle.gcs_path,
+                )
+            else:
+                bucket_obj.blob(file_handle.gcs_key).download_to_file(temp_file_obj)
             self._local_handle_cache[file_handle.gcs_path] = temp_name
 
         return file_handle
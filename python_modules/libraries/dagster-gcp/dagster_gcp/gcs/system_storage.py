@@ -1,5 +1,6 @@
-from dagster import Field, String, SystemStorageData, system_storage
+from dagster import Field, Int, String, SystemStorageData, system_storage
 from dagster.core.storage.intermediates_manager import IntermediateStoreIntermediatesManager
+from dagster.core.storage.local_file_cache import LocalFileCache
 from dagster.core.storage.system_storage import fs_system_storage, mem_system_storage
 
 from .file_manager import GCSFileManager
@@ -12,6 +13,12 @@ from .intermediate_store import GCSIntermediateStore
     config={
         'gcs_bucket': Field(String),
         'gcs_prefix': Field(String, is_required=False, default_value='dagster'),
+        'file_cache_max_bytes': Field(
+            Int,
+            is_required=False,
+            description='If set, files read from GCS are cached on local disk in the instance '
+            'directory, shared between runs, up to this many bytes.',
+        ),
     },
     required_resource_keys={'gcs'},
 )
@@ -21,11 +28,17 @@ def gcs_system_storage(init_context):
         prefix=init_context.system_storage_config['gcs_prefix'],
         run_id=init_context.pipeline_run.run_id,
     )
+    file_cache_max_bytes = init_context.system_storage_config.get('file_cache_max_bytes')
     return SystemStorageData(
         file_manager=GCSFileManager(
             client=client,
             gcs_bucket=init_context.system_storage_config['gcs_bucket'],
             gcs_base_key=gcs_key,
+            local_file_cache=LocalFileCache.for_run(
+                init_context.instance, init_context.pipeline_run, max_bytes=file_cache_max_bytes
+            )
+            if file_cache_max_bytes is not None
+            else None,
         ),
         intermediates_manager=IntermediateStoreIntermediatesManager(
             GCSIntermediateStore(
@@ -0,0 +1,51 @@
+"""add materialization label
+
+Revision ID: 5d1c8c5a2f4e
+Revises: d2e73ef25a01
+Create Date: 2020-05-12 14:31:05.117243
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from dagster.core.storage.migration.utils import has_column, has_index, has_table
+
+# alembic magic breaks pylint
+# pylint: disable=no-member
+
+# revision identifiers, used by Alembic.
+revision = '5d1c8c5a2f4e'
+down_revision = 'd2e73ef25a01'
+branch_labels = None
+depends_on = None
+
+# The labels of existing materializations are filled in by migrate_event_log_data
+INDEX_NAME = 'idx_event_logs_materialization_label'
+
+
+def upgrade():
+    if not has_table('event_logs'):
+        return
+
+    if not has_column('event_logs', 'materialization_label'):
+        op.add_column('event_logs', sa.Column('materialization_label', sa.String))
+
+    # Building an index on a large event log takes a while, so build it concurrently to keep
+    # accepting events in the meantime. Concurrent builds can't run inside a transaction.
+    with op.get_context().autocommit_block():
+        if not has_index('event_logs', INDEX_NAME):
+            op.create_index(
+                INDEX_NAME,
+                'event_logs',
+                ['materialization_label', 'timestamp'],
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        if has_index('event_logs', INDEX_NAME):
+            op.drop_index(INDEX_NAME, 'event_logs', postgresql_concurrently=True)
+
+    if has_column('event_logs', 'materialization_label'):
+        op.drop_column('event_logs', 'materialization_label')
@@ -13,16 +13,18 @@ from dagster.core.storage.event_log import (
     SqlEventLogStorageMetadata,
     SqlEventLogStorageTable,
 )
-from dagster.core.storage.sql import create_engine, get_alembic_config, run_alembic_upgrade
+from dagster.core.storage.event_log.base import materialization_label
+from dagster.core.storage.sql import get_alembic_config, run_alembic_upgrade
 from dagster.serdes import (
     ConfigurableClass,
     ConfigurableClassData,
     deserialize_json_to_dagster_namedtuple,
     serialize_dagster_namedtuple,
 )
+from dagster.utils.tracing import trace_span
 
 from ..pynotify import await_pg_notifications
-from ..utils import pg_config, pg_url_from_config
+from ..utils import create_pg_engine, pg_config, pg_url_from_config
 
 CHANNEL_NAME = 'run_events'
 
@@ -30,6 +32,34 @@ CHANNEL_NAME = 'run_events'
 WATCHER_POLL_INTERVAL = 0.2
 
 
+def _store_event_statement():
+    # Inserts an event and notifies watchers of it in one round trip. The statement is built once,
+    # with bound parameters, so the engine's compiled cache compiles it only once.
+    inserted = (
+        SqlEventLogStorageTable.insert()  # pylint: disable=no-value-for-parameter
+        .values(
+            run_id=db.bindparam('run_id'),
+            event=db.bindparam('event'),
+            dagster_event_type=db.bindparam('dagster_event_type'),
+            timestamp=db.bindparam('timestamp'),
+            step_key=db.bindparam('step_key'),
+            materialization_label=db.bindparam('materialization_label'),
+        )
+        .returning(SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id)
+        .cte('inserted')
+    )
+    return db.select(
+        [
+            db.func.pg_notify(
+                CHANNEL_NAME, inserted.c.run_id + '_' + db.cast(inserted.c.id, db.String),
+            )
+        ]
+    ).select_from(inserted)
+
+
+STORE_EVENT_STATEMENT = _store_event_statement()
+
+
 class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     '''Postgres-backed event log storage.
 
@@ -47,13 +77,12 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     '''
 
-    def __init__(self, postgres_url, inst_data=None):
+    def __init__(self, postgres_url, inst_data=None, pool=None):
         self.postgres_url = check.str_param(postgres_url, 'postgres_url')
-        self._event_watcher = PostgresEventWatcher(self.postgres_url)
+        self._event_watcher = PostgresEventWatcher(self.postgres_url, pool=pool)
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
-        self._engine = create_engine(
-            self.postgres_url, isolation_level='AUTOCOMMIT', poolclass=db.pool.NullPool
-        )
+        self._engine = create_pg_engine(self.postgres_url, pool=pool)
+        self._store_event_engine = self._engine.execution_options(compiled_cache={})
         SqlEventLogStorageMetadata.create_all(self._engine)
 
     def upgrade(self):
@@ -71,7 +100,9 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     @staticmethod
     def from_config_value(inst_data, config_value):
         return PostgresEventLogStorage(
-            inst_data=inst_data, postgres_url=pg_url_from_config(config_value)
+            inst_data=inst_data,
+            postgres_url=pg_url_from_config(config_value),
+            pool=config_value.get('pool'),
         )
 
     @staticmethod
@@ -94,25 +125,16 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
             dagster_event_type = event.dagster_event.event_type_value
             step_key = event.dagster_event.step_key
 
-        run_id = event.run_id
-
-        # https://stackoverflow.com/a/54386260/324449
-        event_insert = SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
-            run_id=run_id,
-            event=serialize_dagster_namedtuple(event),
-            dagster_event_type=dagster_event_type,
-            timestamp=datetime.datetime.fromtimestamp(event.timestamp),
-            step_key=step_key,
-        )
-        result_proxy = self._engine.execute(
-            event_insert.returning(SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id)
-        )
-        res = result_proxy.fetchone()
-        result_proxy.close()
-        self._engine.execute(
-            '''NOTIFY {channel}, %s; '''.format(channel=CHANNEL_NAME),
-            (res[0] + '_' + str(res[1]),),
-        )
+        with trace_span('store_event', 'event_log'):
+            self._store_event_engine.execute(
+                STORE_EVENT_STATEMENT,
+                run_id=event.run_id,
+                event=serialize_dagster_namedtuple(event),
+                dagster_event_type=dagster_event_type,
+                timestamp=datetime.datetime.fromtimestamp(event.timestamp),
+                step_key=step_key,
+                materialization_label=materialization_label(event),
+            ).close()
 
     @contextmanager
     def connect(self, run_id=None):
@@ -157,8 +179,8 @@ POLLING_CADENCE = 0.25
 TERMINATE_EVENT_LOOP = 'TERMINATE_EVENT_LOOP'
 
 
-def watcher_thread(conn_string, run_id_dict, handlers_dict, dict_lock, watcher_thread_exit):
-
+def watcher_thread(conn_string, pool, run_id_dict, handlers_dict, dict_lock, watcher_thread_exit):
+    engine = create_pg_engine(conn_string, pool=pool)
     try:
         for notif in await_pg_notifications(
             conn_string,
@@ -179,28 +201,24 @@ def watcher_thread(conn_string, run_id_dict, handlers_dict, dict_lock, watcher_t
                 with dict_lock:
                     handlers = handlers_dict.get(run_id, [])
 
-                engine = create_engine(
-                    conn_string, isolation_level='AUTOCOMMIT', poolclass=db.pool.NullPool
+                res = engine.execute(
+                    db.select([SqlEventLogStorageTable.c.event]).where(
+                        SqlEventLogStorageTable.c.id == index
+                    ),
                 )
-                try:
-                    res = engine.execute(
-                        db.select([SqlEventLogStorageTable.c.event]).where(
-                            SqlEventLogStorageTable.c.id == index
-                        ),
-                    )
-                    dagster_event = deserialize_json_to_dagster_namedtuple(res.fetchone()[0])
-                finally:
-                    engine.dispose()
+                dagster_event = deserialize_json_to_dagster_namedtuple(res.fetchone()[0])
 
                 for (cursor, callback) in handlers:
                     if index >= cursor:
                         callback(dagster_event)
     except psycopg2.OperationalError:
         pass
+    finally:
+        engine.dispose()
 
 
 class PostgresEventWatcher(object):
-    def __init__(self, conn_string):
+    def __init__(self, conn_string, pool=None):
         self._run_id_dict = {}
         self._handlers_dict = {}
         self._dict_lock = threading.Lock()
@@ -210,6 +228,7 @@ class PostgresEventWatcher(object):
             target=watcher_thread,
             args=(
                 self._conn_string,
+                pool,
                 self._run_id_dict,
                 self._handlers_dict,
                 self._dict_lock,
@@ -0,0 +1,40 @@
+"""add step cache table
+
+Revision ID: 3e0770016702
+Revises: c63a27054f08
+Create Date: 2020-04-21 15:21:06.411834
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from dagster.core.storage.migration.utils import has_table
+
+# alembic magic breaks pylint
+# pylint: disable=no-member
+
+# revision identifiers, used by Alembic.
+revision = '3e0770016702'
+down_revision = 'c63a27054f08'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table('step_cache'):
+        op.create_table(
+            'step_cache',
+            sa.Column('id', sa.Integer, primary_key=True, autoincrement=True),
+            sa.Column('cache_key', sa.String(255), nullable=False),
+            sa.Column('run_id', sa.String(255), nullable=False),
+            sa.Column('step_key', sa.String),
+            sa.Column('entry_body', sa.String),
+            sa.Column('create_timestamp', sa.DateTime, server_default=sa.text('CURRENT_TIMESTAMP')),
+        )
+        op.create_index('idx_step_cache_cache_key', 'step_cache', ['cache_key'])
+
+
+def downgrade():
+    if has_table('step_cache'):
+        op.drop_index('idx_step_cache_cache_key', 'step_cache')
+        op.drop_table('step_cache')
@@ -1,18 +1,11 @@
 from contextlib import contextmanager
 
-import sqlalchemy as db
-
 from dagster import check
 from dagster.core.storage.runs import RunStorageSqlMetadata, SqlRunStorage
-from dagster.core.storage.sql import (
-    create_engine,
-    get_alembic_config,
-    handle_schema_errors,
-    run_alembic_upgrade,
-)
+from dagster.core.storage.sql import get_alembic_config, handle_schema_errors, run_alembic_upgrade
 from dagster.serdes import ConfigurableClass, ConfigurableClassData
 
-from ..utils import pg_config, pg_url_from_config
+from ..utils import create_pg_engine, pg_config, pg_url_from_config
 
 
 class PostgresRunStorage(SqlRunStorage, ConfigurableClass):
@@ -31,11 +24,9 @@ class PostgresRunStorage(SqlRunStorage, ConfigurableClass):
        :language: YAML
     '''
 
-    def __init__(self, postgres_url, inst_data=None):
+    def __init__(self, postgres_url, inst_data=None, pool=None):
         self.postgres_url = postgres_url
-        self._engine = create_engine(
-            self.postgres_url, isolation_level='AUTOCOMMIT', poolclass=db.pool.NullPool
-        )
+        self._engine = create_pg_engine(self.postgres_url, pool=pool)
         RunStorageSqlMetadata.create_all(self._engine)
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
 
@@ -50,14 +41,14 @@ class PostgresRunStorage(SqlRunStorage, ConfigurableClass):
     @staticmethod
     def from_config_value(inst_data, config_value):
         return PostgresRunStorage(
-            inst_data=inst_data, postgres_url=pg_url_from_config(config_value)
+            inst_data=inst_data,
+            postgres_url=pg_url_from_config(config_value),
+            pool=config_value.get('pool'),
         )
 
     @staticmethod
     def create_clean_storage(postgres_url):
-        engine = create_engine(
-            postgres_url, isolation_level='AUTOCOMMIT', poolclass=db.pool.NullPool
-        )
+        engine = create_pg_engine(postgres_url)
         try:
             RunStorageSqlMetadata.drop_all(engine)
         finally:
@@ -78,3 +69,13 @@ class PostgresRunStorage(SqlRunStorage, ConfigurableClass):
     def upgrade(self):
         alembic_config = get_alembic_config(__file__)
         run_alembic_upgrade(alembic_config, self._engine)
+
+    def delete_runs(self, run_ids):
+        # connect yields the engine, which would run each statement on a connection of its own, so
+        # the transaction has to be begun on the engine
+        check.list_param(run_ids, 'run_ids', of_type=str)
+        if not run_ids:
+            return
+
+        with self._engine.begin() as conn:
+            self._delete_runs(conn, run_ids)
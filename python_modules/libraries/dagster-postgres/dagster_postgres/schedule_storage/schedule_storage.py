@@ -1,13 +1,11 @@
 from contextlib import contextmanager
 
-import sqlalchemy as db
-
 from dagster import check
 from dagster.core.storage.schedules import ScheduleStorageSqlMetadata, SqlScheduleStorage
-from dagster.core.storage.sql import create_engine, get_alembic_config, run_alembic_upgrade
+from dagster.core.storage.sql import get_alembic_config, run_alembic_upgrade
 from dagster.serdes import ConfigurableClass, ConfigurableClassData
 
-from ..utils import pg_config, pg_url_from_config
+from ..utils import create_pg_engine, pg_config, pg_url_from_config
 
 
 class PostgresScheduleStorage(SqlScheduleStorage, ConfigurableClass):
@@ -18,22 +16,12 @@ class PostgresScheduleStorage(SqlScheduleStorage, ConfigurableClass):
     ``$DAGSTER_HOME``. Configuration of this class should be done by setting values in that file.
     '''
 
-    def __init__(self, postgres_url, inst_data=None):
+    def __init__(self, postgres_url, inst_data=None, pool=None):
         self.postgres_url = postgres_url
-        with self.get_engine() as engine:
-            ScheduleStorageSqlMetadata.create_all(engine)
+        self._engine = create_pg_engine(self.postgres_url, pool=pool)
+        ScheduleStorageSqlMetadata.create_all(self._engine)
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
 
-    @contextmanager
-    def get_engine(self):
-        engine = create_engine(
-            self.postgres_url, isolation_level='AUTOCOMMIT', poolclass=db.pool.NullPool
-        )
-        try:
-            yield engine
-        finally:
-            engine.dispose()
-
     @property
     def inst_data(self):
         return self._inst_data
@@ -45,14 +33,14 @@ class PostgresScheduleStorage(SqlScheduleStorage, ConfigurableClass):
     @staticmethod
     def from_config_value(inst_data, config_value):
         return PostgresScheduleStorage(
-            inst_data=inst_data, postgres_url=pg_url_from_config(config_value)
+            inst_data=inst_data,
+            postgres_url=pg_url_from_config(config_value),
+            pool=config_value.get('pool'),
         )
 
     @staticmethod
     def create_clean_storage(postgres_url):
-        engine = create_engine(
-            postgres_url, isolation_level='AUTOCOMMIT', poolclass=db.pool.NullPool
-        )
+        engine = create_pg_engine(postgres_url)
         try:
             ScheduleStorageSqlMetadata.drop_all(engine)
         finally:
@@ -61,10 +49,8 @@ class PostgresScheduleStorage(SqlScheduleStorage, ConfigurableClass):
 
     @contextmanager
     def connect(self, _run_id=None):  # pylint: disable=arguments-differ
-        with self.get_engine() as engine:
-            yield engine
+        yield self._engine
 
     def upgrade(self):
         alembic_config = get_alembic_config(__file__)
-        with self.get_engine() as engine:
-            run_alembic_upgrade(alembic_config, engine)
+        run_alembic_upgrade(alembic_config, self._engine)
@@ -1,8 +1,11 @@
+import os
 import time
 
 import psycopg2
+import sqlalchemy as db
 
-from dagster import Field, IntSource, Selector, StringSource
+from dagster import Bool, Field, IntSource, StringSource, check
+from dagster.core.storage.sql import create_engine
 from dagster.seven import quote_plus as urlquote
 
 
@@ -13,27 +16,117 @@ def get_conn(conn_string):
 
 
 def pg_config():
-    return Selector(
-        {
-            'postgres_url': str,
-            'postgres_db': {
+    return {
+        'postgres_url': Field(str, is_required=False),
+        'postgres_db': Field(
+            {
                 'username': StringSource,
                 'password': StringSource,
                 'hostname': StringSource,
                 'db_name': StringSource,
                 'port': Field(IntSource, is_required=False, default_value=5432),
             },
-        }
-    )
+            is_required=False,
+        ),
+        'pool': Field(
+            {
+                'pool_size': Field(
+                    IntSource,
+                    is_required=False,
+                    default_value=5,
+                    description='The number of connections to keep open.',
+                ),
+                'max_overflow': Field(
+                    IntSource,
+                    is_required=False,
+                    default_value=10,
+                    description='The number of connections to open beyond pool_size when all of '
+                    'them are in use, which are closed once they are returned.',
+                ),
+                'pool_recycle': Field(
+                    IntSource,
+                    is_required=False,
+                    default_value=3600,
+                    description='The number of seconds after which to replace a connection, or -1 '
+                    'to keep connections indefinitely.',
+                ),
+                'pool_pre_ping': Field(
+                    Bool,
+                    is_required=False,
+                    default_value=True,
+                    description='Whether to test connections for liveness when they are checked '
+                    'out of the pool.',
+                ),
+            },
+            is_required=False,
+            description='Keep connections to Postgres open and reuse them between queries. If '
+            'not set, a connection is opened for every query.',
+        ),
+    }
 
 
 def pg_url_from_config(config_value):
+    check.invariant(
+        bool(config_value.get('postgres_url')) != bool(config_value.get('postgres_db')),
+        'Exactly one of postgres_url and postgres_db must be set in the config of Postgres '
+        'storage.',
+    )
     if config_value.get('postgres_url'):
         return config_value['postgres_url']
 
     return get_conn_string(**config_value['postgres_db'])
 
 
+def create_pg_engine(postgres_url, pool=None):
+    '''Create an engine for Postgres storage.
+
+    Args:
+        postgres_url (str): The url of the database.
+        pool (Optional[Dict[str, Any]]): How to pool connections, as configured by the ``pool``
+            field of :py:func:`pg_config`. If not set, a connection is opened for every query.
+
+    Returns:
+        sqlalchemy.engine.Engine
+    '''
+    check.str_param(postgres_url, 'postgres_url')
+    check.opt_dict_param(pool, 'pool', key_type=str)
+
+    if pool is None:
+        return create_engine(postgres_url, isolation_level='AUTOCOMMIT', poolclass=db.pool.NullPool)
+
+    engine = create_engine(
+        postgres_url,
+        isolation_level='AUTOCOMMIT',
+        poolclass=db.pool.QueuePool,
+        pool_size=pool['pool_size'],
+        max_overflow=pool['max_overflow'],
+        pool_recycle=pool['pool_recycle'],
+        pool_pre_ping=pool['pool_pre_ping'],
+    )
+    _make_fork_safe(engine)
+    return engine
+
+
+def _make_fork_safe(engine):
+    # The multiprocess engine forks processes that inherit the pools of the instance in the parent.
+    # Connections opened by another process are discarded on checkout rather than shared; see
+    # https://docs.sqlalchemy.org/en/13/core/pooling.html#using-connection-pools-with-multiprocessing
+
+    @db.event.listens_for(engine, 'connect')
+    def _connect(_dbapi_connection, connection_record):
+        connection_record.info['pid'] = os.getpid()
+
+    @db.event.listens_for(engine, 'checkout')
+    def _checkout(_dbapi_connection, connection_record, connection_proxy):
+        if connection_record.info['pid'] != os.getpid():
+            # detach without closing, so the connection in the parent is left usable
+            connection_record.connection = connection_proxy.connection = None
+            raise db.exc.DisconnectionError(
+                'Connection record belongs to pid {owner}, attempting to check out in pid '
+                '{current}'.format(owner=connection_record.info['pid'], current=os.getpid())
+            )
+
+
 def get_conn_string(username, password, hostname, db_name, port='5432'):
     return 'postgresql://{username}:{password}@{hostname}:{port}/{db_name}'.format(
         username=username,
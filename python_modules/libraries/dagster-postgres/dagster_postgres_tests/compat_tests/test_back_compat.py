@@ -4,7 +4,7 @@ import os
 import subprocess
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 
 from dagster import execute_pipeline, pipeline, seven, solid
 from dagster.core.errors import DagsterInstanceMigrationRequired
@@ -107,6 +107,12 @@ def test_0_7_6_postgres_pre_event_log_migration(hostname, conn_string):
         # Make sure the schema is migrated
         instance.upgrade()
 
+        assert {
+            'idx_event_logs_run_id',
+            'idx_event_logs_step_key',
+            'idx_event_logs_event_type',
+        } <= {index['name'] for index in inspect(engine).get_indexes('event_logs')}
+
         assert isinstance(instance._event_storage, SqlEventLogStorage)
         events_by_id = instance._event_storage.get_logs_for_run_by_log_id(run_id)
         assert len(events_by_id) == 40
@@ -176,7 +182,7 @@ def test_0_7_6_postgres_pre_add_pipeline_snapshot(hostname, conn_string):
 
         assert str(exc_info.value) == (
             'Instance is out of date and must be migrated (Postgres run storage '
-            'requires migration). Database is at revision None, head is c63a27054f08. '
+            'requires migration). Database is at revision None, head is 5d1c8c5a2f4e. '
             'Please run `dagster instance migrate`.'
         )
 
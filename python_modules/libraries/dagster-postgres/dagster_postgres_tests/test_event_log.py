@@ -4,6 +4,7 @@ from collections import Counter
 import yaml
 from dagster_postgres.event_log import PostgresEventLogStorage
 from dagster_postgres.utils import get_conn
+from sqlalchemy.pool import QueuePool
 
 from dagster import ModeDefinition, RunConfig, execute_pipeline, pipeline, solid
 from dagster.core.events import DagsterEventType
@@ -288,6 +289,16 @@ def test_basic_get_logs_for_run_multiple_runs(conn_string):
     stats_two = event_log_storage.get_stats_for_run(result_two.run_id)
     assert stats_two.steps_succeeded == 1
 
+    run_ids = [result_one.run_id, result_two.run_id]
+    assert event_log_storage.get_stats_for_runs(run_ids) == {
+        result_one.run_id: stats_one,
+        result_two.run_id: stats_two,
+    }
+    assert event_log_storage.get_step_stats_for_runs(run_ids) == {
+        run_id: event_log_storage.get_step_stats_for_run(run_id) for run_id in run_ids
+    }
+    assert event_log_storage.get_stats_for_runs([]) == {}
+
 
 def test_basic_get_logs_for_run_multiple_runs_cursors(conn_string):
     event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
@@ -484,3 +495,48 @@ def test_load_from_config(hostname):
     )._event_storage
 
     assert from_url.postgres_url == from_explicit.postgres_url
+
+
+def test_load_pooled_from_config(conn_string):
+    cfg = '''
+      event_log_storage:
+        module: dagster_postgres.event_log
+        class: PostgresEventLogStorage
+        config:
+            postgres_url: {conn_string}
+            pool:
+              pool_size: 2
+    '''.format(
+        conn_string=conn_string
+    )
+
+    # pylint: disable=protected-access
+    event_log_storage = DagsterInstance.local_temp(overrides=yaml.safe_load(cfg))._event_storage
+    assert isinstance(event_log_storage._engine.pool, QueuePool)
+    assert event_log_storage._engine.pool.size() == 2
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    events, result = gather_events(_solids)
+
+    event_log_storage.wipe()
+    event_list = []
+    event_log_storage.event_watcher.watch_run(result.run_id, 0, event_list.append)
+    try:
+        for event in events:
+            event_log_storage.store_event(event)
+
+        assert len(event_log_storage.get_logs_for_run(result.run_id)) == len(events)
+
+        start = time.time()
+        while len(event_list) < len(events) and time.time() - start < TEST_TIMEOUT:
+            pass
+
+        assert len(event_list) == len(events)
+    finally:
+        del event_log_storage